@@ -11,12 +11,17 @@ Per `docs/app/ARCHITECTURE.md` Section 4.3, domain-specific DDL lives under
 
 Issue #75 Phase 1: adds performance indexes for the hot query paths
 on ``backups`` (per-server listings ordered by recency, status
-filters).
+filters). :func:`migrate_backup_checksum` adds the ``checksum`` column
+to pre-existing ``backups`` tables, and
+:func:`migrate_backup_schedule_retention_tiers` the ``keep_*`` retention
+columns to ``backup_schedules``.
 """
 
 import logging
 from typing import Any
 
+from sqlalchemy import inspect, text
+
 from app.core.db_ddl import create_index_if_not_exists
 
 logger = logging.getLogger(__name__)
@@ -79,3 +84,62 @@ def migrate_backup_indexes(engine: Any) -> None:
                     exc,
                 )
         conn.commit()
+
+
+def migrate_backup_checksum(engine: Any) -> None:
+    """Idempotent migration: ensure ``backups.checksum`` column exists.
+
+    ``create_all`` never adds columns to existing tables, so databases
+    provisioned before backups recorded a SHA-256 get a nullable
+    ``checksum VARCHAR(64)`` column here. Existing rows keep ``NULL``;
+    the backup scrubber fills them in on its first pass.
+    """
+    inspector = inspect(engine)
+    if "backups" not in inspector.get_table_names():
+        return
+
+    existing_columns = {col["name"] for col in inspector.get_columns("backups")}
+    if "checksum" in existing_columns:
+        return
+
+    with engine.connect() as conn:
+        conn.execute(text("ALTER TABLE backups ADD COLUMN checksum VARCHAR(64)"))
+        conn.commit()
+
+    logger.info("backups.checksum column added")
+
+
+_RETENTION_TIER_COLUMNS: tuple[str, ...] = (
+    "keep_hourly",
+    "keep_daily",
+    "keep_weekly",
+    "keep_monthly",
+)
+
+
+def migrate_backup_schedule_retention_tiers(engine: Any) -> None:
+    """Idempotent migration: ensure the ``backup_schedules.keep_*`` columns.
+
+    Added as ``INTEGER NOT NULL DEFAULT 0`` so existing schedules keep
+    their flat ``max_backups`` retention.
+    """
+    inspector = inspect(engine)
+    if "backup_schedules" not in inspector.get_table_names():
+        return
+
+    existing_columns = {col["name"] for col in inspector.get_columns("backup_schedules")}
+    missing = [c for c in _RETENTION_TIER_COLUMNS if c not in existing_columns]
+    if not missing:
+        return
+
+    with engine.connect() as conn:
+        for column in missing:
+            conn.execute(
+                text(
+                    f"ALTER TABLE backup_schedules ADD COLUMN {column} "
+                    "INTEGER NOT NULL DEFAULT 0"
+                )
+            )
+        conn.commit()
+
+    logger.info("backup_schedules retention tier columns added: %s", missing)
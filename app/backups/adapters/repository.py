@@ -19,9 +19,9 @@ without a per-row lazy SELECT. See `docs/app/ARCHITECTURE.md` Section 4.3.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterable, List, Optional, Sequence
 
-from sqlalchemy import func
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session, joinedload
 
 from app.backups.domain.entities import (
@@ -34,10 +34,17 @@ from app.backups.domain.entities import (
     BackupStatistics,
     CreateBackupCommand,
     CreateBackupScheduleCommand,
+    RetentionCandidate,
     UpdateBackupFileCommand,
     UpdateBackupScheduleCommand,
 )
-from app.backups.models import Backup, BackupSchedule, BackupScheduleLog, BackupStatus
+from app.backups.models import (
+    Backup,
+    BackupSchedule,
+    BackupScheduleLog,
+    BackupStatus,
+    BackupType,
+)
 from app.core.datetime_utils import utcnow
 
 
@@ -69,6 +76,7 @@ def _backup_to_entity(row: Backup) -> BackupEntity:
         if row.server is not None
         else None,
         server_owner_id=row.server.owner_id if row.server is not None else None,
+        checksum=row.checksum,
     )
 
 
@@ -84,9 +92,18 @@ def _schedule_to_entity(row: BackupSchedule) -> BackupScheduleEntity:
         next_backup_at=row.next_backup_at,
         created_at=row.created_at,
         updated_at=row.updated_at,
+        keep_hourly=row.keep_hourly or 0,
+        keep_daily=row.keep_daily or 0,
+        keep_weekly=row.keep_weekly or 0,
+        keep_monthly=row.keep_monthly or 0,
     )
 
 
+# Bound on the number of ids in one `DELETE ... WHERE id IN (...)`; stays
+# well under SQLite's host-parameter limit.
+_DELETE_BATCH_SIZE = 500
+
+
 def _log_to_entity(row: BackupScheduleLog) -> BackupScheduleLogEntity:
     """Convert a log ORM row to a domain entity.
 
@@ -149,6 +166,39 @@ class SqlAlchemyBackupRepository:
             size=spec.size,
         )
 
+    async def list_retention_candidates(
+        self, server_ids: Optional[Sequence[int]] = None
+    ) -> List[RetentionCandidate]:
+        # Only the columns retention needs, ordered to walk
+        # `ix_backups_server_id_created_at`: one range scan for every
+        # server instead of one paged listing per schedule.
+        query = (
+            select(
+                Backup.id,
+                Backup.server_id,
+                Backup.created_at,
+                Backup.file_path,
+                Backup.file_size,
+            )
+            .where(
+                Backup.status == BackupStatus.completed,
+                Backup.backup_type == BackupType.scheduled,
+            )
+            .order_by(Backup.server_id, Backup.created_at.desc())
+        )
+        if server_ids is not None:
+            query = query.where(Backup.server_id.in_(list(server_ids)))
+        return [
+            RetentionCandidate(
+                id=row.id,
+                server_id=row.server_id,
+                created_at=row.created_at,
+                file_path=row.file_path,
+                file_size=row.file_size,
+            )
+            for row in self.db.execute(query)
+        ]
+
     async def get_statistics(self, server_id: Optional[int] = None) -> BackupStatistics:
         query = self.db.query(Backup)
         if server_id is not None:
@@ -184,6 +234,7 @@ class SqlAlchemyBackupRepository:
             description=command.description,
             file_path=command.file_path,
             file_size=command.file_size,
+            checksum=command.checksum,
             backup_type=command.backup_type,
             status=command.status,
         )
@@ -207,6 +258,7 @@ class SqlAlchemyBackupRepository:
             return None
         row.file_path = command.file_path
         row.file_size = command.file_size
+        row.checksum = command.checksum
         row.status = command.status
         self.db.flush()
         return _backup_to_entity(row)
@@ -226,6 +278,21 @@ class SqlAlchemyBackupRepository:
         self.db.flush()
         return _backup_to_entity(row)
 
+    async def update_checksum(
+        self, backup_id: int, checksum: str
+    ) -> Optional[BackupEntity]:
+        row = (
+            self.db.query(Backup)
+            .options(joinedload(Backup.server))
+            .filter(Backup.id == backup_id)
+            .first()
+        )
+        if row is None:
+            return None
+        row.checksum = checksum
+        self.db.flush()
+        return _backup_to_entity(row)
+
     async def delete(self, backup_id: int) -> bool:
         row = self.db.query(Backup).filter(Backup.id == backup_id).first()
         if row is None:
@@ -234,6 +301,20 @@ class SqlAlchemyBackupRepository:
         self.db.flush()
         return True
 
+    async def delete_many(self, backup_ids: Iterable[int]) -> int:
+        ids = list(backup_ids)
+        deleted = 0
+        for start in range(0, len(ids), _DELETE_BATCH_SIZE):
+            batch = ids[start : start + _DELETE_BATCH_SIZE]
+            result = self.db.execute(
+                delete(Backup)
+                .where(Backup.id.in_(batch))
+                .execution_options(synchronize_session=False)
+            )
+            deleted += result.rowcount or 0
+        self.db.flush()
+        return deleted
+
 
 class SqlAlchemyBackupScheduleRepository:
     """SQLAlchemy-backed implementation of the schedule + log Ports."""
@@ -302,6 +383,10 @@ class SqlAlchemyBackupScheduleRepository:
             enabled=command.enabled,
             only_when_running=command.only_when_running,
             next_backup_at=command.next_backup_at,
+            keep_hourly=command.keep_hourly,
+            keep_daily=command.keep_daily,
+            keep_weekly=command.keep_weekly,
+            keep_monthly=command.keep_monthly,
         )
         self.db.add(row)
         self.db.flush()
@@ -37,6 +37,7 @@ def backup_entity_to_response(entity: BackupEntity) -> BackupResponse:
         backup_type=entity.backup_type,
         status=entity.status,
         created_at=entity.created_at,
+        checksum=entity.checksum,
         server_name=entity.server_name,
         minecraft_version=entity.minecraft_version,
     )
@@ -68,6 +69,10 @@ def backup_schedule_entity_to_response(
         next_backup_at=entity.next_backup_at,
         created_at=entity.created_at,
         updated_at=entity.updated_at,
+        keep_hourly=entity.keep_hourly,
+        keep_daily=entity.keep_daily,
+        keep_weekly=entity.keep_weekly,
+        keep_monthly=entity.keep_monthly,
     )
 
 
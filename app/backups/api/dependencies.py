@@ -21,6 +21,7 @@ from app.backups import backup_scheduler_instance
 from app.backups.adapters.repository import SqlAlchemyBackupRepository
 from app.backups.adapters.uow import SqlAlchemyBackupsUnitOfWork
 from app.backups.application.scheduler import BackupSchedulerService
+from app.backups.application.scrubber import BackupScrubberService
 from app.backups.application.service import BackupService
 from app.backups.domain.ports import BackupRepository, BackupsUnitOfWork
 from app.core.database import SessionLocal, get_db
@@ -102,6 +103,9 @@ def make_backup_scheduler(
     `backups_directory` is forwarded to the periodic `.pending/` /
     `.failed/` housekeeping sweep (Issue #284). Retention windows and
     sweep cadence are read from `app.core.config.settings`.
+
+    Scheduled runs get a `BackupService` whose UoW also opens a session
+    per entry, so none is held open while an archive is written.
     """
     return BackupSchedulerService(
         uow_factory=lambda: SqlAlchemyBackupsUnitOfWork.from_session_factory(
@@ -109,4 +113,22 @@ def make_backup_scheduler(
         ),
         server_read_factory=lambda: SqlAlchemyServerReadPort(SessionLocal()),
         backups_directory=backups_directory,
+        backup_service_factory=lambda: BackupService(
+            uow=SqlAlchemyBackupsUnitOfWork.from_session_factory(SessionLocal),
+            server_read=SqlAlchemyServerReadPort(SessionLocal()),
+            backups_directory=backups_directory,
+        ),
+    )
+
+
+def make_backup_scrubber() -> BackupScrubberService:
+    """Build the lifespan-scoped `BackupScrubberService`.
+
+    Like the scheduler, each scrub pass opens its own sessions via
+    `SessionLocal`; cadence and read throttle come from settings.
+    """
+    return BackupScrubberService(
+        uow_factory=lambda: SqlAlchemyBackupsUnitOfWork.from_session_factory(
+            SessionLocal
+        ),
     )
@@ -0,0 +1,559 @@
+"""Content-addressed chunk store for incremental backups.
+
+With ``BACKUP_MODE=incremental`` a backup is not a tarball but a small JSON
+*manifest* listing every file of the server directory together with the
+chunks its content was split into. Chunk bodies live once, keyed by their
+SHA-256, under ``backups_directory/.chunks/objects/``, so region files
+(``*.mca``) that barely change between hourly backups cost almost nothing
+after the first one.
+
+Files are split with a gear rolling hash (FastCDC-style content-defined
+chunking): a cut is placed wherever the hash of the preceding bytes matches
+a mask, so an edit only changes the chunks around it instead of shifting
+every later fixed-size block. The hash runs per byte in Python, so region
+files and already-compressed files, which are the bulk of a world and gain
+nothing from shifting boundaries, are cut into fixed ``CHUNK_FIXED_SIZE``
+blocks instead: region files are laid out in 4 KiB sectors, so an updated
+Minecraft chunk only changes the blocks holding its sectors. Files whose
+size and mtime match the previous manifest of the same server are not read
+at all; their chunk list is reused.
+
+Each manifest entry holds a reference on its chunks. References are
+counted in ``.chunks/refcounts.json``; deleting a backup releases its
+references and removes chunks nobody points at any more. The counts are
+written before a new manifest appears and after a deleted one is gone, so
+a crash can leave them too high (keeping unreferenced chunks) but never
+too low. When the file is missing they are rebuilt from the manifests,
+including those in ``.pending/`` and ``.failed/``.
+
+Restoring a manifest writes the files straight into the target directory;
+:meth:`ChunkStore.export` streams a manifest into a ``TarFile`` so a
+regular archive can be materialized on demand (e.g. for downloads).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import os
+import tarfile
+import threading
+import uuid
+import zlib
+from datetime import datetime
+from pathlib import Path, PurePosixPath
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional
+
+from app.core.fs_walk import walk_files
+from app.core.security import SecurityError, _has_traversal_component
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 1
+
+CHUNK_MIN_SIZE = 16 * 1024
+CHUNK_AVG_BITS = 16  # ~64 KiB expected distance between cuts past the minimum
+CHUNK_MAX_SIZE = 256 * 1024
+# Multiple of the 4 KiB region file sector.
+CHUNK_FIXED_SIZE = 64 * 1024
+
+# Region files (sector-aligned) and formats that are already compressed.
+FIXED_CHUNK_SUFFIXES = frozenset(
+    {".mca", ".mcr", ".mcc", ".jar", ".zip", ".gz", ".zst", ".xz", ".png", ".ogg"}
+)
+# Directories next to the backups whose manifests still hold references.
+_MANIFEST_SUBDIRECTORIES = (".pending", ".failed")
+
+# Object header: zlib-compressed or stored as-is (already compressed data
+# such as region chunks often does not shrink).
+_COMPRESSED = b"z"
+_STORED = b"r"
+
+# 64-bit gear table derived from SHA-256 so chunk boundaries are identical
+# across processes and releases (changing it would defeat deduplication).
+_GEAR = tuple(
+    int.from_bytes(hashlib.sha256(bytes([i])).digest()[:8], "big") for i in range(256)
+)
+_MASK64 = (1 << 64) - 1
+
+
+def _log_walk_error(error: OSError) -> None:
+    logger.warning(f"Skipping unreadable path during backup: {error}")
+
+
+def is_manifest(path) -> bool:
+    """True if ``path`` names an incremental backup manifest."""
+    return str(path).endswith(MANIFEST_SUFFIX)
+
+
+def _find_cut(data: bytes, start: int, end: int, mask: int) -> int:
+    """Return the end offset of the chunk starting at ``start``."""
+    i = start + CHUNK_MIN_SIZE
+    if i >= end:
+        return end
+    gear = _GEAR
+    h = 0
+    while i < end:
+        h = ((h << 1) + gear[data[i]]) & _MASK64
+        i += 1
+        if not h & mask:
+            return i
+    return end
+
+
+def iter_chunks(
+    fileobj: BinaryIO, *, read_size: int = 4 * CHUNK_MAX_SIZE
+) -> Iterator[bytes]:
+    """Split a binary stream into content-defined chunks.
+
+    Chunks are between ``CHUNK_MIN_SIZE`` and ``CHUNK_MAX_SIZE`` bytes
+    (the last one may be shorter). Boundaries depend only on the content,
+    never on ``read_size``.
+    """
+    # Use the high bits: they depend on the most recent 64 bytes.
+    mask = ((1 << CHUNK_AVG_BITS) - 1) << (64 - CHUNK_AVG_BITS)
+    buffer = b""
+    eof = False
+    while not eof:
+        data = fileobj.read(read_size)
+        eof = not data
+        buffer = buffer + data if buffer else data
+        start = 0
+        while start < len(buffer):
+            end = start + CHUNK_MAX_SIZE
+            if end > len(buffer):
+                if not eof:
+                    break  # need more data to place this cut
+                end = len(buffer)
+            cut = _find_cut(buffer, start, end, mask)
+            yield buffer[start:cut]
+            start = cut
+        buffer = buffer[start:]
+
+
+def iter_fixed_chunks(fileobj: BinaryIO, size: int = CHUNK_FIXED_SIZE) -> Iterator[bytes]:
+    """Split a binary stream into ``size``-byte chunks (the last may be shorter)."""
+    while True:
+        data = fileobj.read(size)
+        if not data:
+            return
+        yield data
+
+
+def chunker_for(path: str) -> Callable[[BinaryIO], Iterator[bytes]]:
+    """Chunking function for a file, chosen by its name."""
+    if os.path.splitext(path)[1].lower() in FIXED_CHUNK_SUFFIXES:
+        return iter_fixed_chunks
+    return iter_chunks
+
+
+class _ChunkReader(io.RawIOBase):
+    """Readable stream over a file's chunks, fetched lazily from the store."""
+
+    def __init__(self, store: "ChunkStore", digests: List[str]):
+        super().__init__()
+        self._store = store
+        self._digests = iter(digests)
+        self._current = b""
+        self._offset = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while self._offset >= len(self._current):
+            digest = next(self._digests, None)
+            if digest is None:
+                return 0
+            self._current = self._store.read(digest)
+            self._offset = 0
+        n = min(len(buffer), len(self._current) - self._offset)
+        buffer[:n] = self._current[self._offset : self._offset + n]
+        self._offset += n
+        return n
+
+
+class ChunkStore:
+    """Deduplicated, reference-counted chunk objects plus manifest operations.
+
+    One instance per backups directory should be shared (see
+    :func:`get_chunk_store`); reference-count updates are serialized by an
+    internal lock, so snapshots and deletions may run in worker threads
+    concurrently. All methods are blocking.
+    """
+
+    def __init__(self, backups_directory: Path, compression_level: int = 6):
+        self.backups_directory = Path(backups_directory)
+        self.root = self.backups_directory / ".chunks"
+        self.objects_directory = self.root / "objects"
+        self.compression_level = compression_level
+        self._refcounts_path = self.root / "refcounts.json"
+        self._refcounts: Optional[Dict[str, int]] = None
+        self._lock = threading.RLock()
+
+    # ---------------------------------------------------------------
+    # Objects and references
+    # ---------------------------------------------------------------
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_directory / digest[:2] / digest
+
+    def _counts(self) -> Dict[str, int]:
+        if self._refcounts is None:
+            if self._refcounts_path.exists():
+                with open(self._refcounts_path, encoding="utf-8") as f:
+                    self._refcounts = json.load(f)
+            else:
+                self._refcounts = self._count_manifest_references()
+        return self._refcounts
+
+    def _count_manifest_references(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        manifest_paths = [
+            path
+            for directory in (
+                self.backups_directory,
+                *(self.backups_directory / name for name in _MANIFEST_SUBDIRECTORIES),
+            )
+            for path in directory.glob(f"*{MANIFEST_SUFFIX}")
+        ]
+        for manifest_path in manifest_paths:
+            try:
+                manifest = self.load_manifest(manifest_path)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable manifest {manifest_path}: {e}")
+                continue
+            for entry in manifest["files"]:
+                for digest in entry["chunks"]:
+                    counts[digest] = counts.get(digest, 0) + 1
+        if counts:
+            logger.info(f"Rebuilt chunk reference counts from manifests ({len(counts)})")
+        return counts
+
+    def reference_count(self, digest: str) -> int:
+        with self._lock:
+            return self._counts().get(digest, 0)
+
+    def put(self, data: bytes) -> tuple[str, int]:
+        """Store ``data`` (if new) and take a reference on it.
+
+        Returns the chunk digest and the number of bytes newly written to
+        disk (0 when the chunk was already present).
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        # Compress outside the lock; known chunks skip it entirely.
+        body = None if path.exists() else self._encode(data)
+        with self._lock:
+            counts = self._counts()
+            written = 0
+            if not path.exists():
+                if body is None:
+                    body = self._encode(data)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temp = path.parent / f".tmp-{uuid.uuid4().hex}"
+                with open(temp, "wb") as f:
+                    f.write(body)
+                os.replace(temp, path)
+                written = len(body)
+            counts[digest] = counts.get(digest, 0) + 1
+            return digest, written
+
+    def _encode(self, data: bytes) -> bytes:
+        compressed = zlib.compress(data, self.compression_level)
+        if len(compressed) < len(data):
+            return _COMPRESSED + compressed
+        return _STORED + data
+
+    def retain(self, digests: Iterable[str]) -> bool:
+        """Take a reference on existing chunks.
+
+        Returns False (taking no references) if any chunk is missing.
+        """
+        digests = list(digests)
+        with self._lock:
+            counts = self._counts()
+            if not all(self._object_path(d).exists() for d in digests):
+                return False
+            for digest in digests:
+                counts[digest] = counts.get(digest, 0) + 1
+            return True
+
+    def release(self, digests: Iterable[str]) -> int:
+        """Drop one reference per digest; delete unreferenced chunks.
+
+        Returns the number of chunk objects removed.
+        """
+        removed = 0
+        with self._lock:
+            counts = self._counts()
+            for digest in digests:
+                remaining = counts.get(digest, 0) - 1
+                if remaining > 0:
+                    counts[digest] = remaining
+                    continue
+                counts.pop(digest, None)
+                try:
+                    self._object_path(digest).unlink()
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+        return removed
+
+    def flush(self) -> None:
+        """Persist reference counts atomically."""
+        with self._lock:
+            counts = self._counts()
+            self.root.mkdir(parents=True, exist_ok=True)
+            temp = self.root / f".refcounts-{uuid.uuid4().hex}.json"
+            with open(temp, "w", encoding="utf-8") as f:
+                json.dump(counts, f, separators=(",", ":"))
+            os.replace(temp, self._refcounts_path)
+
+    def read(self, digest: str) -> bytes:
+        """Return a chunk's content, verifying it against its digest."""
+        with open(self._object_path(digest), "rb") as f:
+            body = f.read()
+        return self._decode(digest, body)
+
+    def verify(self, digest: str, *, drop_cache: bool = False) -> int:
+        """Check a chunk object against its digest, as :meth:`read` does.
+
+        Returns the object's size on disk. Raises ``FileNotFoundError`` if
+        it is gone and ``ValueError`` if it is corrupt. With ``drop_cache``
+        its pages are dropped from the page cache again.
+        """
+        with open(self._object_path(digest), "rb") as f:
+            body = f.read()
+            if drop_cache and hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        self._decode(digest, body)
+        return len(body)
+
+    @staticmethod
+    def _decode(digest: str, body: bytes) -> bytes:
+        try:
+            data = zlib.decompress(body[1:]) if body[:1] == _COMPRESSED else body[1:]
+        except zlib.error as e:
+            raise ValueError(f"Chunk {digest} is corrupt: {e}") from e
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"Chunk {digest} is corrupt")
+        return data
+
+    # ---------------------------------------------------------------
+    # Manifests
+    # ---------------------------------------------------------------
+
+    @staticmethod
+    def load_manifest(manifest_path: Path) -> Dict[str, Any]:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported manifest version in {manifest_path}")
+        return manifest
+
+    def latest_manifest(self, server_id: int) -> Optional[Path]:
+        """Most recent committed manifest of ``server_id``, if any."""
+        candidates = list(
+            self.backups_directory.glob(f"backup_{server_id}_*{MANIFEST_SUFFIX}")
+        )
+        if not candidates:
+            return None
+        return max(candidates, key=lambda p: p.stat().st_mtime_ns)
+
+    def snapshot(
+        self,
+        source_dir: Path,
+        manifest_path: Path,
+        previous_manifest: Optional[Path] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """Chunk ``source_dir`` into the store and write its manifest.
+
+        Unchanged files (same size and mtime as in ``previous_manifest``)
+        reuse their chunk lists without being read. Files that cannot be
+        read are logged and skipped, as for tarball backups. ``progress``
+        receives the running file and byte counts. Returns the
+        number of bytes added to disk (new chunks plus the manifest); the
+        chunk part is also recorded in the manifest as ``stored_size``.
+        """
+        previous: Dict[str, Dict[str, Any]] = {}
+        if previous_manifest is not None:
+            try:
+                previous = {
+                    entry["path"]: entry
+                    for entry in self.load_manifest(previous_manifest)["files"]
+                }
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring previous manifest {previous_manifest}: {e}")
+
+        total_size = 0
+        entries: List[Dict[str, Any]] = []
+        taken: List[str] = []
+        written = 0
+        reused = 0
+        try:
+            for walked in walk_files(source_dir, on_error=_log_walk_error):
+                st = walked.stat
+                try:
+                    old = previous.get(walked.relative_path)
+                    if (
+                        old is not None
+                        and old["size"] == st.st_size
+                        and old["mtime_ns"] == st.st_mtime_ns
+                        and self.retain(old["chunks"])
+                    ):
+                        chunks = list(old["chunks"])
+                        size = old["size"]
+                        reused += 1
+                    else:
+                        # Record what was read, not the stat size: the
+                        # file may change while a running server writes.
+                        chunks = []
+                        size = 0
+                        chunker = chunker_for(walked.relative_path)
+                        try:
+                            with open(walked.path, "rb") as f:
+                                for data in chunker(f):
+                                    digest, stored = self.put(data)
+                                    chunks.append(digest)
+                                    size += len(data)
+                                    written += stored
+                        except Exception:
+                            self.release(chunks)
+                            raise
+                except Exception as e:
+                    logger.warning(f"Failed to add file {walked.path} to backup: {e}")
+                    continue
+                taken.extend(chunks)
+                total_size += size
+                entries.append(
+                    {
+                        "path": walked.relative_path,
+                        "size": size,
+                        "mode": st.st_mode & 0o7777,
+                        "mtime_ns": st.st_mtime_ns,
+                        "chunks": chunks,
+                    }
+                )
+                if progress and len(entries) % 100 == 0:
+                    progress(len(entries), total_size)
+
+            manifest = {
+                "version": MANIFEST_VERSION,
+                "created_at": datetime.now().isoformat(),
+                "source": str(source_dir),
+                "total_size": total_size,
+                "stored_size": written,
+                "files": entries,
+            }
+            # Persist the references first: if the process dies after the
+            # manifest is written, the counts on disk must already cover it.
+            self.flush()
+            with open(manifest_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, separators=(",", ":"))
+        except BaseException:
+            self.release(taken)
+            manifest_path.unlink(missing_ok=True)
+            raise
+
+        if progress:
+            progress(len(entries), total_size)
+        logger.info(
+            f"Incremental snapshot of {source_dir}: {len(entries)} files, "
+            f"{reused} unchanged, {written / (1024 * 1024):.1f}MB new chunk data"
+        )
+        return written + manifest_path.stat().st_size
+
+    def discard(self, manifest_path: Path) -> int:
+        """Release a manifest's chunk references and delete the manifest.
+
+        Returns the number of chunk objects freed.
+        """
+        manifest = self.load_manifest(manifest_path)
+        with self._lock:
+            # Unlink first: a manifest must never outlive its chunks.
+            manifest_path.unlink()
+            removed = self.release(
+                digest for entry in manifest["files"] for digest in entry["chunks"]
+            )
+            self.flush()
+        return removed
+
+    def restore(
+        self,
+        manifest_path: Path,
+        target_dir: Path,
+        include: Optional[Callable[[str], bool]] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """Recreate the files of a manifest under ``target_dir``.
+
+        Entry paths are validated like tar members; a path escaping
+        ``target_dir`` raises :class:`SecurityError`. ``include`` limits
+        the restore to the entries whose path it accepts, and
+        ``progress(files, bytes)`` is called after each file. Returns the
+        number of files written.
+        """
+        manifest = self.load_manifest(manifest_path)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        resolved_target = target_dir.resolve()
+        restored = 0
+        restored_bytes = 0
+        for entry in manifest["files"]:
+            destination = self._safe_destination(entry["path"], resolved_target)
+            if include is not None and not include(entry["path"]):
+                continue
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            with open(destination, "wb") as f:
+                for digest in entry["chunks"]:
+                    f.write(self.read(digest))
+            os.chmod(destination, entry["mode"] & 0o777)
+            os.utime(destination, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+            restored += 1
+            restored_bytes += entry["size"]
+            if progress is not None:
+                progress(restored, restored_bytes)
+        return restored
+
+    @staticmethod
+    def _safe_destination(name: str, resolved_target: Path) -> Path:
+        if (
+            not name
+            or PurePosixPath(name).is_absolute()
+            or _has_traversal_component(name)
+        ):
+            raise SecurityError(f"Unsafe path in backup manifest: {name}")
+        destination = (resolved_target / name).resolve()
+        try:
+            destination.relative_to(resolved_target)
+        except ValueError:
+            raise SecurityError(f"Path traversal attempt in backup manifest: {name}")
+        return destination
+
+    def export(self, manifest_path: Path, tar: tarfile.TarFile) -> None:
+        """Write a manifest's files into an open ``TarFile``."""
+        manifest = self.load_manifest(manifest_path)
+        for entry in manifest["files"]:
+            info = tarfile.TarInfo(entry["path"])
+            info.size = entry["size"]
+            info.mode = entry["mode"]
+            info.mtime = entry["mtime_ns"] // 1_000_000_000
+            tar.addfile(info, io.BufferedReader(_ChunkReader(self, entry["chunks"])))
+
+
+_stores: Dict[Path, ChunkStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_chunk_store(backups_directory: Path, compression_level: int = 6) -> ChunkStore:
+    """Return the shared :class:`ChunkStore` for ``backups_directory``."""
+    key = Path(backups_directory).resolve()
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = ChunkStore(key, compression_level)
+        return store
@@ -1,4 +1,4 @@
-"""Backup tar.gz file operations (application-layer helper).
+"""Backup archive file operations (application-layer helper).
 
 Migrated verbatim from `app.services.backup_service.BackupFileService`
 so the legacy behaviour (chunked async tar creation, large-file
@@ -6,31 +6,176 @@ streaming, secure extraction via `TarExtractor`) is preserved during
 the strangler refactor. Lives in `application/` (not `adapters/`)
 because it is an in-process file-IO helper, not an external
 infrastructure boundary.
+
+Archives are written through the pluggable backends in
+`app.core.archives` (parallel gzip or zstd, per
+`BACKUP_ARCHIVE_FORMAT`) and read back with format detection. With
+`BACKUP_MODE=incremental` backups are manifests over the shared
+`ChunkStore` instead; restore and deletion dispatch on the file suffix,
+so both kinds can coexist in one backups directory. Restores are staged
+beside the server directory and renamed into place (see
+`app.backups.application.restore`).
 """
 
 import asyncio
+import functools
 import logging
-import shutil
+import stat
 import tarfile
+import time
+import uuid
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-
+from typing import Callable, Dict, Optional, Sequence, Set, Tuple
+
+try:
+    import grp
+    import pwd
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    grp = pwd = None
+
+from app.backups.application.chunk_store import (
+    MANIFEST_SUFFIX,
+    ChunkStore,
+    get_chunk_store,
+    is_manifest,
+)
+from app.backups.application.restore import (
+    RESTORE_PROGRESS_TOPIC,
+    RestoreProgressEvent,
+    extract_archive,
+    new_staging_directory,
+    path_selected,
+    remove_trees,
+    stale_restore_directories,
+    swap_into_place,
+    throttled,
+)
 from app.backups.models import Backup, BackupType
+from app.core.archives import (
+    ARCHIVE_FORMAT_ZSTD,
+    ARCHIVE_SUFFIXES,
+    open_archive_writer,
+)
+from app.core.checksums import ChecksumMismatchError, file_checksum, new_hasher
+from app.core.event_bus import get_event_bus
 from app.core.exceptions import FileOperationException, handle_file_error
-from app.core.security import SecurityError, TarExtractor
+from app.core.fs_walk import WalkedFile, walk_files
+from app.core.security import SecurityError
 from app.servers.models import Server
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class ArchiveStats:
+    """Throughput of one completed backup walk."""
+
+    files: int
+    bytes: int
+    seconds: float
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+
+# Files/bytes seen by the last backup of each server directory; the
+# progress estimate for its next one.
+_walk_estimates: Dict[str, tuple[int, int]] = {}
+_last_archive_stats: Optional[ArchiveStats] = None
+
+# Staging directories of restores in progress (never swept as stale), and
+# pending background deletions of replaced trees (kept referenced).
+_active_restore_directories: Set[Path] = set()
+_background_removals: Set[asyncio.Future] = set()
+
+
+def last_archive_stats() -> Optional[ArchiveStats]:
+    """Throughput of the most recent backup in this process, if any."""
+    return _last_archive_stats
+
+
+@functools.lru_cache(maxsize=64)
+def _user_name(uid: int) -> str:
+    try:
+        return pwd.getpwuid(uid).pw_name if pwd else ""
+    except KeyError:
+        return ""
+
+
+@functools.lru_cache(maxsize=64)
+def _group_name(gid: int) -> str:
+    try:
+        return grp.getgrgid(gid).gr_name if grp else ""
+    except KeyError:
+        return ""
+
+
+def _log_walk_error(error: OSError) -> None:
+    logger.warning(f"Skipping unreadable path during backup: {error}")
+
+
 class BackupFileService:
-    """Tar.gz creation, restoration, and on-disk deletion for backups.
+    """Archive creation, restoration, and on-disk deletion for backups.
 
-    Pure file IO — does not touch the database.
+    Pure file IO — does not touch the database. Mode, format, level and
+    thread count default to the `BACKUP_*` settings.
     """
 
-    def __init__(self, backups_directory: Path):
+    def __init__(
+        self,
+        backups_directory: Path,
+        archive_format: Optional[str] = None,
+        compression_level: Optional[int] = None,
+        compression_threads: Optional[int] = None,
+        backup_mode: Optional[str] = None,
+    ):
+        from app.core.config import settings
+
         self.backups_directory = backups_directory
+        self.backup_mode = backup_mode or settings.BACKUP_MODE
+        self.archive_format = archive_format or settings.BACKUP_ARCHIVE_FORMAT
+        if compression_level is None:
+            compression_level = (
+                settings.BACKUP_ZSTD_LEVEL
+                if self.archive_format == ARCHIVE_FORMAT_ZSTD
+                else settings.BACKUP_GZIP_LEVEL
+            )
+        self.compression_level = compression_level
+        self.compression_threads = (
+            compression_threads or settings.BACKUP_COMPRESSION_THREADS or None
+        )
+        # Chunks are zlib-compressed individually, whatever the archive format.
+        self._chunk_compression_level = settings.BACKUP_GZIP_LEVEL
+
+    @property
+    def incremental(self) -> bool:
+        return self.backup_mode == "incremental"
+
+    @property
+    def archive_suffix(self) -> str:
+        """File name suffix of backups written by this service."""
+        if self.incremental:
+            return MANIFEST_SUFFIX
+        return ARCHIVE_SUFFIXES[self.archive_format]
+
+    @property
+    def chunk_store(self) -> ChunkStore:
+        return get_chunk_store(self.backups_directory, self._chunk_compression_level)
+
+    def backup_size(self, backup_path: Path) -> int:
+        """Disk space taken by a backup: the archive, or the manifest plus
+        the chunk data it added to the store."""
+        size = backup_path.stat().st_size
+        if is_manifest(backup_path):
+            size += ChunkStore.load_manifest(backup_path).get("stored_size", 0)
+        return size
 
     async def create_backup_file(
         self,
@@ -39,7 +184,7 @@ class BackupFileService:
         backup_type: BackupType,
         progress_callback=None,
     ) -> str:
-        """Create the actual backup file (tar.gz).
+        """Create the actual backup archive file.
 
         Writes directly to the final path. Prefer
         :meth:`write_backup_file_to` (atomic-rename caller pattern) for
@@ -55,9 +200,7 @@ class BackupFileService:
             backup_filename = self._generate_backup_filename(server.id, backup_id)
             backup_path = self.backups_directory / backup_filename
 
-            await self._create_tar_backup_async(
-                server_dir, backup_path, progress_callback
-            )
+            await self._write_backup(server, server_dir, backup_path, progress_callback)
 
             logger.info(f"Created backup file: {backup_filename}")
             return backup_filename
@@ -70,15 +213,17 @@ class BackupFileService:
         server: Server,
         target_path: Path,
         progress_callback=None,
-    ) -> None:
-        """Write a backup tar.gz to an explicit target path.
+    ) -> str:
+        """Write a backup archive to an explicit target path.
 
-        Caller-controlled destination (typically a `.pending-*.tar.gz`
+        Caller-controlled destination (typically a `.pending-*` archive
         temp file). Use this with `os.replace()` to implement the
         atomic-rename pattern: write to temp → DB commit → rename
         final. On DB-commit failure the caller deletes the temp file,
         guaranteeing no orphan archive ends up in the canonical
         backups directory.
+
+        Returns the hex SHA-256 of the written file.
         """
         server_dir = Path(server.directory_path)
         if not server_dir.exists():
@@ -87,206 +232,322 @@ class BackupFileService:
             )
 
         try:
-            await self._create_tar_backup_async(
-                server_dir, target_path, progress_callback
+            return await self._write_backup(
+                server, server_dir, target_path, progress_callback
             )
         except Exception as e:
             handle_file_error("create backup", str(server_dir), e)
 
-    def _generate_backup_filename(self, server_id: int, backup_id: int) -> str:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"backup_{server_id}_{backup_id}_{timestamp}.tar.gz"
-
-    async def _create_tar_backup_async(
-        self, server_dir: Path, backup_path: Path, progress_callback=None
-    ) -> None:
-        await self._create_tar_backup_chunked(server_dir, backup_path, progress_callback)
-
-    async def _calculate_directory_size_async(self, directory: Path) -> tuple[int, int]:
-        """Calculate directory size and file count without blocking event loop."""
-        total_files = 0
-        total_size = 0
+    async def _write_backup(
+        self, server: Server, server_dir: Path, target_path: Path, progress_callback
+    ) -> str:
+        """Archive (or snapshot) ``server_dir`` in one walk of the tree.
 
-        def get_file_info(path: Path) -> tuple[int, int]:
-            try:
-                if path.is_file():
-                    return 1, path.stat().st_size
-                return 0, 0
-            except OSError:
-                return 0, 0
-
-        paths = list(directory.rglob("*"))
-        batch_size = 100
-        for i in range(0, len(paths), batch_size):
-            batch = paths[i : i + batch_size]
-            loop = asyncio.get_event_loop()
-            tasks = [loop.run_in_executor(None, get_file_info, path) for path in batch]
-            results = await asyncio.gather(*tasks)
-            for file_count, file_size in results:
-                total_files += file_count
-                total_size += file_size
-            await asyncio.sleep(0)
-
-        return total_files, total_size
-
-    async def _create_tar_backup_chunked(
-        self, server_dir: Path, backup_path: Path, progress_callback=None
-    ) -> None:
+        There is no sizing pre-scan: progress totals are estimated from
+        the previous backup of the same directory and never reported
+        below what has actually been processed. Returns the SHA-256 of
+        the archive, hashed as it is written (for a manifest, of the
+        manifest file; its chunks are addressed by their own digests).
+        """
         from app.core.concurrency import get_semaphores
 
-        async with get_semaphores().file_io:
-            total_files, total_size = await self._calculate_directory_size_async(
-                server_dir
-            )
-            logger.info(
-                f"Starting backup of {total_files} files "
-                f"({total_size / (1024 * 1024):.1f}MB) from {server_dir}"
-            )
+        estimated_files, estimated_size = _walk_estimates.get(str(server_dir), (0, 0))
+        processed = [0, 0]
 
+        def report(files: int, size: int) -> None:
+            processed[:] = (files, size)
             if progress_callback:
-                progress_callback(0, total_files, 0, total_size)
-
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                self._create_tar_archive_sync,
-                server_dir,
-                backup_path,
-                total_files,
-                total_size,
-                progress_callback,
-            )
+                progress_callback(
+                    files, max(files, estimated_files), size, max(size, estimated_size)
+                )
 
+        async with get_semaphores().file_io:
             logger.info(
-                f"Backup creation completed for {total_files} files "
-                f"({total_size / (1024 * 1024):.1f}MB)"
+                f"Starting backup of {server_dir} (estimated {estimated_files} files, "
+                f"{estimated_size / (1024 * 1024):.1f}MB)"
             )
+            report(0, 0)
+            started = time.monotonic()
+            if self.incremental:
+                store = self.chunk_store
+                previous = await asyncio.to_thread(store.latest_manifest, server.id)
+                await asyncio.to_thread(
+                    store.snapshot, server_dir, target_path, previous, report
+                )
+                checksum = await asyncio.to_thread(file_checksum, target_path)
+            else:
+                checksum = await asyncio.to_thread(
+                    self._create_tar_archive_sync, server_dir, target_path, report
+                )
+            elapsed = time.monotonic() - started
+
+        global _last_archive_stats
+        files, size = processed
+        _walk_estimates[str(server_dir)] = (files, size)
+        _last_archive_stats = ArchiveStats(files=files, bytes=size, seconds=elapsed)
+        logger.info(
+            f"Backup creation completed for {files} files "
+            f"({size / (1024 * 1024):.1f}MB) in {elapsed:.1f}s "
+            f"({_last_archive_stats.files_per_second:.0f} files/s, "
+            f"{_last_archive_stats.bytes_per_second / (1024 * 1024):.1f}MB/s)"
+        )
+        return checksum
+
+    def _generate_backup_filename(self, server_id: int, backup_id: int) -> str:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"backup_{server_id}_{backup_id}_{timestamp}{self.archive_suffix}"
 
     def _create_tar_archive_sync(
         self,
         server_dir: Path,
         backup_path: Path,
-        total_files: int,
-        total_size: int,
-        progress_callback=None,
-    ) -> None:
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> str:
         processed_files = 0
         processed_size = 0
-        with tarfile.open(backup_path, "w:gz") as tar:
-            for item in server_dir.rglob("*"):
-                if item.is_file():
-                    arcname = item.relative_to(server_dir)
-                    file_size = item.stat().st_size
-                    try:
-                        if file_size > 100 * 1024 * 1024:
-                            logger.debug(
-                                f"Processing large file: {item} "
-                                f"({file_size / (1024 * 1024):.1f}MB)"
-                            )
-                            self._add_large_file_to_tar_chunked(tar, item, arcname)
-                        else:
-                            tar.add(item, arcname=arcname)
-                        processed_files += 1
-                        processed_size += file_size
-                        if processed_files % 100 == 0 or file_size > 50 * 1024 * 1024:
-                            if progress_callback:
-                                progress_callback(
-                                    processed_files,
-                                    total_files,
-                                    processed_size,
-                                    total_size,
-                                )
-                    except Exception as e:
-                        logger.warning(f"Failed to add file {item} to backup: {e}")
-                        continue
-        if progress_callback:
-            progress_callback(processed_files, total_files, processed_size, total_size)
-
-    def _add_large_file_to_tar_chunked(
-        self, tar: tarfile.TarFile, file_path: Path, arcname
+        hasher = new_hasher()
+        with open_archive_writer(
+            backup_path,
+            self.archive_format,
+            level=self.compression_level,
+            threads=self.compression_threads,
+            hasher=hasher,
+        ) as tar:
+            for walked in walk_files(
+                server_dir, follow_symlinks=False, on_error=_log_walk_error
+            ):
+                file_size = walked.stat.st_size
+                try:
+                    self._add_file_to_tar(tar, walked)
+                except Exception as e:
+                    logger.warning(f"Failed to add file {walked.path} to backup: {e}")
+                    continue
+                processed_files += 1
+                processed_size += file_size
+                if progress and (
+                    processed_files % 100 == 0 or file_size > 50 * 1024 * 1024
+                ):
+                    progress(processed_files, processed_size)
+        if progress:
+            progress(processed_files, processed_size)
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _add_file_to_tar(tar: tarfile.TarFile, walked: WalkedFile) -> None:
+        """Add a walked file using its cached ``lstat`` result.
+
+        Unlike ``TarFile.add`` this does not stat the file again or look
+        up its owner per file; the content is streamed in ``tarfile``'s
+        copy-buffer sized pieces, so large files need no special casing.
+        """
+        st = walked.stat
+        if stat.S_ISLNK(st.st_mode):
+            tar.add(walked.path, arcname=walked.relative_path)  # keep the link
+            return
+        info = tarfile.TarInfo(walked.relative_path)
+        info.size = st.st_size
+        info.mtime = int(st.st_mtime)
+        info.mode = stat.S_IMODE(st.st_mode)
+        info.uid = st.st_uid
+        info.gid = st.st_gid
+        info.uname = _user_name(st.st_uid)
+        info.gname = _group_name(st.st_gid)
+        with open(walked.path, "rb") as source_file:
+            tar.addfile(info, source_file)
+
+    async def restore_backup_file(
+        self,
+        backup: Backup,
+        target_server: Server,
+        paths: Optional[Sequence[str]] = None,
     ) -> None:
-        try:
-            tarinfo = tar.gettarinfo(file_path, arcname)
-            tar.addfile(tarinfo)
-            chunk_size = 64 * 1024
-            bytes_written = 0
-            with open(file_path, "rb") as source_file:
-                while bytes_written < tarinfo.size:
-                    remaining = tarinfo.size - bytes_written
-                    chunk = source_file.read(min(chunk_size, remaining))
-                    if not chunk:
-                        break
-                    tar.fileobj.write(chunk)
-                    bytes_written += len(chunk)
-            blocks_written = (tarinfo.size + 511) // 512
-            padding_needed = (blocks_written * 512) - tarinfo.size
-            if padding_needed > 0:
-                tar.fileobj.write(b"\0" * padding_needed)
-        except Exception as e:
-            logger.warning(f"Failed to add large file {file_path} to backup: {e}")
-            tar.add(file_path, arcname=arcname)
-
-    async def restore_backup_file(self, backup: Backup, target_server: Server) -> None:
+        """Restore ``backup`` into the server directory via a staging tree.
+
+        The archive (or manifest) is extracted beside the server directory
+        and then renamed into place, either as a whole or, with ``paths``,
+        one selected subtree at a time. The replaced data is deleted in
+        the background. Progress is published as `RestoreProgressEvent`s.
+        A recorded ``backup.checksum`` is verified while the archive is
+        read; a mismatch fails the restore before anything is swapped.
+        """
         from app.core.concurrency import get_semaphores
 
+        loop = asyncio.get_running_loop()
+        selected = list(paths) if paths is not None else None
+        checksum = getattr(backup, "checksum", None)
+
+        def publish(phase: str, files: int = 0, size: int = 0, error=None) -> None:
+            get_event_bus().publish(
+                RESTORE_PROGRESS_TOPIC,
+                RestoreProgressEvent(
+                    server_id=target_server.id,
+                    backup_id=backup.id,
+                    phase=phase,
+                    files=files,
+                    bytes=size,
+                    paths=selected,
+                    error=error,
+                ),
+            )
+
+        def report(files: int, size: int) -> None:
+            # Called from the extraction thread.
+            loop.call_soon_threadsafe(publish, "extracting", files, size)
+
         async with get_semaphores().file_io:
+            backup_path = Path(backup.file_path)
+            target_dir = Path(target_server.directory_path)
+            staging_dir = new_staging_directory(target_dir)
+            _active_restore_directories.add(staging_dir)
             try:
-                backup_path = Path(backup.file_path)
                 if not backup_path.exists():
                     raise FileOperationException(
                         "restore",
                         str(backup_path),
                         "Backup file not found",
                     )
+                publish("started")
+                self._discard_in_background(
+                    [
+                        path
+                        for path in stale_restore_directories(target_dir)
+                        if path not in _active_restore_directories
+                    ]
+                )
 
-                target_dir = Path(target_server.directory_path)
-                self._backup_current_server_state(target_dir)
-                self._extract_backup_to_directory(backup_path, target_dir)
-
-                logger.info(f"Extracted backup to: {target_dir}")
+                files, size = await asyncio.to_thread(
+                    self._stage_restore,
+                    backup_path,
+                    staging_dir,
+                    selected,
+                    report,
+                    checksum,
+                )
+                publish("swapping", files, size)
+                replaced = swap_into_place(staging_dir, target_dir, selected)
+                self._discard_in_background(replaced)
+                publish("completed", files, size)
+                logger.info(f"Restored {files} files from {backup_path} to {target_dir}")
             except Exception as e:
+                publish("failed", error=str(e))
+                if staging_dir.exists():
+                    self._discard_in_background([staging_dir])
                 handle_file_error("restore backup", str(backup_path), e)
+            finally:
+                _active_restore_directories.discard(staging_dir)
 
-    def _backup_current_server_state(self, target_dir: Path) -> None:
-        if target_dir.exists():
-            backup_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            temp_backup_dir = (
-                target_dir.parent / f"{target_dir.name}_backup_{backup_timestamp}"
+    def _stage_restore(
+        self,
+        backup_path: Path,
+        staging_dir: Path,
+        paths: Optional[Sequence[str]],
+        progress: Callable[[int, int], None],
+        checksum: Optional[str] = None,
+    ) -> Tuple[int, int]:
+        if not is_manifest(backup_path):
+            return self._extract_backup_to_directory(
+                backup_path,
+                staging_dir,
+                paths=paths,
+                progress=progress,
+                checksum=checksum,
             )
-            shutil.move(str(target_dir), str(temp_backup_dir))
-            logger.info(f"Created temporary backup of current state: {temp_backup_dir}")
-
-    def _extract_backup_to_directory(self, backup_path: Path, target_dir: Path) -> None:
-        target_dir.mkdir(parents=True, exist_ok=True)
-        with tarfile.open(backup_path, "r:gz") as tar:
-            members = tar.getmembers()
-            total_members = len(members)
-            processed = 0
-            logger.info(
-                f"Starting secure extraction of {total_members} files to {target_dir}"
+        if checksum is not None:
+            # Chunks verify themselves against their digests on read.
+            actual = file_checksum(backup_path)
+            if actual != checksum:
+                raise ChecksumMismatchError(str(backup_path), checksum, actual)
+        totals = [0, 0]
+
+        def record(files: int, size: int) -> None:
+            totals[:] = [files, size]
+            report(files, size)
+
+        report = throttled(progress)
+        self.chunk_store.restore(
+            backup_path,
+            staging_dir,
+            include=lambda path: path_selected(path, paths),
+            progress=record,
+        )
+        return totals[0], totals[1]
+
+    @staticmethod
+    def _discard_in_background(paths: Sequence[Path]) -> None:
+        """Delete replaced or abandoned restore trees off the event loop."""
+        if not paths:
+            return
+        future = asyncio.get_running_loop().run_in_executor(
+            None, remove_trees, list(paths)
+        )
+        _background_removals.add(future)
+        future.add_done_callback(_background_removals.discard)
+
+    def _extract_backup_to_directory(
+        self,
+        backup_path: Path,
+        target_dir: Path,
+        paths: Optional[Sequence[str]] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+        checksum: Optional[str] = None,
+    ) -> Tuple[int, int]:
+        logger.info(f"Starting secure extraction of {backup_path} to {target_dir}")
+        try:
+            files, size = extract_archive(
+                backup_path,
+                target_dir,
+                paths=paths,
+                progress=progress,
+                checksum=checksum,
             )
-            for member in members:
-                try:
-                    TarExtractor.safe_extract_tar_member(tar, member, target_dir)
-                    processed += 1
-                except SecurityError as e:
-                    logger.error(
-                        f"Security violation during extraction of {member.name}: {e}"
-                    )
-                    raise FileOperationException(
-                        "extract_backup",
-                        str(backup_path),
-                        f"Security violation: {e}",
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to extract {member.name}: {e}")
-                    continue
-            logger.info(
-                f"Secure extraction completed: {processed}/{total_members} files extracted"
+        except SecurityError as e:
+            logger.error(f"Security violation during extraction of {backup_path}: {e}")
+            raise FileOperationException(
+                "extract_backup",
+                str(backup_path),
+                f"Security violation: {e}",
             )
+        logger.info(f"Secure extraction completed: {files} files extracted")
+        return files, size
+
+    async def materialize_archive(self, backup_path: Path) -> Path:
+        """Write a manifest backup out as a regular archive.
+
+        The archive is created under `.pending/` in `archive_format`; the
+        caller owns it and must delete it when done.
+        """
+        from app.core.concurrency import get_semaphores
+
+        pending_dir = self.backups_directory / ".pending"
+        pending_dir.mkdir(parents=True, exist_ok=True)
+        target = pending_dir / (
+            f".download-{uuid.uuid4().hex}{ARCHIVE_SUFFIXES[self.archive_format]}"
+        )
+        async with get_semaphores().file_io:
+            try:
+                await asyncio.to_thread(self._export_manifest_sync, backup_path, target)
+            except BaseException:
+                target.unlink(missing_ok=True)
+                raise
+        return target
+
+    def _export_manifest_sync(self, manifest_path: Path, target: Path) -> None:
+        with open_archive_writer(
+            target,
+            self.archive_format,
+            level=self.compression_level,
+            threads=self.compression_threads,
+        ) as tar:
+            self.chunk_store.export(manifest_path, tar)
 
     def delete_backup_file(self, backup_path: str) -> None:
         backup_file = Path(backup_path)
         if backup_file.exists():
+            if is_manifest(backup_file):
+                freed = self.chunk_store.discard(backup_file)
+                logger.info(
+                    f"Deleted backup manifest: {backup_file} ({freed} chunks freed)"
+                )
+                return
             backup_file.unlink()
             logger.info(f"Deleted backup file: {backup_file}")
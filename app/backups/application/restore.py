@@ -0,0 +1,316 @@
+"""Staged, atomic restore of backups into a server directory.
+
+A restore used to move the live server directory aside as
+``<name>_backup_<timestamp>`` (never cleaned up) and then extract the
+archive member by member straight into place, so a failed or interrupted
+restore left a half-written server behind. The pipeline here:
+
+1. extracts into a staging directory next to the server directory
+   (``.<name>.restore-<id>``), so it is on the same filesystem; members
+   of at least :data:`PARALLEL_WRITE_THRESHOLD` bytes (region files) are
+   written by a thread pool while the archive keeps decompressing, and
+   members over :data:`PARALLEL_WRITE_MAX_SIZE` are streamed to disk so
+   none is ever held in memory whole;
+2. swaps the staged tree into place with ``rename`` — the whole server
+   directory, or only the selected subtrees (``world``,
+   ``world/DIM-1``, ...) for a partial restore;
+3. leaves the replaced tree as ``.<name>.old-<id>`` for the caller to
+   delete in the background.
+
+Nothing in the server directory changes until extraction has succeeded.
+Progress is reported through a callback and published on the event bus
+as :class:`RestoreProgressEvent` under :data:`RESTORE_PROGRESS_TOPIC`.
+"""
+
+import logging
+import os
+import shutil
+import tarfile
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path, PurePosixPath
+from typing import Callable, Deque, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.archives import open_tar_archive
+from app.core.security import SecurityError, TarExtractor, _has_traversal_component
+
+logger = logging.getLogger(__name__)
+
+RESTORE_PROGRESS_TOPIC = "backup_restore"
+
+# Members at least this large are handed to the writer pool.
+PARALLEL_WRITE_THRESHOLD = 4 * 1024 * 1024
+# Members larger than this (whole worlds in one file, packed mods) are
+# streamed on the extracting thread instead of being read into memory.
+PARALLEL_WRITE_MAX_SIZE = 64 * 1024 * 1024
+# Upper bound on member data read ahead of the writers.
+MAX_PENDING_WRITE_BYTES = 64 * 1024 * 1024
+# Minimum spacing of progress callbacks.
+PROGRESS_INTERVAL_SECONDS = 0.5
+
+ProgressCallback = Callable[[int, int], None]
+
+
+@dataclass
+class RestoreProgressEvent:
+    """Progress of a restore, published under ``RESTORE_PROGRESS_TOPIC``."""
+
+    server_id: int
+    backup_id: int
+    # "started", "extracting", "swapping", "completed" or "failed"
+    phase: str
+    files: int = 0
+    bytes: int = 0
+    paths: Optional[List[str]] = None
+    error: Optional[str] = None
+    timestamp: datetime = field(default_factory=datetime.now)
+
+
+def normalize_restore_paths(paths: Optional[Iterable[str]]) -> Optional[List[str]]:
+    """Validate and canonicalise the subset of paths to restore.
+
+    Returns ``None`` for a full restore. Paths are relative to the server
+    directory; nested selections collapse into their parent.
+    """
+    if paths is None:
+        return None
+    normalized = []
+    for raw in paths:
+        path = PurePosixPath(raw.strip().replace("\\", "/"))
+        if path.is_absolute() or _has_traversal_component(str(path)):
+            raise SecurityError(f"Invalid restore path: {raw}")
+        text = str(path)
+        if text in ("", "."):
+            raise SecurityError(f"Invalid restore path: {raw!r}")
+        normalized.append(text)
+    if not normalized:
+        return None
+    selected: List[str] = []
+    for path in sorted(set(normalized)):
+        if not any(_is_within(path, parent) for parent in selected):
+            selected.append(path)
+    return selected
+
+
+def _is_within(path: str, parent: str) -> bool:
+    return path == parent or path.startswith(parent + "/")
+
+
+def path_selected(path: str, paths: Optional[Sequence[str]]) -> bool:
+    """Whether ``path`` falls inside the selection (``None`` selects all)."""
+    return paths is None or any(_is_within(path, p) for p in paths)
+
+
+def _member_path(name: str) -> str:
+    """Archive member name relative to the server root (``./`` stripped)."""
+    text = str(PurePosixPath(name)).lstrip("/")
+    return "" if text == "." else text
+
+
+def throttled(callback: ProgressCallback) -> ProgressCallback:
+    """Wrap ``callback`` so it runs at most every ``PROGRESS_INTERVAL_SECONDS``."""
+    last = [0.0]
+
+    def report(files: int, size: int) -> None:
+        now = time.monotonic()
+        if now - last[0] >= PROGRESS_INTERVAL_SECONDS:
+            last[0] = now
+            callback(files, size)
+
+    return report
+
+
+def _write_member(destination: Path, data: bytes, mode: int, mtime: float) -> None:
+    with open(destination, "wb") as f:
+        f.write(data)
+    _apply_metadata(destination, mode, mtime)
+
+
+def _apply_metadata(destination: Path, mode: int, mtime: float) -> None:
+    # Same sanitising as tarfile's "data" filter: no setuid/setgid/sticky,
+    # no group/other write, and the owner can always read and write.
+    os.chmod(destination, (mode & 0o755) | 0o600)
+    os.utime(destination, (mtime, mtime))
+
+
+class _Progress:
+    def __init__(self, callback: Optional[ProgressCallback]):
+        self._report = throttled(callback) if callback else None
+        self.files = 0
+        self.bytes = 0
+
+    def add(self, size: int) -> None:
+        self.files += 1
+        self.bytes += size
+        if self._report:
+            self._report(self.files, self.bytes)
+
+
+def extract_archive(
+    archive_path: Path,
+    target_dir: Path,
+    *,
+    paths: Optional[Sequence[str]] = None,
+    progress: Optional[ProgressCallback] = None,
+    threads: Optional[int] = None,
+    checksum: Optional[str] = None,
+) -> Tuple[int, int]:
+    """Extract a ``tar.gz`` / ``tar.zst`` backup into ``target_dir``.
+
+    Every member is validated with ``TarExtractor.validate_tar_member``;
+    a violation raises :class:`SecurityError`. Other per-member failures
+    are logged and the member skipped. With ``paths``, only members
+    inside those subtrees are extracted. With ``checksum``, the archive
+    is verified while it is read and a mismatch raises
+    :class:`ChecksumMismatchError` once the last member is out — before
+    anything is swapped into place. Returns ``(files, bytes)``.
+    """
+    target_dir.mkdir(parents=True, exist_ok=True)
+    counter = _Progress(progress)
+    pending: Deque[Tuple[Future, int, str]] = deque()
+    pending_bytes = 0
+    workers = threads or min(4, os.cpu_count() or 1)
+
+    def settle(future: Future, size: int, name: str) -> None:
+        try:
+            future.result()
+        except OSError as e:
+            logger.warning(f"Failed to extract {name}: {e}")
+            return
+        counter.add(size)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="restore") as pool:
+        try:
+            with open_tar_archive(archive_path, checksum) as tar:
+                # Archive order; works for forward-only (tar.zst) streams.
+                for member in tar:
+                    name = _member_path(member.name)
+                    if not name:
+                        continue
+                    if not path_selected(name, paths):
+                        continue
+                    TarExtractor.validate_tar_member(member, target_dir)
+                    destination = target_dir / name
+                    try:
+                        if member.isdir():
+                            destination.mkdir(parents=True, exist_ok=True)
+                            continue
+                        if not member.isfile():
+                            continue
+                        destination.parent.mkdir(parents=True, exist_ok=True)
+                        source = tar.extractfile(member)
+                        if not (
+                            PARALLEL_WRITE_THRESHOLD
+                            <= member.size
+                            <= PARALLEL_WRITE_MAX_SIZE
+                        ):
+                            with open(destination, "wb") as f:
+                                shutil.copyfileobj(source, f)
+                            _apply_metadata(destination, member.mode, member.mtime)
+                            counter.add(member.size)
+                            continue
+                        # Make room first, so the data read ahead of the
+                        # writers never exceeds MAX_PENDING_WRITE_BYTES.
+                        while (
+                            pending
+                            and pending_bytes + member.size > MAX_PENDING_WRITE_BYTES
+                        ):
+                            future, size, pending_name = pending.popleft()
+                            pending_bytes -= size
+                            settle(future, size, pending_name)
+                        data = source.read()
+                    except (OSError, tarfile.TarError) as e:
+                        logger.warning(f"Failed to extract {member.name}: {e}")
+                        continue
+
+                    # Decompression stays on this thread; the pool
+                    # overlaps the large writes with it.
+                    future = pool.submit(
+                        _write_member, destination, data, member.mode, member.mtime
+                    )
+                    pending.append((future, member.size, member.name))
+                    pending_bytes += member.size
+        finally:
+            while pending:
+                settle(*pending.popleft())
+    return counter.files, counter.bytes
+
+
+def new_staging_directory(target_dir: Path) -> Path:
+    """Return a fresh staging path beside ``target_dir`` (same filesystem)."""
+    return target_dir.parent / f".{target_dir.name}.restore-{uuid.uuid4().hex[:12]}"
+
+
+def swap_into_place(
+    staging_dir: Path, target_dir: Path, paths: Optional[Sequence[str]] = None
+) -> List[Path]:
+    """Move the staged tree into ``target_dir`` with renames.
+
+    Without ``paths`` the whole directory is replaced; otherwise only the
+    selected subtrees are, each with one rename. Every selected path must
+    exist in the staging directory. If a rename fails, the ones already
+    done are undone before the error propagates. Returns the directories
+    holding the replaced data, which the caller should delete.
+    """
+    trash_dir = target_dir.parent / f".{target_dir.name}.old-{uuid.uuid4().hex[:12]}"
+
+    if paths is None:
+        if not target_dir.exists():
+            os.rename(staging_dir, target_dir)
+            return []
+        os.rename(target_dir, trash_dir)
+        try:
+            os.rename(staging_dir, target_dir)
+        except OSError:
+            os.rename(trash_dir, target_dir)
+            raise
+        return [trash_dir]
+
+    missing = [p for p in paths if not os.path.lexists(staging_dir / p)]
+    if missing:
+        raise FileNotFoundError(f"Not found in backup: {', '.join(missing)}")
+
+    target_dir.mkdir(parents=True, exist_ok=True)
+    # Renames done so far, undone in reverse if a later one fails: the
+    # trash directory must never end up holding the only copy of live data.
+    moved: List[Tuple[Path, Path]] = []
+    try:
+        for path in paths:
+            live = target_dir / path
+            if os.path.lexists(live):
+                (trash_dir / path).parent.mkdir(parents=True, exist_ok=True)
+                os.rename(live, trash_dir / path)
+                moved.append((live, trash_dir / path))
+            live.parent.mkdir(parents=True, exist_ok=True)
+            os.rename(staging_dir / path, live)
+            moved.append((staging_dir / path, live))
+    except OSError:
+        for source, destination in reversed(moved):
+            try:
+                os.rename(destination, source)
+            except OSError as e:
+                logger.critical(
+                    f"Could not roll back restore of {source}; "
+                    f"its data is at {destination}: {e}"
+                )
+        raise
+    # What is left of the staging tree is unselected data.
+    return [trash_dir, staging_dir] if trash_dir.exists() else [staging_dir]
+
+
+def stale_restore_directories(target_dir: Path) -> List[Path]:
+    """Staging and replaced trees left beside ``target_dir`` by earlier runs."""
+    parent = target_dir.parent
+    if not parent.is_dir():
+        return []
+    prefixes = (f".{target_dir.name}.restore-", f".{target_dir.name}.old-")
+    return [p for p in parent.iterdir() if p.name.startswith(prefixes) and p.is_dir()]
+
+
+def remove_trees(paths: Iterable[Path]) -> None:
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
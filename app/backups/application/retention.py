@@ -0,0 +1,204 @@
+"""Tiered (grandfather-father-son) retention for scheduled backups.
+
+A schedule either keeps a flat `max_backups` newest scheduled backups
+or, when any of its `keep_hourly` / `keep_daily` / `keep_weekly` /
+`keep_monthly` tiers is set, the newest backup in each of the last N
+hours, days, ISO weeks and months (UTC). A backup kept by any tier is
+kept. Manual and uploaded backups are never pruned.
+
+`BackupRetentionService.prune()` computes the prune set for every
+server from one query ordered by `(server_id, created_at)` — a single
+walk of `ix_backups_server_id_created_at` — and deletes in batches:
+files first (on a worker thread, like `delete_backup`), then their rows
+with one `DELETE ... WHERE id IN (...)` per batch.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import groupby
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from app.backups.domain.entities import (
+    BackupScheduleEntity,
+    PruneReport,
+    RetentionCandidate,
+)
+from app.backups.domain.ports import BackupsUnitOfWork
+
+logger = logging.getLogger(__name__)
+
+_DELETE_BATCH_SIZE = 500
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes (as returned by SQLite) as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _hour(value: datetime) -> Hashable:
+    return (value.year, value.month, value.day, value.hour)
+
+
+def _day(value: datetime) -> Hashable:
+    return value.date()
+
+
+def _week(value: datetime) -> Hashable:
+    year, week, _ = value.isocalendar()
+    return (year, week)
+
+
+def _month(value: datetime) -> Hashable:
+    return (value.year, value.month)
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """How many backups a server keeps, flat (`keep_last`) or per tier."""
+
+    keep_last: int = 0
+    hourly: int = 0
+    daily: int = 0
+    weekly: int = 0
+    monthly: int = 0
+
+    @classmethod
+    def for_schedule(cls, schedule: BackupScheduleEntity) -> "RetentionPolicy":
+        tiers = (
+            schedule.keep_hourly,
+            schedule.keep_daily,
+            schedule.keep_weekly,
+            schedule.keep_monthly,
+        )
+        if any(tiers):
+            return cls(
+                hourly=schedule.keep_hourly,
+                daily=schedule.keep_daily,
+                weekly=schedule.keep_weekly,
+                monthly=schedule.keep_monthly,
+            )
+        return cls(keep_last=schedule.max_backups)
+
+    def tiers(self) -> Tuple[Tuple[int, Callable[[datetime], Hashable]], ...]:
+        return (
+            (self.hourly, _hour),
+            (self.daily, _day),
+            (self.weekly, _week),
+            (self.monthly, _month),
+        )
+
+
+def select_prune_set(
+    candidates: Sequence[RetentionCandidate], policy: RetentionPolicy
+) -> List[RetentionCandidate]:
+    """Return the candidates ``policy`` does not keep.
+
+    ``candidates`` are one server's backups, newest first; the newest
+    backup of each period is the one a tier keeps.
+    """
+    keep = {c.id for c in candidates[: policy.keep_last]}
+    for count, period in policy.tiers():
+        if count <= 0:
+            continue
+        seen = set()
+        for candidate in candidates:
+            key = period(_as_utc(candidate.created_at))
+            if key in seen:
+                continue
+            seen.add(key)
+            keep.add(candidate.id)
+            if len(seen) >= count:
+                break
+    return [c for c in candidates if c.id not in keep]
+
+
+class BackupRetentionService:
+    """Compute and apply retention for all (or some) scheduled servers.
+
+    `delete_file` removes one backup's file (normally
+    `BackupFileService.delete_backup_file`, which also releases the
+    chunks of incremental manifests); it runs on a worker thread.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], BackupsUnitOfWork],
+        delete_file: Callable[[str], None],
+    ):
+        self._uow_factory = uow_factory
+        self._delete_file = delete_file
+
+    async def plan(
+        self, server_ids: Optional[Sequence[int]] = None
+    ) -> Dict[int, List[RetentionCandidate]]:
+        """Prune set per server, without deleting anything."""
+        async with self._uow_factory() as uow:
+            schedules = await uow.schedules.list()
+            candidates = await uow.backups.list_retention_candidates(server_ids)
+
+        policies = {
+            s.server_id: RetentionPolicy.for_schedule(s)
+            for s in schedules
+            if server_ids is None or s.server_id in server_ids
+        }
+        plan: Dict[int, List[RetentionCandidate]] = {}
+        for server_id, rows in groupby(candidates, key=lambda c: c.server_id):
+            policy = policies.get(server_id)
+            if policy is None:
+                continue
+            prune = select_prune_set(list(rows), policy)
+            if prune:
+                plan[server_id] = prune
+        return plan
+
+    async def prune(self, server_ids: Optional[Sequence[int]] = None) -> PruneReport:
+        """Delete everything outside each schedule's retention policy."""
+        plan = await self.plan(server_ids)
+        doomed = [c for rows in plan.values() for c in rows]
+
+        deleted = 0
+        reclaimed = 0
+        failed = 0
+        for start in range(0, len(doomed), _DELETE_BATCH_SIZE):
+            batch = doomed[start : start + _DELETE_BATCH_SIZE]
+            removed = await asyncio.to_thread(self._delete_files, batch)
+            failed += len(batch) - len(removed)
+            if not removed:
+                continue
+            async with self._uow_factory() as uow:
+                deleted += await uow.backups.delete_many(c.id for c in removed)
+                await uow.commit()
+            reclaimed += sum(c.file_size for c in removed)
+
+        report = PruneReport(
+            backups_deleted=deleted,
+            bytes_reclaimed=reclaimed,
+            servers=len(plan),
+            failed=failed,
+        )
+        if doomed:
+            logger.info(
+                f"Retention pruned {deleted} backup(s) across {len(plan)} server(s), "
+                f"reclaiming {reclaimed / (1024 * 1024):.1f}MB ({failed} failed)"
+            )
+        return report
+
+    def _delete_files(
+        self, batch: Sequence[RetentionCandidate]
+    ) -> List[RetentionCandidate]:
+        removed = []
+        for candidate in batch:
+            try:
+                self._delete_file(candidate.file_path)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to delete file of backup {candidate.id} "
+                    f"({candidate.file_path}): {e}"
+                )
+                continue
+            removed.append(candidate)
+        return removed
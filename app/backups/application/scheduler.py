@@ -1,9 +1,17 @@
 """Backup scheduler service (application layer).
 
-Maintains the persistent backup-schedule rows and surfaces them to the
-router. The actual scheduler tick is a no-op stub today (`TODO: Implement
-actual backup execution logic` in the legacy code); the tick loop and
-backup-execution wiring will be added in a follow-up.
+Maintains the persistent backup-schedule rows and runs them. Enabled
+schedules sit in a min-heap keyed on their due time; the loop sleeps
+until the head of the heap is due (or until a schedule change wakes it),
+re-reads the due rows via `get_due_schedules()`, and starts one backup
+task per server. Backups go through `BackupService.create_scheduled_backup`
+and so share the process-wide `backup` semaphore with manual backups.
+
+Each server's due time is offset by a fixed per-server jitter
+(`BACKUP_SCHEDULE_JITTER_SECONDS`) so schedules created together do not
+all fire on the same second. The jitter only affects when the loop
+fires; `next_backup_at` in the database stays on the nominal interval
+grid, so it does not drift from run to run.
 
 Cache invalidation (D-8): the per-server schedule cache is invalidated
 after every successful UoW commit that touches the corresponding
@@ -12,17 +20,27 @@ SELECT.
 """
 
 import asyncio
+import heapq
 import logging
+import random
 import time
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
+from app.backups.application.chunk_store import (
+    MANIFEST_SUFFIX,
+    get_chunk_store,
+    is_manifest,
+)
+from app.backups.application.retention import BackupRetentionService
 from app.backups.domain.entities import (
     AppendScheduleLogCommand,
     BackupScheduleEntity,
     BackupScheduleLogEntity,
     CreateBackupScheduleCommand,
+    PruneReport,
     UpdateBackupScheduleCommand,
 )
 from app.backups.domain.exceptions import (
@@ -31,19 +49,52 @@ from app.backups.domain.exceptions import (
 )
 from app.backups.domain.ports import BackupsUnitOfWork
 from app.backups.models import ScheduleAction
+from app.core.archives import ARCHIVE_SUFFIXES
 from app.servers.application.minecraft_server import minecraft_server_manager
 from app.servers.domain.ports import ServerReadPort
 from app.servers.models import ServerStatus
 
+if TYPE_CHECKING:
+    from app.backups.application.service import BackupService
+
 ServerReadPortFactory = Callable[[], ServerReadPort]
+BackupServiceFactory = Callable[[], "BackupService"]
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on one sleep of the scheduler loop. Schedule changes made
+# through this service wake the loop immediately; the periodic resync
+# picks up rows changed behind its back (another process, manual SQL).
+_RESYNC_INTERVAL_SECONDS = 3600
+
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes (as returned by SQLite) as UTC."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _schedule_config(schedule: BackupScheduleEntity) -> Dict[str, Any]:
+    """Configuration snapshot recorded in schedule log rows.
+
+    Retention tiers are only included when set, so flat-count schedules
+    log the same shape as before tiers existed.
+    """
+    config: Dict[str, Any] = {
+        "interval_hours": schedule.interval_hours,
+        "max_backups": schedule.max_backups,
+        "enabled": schedule.enabled,
+        "only_when_running": schedule.only_when_running,
+    }
+    for tier in ("keep_hourly", "keep_daily", "keep_weekly", "keep_monthly"):
+        if getattr(schedule, tier):
+            config[tier] = getattr(schedule, tier)
+    return config
+
+
 class BackupSchedulerService:
     """Schedule CRUD + scheduler loop control.
 
@@ -51,6 +102,9 @@ class BackupSchedulerService:
     its own UoW bound to its own session) and a `clock` callable
     (D-12: deterministic time injection for tests). `server_read` is
     used for owner-validation prior to creating a schedule.
+    `backup_service_factory` builds the `BackupService` each scheduled
+    run uses; without it the loop does not execute backups. `retention`
+    prunes old scheduled backups after each run and on the cleanup tick.
     """
 
     def __init__(
@@ -62,15 +116,27 @@ class BackupSchedulerService:
         pending_retention_hours: Optional[int] = None,
         failed_retention_days: Optional[int] = None,
         cleanup_interval_seconds: Optional[int] = None,
+        backup_service_factory: Optional[BackupServiceFactory] = None,
+        jitter_seconds: Optional[int] = None,
+        retention: Optional[BackupRetentionService] = None,
     ):
         self._uow_factory = uow_factory
         self._server_read_factory = server_read_factory
+        self._backup_service_factory = backup_service_factory
         self._clock = clock
         self._running = False
         self._task: Optional[asyncio.Task] = None
         self._cleanup_task: Optional[asyncio.Task] = None
         self._schedule_cache: Dict[int, BackupScheduleEntity] = {}
 
+        # Due-time queue: heap of (fire_at, server_id). `_queued` holds the
+        # live fire time per server; heap entries that no longer match it
+        # are stale and skipped when they reach the top.
+        self._queue: List[Tuple[datetime, int]] = []
+        self._queued: Dict[int, datetime] = {}
+        self._in_flight: Dict[int, asyncio.Task] = {}
+        self._wakeup = asyncio.Event()
+
         # Sweep configuration for `.pending/` and `.failed/` (Issue #284).
         # Defaults come from `app.core.config.settings` but each value can
         # be overridden by the constructor for tests / wiring flexibility.
@@ -92,6 +158,22 @@ class BackupSchedulerService:
             if cleanup_interval_seconds is not None
             else _settings.BACKUPS_CLEANUP_INTERVAL_SECONDS
         )
+        # Chunks are zlib-compressed at the archive gzip level, as in
+        # `BackupFileService`.
+        self._chunk_compression_level: int = _settings.BACKUP_GZIP_LEVEL
+        self._jitter_seconds: int = (
+            jitter_seconds
+            if jitter_seconds is not None
+            else _settings.BACKUP_SCHEDULE_JITTER_SECONDS
+        )
+        if retention is None:
+            from app.backups.application.file_service import BackupFileService
+
+            retention = BackupRetentionService(
+                uow_factory=uow_factory,
+                delete_file=BackupFileService(self._backups_directory).delete_backup_file,
+            )
+        self._retention = retention
 
     # ===================
     # Schedule CRUD
@@ -105,6 +187,10 @@ class BackupSchedulerService:
         enabled: bool = True,
         only_when_running: bool = True,
         executed_by_user_id: Optional[int] = None,
+        keep_hourly: int = 0,
+        keep_daily: int = 0,
+        keep_weekly: int = 0,
+        keep_monthly: int = 0,
     ) -> BackupScheduleEntity:
         """Create a schedule + log row atomically in one UoW commit.
 
@@ -138,6 +224,10 @@ class BackupSchedulerService:
                     enabled=enabled,
                     only_when_running=only_when_running,
                     next_backup_at=next_backup_at,
+                    keep_hourly=keep_hourly,
+                    keep_daily=keep_daily,
+                    keep_weekly=keep_weekly,
+                    keep_monthly=keep_monthly,
                 )
             )
 
@@ -146,18 +236,14 @@ class BackupSchedulerService:
                     server_id=server_id,
                     action=ScheduleAction.created,
                     reason="Schedule created",
-                    new_config={
-                        "interval_hours": interval_hours,
-                        "max_backups": max_backups,
-                        "enabled": enabled,
-                        "only_when_running": only_when_running,
-                    },
+                    new_config=_schedule_config(entity),
                     executed_by_user_id=executed_by_user_id,
                 )
             )
             await uow.commit()
 
         self._schedule_cache[server_id] = entity
+        self._enqueue(entity)
         return entity
 
     async def update_schedule(
@@ -168,6 +254,10 @@ class BackupSchedulerService:
         enabled: Optional[bool] = None,
         only_when_running: Optional[bool] = None,
         executed_by_user_id: Optional[int] = None,
+        keep_hourly: Optional[int] = None,
+        keep_daily: Optional[int] = None,
+        keep_weekly: Optional[int] = None,
+        keep_monthly: Optional[int] = None,
     ) -> BackupScheduleEntity:
         uow = self._uow_factory()
         async with uow:
@@ -177,18 +267,17 @@ class BackupSchedulerService:
                     f"No backup schedule found for server {server_id}"
                 )
 
-            old_config = {
-                "interval_hours": existing.interval_hours,
-                "max_backups": existing.max_backups,
-                "enabled": existing.enabled,
-                "only_when_running": existing.only_when_running,
-            }
+            old_config = _schedule_config(existing)
 
             command_kwargs = {
                 "interval_hours": interval_hours,
                 "max_backups": max_backups,
                 "enabled": enabled,
                 "only_when_running": only_when_running,
+                "keep_hourly": keep_hourly,
+                "keep_daily": keep_daily,
+                "keep_weekly": keep_weekly,
+                "keep_monthly": keep_monthly,
             }
 
             # Recompute `next_backup_at` when interval changes
@@ -202,12 +291,7 @@ class BackupSchedulerService:
             )
             assert updated is not None  # find_by_server succeeded just above
 
-            new_config = {
-                "interval_hours": updated.interval_hours,
-                "max_backups": updated.max_backups,
-                "enabled": updated.enabled,
-                "only_when_running": updated.only_when_running,
-            }
+            new_config = _schedule_config(updated)
 
             await uow.schedules.append_log(
                 AppendScheduleLogCommand(
@@ -222,6 +306,7 @@ class BackupSchedulerService:
             await uow.commit()
 
         self._schedule_cache[server_id] = updated
+        self._enqueue(updated)
         return updated
 
     async def delete_schedule(
@@ -235,12 +320,7 @@ class BackupSchedulerService:
             if existing is None:
                 return False
 
-            old_config = {
-                "interval_hours": existing.interval_hours,
-                "max_backups": existing.max_backups,
-                "enabled": existing.enabled,
-                "only_when_running": existing.only_when_running,
-            }
+            old_config = _schedule_config(existing)
 
             await uow.schedules.delete_by_server(server_id)
             await uow.schedules.append_log(
@@ -256,6 +336,7 @@ class BackupSchedulerService:
 
         # Invalidate cache
         self._schedule_cache.pop(server_id, None)
+        self._dequeue(server_id)
         return True
 
     async def get_schedule(self, server_id: int) -> Optional[BackupScheduleEntity]:
@@ -294,7 +375,7 @@ class BackupSchedulerService:
             )
 
     # ===================
-    # Execution decision (kept for unit-test coverage)
+    # Execution decision
     # ===================
 
     async def _should_execute_backup(
@@ -303,7 +384,7 @@ class BackupSchedulerService:
         if not schedule.enabled:
             return False, "Schedule is disabled"
         now = self._clock()
-        if schedule.next_backup_at and now < schedule.next_backup_at:
+        if schedule.next_backup_at and now < _as_utc(schedule.next_backup_at):
             return False, f"Not yet time (next: {schedule.next_backup_at})"
         if schedule.only_when_running:
             try:
@@ -357,18 +438,127 @@ class BackupSchedulerService:
                 except asyncio.CancelledError:
                     pass
                 setattr(self, task_attr, None)
+        in_flight = list(self._in_flight.values())
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+        self._in_flight.clear()
+        self._queue.clear()
+        self._queued.clear()
         self._schedule_cache.clear()
 
+    # ===================
+    # Due-time queue
+    # ===================
+
+    def _jitter(self, server_id: int) -> timedelta:
+        """Fixed per-server offset in `[0, jitter_seconds]`."""
+        if self._jitter_seconds <= 0:
+            return timedelta(0)
+        return timedelta(
+            seconds=random.Random(server_id).uniform(0, self._jitter_seconds)
+        )
+
+    def _enqueue(self, schedule: BackupScheduleEntity) -> None:
+        """(Re)queue a schedule at its jittered due time and wake the loop."""
+        server_id = schedule.server_id
+        if not schedule.enabled:
+            self._dequeue(server_id)
+            return
+        if server_id in self._in_flight:
+            # The running task requeues the schedule when it finishes.
+            return
+        nominal = (
+            _as_utc(schedule.next_backup_at)
+            if schedule.next_backup_at is not None
+            else self._clock()
+        )
+        fire_at = nominal + self._jitter(server_id)
+        self._queued[server_id] = fire_at
+        heapq.heappush(self._queue, (fire_at, server_id))
+        self._wakeup.set()
+
+    def _dequeue(self, server_id: int) -> None:
+        if self._queued.pop(server_id, None) is not None:
+            self._wakeup.set()
+
+    def _peek_next(self) -> Optional[datetime]:
+        """Return the earliest live fire time, dropping stale heap entries."""
+        while self._queue:
+            fire_at, server_id = self._queue[0]
+            if self._queued.get(server_id) == fire_at:
+                return fire_at
+            heapq.heappop(self._queue)
+        return None
+
+    def _pop_due(self, now: datetime) -> List[int]:
+        due: List[int] = []
+        while True:
+            fire_at = self._peek_next()
+            if fire_at is None or fire_at > now:
+                return due
+            _, server_id = heapq.heappop(self._queue)
+            del self._queued[server_id]
+            due.append(server_id)
+
+    async def _refresh_queue(self) -> None:
+        """Rebuild the queue from the enabled schedules in the database."""
+        schedules = await self.list_schedules(enabled_only=True)
+        self._queue.clear()
+        self._queued.clear()
+        for schedule in schedules:
+            self._enqueue(schedule)
+
+    def _next_backup_after(
+        self, schedule: BackupScheduleEntity, now: datetime
+    ) -> datetime:
+        """Next slot on the schedule's interval grid strictly after `now`.
+
+        Missed slots (downtime, long backups) are skipped rather than
+        replayed back to back.
+        """
+        interval = timedelta(hours=schedule.interval_hours)
+        if schedule.next_backup_at is None:
+            return now + interval
+        next_at = _as_utc(schedule.next_backup_at)
+        if next_at <= now:
+            next_at += interval * ((now - next_at) // interval + 1)
+        return next_at
+
+    # ===================
+    # Scheduler loop
+    # ===================
+
     async def _scheduler_loop(self) -> None:
-        """No-op stub matching legacy behaviour.
+        """Sleep until the earliest schedule is due, then run what is due.
 
-        The legacy tick was a `pass`-with-sleep too; the actual
-        execution loop is tracked separately and will be added when
-        `BackupService.create_scheduled_backup` is plumbed through.
+        The wait ends early when a schedule is created, updated or
+        deleted through this service, and at least every
+        `_RESYNC_INTERVAL_SECONDS` to resynchronise with the database.
         """
+        if self._backup_service_factory is None:
+            logger.info("Backup scheduler has no backup service; not executing")
+            return
+        try:
+            await self._refresh_queue()
+        except Exception as e:
+            logger.error(f"Failed to load backup schedule queue: {e}")
         while self._running:
             try:
-                await asyncio.sleep(600)
+                self._wakeup.clear()
+                next_at = self._peek_next()
+                delay = (
+                    None if next_at is None else (next_at - self._clock()).total_seconds()
+                )
+                if delay is not None and delay <= 0:
+                    await self._dispatch_due()
+                    continue
+                timeout = min(delay or _RESYNC_INTERVAL_SECONDS, _RESYNC_INTERVAL_SECONDS)
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    if delay is None or delay > _RESYNC_INTERVAL_SECONDS:
+                        await self._refresh_queue()
             except asyncio.CancelledError:
                 logger.info("Backup scheduler loop cancelled")
                 break
@@ -376,11 +566,100 @@ class BackupSchedulerService:
                 logger.error(f"Unexpected error in backup scheduler loop: {e}")
                 await asyncio.sleep(60)
 
+    async def _dispatch_due(self) -> None:
+        """Start a backup task for every queued schedule that is due."""
+        server_ids = self._pop_due(self._clock())
+        if not server_ids:
+            return
+        # The queue only decides when to wake; the database decides what
+        # actually runs, so edits made elsewhere are honoured.
+        due = {s.server_id: s for s in await self.get_due_schedules()}
+        stale = False
+        for server_id in server_ids:
+            schedule = due.get(server_id)
+            if schedule is None:
+                stale = True
+                continue
+            self._in_flight[server_id] = asyncio.create_task(self._run_schedule(schedule))
+        if stale:
+            await self._refresh_queue()
+
+    async def _run_schedule(self, schedule: BackupScheduleEntity) -> None:
+        server_id = schedule.server_id
+        updated: Optional[BackupScheduleEntity] = None
+        try:
+            should_execute, reason = await self._should_execute_backup(schedule)
+            backup = None
+            if should_execute:
+                assert self._backup_service_factory is not None
+                service = self._backup_service_factory()
+                backup = await service.create_scheduled_backup(server_id)
+                if backup is None:
+                    reason = "Scheduled backup failed"
+                else:
+                    reason = f"Created backup {backup.id}"
+                    report = await self._retention.prune([server_id])
+                    pruned = report.backups_deleted
+                    if pruned:
+                        reason += f", pruned {pruned} old backup(s)"
+
+            now = self._clock()
+            uow = self._uow_factory()
+            async with uow:
+                updated = await uow.schedules.update(
+                    server_id,
+                    UpdateBackupScheduleCommand(
+                        last_backup_at=now if backup is not None else None,
+                        next_backup_at=self._next_backup_after(schedule, now),
+                    ),
+                )
+                if updated is not None:
+                    await uow.schedules.append_log(
+                        AppendScheduleLogCommand(
+                            server_id=server_id,
+                            action=(
+                                ScheduleAction.executed
+                                if backup is not None
+                                else ScheduleAction.skipped
+                            ),
+                            reason=reason,
+                        )
+                    )
+                    await uow.commit()
+            logger.info(f"Scheduled backup for server {server_id}: {reason}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Scheduled backup run failed for server {server_id}: {e}")
+        finally:
+            self._in_flight.pop(server_id, None)
+
+        if updated is not None:
+            self._schedule_cache[server_id] = updated
+            self._enqueue(updated)
+        else:
+            # Deleted meanwhile, or the bookkeeping failed. Requeue at the
+            # next slot so a failing database is not retried in a tight
+            # loop; if the row is gone, the next dispatch drops it.
+            self._schedule_cache.pop(server_id, None)
+            self._enqueue(
+                replace(
+                    schedule,
+                    next_backup_at=self._next_backup_after(schedule, self._clock()),
+                )
+            )
+
+    async def prune_retention(
+        self, server_ids: Optional[List[int]] = None
+    ) -> PruneReport:
+        """Apply every schedule's retention policy (see `retention.py`)."""
+        return await self._retention.prune(server_ids)
+
     async def _cleanup_loop(self) -> None:
         """Periodic sweep of `.pending/` and `.failed/` artifacts (Issue #284).
 
-        Runs `sweep_stale_pending_and_failed()` every
-        `cleanup_interval_seconds` (default 1h). Each sweep is
+        Runs `sweep_stale_pending_and_failed()` and a retention pass over
+        all schedules every `cleanup_interval_seconds` (default 1h). Each sweep is
         idempotent (mtime-based, query-then-skip), so a missed tick
         will catch up on the next run. Exceptions are logged and the
         loop continues — never block the scheduler on housekeeping.
@@ -397,13 +676,19 @@ class BackupSchedulerService:
                 self.sweep_stale_pending_and_failed()
             except Exception as e:
                 logger.warning(f"Periodic sweep of .pending/.failed failed: {e}")
+            try:
+                await self.prune_retention()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(f"Periodic retention pass failed: {e}")
 
     # ===================
     # `.pending/` / `.failed/` housekeeping (Issue #284)
     # ===================
 
     def sweep_stale_pending_and_failed(self) -> Dict[str, int]:
-        """Delete stale `*.tar.gz` files from `.pending/` and `.failed/`.
+        """Delete stale backup archives from `.pending/` and `.failed/`.
 
         Retention defaults (env-tunable via
         `BACKUPS_PENDING_RETENTION_HOURS` /
@@ -416,6 +701,10 @@ class BackupSchedulerService:
           but the retention window is long enough to catch human
           attention via monitoring).
 
+        Incremental-backup manifests (`*.manifest.json`) in either
+        directory are swept on the same schedule, through the chunk
+        store so the chunk references they hold are released.
+
         Idempotent: only files whose `mtime` is older than the
         retention cutoff are unlinked. Per-file failures (permission
         denied, etc.) are logged at WARNING and the sweep continues.
@@ -438,7 +727,7 @@ class BackupSchedulerService:
     def _sweep_directory(
         self, directory: Path, *, max_age_seconds: int, kind: str
     ) -> int:
-        """Unlink `*.tar.gz` files older than `max_age_seconds` in `directory`.
+        """Delete archives and manifests older than `max_age_seconds` in `directory`.
 
         Returns the number of files actually deleted. Missing
         directories are a no-op (the directory is lazily created by
@@ -448,7 +737,11 @@ class BackupSchedulerService:
         if not directory.exists():
             return 0
         try:
-            entries = list(directory.glob("*.tar.gz"))
+            entries = [
+                path
+                for suffix in (*ARCHIVE_SUFFIXES.values(), MANIFEST_SUFFIX)
+                for path in directory.glob(f"*{suffix}")
+            ]
         except OSError as e:
             logger.warning(f"Failed to enumerate {kind} sweep directory {directory}: {e}")
             return 0
@@ -467,7 +760,7 @@ class BackupSchedulerService:
                 # idempotency).
                 continue
             try:
-                path.unlink()
+                self._delete_artifact(path)
                 deleted += 1
                 age_hours = (now - mtime) / 3600
                 logger.info(
@@ -483,6 +776,20 @@ class BackupSchedulerService:
                 logger.warning(f"Failed to unlink stale {kind} artifact {path}: {e}")
         return deleted
 
+    def _delete_artifact(self, path: Path) -> None:
+        if is_manifest(path):
+            store = get_chunk_store(
+                self._backups_directory, self._chunk_compression_level
+            )
+            try:
+                store.discard(path)
+                return
+            except ValueError as e:
+                # Unreadable (e.g. truncated by a crash): there are no
+                # references to release, so just remove the file.
+                logger.warning(f"Removing unreadable backup manifest {path}: {e}")
+        path.unlink()
+
     # ===================
     # Properties
     # ===================
@@ -503,8 +810,6 @@ class BackupSchedulerService:
 # Legacy module-level proxy
 # ---------------------------------------------------------------------------
 
-from typing import Any  # noqa: E402
-
 from app.backups import backup_scheduler_instance  # noqa: E402
 
 
@@ -560,6 +865,9 @@ class _SchedulerProxy:
     def sweep_stale_pending_and_failed(self) -> Any:
         return backup_scheduler_instance.get().sweep_stale_pending_and_failed()
 
+    async def prune_retention(self, *args: Any, **kwargs: Any) -> Any:
+        return await backup_scheduler_instance.get().prune_retention(*args, **kwargs)
+
     # ---- Properties ----
 
     @property
@@ -0,0 +1,349 @@
+"""Background re-verification ("scrubbing") of stored backups.
+
+Every completed backup records the SHA-256 of its file when it is
+written (see `app.core.checksums`). `BackupScrubberService` re-reads the
+stored files periodically and compares, so bit-rot and truncated
+archives show up on a dashboard instead of halfway through a restore.
+Backups made before checksums were recorded get theirs filled in on the
+first pass. For incremental backups the recorded file is only the
+manifest, so the chunks it points at are re-hashed through the chunk
+store as well; a chunk shared by several backups is read once per pass.
+
+Scrubbing must not compete with running Minecraft servers for disk:
+
+* files are hashed on one dedicated thread whose I/O priority is lowered
+  to the idle class (Linux `ioprio_set`; best-effort elsewhere);
+* reads are throttled to `BACKUP_SCRUB_MAX_BYTES_PER_SECOND`;
+* the pages read are dropped from the page cache again.
+
+Results of the most recent pass are kept in `last_scrub_stats()` and
+projected into Prometheus gauges by `BusinessMetricsCollector`.
+"""
+
+import asyncio
+import ctypes
+import logging
+import os
+import platform
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from app.backups.application.chunk_store import get_chunk_store, is_manifest
+from app.backups.domain.entities import BackupEntity, BackupListSpec
+from app.backups.domain.ports import BackupsUnitOfWork
+from app.core.checksums import file_checksum
+from app.servers.domain.value_objects import BackupStatus
+
+logger = logging.getLogger(__name__)
+
+_LIST_PAGE_SIZE = 500
+
+# `ioprio_set(IOPRIO_WHO_PROCESS, 0, IOPRIO_CLASS_IDLE << 13)` applies to
+# the calling thread only, which is why scrubbing owns its thread.
+_IOPRIO_SET_SYSCALL = {"x86_64": 251, "aarch64": 30, "i686": 289}
+_IOPRIO_WHO_PROCESS = 1
+_IOPRIO_CLASS_IDLE = 3
+_IOPRIO_CLASS_SHIFT = 13
+
+
+@dataclass
+class ScrubStats:
+    """Outcome of one scrub pass over all completed backups."""
+
+    verified: int = 0
+    mismatched: int = 0
+    missing: int = 0
+    backfilled: int = 0
+    errors: int = 0
+    bytes_read: int = 0
+    seconds: float = 0.0
+    finished_at: float = 0.0
+    corrupt_backup_ids: List[int] = field(default_factory=list)
+
+
+_last_scrub_stats: Optional[ScrubStats] = None
+
+
+class _ScrubStopped(Exception):
+    """Raised on the scrub thread to abandon a hash when the service stops."""
+
+
+def last_scrub_stats() -> Optional[ScrubStats]:
+    """Result of the most recent scrub pass in this process, if any."""
+    return _last_scrub_stats
+
+
+def _lower_io_priority() -> None:
+    """Move the calling thread to the idle I/O class (Linux only)."""
+    nr = _IOPRIO_SET_SYSCALL.get(platform.machine())
+    if nr is None:
+        return
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        if (
+            libc.syscall(
+                nr,
+                _IOPRIO_WHO_PROCESS,
+                0,
+                _IOPRIO_CLASS_IDLE << _IOPRIO_CLASS_SHIFT,
+            )
+            != 0
+        ):
+            logger.debug(
+                f"ioprio_set failed for scrub thread: {os.strerror(ctypes.get_errno())}"
+            )
+    except (OSError, AttributeError) as e:
+        logger.debug(f"Could not lower scrub thread I/O priority: {e}")
+
+
+class _Throttle:
+    """Sleep so that reads average at most ``rate`` bytes per second."""
+
+    def __init__(self, rate: int):
+        self._rate = rate
+        self._started = time.monotonic()
+        self._consumed = 0
+
+    def __call__(self, n: int) -> None:
+        if self._rate <= 0:
+            return
+        self._consumed += n
+        ahead = self._consumed / self._rate - (time.monotonic() - self._started)
+        if ahead > 0:
+            time.sleep(ahead)
+
+
+class BackupScrubberService:
+    """Periodically re-hash stored backups and record the results.
+
+    Constructed with a `uow_factory` (each pass opens its own sessions)
+    like `BackupSchedulerService`. `scrub_once()` runs a single pass and
+    is what the loop, and tests, call.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], BackupsUnitOfWork],
+        interval_seconds: Optional[int] = None,
+        max_bytes_per_second: Optional[int] = None,
+    ):
+        from app.core.config import settings as _settings
+
+        self._uow_factory = uow_factory
+        self._interval_seconds: int = (
+            interval_seconds
+            if interval_seconds is not None
+            else _settings.BACKUP_SCRUB_INTERVAL_SECONDS
+        )
+        self._max_bytes_per_second: int = (
+            max_bytes_per_second
+            if max_bytes_per_second is not None
+            else _settings.BACKUP_SCRUB_MAX_BYTES_PER_SECOND
+        )
+        # Passed to the shared chunk store like `BackupFileService` does;
+        # reading chunks does not depend on it.
+        self._chunk_compression_level: int = _settings.BACKUP_GZIP_LEVEL
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        # Checked between reads on the scrub thread: cancelling the task
+        # does not interrupt a hash in progress, and interpreter exit
+        # joins the thread, so a large backup would delay shutdown.
+        self._stop_requested = threading.Event()
+
+    async def start(self) -> None:
+        if self._running or self._interval_seconds <= 0:
+            return
+        self._running = True
+        self._stop_requested.clear()
+        self._task = asyncio.create_task(self._scrub_loop())
+
+    async def stop(self) -> None:
+        self._stop_requested.set()
+        if self._running:
+            self._running = False
+            if self._task:
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+                self._task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    async def _scrub_loop(self) -> None:
+        while self._running:
+            try:
+                await asyncio.sleep(self._interval_seconds)
+            except asyncio.CancelledError:
+                logger.info("Backup scrub loop cancelled")
+                break
+            if not self._running:
+                break
+            try:
+                await self.scrub_once()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(f"Backup scrub pass failed: {e}")
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="backup-scrub",
+                initializer=_lower_io_priority,
+            )
+        return self._executor
+
+    async def _list_completed(self) -> List[BackupEntity]:
+        backups: List[BackupEntity] = []
+        page = 1
+        while True:
+            async with self._uow_factory() as uow:
+                result = await uow.backups.list_paged(
+                    BackupListSpec(
+                        status=BackupStatus.completed,
+                        page=page,
+                        size=_LIST_PAGE_SIZE,
+                    )
+                )
+            backups.extend(result.entities)
+            if page * _LIST_PAGE_SIZE >= result.total:
+                return backups
+            page += 1
+
+    def _check_chunks(
+        self,
+        manifest_path: Path,
+        checked: Dict[str, Optional[str]],
+        on_chunk: Callable[[int], None],
+    ) -> Optional[str]:
+        """Re-hash the chunks an incremental backup's manifest points at.
+
+        ``checked`` maps digests already read in this pass to their outcome,
+        so chunks shared between backups are read once. Returns ``"missing"``
+        or ``"corrupt"`` if any chunk is, else ``None``.
+        """
+        store = get_chunk_store(manifest_path.parent, self._chunk_compression_level)
+        manifest = store.load_manifest(manifest_path)
+        outcome: Optional[str] = None
+        for digest in {d for entry in manifest["files"] for d in entry["chunks"]}:
+            if digest not in checked:
+                try:
+                    on_chunk(store.verify(digest, drop_cache=True))
+                    checked[digest] = None
+                except FileNotFoundError:
+                    checked[digest] = "missing"
+                except ValueError:
+                    checked[digest] = "corrupt"
+            outcome = outcome or checked[digest]
+        return outcome
+
+    async def scrub_once(self) -> ScrubStats:
+        """Verify every completed backup once and publish the results."""
+        global _last_scrub_stats
+
+        loop = asyncio.get_running_loop()
+        stats = ScrubStats()
+        started = time.monotonic()
+        throttle = _Throttle(self._max_bytes_per_second)
+
+        def on_chunk(n: int) -> None:
+            if self._stop_requested.is_set():
+                raise _ScrubStopped()
+            stats.bytes_read += n
+            throttle(n)
+
+        checked_chunks: Dict[str, Optional[str]] = {}
+        for backup in await self._list_completed():
+            path = Path(backup.file_path)
+            try:
+                actual = await loop.run_in_executor(
+                    self._get_executor(),
+                    lambda: file_checksum(path, on_chunk=on_chunk, drop_cache=True),
+                )
+            except _ScrubStopped:
+                logger.info("Backup scrub pass stopped before completion")
+                return stats
+            except FileNotFoundError:
+                stats.missing += 1
+                stats.corrupt_backup_ids.append(backup.id)
+                logger.error(f"Backup {backup.id} file is missing: {path}")
+                continue
+            except OSError as e:
+                stats.errors += 1
+                logger.warning(f"Could not scrub backup {backup.id} ({path}): {e}")
+                continue
+
+            if backup.checksum is not None and actual != backup.checksum:
+                stats.mismatched += 1
+                stats.corrupt_backup_ids.append(backup.id)
+                logger.error(
+                    f"Backup {backup.id} failed verification: expected "
+                    f"{backup.checksum}, got {actual} ({path})"
+                )
+                continue
+
+            chunks_problem = None
+            if is_manifest(path):
+                try:
+                    chunks_problem = await loop.run_in_executor(
+                        self._get_executor(),
+                        lambda: self._check_chunks(path, checked_chunks, on_chunk),
+                    )
+                except _ScrubStopped:
+                    logger.info("Backup scrub pass stopped before completion")
+                    return stats
+                except (OSError, ValueError) as e:
+                    stats.errors += 1
+                    logger.warning(f"Could not scrub backup {backup.id} ({path}): {e}")
+                    continue
+
+            if backup.checksum is None:
+                # The manifest is recorded as it is even if chunks are bad.
+                try:
+                    async with self._uow_factory() as uow:
+                        await uow.backups.update_checksum(backup.id, actual)
+                        await uow.commit()
+                    if chunks_problem is None:
+                        stats.backfilled += 1
+                except Exception as e:
+                    stats.errors += 1
+                    logger.warning(
+                        f"Could not record checksum of backup {backup.id}: {e}"
+                    )
+            elif chunks_problem is None:
+                stats.verified += 1
+
+            if chunks_problem == "missing":
+                stats.missing += 1
+            elif chunks_problem == "corrupt":
+                stats.mismatched += 1
+            if chunks_problem is not None:
+                stats.corrupt_backup_ids.append(backup.id)
+                logger.error(
+                    f"Backup {backup.id} failed verification: a chunk it "
+                    f"references is {chunks_problem} ({path})"
+                )
+
+        stats.seconds = time.monotonic() - started
+        stats.finished_at = time.time()
+        _last_scrub_stats = stats
+        logger.info(
+            f"Backup scrub finished in {stats.seconds:.1f}s: "
+            f"{stats.verified} ok, {stats.mismatched} corrupt, "
+            f"{stats.missing} missing, {stats.backfilled} backfilled, "
+            f"{stats.errors} errors"
+        )
+        return stats
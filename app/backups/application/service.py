@@ -8,15 +8,16 @@ import from `adapters/`, `api/`, FastAPI, or SQLAlchemy.
 
 import logging
 import os
-import tarfile
 import tempfile
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, AsyncIterator, Optional
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional
 
+from app.backups.application.chunk_store import is_manifest
 from app.backups.application.file_service import BackupFileService
 from app.backups.application.resource_monitor import ResourceMonitor
+from app.backups.application.restore import normalize_restore_paths
 from app.backups.domain.entities import (
     BackupEntity,
     BackupListPage,
@@ -32,6 +33,11 @@ from app.backups.domain.ports import BackupsUnitOfWork
 # type annotations, so it stays under TYPE_CHECKING to keep the
 # application layer free of cross-domain ORM imports at runtime.
 from app.backups.models import BackupStatus, BackupType
+from app.core.archives import (
+    ACCEPTED_ARCHIVE_SUFFIXES,
+    ARCHIVE_SUFFIXES,
+)
+from app.core.checksums import new_hasher
 from app.core.exceptions import (
     BackupNotFoundException,
     DatabaseOperationException,
@@ -39,7 +45,7 @@ from app.core.exceptions import (
     ServerNotFoundException,
     ServerStateException,
 )
-from app.core.security import SecurityError, TarExtractor
+from app.core.security import SecurityError, StreamingTarValidator
 
 # `minecraft_server_manager` is the legacy module-level singleton; it is
 # *called* at runtime (`get_server_status`) so it cannot move under
@@ -121,13 +127,19 @@ class BackupService:
         description: Optional[str] = None,
         backup_type: BackupType = BackupType.manual,
     ) -> BackupEntity:
-        """Create a backup row, write the tar.gz, finalise the row.
+        """Reserve a backup row, write the tar.gz, finalise the row.
+
+        Two short transactions bracket the archive write: the first
+        inserts a `creating` row, the second marks it `completed`. No
+        DB connection is held while archiving, which can take minutes.
+        A failed write marks the row `failed`; a crash leaves it
+        `creating` for :meth:`recover_interrupted_backups`.
 
         Atomic-rename pattern (#228 punch-list B): the tar.gz is first
         written to a `.pending/.pending-<uuid>.tar.gz` temp file (on
         the same filesystem as `backups_directory` to guarantee that
-        `os.replace()` is a same-FS atomic rename), then the UoW is
-        committed, then the file is `os.replace()`-moved to its final
+        `os.replace()` is a same-FS atomic rename), then the row is
+        finalised, then the file is `os.replace()`-moved to its final
         location.
 
         Data-loss protection (review feedback B-2): the `committed`
@@ -160,41 +172,48 @@ class BackupService:
         # is well-defined on every failure branch.
         pending_dir = self.backups_directory / ".pending"
         pending_dir.mkdir(parents=True, exist_ok=True)
-        temp_filename = f".pending-{uuid.uuid4().hex}.tar.gz"
+        suffix = self._file_service.archive_suffix
+        temp_filename = f".pending-{uuid.uuid4().hex}{suffix}"
         temp_path: Path = pending_dir / temp_filename
         final_path: Optional[Path] = None
-        backup_entity: Optional[BackupEntity] = None
-        committed = False
-        try:
-            async with self._uow as uow:
-                backup_entity = await uow.backups.add(
-                    CreateBackupCommand(
-                        server_id=server_id,
-                        name=name,
-                        description=description,
-                        backup_type=backup_type,
-                    )
-                )
-
-                # Write tar to temp path (caller-controlled location).
-                await self._file_service.write_backup_file_to(server, temp_path)
-                file_size = temp_path.stat().st_size
 
-                # Derive the final filename now that the backup row has
-                # an id; this stays out of `backups_directory/` until
-                # after a successful commit.
-                final_filename = (
-                    f"backup_{server_id}_{backup_entity.id}_"
-                    f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.tar.gz"
+        # Phase 1: reserve a `creating` row in a short transaction. It
+        # points at the temp path so the startup recovery sweep can find
+        # the leftovers if this process dies mid-archive.
+        async with self._uow as uow:
+            backup_entity = await uow.backups.add(
+                CreateBackupCommand(
+                    server_id=server_id,
+                    name=name,
+                    description=description,
+                    backup_type=backup_type,
+                    file_path=str(temp_path),
                 )
-                final_path = self.backups_directory / final_filename
+            )
+            await uow.commit()
+
+        committed = False
+        try:
+            # Phase 2: write the tar (or incremental manifest) to the temp
+            # path. This can take minutes and holds no DB connection.
+            checksum = await self._file_service.write_backup_file_to(server, temp_path)
+            file_size = self._file_service.backup_size(temp_path)
+
+            final_filename = (
+                f"backup_{server_id}_{backup_entity.id}_"
+                f"{datetime.now().strftime('%Y%m%d_%H%M%S')}{suffix}"
+            )
+            final_path = self.backups_directory / final_filename
 
+            # Phase 3: finalise the row in a second short transaction.
+            async with self._uow as uow:
                 final = await uow.backups.update_file_info(
                     backup_entity.id,
                     UpdateBackupFileCommand(
                         file_path=str(final_path),
                         file_size=file_size,
                         status=BackupStatus.completed,
+                        checksum=checksum,
                     ),
                 )
                 assert final is not None
@@ -226,22 +245,79 @@ class BackupService:
                     temp_path=temp_path,
                     temp_filename=temp_filename,
                     final_path=final_path,
-                    entity_id=backup_entity.id if backup_entity is not None else None,
+                    entity_id=backup_entity.id,
                     error=e,
                 )
             else:
-                # Pre-commit failure — safe to unlink the temp file
-                # because no DB row references it.
+                # Pre-finalise failure — safe to delete the temp file
+                # because only the `creating` row references it.
+                # Manifests also give back their chunk references.
                 try:
-                    temp_path.unlink(missing_ok=True)
-                except OSError as cleanup_error:
+                    if is_manifest(temp_path):
+                        self._file_service.delete_backup_file(str(temp_path))
+                    else:
+                        temp_path.unlink(missing_ok=True)
+                except (OSError, ValueError) as cleanup_error:
                     logger.warning(
                         f"Failed to cleanup pending backup file {temp_path}: "
                         f"{cleanup_error}"
                     )
+                await self._mark_backup_failed(backup_entity.id)
             logger.error(f"Failed to create backup for server {server_id}: {e}")
             raise
 
+    async def _mark_backup_failed(self, backup_id: int) -> None:
+        """Flag a reserved row as `failed`; best effort."""
+        try:
+            async with self._uow as uow:
+                await uow.backups.update_status(backup_id, BackupStatus.failed)
+                await uow.commit()
+        except Exception as e:
+            logger.error(f"Failed to mark backup {backup_id} as failed: {e}")
+
+    async def recover_interrupted_backups(self) -> int:
+        """Fail `creating` rows orphaned by a previous process.
+
+        A backup stays `creating` only while its archive is being
+        written, so at startup every such row belongs to a process that
+        died mid-archive. Each is marked `failed` and its partial temp
+        file under `.pending/` is removed. Call this before any backup
+        can start (i.e. during application startup). Returns the number
+        of rows recovered.
+        """
+        async with self._uow as uow:
+            orphans: list[BackupEntity] = []
+            page = 1
+            while True:
+                result = await uow.backups.list_paged(
+                    BackupListSpec(status=BackupStatus.creating, page=page, size=100)
+                )
+                orphans.extend(result.entities)
+                if page * result.size >= result.total:
+                    break
+                page += 1
+            for backup in orphans:
+                await uow.backups.update_status(backup.id, BackupStatus.failed)
+            await uow.commit()
+
+        pending_dir = (self.backups_directory / ".pending").resolve()
+        for backup in orphans:
+            if not backup.file_path:
+                continue
+            temp_path = Path(backup.file_path)
+            if temp_path.resolve().parent != pending_dir:
+                continue
+            try:
+                self._file_service.delete_backup_file(str(temp_path))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to remove interrupted backup {temp_path}: {e}")
+        if orphans:
+            logger.warning(
+                f"Marked {len(orphans)} interrupted backup(s) as failed: "
+                f"{[b.id for b in orphans]}"
+            )
+        return len(orphans)
+
     def _preserve_post_commit_temp(
         self,
         *,
@@ -301,8 +377,18 @@ class BackupService:
         self,
         backup_id: int,
         server_id: Optional[int] = None,
+        paths: Optional[List[str]] = None,
     ) -> bool:
-        """Restore a backup to its original server (or `server_id`)."""
+        """Restore a backup to its original server (or `server_id`).
+
+        `paths` restricts the restore to those subtrees of the server
+        directory (e.g. `["world/DIM-1"]`); everything else is left as is.
+        """
+        try:
+            selected = normalize_restore_paths(paths)
+        except SecurityError as e:
+            raise FileOperationException("restore", str(backup_id), str(e))
+
         async with self._uow as uow:
             backup = await uow.backups.get(backup_id)
 
@@ -329,13 +415,27 @@ class BackupService:
             id=backup.id,
             file_path=backup.file_path,
         )
-        await self._file_service.restore_backup_file(backup_orm, target_server)
+        await self._file_service.restore_backup_file(
+            backup_orm, target_server, paths=selected
+        )
 
         logger.info(
             f"Successfully restored backup {backup_id} to server {target_server_id}"
         )
         return True
 
+    async def open_backup_archive(self, backup: BackupEntity) -> tuple[Path, bool]:
+        """Return a downloadable archive for ``backup``.
+
+        Full backups are served as-is. Incremental (manifest) backups are
+        materialized into a temporary archive; the returned flag is True
+        when the caller must delete the file after use.
+        """
+        backup_path = Path(backup.file_path)
+        if not is_manifest(backup_path):
+            return backup_path, False
+        return await self._file_service.materialize_archive(backup_path), True
+
     async def delete_backup(self, backup_id: int) -> bool:
         """Delete a backup row and its file."""
         async with self._uow as uow:
@@ -408,12 +508,14 @@ class BackupService:
         name: Optional[str] = None,
         description: Optional[str] = None,
     ) -> BackupEntity:
-        """Persist an uploaded tar.gz as a completed backup.
+        """Persist an uploaded tar.gz / tar.zst as a completed backup.
 
         Implements the streaming pattern from the legacy code: writes
-        to a temp file with chunk-by-chunk size + memory monitoring,
-        validates safety, commits the DB row, then atomically
-        promotes the temp file into the canonical backups directory.
+        to a temp file with chunk-by-chunk size + memory monitoring
+        while `StreamingTarValidator` checks the tar headers from the
+        same chunks on a worker thread (one decompression pass, early
+        rejection), commits the DB row, then atomically promotes the
+        temp file into the canonical backups directory.
 
         Data-loss protection (review feedback B-1, B-2):
 
@@ -454,12 +556,13 @@ class BackupService:
         committed = False
 
         async with ResourceMonitor(max_memory_mb=256) as monitor:
+            validator = StreamingTarValidator()
             try:
-                if not file.filename.endswith((".tar.gz", ".tgz")):
+                if not file.filename.lower().endswith(ACCEPTED_ARCHIVE_SUFFIXES):
                     raise FileOperationException(
                         "upload",
                         file.filename,
-                        "Only .tar.gz and .tgz files are supported",
+                        "Only .tar.gz, .tgz and .tar.zst files are supported",
                     )
 
                 content_length = file.headers.get("content-length")
@@ -477,8 +580,6 @@ class BackupService:
                     name = f"Uploaded backup - {timestamp}"
 
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_filename = f"server_{server_id}_{timestamp}.tar.gz"
-                backup_path = self.backups_directory / backup_filename
 
                 # B-1 fix: create the temp file under
                 # `backups_directory/.pending/` so it is guaranteed
@@ -494,6 +595,7 @@ class BackupService:
                     temp_filename = temp_path.name
                     total_size = 0
                     chunk_count = 0
+                    hasher = new_hasher()
                     async for chunk in self._read_file_chunks(file):
                         total_size += len(chunk)
                         chunk_count += 1
@@ -505,35 +607,30 @@ class BackupService:
                                 f"exceeds maximum allowed size (500MB)",
                             )
                         temp_file.write(chunk)
+                        hasher.update(chunk)
+                        # Tar headers are checked as the bytes arrive, so
+                        # a bad archive is rejected before it is fully read.
+                        try:
+                            await validator.feed(chunk)
+                        except Exception as e:
+                            raise _upload_validation_error(file.filename, e)
                         if chunk_count % 100 == 0:
                             await monitor.check_memory_usage()
                     temp_file.flush()
                     file_size = total_size
 
                 try:
-                    with tarfile.open(temp_path, mode="r:gz") as tar:
-                        tar.getnames()
-                    await monitor.check_memory_usage()
-                    TarExtractor.validate_archive_safety(temp_path)
-                    logger.info(f"Upload validation passed for {file.filename}")
-                except SecurityError as e:
-                    raise FileOperationException(
-                        "upload",
-                        file.filename,
-                        f"Security validation failed: {str(e)}",
-                    )
-                except MemoryError as e:
-                    raise FileOperationException(
-                        "upload",
-                        file.filename,
-                        f"Memory limit exceeded during validation: {str(e)}",
-                    )
+                    # Name the stored file after the detected format, not
+                    # the client-supplied extension.
+                    archive_format = await validator.finish()
                 except Exception as e:
-                    raise FileOperationException(
-                        "upload",
-                        file.filename,
-                        f"Invalid tar.gz file: {str(e)}",
-                    )
+                    raise _upload_validation_error(file.filename, e)
+                logger.info(f"Upload validation passed for {file.filename}")
+
+                backup_filename = (
+                    f"server_{server_id}_{timestamp}{ARCHIVE_SUFFIXES[archive_format]}"
+                )
+                backup_path = self.backups_directory / backup_filename
 
                 # Atomic-rename pattern (#228 punch-list B): commit the
                 # DB row first, then promote the validated temp file
@@ -548,6 +645,7 @@ class BackupService:
                             status=BackupStatus.completed,
                             file_path=str(backup_path),
                             file_size=file_size,
+                            checksum=hasher.hexdigest(),
                         )
                     )
                     await uow.commit()
@@ -606,6 +704,8 @@ class BackupService:
                     raise e
                 else:
                     raise DatabaseOperationException("upload", "backup", str(e))
+            finally:
+                validator.close()
 
     async def _read_file_chunks(
         self, file: "UploadFile", chunk_size: int = 8192
@@ -617,6 +717,17 @@ class BackupService:
             yield chunk
 
 
+def _upload_validation_error(filename: str, error: Exception) -> FileOperationException:
+    """Map a streaming-validation failure to the upload error contract."""
+    if isinstance(error, SecurityError):
+        reason = f"Security validation failed: {str(error)}"
+    elif isinstance(error, MemoryError):
+        reason = f"Memory limit exceeded during validation: {str(error)}"
+    else:
+        reason = f"Invalid backup archive: {str(error)}"
+    return FileOperationException("upload", filename, reason)
+
+
 # ---------------------------------------------------------------------------
 # ORM-shaped views (legacy compatibility for BackupFileService)
 # ---------------------------------------------------------------------------
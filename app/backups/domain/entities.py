@@ -54,6 +54,9 @@ class BackupEntity:
     server_name: Optional[str]
     minecraft_version: Optional[str]
     server_owner_id: Optional[int]
+    # Hex SHA-256 of the file at `file_path`; None for backups made
+    # before checksums were recorded.
+    checksum: Optional[str] = None
 
 
 @dataclass(frozen=True)
@@ -73,6 +76,7 @@ class CreateBackupCommand:
     status: BackupStatus = BackupStatus.creating
     file_path: str = ""
     file_size: int = 0
+    checksum: Optional[str] = None
 
 
 @dataclass(frozen=True)
@@ -82,6 +86,7 @@ class UpdateBackupFileCommand:
     file_path: str
     file_size: int
     status: BackupStatus
+    checksum: Optional[str] = None
 
 
 @dataclass(frozen=True)
@@ -144,6 +149,13 @@ class BackupScheduleEntity:
     next_backup_at: Optional[datetime]
     created_at: datetime
     updated_at: datetime
+    # Grandfather-father-son retention tiers. When any is non-zero the
+    # schedule keeps the newest backup of each of the last N hours /
+    # days / ISO weeks / months instead of a flat `max_backups`.
+    keep_hourly: int = 0
+    keep_daily: int = 0
+    keep_weekly: int = 0
+    keep_monthly: int = 0
 
 
 @dataclass(frozen=True)
@@ -156,6 +168,10 @@ class CreateBackupScheduleCommand:
     enabled: bool
     only_when_running: bool
     next_backup_at: Optional[datetime]
+    keep_hourly: int = 0
+    keep_daily: int = 0
+    keep_weekly: int = 0
+    keep_monthly: int = 0
 
 
 @dataclass(frozen=True)
@@ -173,12 +189,42 @@ class UpdateBackupScheduleCommand:
     only_when_running: Optional[bool] = None
     last_backup_at: Optional[datetime] = None
     next_backup_at: Optional[datetime] = None
+    keep_hourly: Optional[int] = None
+    keep_daily: Optional[int] = None
+    keep_weekly: Optional[int] = None
+    keep_monthly: Optional[int] = None
 
     def applied_fields(self) -> Dict[str, Any]:
         """Return only the fields the caller actually set (non-None)."""
         return {k: v for k, v in self.__dict__.items() if v is not None}
 
 
+# ---------------------------------------------------------------------------
+# Retention
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class RetentionCandidate:
+    """The columns retention needs from a completed scheduled backup."""
+
+    id: int
+    server_id: int
+    created_at: datetime
+    file_path: str
+    file_size: int
+
+
+@dataclass(frozen=True)
+class PruneReport:
+    """Outcome of one retention run."""
+
+    backups_deleted: int = 0
+    bytes_reclaimed: int = 0
+    servers: int = 0
+    failed: int = 0
+
+
 # ---------------------------------------------------------------------------
 # BackupScheduleLog aggregate
 # ---------------------------------------------------------------------------
@@ -18,7 +18,7 @@ Three Ports are defined:
 
 from datetime import datetime
 from types import TracebackType
-from typing import List, Optional, Protocol
+from typing import Iterable, List, Optional, Protocol, Sequence
 
 from app.backups.domain.entities import (
     AppendScheduleLogCommand,
@@ -30,6 +30,7 @@ from app.backups.domain.entities import (
     BackupStatistics,
     CreateBackupCommand,
     CreateBackupScheduleCommand,
+    RetentionCandidate,
     UpdateBackupFileCommand,
     UpdateBackupScheduleCommand,
 )
@@ -57,6 +58,12 @@ class BackupRepository(Protocol):
         self, server_id: Optional[int] = None
     ) -> BackupStatistics: ...
 
+    async def list_retention_candidates(
+        self, server_ids: Optional[Sequence[int]] = None
+    ) -> List[RetentionCandidate]:
+        """Completed scheduled backups, by server then newest first."""
+        ...
+
     # ----- Writes -----
 
     async def add(self, command: CreateBackupCommand) -> BackupEntity:
@@ -77,8 +84,16 @@ class BackupRepository(Protocol):
         self, backup_id: int, status: BackupStatus
     ) -> Optional[BackupEntity]: ...
 
+    async def update_checksum(
+        self, backup_id: int, checksum: str
+    ) -> Optional[BackupEntity]: ...
+
     async def delete(self, backup_id: int) -> bool: ...
 
+    async def delete_many(self, backup_ids: Iterable[int]) -> int:
+        """Delete rows in bulk; returns the number deleted."""
+        ...
+
 
 class BackupScheduleRepository(Protocol):
     """Persistence port for the `BackupSchedule` + log aggregates.
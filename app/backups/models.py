@@ -63,6 +63,7 @@ class Backup(Base):
     description = Column(Text)
     file_path = Column(String(500), nullable=False)
     file_size = Column(BigInteger, nullable=False)  # bytes
+    checksum = Column(String(64), nullable=True)  # hex SHA-256 of file_path
     backup_type: Column[BackupType] = Column(Enum(BackupType), default=BackupType.manual)
     status: Column[BackupStatus] = Column(
         Enum(BackupStatus), default=BackupStatus.creating, index=True
@@ -120,6 +121,13 @@ class BackupSchedule(Base):
     enabled = Column(Boolean, default=True, nullable=False, index=True)
     only_when_running = Column(Boolean, default=True, nullable=False)
 
+    # Grandfather-father-son retention tiers (0 = tier unused). If all
+    # are 0, the flat `max_backups` count applies.
+    keep_hourly = Column(Integer, default=0, server_default="0", nullable=False)
+    keep_daily = Column(Integer, default=0, server_default="0", nullable=False)
+    keep_weekly = Column(Integer, default=0, server_default="0", nullable=False)
+    keep_monthly = Column(Integer, default=0, server_default="0", nullable=False)
+
     # Execution state management
     last_backup_at = Column(DateTime, nullable=True)
     next_backup_at = Column(DateTime, nullable=True, index=True)
@@ -140,6 +148,11 @@ class BackupSchedule(Base):
         CheckConstraint(
             "max_backups >= 1 AND max_backups <= 30", name="check_max_backups_range"
         ),
+        CheckConstraint(
+            "keep_hourly >= 0 AND keep_daily >= 0 AND keep_weekly >= 0 "
+            "AND keep_monthly >= 0",
+            name="check_retention_tiers_non_negative",
+        ),
     )
 
     def __repr__(self):
@@ -21,8 +21,8 @@ from fastapi import (
     UploadFile,
     status,
 )
-from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
+from starlette.background import BackgroundTask
 
 from app.auth.dependencies import get_current_user
 from app.backups.api._mappers import (
@@ -46,6 +46,11 @@ from app.backups.schemas import (
     BackupUploadResponse,
     ScheduledBackupRequest,
 )
+from app.core.archives import (
+    ARCHIVE_FORMAT_GZIP,
+    ARCHIVE_FORMAT_ZSTD,
+    ARCHIVE_SUFFIXES,
+)
 from app.core.database import get_db
 from app.core.exceptions import (
     BackupNotFoundException,
@@ -53,6 +58,7 @@ from app.core.exceptions import (
     FileOperationException,
     ServerNotFoundException,
 )
+from app.core.file_responses import RangeFileResponse
 from app.servers.api.dependencies import get_authorization_service
 from app.servers.application.authorization import AuthorizationService
 from app.servers.domain.exceptions import ServerAccessError, ServerNotFoundError
@@ -408,13 +414,17 @@ async def restore_backup(
         success = await backup_service.restore_backup(
             backup_id=backup_id,
             server_id=target_server_id,
+            paths=request.paths,
         )
 
+        details = {"target_server_id": target_server_id}
+        if request.paths:
+            details["paths"] = request.paths
         return BackupOperationResponse(
             success=success,
             message=f"Backup {backup_id} restored successfully to server {target_server_id}",
             backup_id=backup_id,
-            details={"target_server_id": target_server_id},
+            details=details,
         )
 
     except (
@@ -444,9 +454,16 @@ async def download_backup(
     backup_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    backup_service: BackupService = Depends(get_backup_service),
     auth: AuthorizationService = Depends(get_authorization_service),
 ):
-    """Download a backup file."""
+    """Download a backup file.
+
+    Incremental backups are stored as manifests; they are materialized
+    into a temporary archive that is removed once the response is sent.
+    Stored archives are served with their recorded SHA-256 as `ETag` and
+    `Repr-Digest`, and full downloads are verified against it.
+    """
     try:
         backup = await auth.check_backup_access(backup_id, current_user)
 
@@ -465,13 +482,24 @@ async def download_backup(
         # `server_name` is denormalised onto `BackupEntity` (post-#228),
         # replacing the legacy `backup.server.name` relationship access.
         server_name = backup.server_name or f"server_{backup.server_id}"
-        backup_filename = f"{server_name}_{backup.name}_{backup.id}.tar.gz"
+        archive_path, temporary = await backup_service.open_backup_archive(backup)
+        is_zstd = archive_path.name.endswith(ARCHIVE_SUFFIXES[ARCHIVE_FORMAT_ZSTD])
+        suffix = ARCHIVE_SUFFIXES[ARCHIVE_FORMAT_ZSTD if is_zstd else ARCHIVE_FORMAT_GZIP]
+        backup_filename = f"{server_name}_{backup.name}_{backup.id}{suffix}"
 
-        return FileResponse(
-            path=backup.file_path,
+        return RangeFileResponse(
+            path=str(archive_path),
             filename=backup_filename,
-            media_type="application/gzip",
+            media_type="application/zstd" if is_zstd else "application/gzip",
             headers={"Content-Disposition": f'attachment; filename="{backup_filename}"'},
+            # Materialized archives are new files; the recorded checksum
+            # only describes the stored backup.
+            sha256=None if temporary else backup.checksum,
+            background=(
+                BackgroundTask(archive_path.unlink, missing_ok=True)
+                if temporary
+                else None
+            ),
         )
 
     except (
@@ -30,6 +30,7 @@ from app.backups.schemas import (
     BackupScheduleRequest,
     BackupScheduleResponse,
     BackupScheduleUpdateRequest,
+    RetentionPruneResponse,
     SchedulerStatusResponse,
 )
 from app.core.database import get_db
@@ -66,6 +67,10 @@ async def create_backup_schedule(
             enabled=request.enabled,
             only_when_running=request.only_when_running,
             executed_by_user_id=current_user.id,
+            keep_hourly=request.keep_hourly,
+            keep_daily=request.keep_daily,
+            keep_weekly=request.keep_weekly,
+            keep_monthly=request.keep_monthly,
         )
         return backup_schedule_entity_to_response(entity)
 
@@ -156,6 +161,10 @@ async def update_backup_schedule(
             enabled=request.enabled,
             only_when_running=request.only_when_running,
             executed_by_user_id=current_user.id,
+            keep_hourly=request.keep_hourly,
+            keep_daily=request.keep_daily,
+            keep_weekly=request.keep_weekly,
+            keep_monthly=request.keep_monthly,
         )
         return backup_schedule_entity_to_response(entity)
 
@@ -334,3 +343,40 @@ async def list_all_backup_schedules(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to list backup schedules: {str(e)}",
         )
+
+
+@router.post(
+    "/scheduler/retention/prune",
+    response_model=RetentionPruneResponse,
+)
+async def prune_backup_retention(
+    current_user: User = Depends(get_current_user),
+    scheduler: BackupSchedulerService = Depends(get_backup_scheduler_service),
+):
+    """Apply every schedule's retention policy now (admin only).
+
+    The same pass runs on the scheduler's hourly cleanup tick; this
+    endpoint is for catching up after a policy change.
+    """
+    try:
+        if current_user.role != Role.admin:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only admins can run backup retention",
+            )
+
+        report = await scheduler.prune_retention()
+        return RetentionPruneResponse(
+            backups_deleted=report.backups_deleted,
+            bytes_reclaimed=report.bytes_reclaimed,
+            servers=report.servers,
+            failed=report.failed,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to prune backups: {str(e)}",
+        )
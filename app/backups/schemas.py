@@ -3,7 +3,9 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from app.backups.application.restore import normalize_restore_paths
 from app.backups.models import BackupStatus, BackupType
+from app.core.security import SecurityError
 
 
 class BackupCreateRequest(BaseModel):
@@ -41,6 +43,12 @@ class BackupRestoreRequest(BaseModel):
     confirm: bool = Field(
         False, description="Confirmation flag - must be True to proceed"
     )
+    paths: Optional[List[str]] = Field(
+        None,
+        max_length=100,
+        description="Restore only these paths of the server directory "
+        "(e.g. 'world' or 'world/DIM-1'); omit to restore everything",
+    )
 
     @field_validator("confirm")
     @classmethod
@@ -50,6 +58,15 @@ class BackupRestoreRequest(BaseModel):
             raise ValueError("Confirmation required to restore backup")
         return v
 
+    @field_validator("paths")
+    @classmethod
+    def validate_paths(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Reject absolute paths and path traversal"""
+        try:
+            return normalize_restore_paths(v)
+        except SecurityError as e:
+            raise ValueError(str(e))
+
 
 class BackupResponse(BaseModel):
     """Response schema for backup information"""
@@ -64,6 +81,9 @@ class BackupResponse(BaseModel):
     backup_type: BackupType
     status: BackupStatus
     created_at: datetime
+    # Hex SHA-256 of the backup file (None for backups made before
+    # checksums were recorded)
+    checksum: Optional[str] = None
 
     # Server information
     server_name: Optional[str] = None
@@ -87,6 +107,7 @@ class BackupResponse(BaseModel):
             backup_type=backup.backup_type,
             status=backup.status,
             created_at=backup.created_at,
+            checksum=getattr(backup, "checksum", None),
             server_name=backup.server.name if backup.server else None,
             minecraft_version=backup.server.minecraft_version if backup.server else None,
         )
@@ -177,6 +198,18 @@ class BackupScheduleRequest(BaseModel):
     only_when_running: bool = Field(
         True, description="Only backup when server is running"
     )
+    keep_hourly: int = Field(
+        0, ge=0, le=168, description="Keep the newest backup of each of N hours"
+    )
+    keep_daily: int = Field(
+        0, ge=0, le=366, description="Keep the newest backup of each of N days"
+    )
+    keep_weekly: int = Field(
+        0, ge=0, le=260, description="Keep the newest backup of each of N weeks"
+    )
+    keep_monthly: int = Field(
+        0, ge=0, le=120, description="Keep the newest backup of each of N months"
+    )
 
 
 class BackupScheduleUpdateRequest(BaseModel):
@@ -192,6 +225,10 @@ class BackupScheduleUpdateRequest(BaseModel):
     only_when_running: Optional[bool] = Field(
         None, description="Only backup when server is running"
     )
+    keep_hourly: Optional[int] = Field(None, ge=0, le=168)
+    keep_daily: Optional[int] = Field(None, ge=0, le=366)
+    keep_weekly: Optional[int] = Field(None, ge=0, le=260)
+    keep_monthly: Optional[int] = Field(None, ge=0, le=120)
 
 
 class BackupScheduleResponse(BaseModel):
@@ -203,6 +240,11 @@ class BackupScheduleResponse(BaseModel):
     max_backups: int
     enabled: bool
     only_when_running: bool
+    # Tiered retention; all 0 means the flat `max_backups` count applies
+    keep_hourly: int = 0
+    keep_daily: int = 0
+    keep_weekly: int = 0
+    keep_monthly: int = 0
     last_backup_at: Optional[datetime] = None
     next_backup_at: Optional[datetime] = None
     created_at: datetime
@@ -227,6 +269,15 @@ class BackupScheduleLogResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class RetentionPruneResponse(BaseModel):
+    """Response schema for a retention run"""
+
+    backups_deleted: int
+    bytes_reclaimed: int
+    servers: int
+    failed: int
+
+
 class SchedulerStatusResponse(BaseModel):
     """Response schema for scheduler status"""
 
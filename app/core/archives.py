@@ -0,0 +1,264 @@
+"""Compressed tar archive formats used for server backups.
+
+Backups used to be written with ``tarfile.open(path, "w:gz")``, i.e. a
+single zlib stream at level 9 on one core. This module provides pluggable
+writer backends and format-aware readers:
+
+* ``tar.gz`` — :class:`ParallelGzipWriter` splits the tar stream into
+  blocks and deflates them on a thread pool (zlib releases the GIL), the way
+  ``pigz`` does. Each block is primed with the last 32 KiB of its
+  predecessor and ends on a byte boundary, so the concatenated blocks form
+  one ordinary gzip member readable by ``gzip``, ``tar`` and ``tarfile``.
+* ``tar.zst`` — Zstandard with its native worker threads. Requires the
+  optional ``zstandard`` package; without it the format is reported as
+  unavailable.
+
+:func:`open_tar_archive` detects the format from the file's magic bytes.
+``tar.gz`` archives are opened for random access as before unless a
+checksum is to be verified; ``tar.zst`` archives (and verified ones) are
+opened as a forward-only stream, so callers must process
+members in order (iterate the ``TarFile`` rather than calling
+``getmembers()`` and then extracting).
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import struct
+import tarfile
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Deque, Iterator, Optional
+
+from app.core.checksums import HashingReader, HashingWriter
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - environment dependent
+    zstandard = None
+
+ARCHIVE_FORMAT_GZIP = "tar.gz"
+ARCHIVE_FORMAT_ZSTD = "tar.zst"
+
+# File name suffix for each format, and every suffix accepted on upload.
+ARCHIVE_SUFFIXES = {ARCHIVE_FORMAT_GZIP: ".tar.gz", ARCHIVE_FORMAT_ZSTD: ".tar.zst"}
+ACCEPTED_ARCHIVE_SUFFIXES = (".tar.gz", ".tgz", ".tar.zst")
+
+DEFAULT_COMPRESSION_LEVELS = {ARCHIVE_FORMAT_GZIP: 6, ARCHIVE_FORMAT_ZSTD: 3}
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+class ArchiveFormatError(ValueError):
+    """Raised for unknown, unsupported or unavailable archive formats."""
+
+
+def zstd_available() -> bool:
+    return zstandard is not None
+
+
+def archive_suffix(path: Path) -> Optional[str]:
+    """Return the accepted archive suffix ``path`` ends with, if any."""
+    name = path.name.lower()
+    for suffix in ACCEPTED_ARCHIVE_SUFFIXES:
+        if name.endswith(suffix):
+            return suffix
+    return None
+
+
+def _read_magic(path: Path) -> bytes:
+    with open(path, "rb") as f:
+        return f.read(4)
+
+
+def detect_archive_format(path: Path) -> str:
+    """Identify a backup archive by its magic bytes."""
+    magic = _read_magic(path)
+    if magic.startswith(_GZIP_MAGIC):
+        return ARCHIVE_FORMAT_GZIP
+    if magic == _ZSTD_MAGIC:
+        return ARCHIVE_FORMAT_ZSTD
+    raise ArchiveFormatError(f"Unrecognised archive format: {path}")
+
+
+def _require_zstandard():
+    if zstandard is None:
+        raise ArchiveFormatError(
+            "tar.zst archives require the optional 'zstandard' package"
+        )
+    return zstandard
+
+
+@contextmanager
+def open_tar_archive(
+    path: Path, checksum: Optional[str] = None
+) -> Iterator[tarfile.TarFile]:
+    """Open a ``tar.gz`` or ``tar.zst`` backup archive for reading.
+
+    Anything without the zstd magic is handed to ``tarfile`` as gzip, so
+    corrupt input fails with the usual ``tarfile.TarError``.
+
+    With ``checksum`` (hex SHA-256 of the archive file) the compressed
+    bytes are hashed as they are read and verified when the block exits
+    without an error, raising :class:`ChecksumMismatchError`. The archive
+    is then opened as a forward-only stream whatever its format.
+    """
+    zstd_magic = _read_magic(path) == _ZSTD_MAGIC
+    with open(path, "rb") as raw:
+        hashing = HashingReader(raw, str(path)) if checksum else None
+        source = hashing if hashing is not None else raw
+        if zstd_magic:
+            zstd = _require_zstandard()
+            with zstd.ZstdDecompressor().stream_reader(source) as reader:
+                with tarfile.open(fileobj=reader, mode="r|") as tar:
+                    yield tar
+        elif checksum:
+            with tarfile.open(fileobj=source, mode="r|gz") as tar:
+                yield tar
+        else:
+            with tarfile.open(fileobj=raw, mode="r:gz") as tar:
+                yield tar
+        if hashing is not None:
+            hashing.verify(checksum)
+
+
+def _deflate_block(block: bytes, dictionary: bytes, level: int) -> bytes:
+    if dictionary:
+        compressor = zlib.compressobj(
+            level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=dictionary
+        )
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    # A sync flush ends the block on a byte boundary without marking it
+    # final, so independently compressed blocks can simply be concatenated.
+    return compressor.compress(block) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+class ParallelGzipWriter(io.RawIOBase):
+    """Write-only file object producing one gzip member from parallel blocks.
+
+    Data is buffered into ``block_size`` blocks which are raw-deflated on a
+    pool of ``threads`` workers; results are written to ``fileobj`` in order
+    while later blocks are still compressing. At most ``2 * threads`` blocks
+    are in flight, bounding memory use. :meth:`close` writes the final block
+    and gzip trailer but leaves ``fileobj`` open.
+    """
+
+    DICTIONARY_SIZE = 32 * 1024
+
+    def __init__(
+        self,
+        fileobj: IO[bytes],
+        *,
+        level: int = 6,
+        threads: Optional[int] = None,
+        block_size: int = 1024 * 1024,
+    ):
+        super().__init__()
+        self._out = fileobj
+        self.level = level
+        self.threads = threads or os.cpu_count() or 1
+        self.block_size = block_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.threads, thread_name_prefix="pgzip"
+        )
+        self._pending: Deque[Future] = deque()
+        self._buffer = bytearray()
+        self._dictionary = b""
+        self._crc = 0
+        self._size = 0
+        xfl = 2 if level >= 9 else 4 if level <= 1 else 0
+        # Header: magic, deflate, no flags, mtime, extra flags, OS=unix.
+        self._out.write(
+            struct.pack("<2sBBIBB", _GZIP_MAGIC, 8, 0, int(time.time()), xfl, 3)
+        )
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        """Uncompressed bytes written so far (what ``tarfile`` expects)."""
+        return self._size + len(self._buffer)
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("write to closed file")
+        self._buffer += data
+        while len(self._buffer) >= self.block_size:
+            block = bytes(self._buffer[: self.block_size])
+            del self._buffer[: self.block_size]
+            self._submit(block)
+        return len(data)
+
+    def _submit(self, block: bytes) -> None:
+        self._crc = zlib.crc32(block, self._crc)
+        self._size += len(block)
+        self._pending.append(
+            self._executor.submit(_deflate_block, block, self._dictionary, self.level)
+        )
+        self._dictionary = block[-self.DICTIONARY_SIZE :]
+        while len(self._pending) > 2 * self.threads:
+            self._out.write(self._pending.popleft().result())
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._out.write(self._pending.popleft().result())
+            # Empty final block, then CRC32 and size modulo 2**32.
+            self._out.write(
+                zlib.compressobj(self.level, zlib.DEFLATED, -zlib.MAX_WBITS).flush()
+            )
+            self._out.write(
+                struct.pack("<II", self._crc & 0xFFFFFFFF, self._size & 0xFFFFFFFF)
+            )
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            super().close()
+
+
+@contextmanager
+def open_archive_writer(
+    path: Path,
+    archive_format: str = ARCHIVE_FORMAT_GZIP,
+    *,
+    level: Optional[int] = None,
+    threads: Optional[int] = None,
+    hasher=None,
+) -> Iterator[tarfile.TarFile]:
+    """Open ``path`` as a new tar archive compressed with ``archive_format``.
+
+    ``level`` defaults to the format's usual level (gzip 6, zstd 3) and
+    ``threads`` to the number of CPUs. A ``hashlib`` ``hasher`` is fed
+    the compressed bytes as they are written, i.e. it ends up holding the
+    digest of the archive file.
+    """
+    if archive_format not in ARCHIVE_SUFFIXES:
+        raise ArchiveFormatError(f"Unknown archive format: {archive_format}")
+    if level is None:
+        level = DEFAULT_COMPRESSION_LEVELS[archive_format]
+    threads = threads or os.cpu_count() or 1
+
+    with open(path, "wb") as raw:
+        out = HashingWriter(raw, hasher) if hasher is not None else raw
+        if archive_format == ARCHIVE_FORMAT_ZSTD:
+            zstd = _require_zstandard()
+            compressor = zstd.ZstdCompressor(level=level, threads=threads)
+            writer = compressor.stream_writer(out, closefd=False)
+        else:
+            writer = ParallelGzipWriter(out, level=level, threads=threads)
+        try:
+            with tarfile.open(fileobj=writer, mode="w") as tar:
+                yield tar
+        finally:
+            writer.close()
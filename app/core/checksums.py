@@ -0,0 +1,129 @@
+"""Streaming SHA-256 checksums for backup archives.
+
+Backups are hashed in the same pass that writes them: :class:`HashingWriter`
+sits between the compressor and the file, so the digest of the bytes on
+disk costs no second read. Readers verify the same way —
+:class:`HashingReader` hashes what the decompressor consumes, and
+:meth:`HashingReader.verify` reads whatever the decompressor left (tar
+padding, the gzip trailer) before comparing.
+
+SHA-256 comes from ``hashlib`` (OpenSSL, hardware-accelerated on current
+x86 and ARM cores); digests are stored as lowercase hex.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+from typing import IO, Callable, Optional, Union
+
+CHECKSUM_ALGORITHM = "sha256"
+
+_READ_SIZE = 1024 * 1024
+
+
+class ChecksumMismatchError(ValueError):
+    """The content read does not match the recorded checksum."""
+
+    def __init__(self, name: str, expected: str, actual: str):
+        super().__init__(
+            f"Checksum mismatch for {name}: expected {expected}, got {actual}"
+        )
+        self.expected = expected
+        self.actual = actual
+
+
+def new_hasher():
+    return hashlib.new(CHECKSUM_ALGORITHM)
+
+
+class HashingWriter(io.RawIOBase):
+    """Write-only wrapper hashing everything written to ``fileobj``.
+
+    ``hasher`` (a ``hashlib`` object) may be passed in to read the digest
+    after the writer is gone. Closing the wrapper leaves ``fileobj`` open.
+    """
+
+    def __init__(self, fileobj: IO[bytes], hasher=None):
+        super().__init__()
+        self._out = fileobj
+        self._hasher = hasher if hasher is not None else new_hasher()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        written = self._out.write(data)
+        self._hasher.update(data)
+        return len(data) if written is None else written
+
+    def flush(self) -> None:
+        # Also called from close() when collected, possibly after the
+        # wrapped file has already been closed.
+        if not self._out.closed:
+            self._out.flush()
+
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
+
+
+class HashingReader(io.RawIOBase):
+    """Read-only wrapper hashing everything read from ``fileobj``."""
+
+    def __init__(self, fileobj: IO[bytes], name: str = "stream"):
+        super().__init__()
+        self._in = fileobj
+        self._name = name
+        self._hasher = new_hasher()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        n = self._in.readinto(buffer)
+        if n:
+            self._hasher.update(memoryview(buffer)[:n])
+        return n or 0
+
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
+
+    def verify(self, expected: str) -> None:
+        """Hash the rest of the stream and compare with ``expected``.
+
+        Raises :class:`ChecksumMismatchError` on a mismatch.
+        """
+        buffer = bytearray(_READ_SIZE)
+        while self.readinto(buffer):
+            pass
+        actual = self.hexdigest()
+        if actual != expected:
+            raise ChecksumMismatchError(self._name, expected, actual)
+
+
+def file_checksum(
+    path: Union[str, os.PathLike],
+    *,
+    on_chunk: Optional[Callable[[int], None]] = None,
+    drop_cache: bool = False,
+) -> str:
+    """Hex SHA-256 of a file, read in 1 MiB pieces.
+
+    ``on_chunk(n)`` runs after each piece (for throttling or progress).
+    With ``drop_cache`` the pages read are dropped from the page cache
+    again, so a background pass does not evict hot data.
+    """
+    hasher = new_hasher()
+    buffer = bytearray(_READ_SIZE)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        offset = 0
+        while n := f.readinto(buffer):
+            hasher.update(view[:n])
+            if drop_cache and hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), offset, n, os.POSIX_FADV_DONTNEED)
+            offset += n
+            if on_chunk is not None:
+                on_chunk(n)
+    return hasher.hexdigest()
@@ -195,6 +195,12 @@ class Settings(BaseSettings):
     # 0 to disable enforcement (not recommended for production).
     FILE_MAX_UPLOAD_BYTES: int = 100 * 1024 * 1024  # 100 MiB
 
+    # Content search: files larger than FILE_SEARCH_MAX_FILE_BYTES are
+    # skipped (0 = no limit); FILE_SEARCH_WORKERS threads read files in
+    # parallel.
+    FILE_SEARCH_MAX_FILE_BYTES: int = 10 * 1024 * 1024  # 10 MiB
+    FILE_SEARCH_WORKERS: int = 4
+
     # Concurrency control (Issue #351). Semaphore limits that cap the
     # number of concurrent heavy I/O operations to prevent resource
     # exhaustion on shared hosts.
@@ -202,10 +208,37 @@ class Settings(BaseSettings):
     MAX_CONCURRENT_WEBSOCKETS: int = 100
     FILE_IO_SEMAPHORE_LIMIT: int = 10
 
+    # Per-connection WebSocket outbound queue. Each client gets a bounded
+    # send queue drained by its own writer task so one slow consumer cannot
+    # stall broadcasts to the others. On overflow either the oldest queued
+    # message is dropped or the slow client is disconnected.
+    WEBSOCKET_SEND_QUEUE_SIZE: int = 256
+    WEBSOCKET_SLOW_CONSUMER_POLICY: Literal["drop_oldest", "disconnect"] = "drop_oldest"
+
     # Backup directory housekeeping (Issue #284)
     BACKUPS_PENDING_RETENTION_HOURS: int = 24
     BACKUPS_FAILED_RETENTION_DAYS: int = 30
     BACKUPS_CLEANUP_INTERVAL_SECONDS: int = 3600
+    # Scheduled backups fire up to this many seconds after their nominal
+    # time (a fixed offset per server) so schedules don't all start at once.
+    BACKUP_SCHEDULE_JITTER_SECONDS: int = 300
+
+    # Backup archive compression. `tar.gz` is written by a parallel block
+    # gzip writer (standard gzip output); `tar.zst` needs the optional
+    # `zstandard` package (the `zstd` extra). Threads default (0) to the
+    # CPU count.
+    BACKUP_ARCHIVE_FORMAT: Literal["tar.gz", "tar.zst"] = "tar.gz"
+    BACKUP_GZIP_LEVEL: int = 6
+    BACKUP_ZSTD_LEVEL: int = 3
+    BACKUP_COMPRESSION_THREADS: int = 0
+    # `incremental` stores backups as manifests over a shared,
+    # content-addressed chunk store (`backups/.chunks`) instead of one
+    # archive per backup; downloads materialize an archive on demand.
+    BACKUP_MODE: Literal["full", "incremental"] = "full"
+    # Stored backups are re-hashed against their recorded SHA-256 this
+    # often (0 disables the scrubber), reading at most this many bytes/s.
+    BACKUP_SCRUB_INTERVAL_SECONDS: int = 86400
+    BACKUP_SCRUB_MAX_BYTES_PER_SECOND: int = 32 * 1024 * 1024
 
     # Health check configuration (Issue #21)
     HEALTH_CHECK_PER_COMPONENT_TIMEOUT_SECONDS: float = 2.0
@@ -467,6 +500,13 @@ class Settings(BaseSettings):
             raise ValueError("MAX_CONCURRENT_WEBSOCKETS must be between 1 and 10000")
         return v
 
+    @field_validator("WEBSOCKET_SEND_QUEUE_SIZE")
+    @classmethod
+    def validate_websocket_send_queue_size(cls, v: int) -> int:
+        if v < 1 or v > 100000:
+            raise ValueError("WEBSOCKET_SEND_QUEUE_SIZE must be between 1 and 100000")
+        return v
+
     @field_validator("FILE_IO_SEMAPHORE_LIMIT")
     @classmethod
     def validate_file_io_semaphore_limit(cls, v: int) -> int:
@@ -489,6 +529,25 @@ class Settings(BaseSettings):
             )
         return v
 
+    @field_validator("FILE_SEARCH_MAX_FILE_BYTES")
+    @classmethod
+    def validate_file_search_max_file_bytes(cls, v: int) -> int:
+        """Validate FILE_SEARCH_MAX_FILE_BYTES: 0 (no limit) or 1 KiB – 1 GiB."""
+        if v == 0:
+            return v
+        if v < 1024 or v > 1024 * 1024 * 1024:
+            raise ValueError(
+                "FILE_SEARCH_MAX_FILE_BYTES must be 0 or between 1KiB and 1GiB"
+            )
+        return v
+
+    @field_validator("FILE_SEARCH_WORKERS")
+    @classmethod
+    def validate_file_search_workers(cls, v: int) -> int:
+        if v < 1 or v > 32:
+            raise ValueError("FILE_SEARCH_WORKERS must be between 1 and 32")
+        return v
+
     @field_validator("BACKUPS_PENDING_RETENTION_HOURS")
     @classmethod
     def validate_pending_retention(cls, v: int) -> int:
@@ -519,6 +578,69 @@ class Settings(BaseSettings):
             )
         return v
 
+    @field_validator("BACKUP_SCHEDULE_JITTER_SECONDS")
+    @classmethod
+    def validate_backup_schedule_jitter(cls, v: int) -> int:
+        if v < 0 or v > 3600:
+            raise ValueError("BACKUP_SCHEDULE_JITTER_SECONDS must be between 0 and 3600")
+        return v
+
+    @field_validator("BACKUP_ARCHIVE_FORMAT")
+    @classmethod
+    def validate_backup_archive_format(cls, v: str) -> str:
+        """Reject `tar.zst` up front when `zstandard` is not importable.
+
+        Otherwise the misconfiguration only surfaces when a backup fails.
+        """
+        from app.core.archives import ARCHIVE_FORMAT_ZSTD, zstd_available
+
+        if v == ARCHIVE_FORMAT_ZSTD and not zstd_available():
+            raise ValueError(
+                "BACKUP_ARCHIVE_FORMAT=tar.zst requires the optional 'zstandard' "
+                "package (install the 'zstd' extra)"
+            )
+        return v
+
+    @field_validator("BACKUP_GZIP_LEVEL")
+    @classmethod
+    def validate_backup_gzip_level(cls, v: int) -> int:
+        if v < 1 or v > 9:
+            raise ValueError("BACKUP_GZIP_LEVEL must be between 1 and 9")
+        return v
+
+    @field_validator("BACKUP_ZSTD_LEVEL")
+    @classmethod
+    def validate_backup_zstd_level(cls, v: int) -> int:
+        if v < 1 or v > 22:
+            raise ValueError("BACKUP_ZSTD_LEVEL must be between 1 and 22")
+        return v
+
+    @field_validator("BACKUP_COMPRESSION_THREADS")
+    @classmethod
+    def validate_backup_compression_threads(cls, v: int) -> int:
+        if v < 0 or v > 256:
+            raise ValueError("BACKUP_COMPRESSION_THREADS must be between 0 and 256")
+        return v
+
+    @field_validator("BACKUP_SCRUB_INTERVAL_SECONDS")
+    @classmethod
+    def validate_backup_scrub_interval(cls, v: int) -> int:
+        if v != 0 and (v < 3600 or v > 30 * 86400):
+            raise ValueError(
+                "BACKUP_SCRUB_INTERVAL_SECONDS must be 0 (disabled) or between "
+                "3600 and 2592000 seconds"
+            )
+        return v
+
+    @field_validator("BACKUP_SCRUB_MAX_BYTES_PER_SECOND")
+    @classmethod
+    def validate_backup_scrub_rate(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError(
+                "BACKUP_SCRUB_MAX_BYTES_PER_SECOND must be >= 0 (0 = unthrottled)"
+            )
+        return v
+
     @field_validator(
         "HEALTH_CHECK_PER_COMPONENT_TIMEOUT_SECONDS",
         "HEALTH_CHECK_FS_TIMEOUT_SECONDS",
@@ -0,0 +1,124 @@
+"""In-process publish/subscribe bus for application events.
+
+Consumers that need to react to state changes (for example the WebSocket
+layer pushing server status to browsers) used to poll the owning service on
+a timer and re-send whatever they found, changed or not. With this module
+the owner publishes an event when something actually happens and every
+interested consumer receives it immediately.
+
+Events are grouped by topic string. :meth:`EventBus.publish` never blocks
+and never runs subscriber code: each :class:`EventSubscription` has its own
+bounded queue that the subscriber drains at its own pace, so a slow or
+stuck consumer cannot delay the publisher or other subscribers. When a
+subscriber falls ``maxsize`` events behind, its oldest event is dropped.
+
+A process-wide instance is available through :func:`get_event_bus`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Set
+
+
+class EventSubscription:
+    """A subscriber's queue of events published to one topic.
+
+    Iterate with ``async for`` (or call :meth:`get`) to receive events in
+    publication order; :meth:`close` detaches it from the bus.
+    """
+
+    def __init__(self, bus: "EventBus", topic: str, maxsize: int):
+        self.topic = topic
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._bus = bus
+        self._events: Deque[Any] = deque()
+        self._ready = asyncio.Event()
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def _put(self, event: Any) -> None:
+        if len(self._events) >= self.maxsize:
+            self._events.popleft()
+            self.dropped += 1
+        self._events.append(event)
+        self._ready.set()
+
+    async def get(self) -> Any:
+        """Wait for and return the next event."""
+        while not self._events:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._events.popleft()
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[Any]:
+        while not self._closed:
+            yield await self.get()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._events.clear()
+        self._bus._unsubscribe(self)
+
+
+class EventBus:
+    """Topic-based fan-out of events to independent subscriber queues."""
+
+    def __init__(self, *, subscriber_queue_size: int = 1000):
+        self.subscriber_queue_size = subscriber_queue_size
+        self._subscriptions: Dict[str, Set[EventSubscription]] = {}
+
+    def subscribe(self, topic: str, maxsize: Optional[int] = None) -> EventSubscription:
+        """Start receiving events published to ``topic`` from now on."""
+        subscription = EventSubscription(
+            self, topic, maxsize or self.subscriber_queue_size
+        )
+        self._subscriptions.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def publish(self, topic: str, event: Any) -> int:
+        """Deliver ``event`` to every subscriber of ``topic``.
+
+        Returns the number of subscribers the event was queued for.
+        """
+        subscriptions = self._subscriptions.get(topic)
+        if not subscriptions:
+            return 0
+        for subscription in subscriptions:
+            subscription._put(event)
+        return len(subscriptions)
+
+    def subscriber_count(self, topic: str) -> int:
+        return len(self._subscriptions.get(topic, ()))
+
+    def _unsubscribe(self, subscription: EventSubscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.topic)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.topic]
+
+
+_event_bus: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    """Return the process-wide :class:`EventBus`, creating it lazily."""
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = EventBus()
+    return _event_bus
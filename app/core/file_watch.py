@@ -0,0 +1,432 @@
+"""Shared append-only file watcher for server log tailing.
+
+Every running server used to own a task that re-opened ``server.log`` every
+0.5s, and every WebSocket-watched server had another task polling
+``logs/latest.log`` every 0.1s. This module replaces those loops with a
+single :class:`LogFileWatcher` that multiplexes all watched files:
+
+* On Linux one ``inotify`` descriptor (via ``ctypes``, no extra dependency)
+  watches the parent directory of every subscribed file and is registered
+  with the event loop through ``add_reader``. An idle file produces no
+  wakeups at all, and new lines are delivered as soon as the kernel reports
+  the write.
+* Elsewhere (or when ``inotify`` is unavailable / exhausted) a single
+  polling task ``stat()``\\ s every watched file each ``poll_interval`` and
+  only opens the ones whose size or mtime changed.
+
+Subscribers receive batches of complete, decoded lines. Each subscription
+keeps its own byte offset and partial-line buffer, and file reads run in a
+worker thread so they never block the event loop.
+
+A process-wide instance is available through :func:`get_log_watcher`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import inspect
+import logging
+import os
+import struct
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+LogLineCallback = Callable[[List[str]], Union[Awaitable[None], None]]
+LogErrorCallback = Callable[[Exception], None]
+
+# inotify(7) constants. Only the directory-level events that signal new or
+# replaced file content are requested.
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_IGNORED = 0x00008000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_BUFFER_BYTES = 64 * 1024
+
+
+class _Inotify:
+    """Minimal ``ctypes`` binding to the Linux inotify API."""
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self.fd = fd
+
+    def add_watch(self, directory: Path) -> int:
+        wd = self._add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), str(directory))
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        self._rm_watch(self.fd, wd)
+
+    def read_events(self) -> List[Tuple[int, int, str]]:
+        """Drain pending events as ``(wd, mask, name)`` tuples."""
+        events: List[Tuple[int, int, str]] = []
+        while True:
+            try:
+                data = os.read(self.fd, _READ_BUFFER_BYTES)
+            except BlockingIOError:
+                return events
+            if not data:
+                return events
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                events.append((wd, mask, os.fsdecode(name)))
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class LogSubscription:
+    """A subscriber's view of one watched file.
+
+    Holds the subscriber's byte offset and trailing partial line. Change
+    notifications from the watcher only mark the subscription dirty; a single
+    drain task per subscription performs the read and invokes the callback,
+    so deliveries are strictly ordered and never overlap.
+    """
+
+    # Upper bound on one read; larger backlogs are delivered in several batches.
+    READ_CHUNK_BYTES = 1024 * 1024
+
+    def __init__(
+        self,
+        watcher: "LogFileWatcher",
+        path: Path,
+        callback: LogLineCallback,
+        offset: int,
+        on_error: Optional[LogErrorCallback],
+    ):
+        self.path = path
+        self.offset = offset
+        self._watcher = watcher
+        self._callback = callback
+        self._on_error = on_error
+        self._partial = b""
+        self._pending = False
+        self._closed = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        """Stop receiving lines. Safe to call more than once."""
+        self._watcher.unsubscribe(self)
+
+    def _schedule(self) -> None:
+        if self._closed:
+            return
+        self._pending = True
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._drain())
+
+    async def _drain(self) -> None:
+        while self._pending and not self._closed:
+            self._pending = False
+            try:
+                lines, more = await asyncio.to_thread(self._read_new_lines)
+            except Exception as e:
+                self._report_error(e)
+                return
+            if more:
+                self._pending = True
+            if lines and not self._closed:
+                try:
+                    result = self._callback(lines)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    self._report_error(e)
+
+    def _report_error(self, error: Exception) -> None:
+        if self._on_error is not None:
+            self._on_error(error)
+        else:
+            logger.warning("Error tailing %s: %s", self.path, error)
+
+    def _read_new_lines(self) -> Tuple[List[str], bool]:
+        """Read bytes appended since the last call (runs in a worker thread).
+
+        Returns the complete lines read and whether unread bytes remain. A
+        file shorter than the offset is treated as truncated and re-read from
+        the start.
+        """
+        try:
+            size = os.stat(self.path).st_size
+        except FileNotFoundError:
+            return [], False
+        if size < self.offset:
+            self.offset = 0
+            self._partial = b""
+        if size == self.offset:
+            return [], False
+
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read(self.READ_CHUNK_BYTES)
+            self.offset = f.tell()
+
+        head, newline, tail = (self._partial + data).rpartition(b"\n")
+        if not newline:
+            self._partial = tail
+            return [], self.offset < size
+        self._partial = tail
+        lines = head.decode("utf-8", errors="ignore").split("\n")
+        return lines, self.offset < size
+
+
+class LogFileWatcher:
+    """Multiplex append notifications for many files onto one watcher.
+
+    ``use_inotify=False`` forces the polling backend (used by tests and on
+    platforms without inotify). The watcher binds to the running event loop
+    on first use and is rebound transparently if a later subscription comes
+    from a different loop.
+    """
+
+    def __init__(self, *, poll_interval: float = 0.5, use_inotify: bool = True):
+        self.poll_interval = poll_interval
+        self._use_inotify = use_inotify
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inotify: Optional[_Inotify] = None
+        self._subscriptions: Dict[Path, Set[LogSubscription]] = {}
+        self._dir_watches: Dict[Path, int] = {}
+        self._watch_dirs: Dict[int, Path] = {}
+        # Files not covered by an inotify directory watch; these are stat()ed
+        # by the polling task. In polling mode this is every watched file.
+        self._polled: Dict[Path, Optional[Tuple[int, int]]] = {}
+        self._poll_task: Optional[asyncio.Task] = None
+
+    @property
+    def backend(self) -> Optional[str]:
+        """``"inotify"``, ``"polling"`` or ``None`` before first use."""
+        if self._loop is None:
+            return None
+        return "inotify" if self._inotify is not None else "polling"
+
+    def subscribe(
+        self,
+        path: Union[str, Path],
+        callback: LogLineCallback,
+        *,
+        offset: Optional[int] = None,
+        from_end: bool = False,
+        on_error: Optional[LogErrorCallback] = None,
+    ) -> LogSubscription:
+        """Deliver lines appended to ``path`` to ``callback``.
+
+        Reading starts at ``offset`` if given, at the current end of file when
+        ``from_end`` is set, and at the start of the file otherwise. The file
+        (and its directory) need not exist yet. Must be called from a running
+        event loop.
+        """
+        self._bind_loop()
+        path = Path(os.path.abspath(path))
+        if offset is None:
+            offset = 0
+            if from_end:
+                try:
+                    offset = os.stat(path).st_size
+                except FileNotFoundError:
+                    pass
+
+        subscription = LogSubscription(self, path, callback, offset, on_error)
+        subscribers = self._subscriptions.setdefault(path, set())
+        first_for_path = not subscribers
+        subscribers.add(subscription)
+        if first_for_path:
+            self._watch_path(path)
+        # Catch up on anything already past the starting offset.
+        subscription._schedule()
+        return subscription
+
+    def unsubscribe(self, subscription: LogSubscription) -> None:
+        if subscription._closed:
+            return
+        subscription._closed = True
+        subscribers = self._subscriptions.get(subscription.path)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscriptions[subscription.path]
+            self._unwatch_path(subscription.path)
+
+    async def close(self) -> None:
+        """Drop every subscription and release the inotify descriptor."""
+        for subscribers in list(self._subscriptions.values()):
+            for subscription in list(subscribers):
+                subscription._closed = True
+        self._subscriptions.clear()
+        self._polled.clear()
+        if self._poll_task is not None and not self._poll_task.done():
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+        self._poll_task = None
+        self._release_inotify()
+        self._loop = None
+
+    # -- loop / backend management ---------------------------------------
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._loop is not None:
+            # Subscriptions created on another (typically closed) loop
+            # cannot be serviced from this one.
+            for subscribers in self._subscriptions.values():
+                for subscription in subscribers:
+                    subscription._closed = True
+            self._subscriptions.clear()
+            self._polled.clear()
+            self._poll_task = None
+            self._release_inotify()
+        self._loop = loop
+        if self._use_inotify:
+            try:
+                self._inotify = _Inotify()
+                loop.add_reader(self._inotify.fd, self._on_inotify_readable)
+            except (OSError, AttributeError, NotImplementedError) as e:
+                logger.info("inotify unavailable (%s); falling back to polling", e)
+                self._release_inotify()
+
+    def _release_inotify(self) -> None:
+        if self._inotify is None:
+            return
+        if self._loop is not None and not self._loop.is_closed():
+            try:
+                self._loop.remove_reader(self._inotify.fd)
+            except Exception:  # pragma: no cover - defensive
+                pass
+        try:
+            self._inotify.close()
+        except OSError:  # pragma: no cover - defensive
+            pass
+        self._inotify = None
+        self._dir_watches.clear()
+        self._watch_dirs.clear()
+
+    # -- watch bookkeeping ------------------------------------------------
+
+    def _watch_path(self, path: Path) -> None:
+        if self._inotify is not None and self._add_dir_watch(path.parent):
+            return
+        self._start_polling(path)
+
+    def _unwatch_path(self, path: Path) -> None:
+        self._polled.pop(path, None)
+        directory = path.parent
+        if any(p.parent == directory for p in self._subscriptions):
+            return
+        wd = self._dir_watches.pop(directory, None)
+        if wd is not None and self._inotify is not None:
+            self._watch_dirs.pop(wd, None)
+            self._inotify.rm_watch(wd)
+
+    def _add_dir_watch(self, directory: Path) -> bool:
+        if directory in self._dir_watches:
+            return True
+        try:
+            wd = self._inotify.add_watch(directory)
+        except OSError as e:
+            if e.errno not in (errno.ENOENT, errno.ENOTDIR):
+                logger.warning("inotify watch on %s failed: %s", directory, e)
+            return False
+        self._dir_watches[directory] = wd
+        self._watch_dirs[wd] = directory
+        return True
+
+    def _on_inotify_readable(self) -> None:
+        try:
+            events = self._inotify.read_events()
+        except OSError as e:  # pragma: no cover - defensive
+            logger.warning("Error reading inotify events: %s", e)
+            return
+        for wd, mask, name in events:
+            directory = self._watch_dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & _IN_IGNORED:
+                # The directory itself went away; fall back to polling its
+                # files until it reappears.
+                self._watch_dirs.pop(wd, None)
+                self._dir_watches.pop(directory, None)
+                for path in list(self._subscriptions):
+                    if path.parent == directory:
+                        self._start_polling(path)
+                continue
+            for subscription in list(self._subscriptions.get(directory / name, ())):
+                subscription._schedule()
+
+    # -- polling backend --------------------------------------------------
+
+    def _start_polling(self, path: Path) -> None:
+        self._polled.setdefault(path, None)
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = self._loop.create_task(self._poll_loop())
+
+    async def _poll_loop(self) -> None:
+        while self._polled:
+            await asyncio.sleep(self.poll_interval)
+            for path, previous in list(self._polled.items()):
+                if path not in self._polled:
+                    continue
+                if self._inotify is not None and self._add_dir_watch(path.parent):
+                    # Directory appeared: hand over to inotify and catch up
+                    # on anything written before the watch existed.
+                    del self._polled[path]
+                    self._notify(path)
+                    continue
+                try:
+                    st = os.stat(path)
+                    signature: Optional[Tuple[int, int]] = (st.st_size, st.st_mtime_ns)
+                except OSError:
+                    signature = None
+                if signature != previous:
+                    self._polled[path] = signature
+                    if signature is not None:
+                        self._notify(path)
+
+    def _notify(self, path: Path) -> None:
+        for subscription in list(self._subscriptions.get(path, ())):
+            subscription._schedule()
+
+
+_log_watcher: Optional[LogFileWatcher] = None
+
+
+def get_log_watcher() -> LogFileWatcher:
+    """Return the process-wide :class:`LogFileWatcher`, creating it lazily."""
+    global _log_watcher
+    if _log_watcher is None:
+        _log_watcher = LogFileWatcher()
+    return _log_watcher
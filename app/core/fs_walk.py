@@ -0,0 +1,72 @@
+"""Single-pass recursive file walking built on ``os.scandir``.
+
+``Path.rglob("*")`` followed by ``is_file()`` and ``stat()`` costs several
+system calls and a ``Path`` object per entry, and callers that first sized
+a tree and then walked it again paid for all of it twice. :func:`walk_files`
+visits each directory once with ``os.scandir`` and yields every file with
+the ``stat`` result cached on its ``DirEntry``; on Linux the file type comes
+from ``readdir`` itself, so directories cost no ``stat`` at all.
+
+Symlinked directories are not descended into (as with ``rglob``). Symlinks
+to files are yielded like regular files; with ``follow_symlinks=False`` the
+link's own ``lstat`` result is returned so callers can tell them apart.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional, Tuple, Union
+
+
+@dataclass(frozen=True)
+class WalkedFile:
+    """A file found by :func:`walk_files`."""
+
+    path: str
+    # POSIX-style path relative to the walk root.
+    relative_path: str
+    stat: os.stat_result
+
+
+def walk_files(
+    root: Union[str, os.PathLike],
+    *,
+    follow_symlinks: bool = True,
+    on_error: Optional[Callable[[OSError], None]] = None,
+) -> Iterator[WalkedFile]:
+    """Yield every file below ``root``, depth first.
+
+    Unreadable directories and entries are skipped; ``on_error`` (if
+    given) receives the ``OSError``.
+    """
+    stack: List[Tuple[str, str]] = [(os.fspath(root), "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            # Read the whole directory before yielding so at most one
+            # descriptor is open, however deep the tree or slow the caller.
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError as e:
+            if on_error is not None:
+                on_error(e)
+            continue
+
+        subdirectories = []
+        for entry in entries:
+            relative_path = prefix + entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append((entry.path, relative_path + "/"))
+                elif entry.is_file():
+                    yield WalkedFile(
+                        entry.path,
+                        relative_path,
+                        entry.stat(follow_symlinks=follow_symlinks),
+                    )
+            except OSError as e:
+                if on_error is not None:
+                    on_error(e)
+        # Reversed so subdirectories are visited in listing order.
+        stack.extend(reversed(subdirectories))
@@ -0,0 +1,248 @@
+"""Shared liveness registry for managed server processes.
+
+The server manager used to answer "is this PID still running?" by building
+a fresh ``psutil.Process`` and reading its status on every check, from the
+0.5s startup loop, the 5s monitoring loops and the 1s SIGTERM wait loop. A
+process exit was therefore noticed up to a whole polling interval late.
+
+:class:`ProcessLivenessRegistry` tracks every watched PID centrally:
+
+* On Linux each PID gets a ``pidfd`` (``pidfd_open(2)``, through ``ctypes``
+  when the ``os`` module lacks it) registered with the event loop via
+  ``add_reader``. The descriptor becomes readable the moment the process
+  exits, so waiters are woken immediately and a live process costs no
+  syscalls at all. A pidfd also pins the process identity, so PID reuse
+  cannot make a dead server look alive.
+* Elsewhere (or when ``pidfd_open`` is unavailable) a single polling task
+  checks all watched PIDs once per ``poll_interval`` in one worker-thread
+  hop, reusing one ``psutil.Process`` per PID.
+
+Callers either await the :class:`asyncio.Event` returned by :meth:`watch`
+or read the cached state through :meth:`is_alive`. A process-wide instance
+is available through :func:`get_process_liveness`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import sys
+from typing import Dict, List, Optional, Set
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+# pidfd_open(2) has the same number on every architecture using the generic
+# syscall table (x86_64, aarch64, ...).
+_SYS_PIDFD_OPEN = 434
+_libc: Optional[ctypes.CDLL] = None
+
+
+def _pidfd_open(pid: int) -> int:
+    """Return a pidfd for ``pid``; raises ``OSError`` like ``os.pidfd_open``."""
+    if hasattr(os, "pidfd_open"):
+        return os.pidfd_open(pid)
+    global _libc
+    if _libc is None:
+        _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    fd = _libc.syscall(_SYS_PIDFD_OPEN, pid, 0)
+    if fd < 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+    return fd
+
+
+class _Watch:
+    """Registry state for one PID."""
+
+    __slots__ = ("pid", "exited", "fd", "process")
+
+    def __init__(
+        self, pid: int, fd: Optional[int], process: Optional[psutil.Process]
+    ) -> None:
+        self.pid = pid
+        self.exited = asyncio.Event()
+        self.fd = fd
+        self.process = process
+
+
+class ProcessLivenessRegistry:
+    """Exit notification for many PIDs, multiplexed on the event loop.
+
+    ``use_pidfd=False`` forces the polling backend (used by tests and on
+    platforms without pidfds). Like :class:`app.core.file_watch.LogFileWatcher`
+    the registry binds to the running loop on first use and drops its
+    watches if a later call comes from a different loop.
+    """
+
+    def __init__(self, *, poll_interval: float = 0.5, use_pidfd: bool = True):
+        self.poll_interval = poll_interval
+        self._use_pidfd = use_pidfd and sys.platform.startswith("linux")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._watches: Dict[int, _Watch] = {}
+        # PIDs without a pidfd; checked together by the polling task.
+        self._polled: Set[int] = set()
+        self._poll_task: Optional[asyncio.Task] = None
+
+    @property
+    def backend(self) -> Optional[str]:
+        """``"pidfd"``, ``"polling"`` or ``None`` before first use."""
+        if self._loop is None:
+            return None
+        return "pidfd" if self._use_pidfd else "polling"
+
+    def watch(self, pid: int) -> Optional[asyncio.Event]:
+        """Start tracking ``pid`` and return an event set when it exits.
+
+        Watching an already-watched PID returns the existing event. Returns
+        ``None`` if the process cannot be watched because it does not exist
+        (any more); callers should then fall back to a direct check. Must be
+        called from a running event loop.
+        """
+        self._bind_loop()
+        existing = self._watches.get(pid)
+        if existing is not None:
+            return existing.exited
+
+        if self._use_pidfd:
+            try:
+                fd = _pidfd_open(pid)
+            except ProcessLookupError:
+                return None
+            except OSError as e:
+                if e.errno == errno.ESRCH:
+                    return None
+                if e.errno == errno.ENOSYS:
+                    logger.info("pidfd_open unavailable; falling back to polling")
+                    self._use_pidfd = False
+                return self._watch_polled(pid)
+            watch = _Watch(pid, fd, None)
+            self._watches[pid] = watch
+            self._loop.add_reader(fd, self._on_pidfd_readable, watch)
+            return watch.exited
+
+        return self._watch_polled(pid)
+
+    def is_alive(self, pid: int) -> Optional[bool]:
+        """Cached liveness of a watched PID, or ``None`` if it is not watched."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        watch = self._watches.get(pid)
+        if watch is None or loop is not self._loop:
+            return None
+        return not watch.exited.is_set()
+
+    def forget(self, pid: int) -> None:
+        """Stop tracking ``pid`` (e.g. once its server has been cleaned up).
+
+        Must also be called before a recycled PID is watched again, since the
+        state of an exited watch is kept until then.
+        """
+        watch = self._watches.pop(pid, None)
+        self._polled.discard(pid)
+        if watch is not None:
+            self._release_fd(watch)
+
+    async def close(self) -> None:
+        """Drop every watch and stop the polling task."""
+        for pid in list(self._watches):
+            self.forget(pid)
+        if self._poll_task is not None and not self._poll_task.done():
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+        self._poll_task = None
+        self._loop = None
+
+    # -- loop / backend management ---------------------------------------
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._loop is not None:
+            # Watches created on another (typically closed) loop cannot be
+            # serviced from this one.
+            for watch in self._watches.values():
+                self._release_fd(watch)
+            self._watches.clear()
+            self._polled.clear()
+            self._poll_task = None
+        self._loop = loop
+
+    def _release_fd(self, watch: _Watch) -> None:
+        if watch.fd is None:
+            return
+        if self._loop is not None and not self._loop.is_closed():
+            try:
+                self._loop.remove_reader(watch.fd)
+            except Exception:  # pragma: no cover - defensive
+                pass
+        try:
+            os.close(watch.fd)
+        except OSError:  # pragma: no cover - defensive
+            pass
+        watch.fd = None
+
+    def _on_pidfd_readable(self, watch: _Watch) -> None:
+        self._release_fd(watch)
+        watch.exited.set()
+
+    def _watch_polled(self, pid: int) -> Optional[asyncio.Event]:
+        try:
+            process = psutil.Process(pid)
+        except psutil.NoSuchProcess:
+            return None
+        watch = _Watch(pid, None, process)
+        self._watches[pid] = watch
+        self._polled.add(pid)
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = self._loop.create_task(self._poll_loop())
+        return watch.exited
+
+    async def _poll_loop(self) -> None:
+        while self._polled:
+            await asyncio.sleep(self.poll_interval)
+            watches = [self._watches[pid] for pid in self._polled if pid in self._watches]
+            exited = await asyncio.to_thread(self._scan, watches)
+            for watch in exited:
+                self._polled.discard(watch.pid)
+                watch.exited.set()
+
+    @staticmethod
+    def _scan(watches: List[_Watch]) -> List[_Watch]:
+        """Return the watches whose process has exited (runs in a thread)."""
+        exited = []
+        for watch in watches:
+            try:
+                # is_running() compares the creation time too, so a recycled
+                # PID is reported as exited.
+                alive = (
+                    watch.process.is_running()
+                    and watch.process.status() != psutil.STATUS_ZOMBIE
+                )
+            except psutil.Error:
+                alive = False
+            if not alive:
+                exited.append(watch)
+        return exited
+
+
+_process_liveness: Optional[ProcessLivenessRegistry] = None
+
+
+def get_process_liveness() -> ProcessLivenessRegistry:
+    """Return the process-wide :class:`ProcessLivenessRegistry`, creating it lazily."""
+    global _process_liveness
+    if _process_liveness is None:
+        _process_liveness = ProcessLivenessRegistry()
+    return _process_liveness
@@ -4,12 +4,16 @@ This module provides security utilities to prevent path traversal attacks
 and other security vulnerabilities in file operations.
 """
 
+import asyncio
+import io
+import queue
 import re
 import stat
 import tarfile
+import threading
 import zipfile
 from pathlib import Path, PureWindowsPath
-from typing import Union
+from typing import Optional, Union
 
 
 class SecurityError(Exception):
@@ -227,9 +231,11 @@ class TarExtractor:
                 f"Archive too large: {archive_size} bytes (max {TarExtractor.MAX_ARCHIVE_SIZE})"
             )
 
-        # Validate archive contents
+        # Validate archive contents (tar.gz or tar.zst)
+        from app.core.archives import ArchiveFormatError, open_tar_archive
+
         try:
-            with tarfile.open(tar_path, "r:gz") as tar:
+            with open_tar_archive(tar_path) as tar:
                 members = tar.getmembers()
 
                 # Check member count
@@ -273,7 +279,7 @@ class TarExtractor:
                         f"Total extracted size too large: {total_extracted_size} bytes"
                     )
 
-        except tarfile.TarError as e:
+        except (tarfile.TarError, ArchiveFormatError, EOFError, OSError) as e:
             raise SecurityError(f"Invalid or corrupted archive: {e}")
 
     @staticmethod
@@ -385,6 +391,199 @@ class TarExtractor:
             tar.extract(member, path=target_dir)
 
 
+class _ValidationAborted(Exception):
+    """Raised inside the validator thread when the producer gives up."""
+
+
+_ABORT = object()
+
+
+class _ChunkQueueReader(io.RawIOBase):
+    """Blocking file object over chunks pushed into a queue.
+
+    ``None`` marks the end of the stream; ``_ABORT`` stops the reader.
+    """
+
+    def __init__(self, chunks: "queue.Queue"):
+        super().__init__()
+        self._chunks = chunks
+        self._pending = memoryview(b"")
+        self._eof = False
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._pending:
+            if self._eof:
+                return 0
+            chunk = self._chunks.get()
+            if chunk is _ABORT:
+                raise _ValidationAborted()
+            if chunk is None:
+                self._eof = True
+                return 0
+            self._pending = memoryview(chunk)
+        n = min(len(b), len(self._pending))
+        b[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        self.bytes_read += n
+        return n
+
+
+class StreamingTarValidator:
+    """Validate a tar.gz / tar.zst archive in one pass as its bytes arrive.
+
+    ``TarExtractor.validate_archive_safety`` needs the complete file and
+    decompresses it in full. This validator is fed the compressed bytes
+    while they are being received (``await feed(chunk)``); a worker thread
+    decompresses them and walks the tar headers as a forward-only stream,
+    applying the same member rules (count, path traversal, links and
+    devices, per-member and total size) as each header is read. The first
+    violation is raised from the next ``feed()``, so an upload can be
+    rejected before the rest of it arrives.
+
+    Sizes are checked from the headers before a member's data is
+    decompressed, so a size bomb is rejected without inflating it. The
+    compression ratio is measured on the actual stream (decompressed
+    offset versus compressed bytes consumed) at every header.
+
+    Call :meth:`finish` after the last chunk; it returns the detected
+    archive format. :meth:`close` stops the worker early and is safe to
+    call at any time.
+    """
+
+    # Ratios are only meaningful once something substantial has been
+    # decompressed; tiny archives of highly compressible text are fine.
+    RATIO_CHECK_MIN_BYTES = 1024 * 1024
+
+    def __init__(self, max_queued_chunks: int = 64):
+        self._chunks: "queue.Queue" = queue.Queue(maxsize=max_queued_chunks)
+        self._reader = _ChunkQueueReader(self._chunks)
+        self._done = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._archive_format: Optional[str] = None
+        self._thread = threading.Thread(
+            target=self._run, name="tar-validator", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def archive_format(self) -> Optional[str]:
+        return self._archive_format
+
+    async def feed(self, data: bytes) -> None:
+        """Queue ``data`` for validation, raising any violation found so far."""
+        self._raise_if_failed()
+        if self._done.is_set() or not data:
+            # Past the end-of-archive marker: trailing bytes are not tar data.
+            return
+        try:
+            self._chunks.put_nowait(bytes(data))
+        except queue.Full:
+            # The validator is behind; wait for it without blocking the loop.
+            await asyncio.to_thread(self._put_blocking, bytes(data))
+        self._raise_if_failed()
+
+    async def finish(self) -> str:
+        """Signal end of input and wait for validation to complete."""
+        if not self._done.is_set():
+            await asyncio.to_thread(self._put_blocking, None)
+        await asyncio.to_thread(self._thread.join)
+        self._raise_if_failed()
+        assert self._archive_format is not None
+        return self._archive_format
+
+    def close(self) -> None:
+        """Stop the worker thread if it is still running."""
+        while not self._done.is_set():
+            try:
+                self._chunks.put_nowait(_ABORT)
+                return
+            except queue.Full:
+                # Make room; whatever was queued is no longer needed.
+                try:
+                    self._chunks.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _put_blocking(self, item) -> None:
+        while not self._done.is_set():
+            try:
+                self._chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        try:
+            self._validate(io.BufferedReader(self._reader, buffer_size=64 * 1024))
+        except _ValidationAborted:
+            pass
+        except BaseException as e:
+            self._error = e
+        finally:
+            self._done.set()
+
+    def _validate(self, stream: io.BufferedReader) -> None:
+        from app.core.archives import (
+            _GZIP_MAGIC,
+            _ZSTD_MAGIC,
+            ARCHIVE_FORMAT_GZIP,
+            ARCHIVE_FORMAT_ZSTD,
+            ArchiveFormatError,
+            _require_zstandard,
+        )
+
+        magic = stream.peek(4)[:4]
+        if magic.startswith(_GZIP_MAGIC):
+            self._archive_format = ARCHIVE_FORMAT_GZIP
+            source, mode = stream, "r|gz"
+        elif magic == _ZSTD_MAGIC:
+            zstd = _require_zstandard()
+            self._archive_format = ARCHIVE_FORMAT_ZSTD
+            source, mode = zstd.ZstdDecompressor().stream_reader(stream), "r|"
+        else:
+            raise ArchiveFormatError("Unrecognised archive format")
+
+        dummy_target = Path("/tmp/dummy")
+        member_count = 0
+        total_extracted_size = 0
+        with tarfile.open(fileobj=source, mode=mode) as tar:
+            for member in tar:
+                member_count += 1
+                if member_count > TarExtractor.MAX_MEMBER_COUNT:
+                    raise SecurityError(
+                        f"Too many files in archive: more than {TarExtractor.MAX_MEMBER_COUNT}"
+                    )
+
+                TarExtractor.validate_tar_member(member, dummy_target)
+
+                if member.size > TarExtractor.MAX_MEMBER_SIZE:
+                    raise SecurityError(
+                        f"File too large in archive: {member.name} - {member.size} bytes"
+                    )
+                total_extracted_size += member.size
+                if total_extracted_size > TarExtractor.MAX_EXTRACTED_SIZE:
+                    raise SecurityError(
+                        f"Total extracted size too large: {total_extracted_size} bytes"
+                    )
+
+                # Everything before this header has been decompressed.
+                decompressed = member.offset
+                if decompressed > self.RATIO_CHECK_MIN_BYTES:
+                    ratio = decompressed / max(1, self._reader.bytes_read)
+                    if ratio > TarExtractor.MAX_COMPRESSION_RATIO:
+                        raise SecurityError(
+                            f"Suspicious compression ratio before {member.name}: {ratio:.1f}"
+                        )
+
+
 class ZipExtractor:
     """Secure zip file extraction utility.
 
@@ -113,8 +113,12 @@ def migrate_file_history_unique_index(engine: Any) -> None:
 # accelerates "edits by user" lookups in the audit UI; the column is
 # also the FK target for `ON DELETE SET NULL`, where some engines
 # (notably MySQL/InnoDB) require an index for cascade efficiency.
+# `backup_file_path` is how versions reference their history blob; it is
+# counted every time a version is deleted to decide whether the blob
+# can go.
 _FILE_HISTORY_INDEXES: tuple[tuple[str, str], ...] = (
     ("ix_file_edit_history_editor_user_id", "editor_user_id"),
+    ("ix_file_edit_history_backup_file_path", "backup_file_path"),
 )
 
 
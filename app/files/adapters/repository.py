@@ -1,9 +1,10 @@
-"""SQLAlchemy implementation of `FileHistoryRepository`.
+"""SQLAlchemy implementations of `FileHistoryRepository` and
+`HistoryBlobRepository`.
 
-Implements `app.files.domain.ports.FileHistoryRepository`. The adapter
-is the only layer that knows about the SQLAlchemy ORM and the
-`FileEditHistory` columns; it converts ORM rows to/from
-`FileHistoryEntity` so the application layer never sees ORM types.
+Implements the Ports in `app.files.domain.ports`. The adapters are the
+only layer that knows about the SQLAlchemy ORM and the
+`FileEditHistory` / `FileHistoryBlob` columns; they convert ORM rows
+to/from domain entities so the application layer never sees ORM types.
 
 Per the UnitOfWork pattern, repository methods **do not commit**. They
 stage changes on the session and rely on the surrounding
@@ -11,17 +12,21 @@ stage changes on the session and rely on the surrounding
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Set
 
-from sqlalchemy import desc, func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import desc, exists, func
+from sqlalchemy.orm import Session, aliased, joinedload
 
 from app.files.domain.entities import (
     CreateHistoryCommand,
     FileHistoryEntity,
     FileHistoryStatsEntity,
+    HistoryBlobEntity,
 )
-from app.files.models import FileEditHistory
+from app.files.models import FileEditHistory, FileHistoryBlob
+
+# Bound on `IN (...)` list sizes (SQLite's variable limit is 999).
+_IN_CLAUSE_BATCH = 500
 
 
 def _history_to_entity(row: FileEditHistory) -> FileHistoryEntity:
@@ -47,6 +52,16 @@ def _history_to_entity(row: FileEditHistory) -> FileHistoryEntity:
     )
 
 
+def _blob_to_entity(row: FileHistoryBlob) -> HistoryBlobEntity:
+    return HistoryBlobEntity(
+        content_hash=row.content_hash,
+        storage_path=row.storage_path,
+        stored_size=row.stored_size,
+        base_hash=row.base_hash,
+        chain_depth=row.chain_depth,
+    )
+
+
 class SqlAlchemyFileHistoryRepository:
     """SQLAlchemy-backed implementation of the file-history
     persistence Port.
@@ -235,3 +250,80 @@ class SqlAlchemyFileHistoryRepository:
             return False
         self.db.delete(row)
         return True
+
+
+class SqlAlchemyHistoryBlobRepository:
+    """SQLAlchemy-backed implementation of the history-blob persistence
+    Port. Does not commit.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    async def get(self, content_hash: str) -> Optional[HistoryBlobEntity]:
+        row = self.db.get(FileHistoryBlob, content_hash)
+        return _blob_to_entity(row) if row else None
+
+    async def get_existing_hashes(self, content_hashes: List[str]) -> Set[str]:
+        existing: Set[str] = set()
+        for start in range(0, len(content_hashes), _IN_CLAUSE_BATCH):
+            batch = content_hashes[start : start + _IN_CLAUSE_BATCH]
+            existing.update(
+                content_hash
+                for (content_hash,) in self.db.query(FileHistoryBlob.content_hash)
+                .filter(FileHistoryBlob.content_hash.in_(batch))
+                .all()
+            )
+        return existing
+
+    async def get_unreferenced(self) -> List[HistoryBlobEntity]:
+        self.db.flush()
+        dependent = aliased(FileHistoryBlob)
+        rows = (
+            self.db.query(FileHistoryBlob)
+            .filter(
+                ~exists().where(
+                    FileEditHistory.backup_file_path == FileHistoryBlob.storage_path
+                ),
+                ~exists().where(dependent.base_hash == FileHistoryBlob.content_hash),
+            )
+            .all()
+        )
+        return [_blob_to_entity(r) for r in rows]
+
+    async def count_references(self, blob: HistoryBlobEntity) -> int:
+        # Sessions are created with autoflush=False; make staged deletes
+        # visible to the counts.
+        self.db.flush()
+        versions = (
+            self.db.query(func.count(FileEditHistory.id))
+            .filter(FileEditHistory.backup_file_path == blob.storage_path)
+            .scalar()
+        )
+        deltas = (
+            self.db.query(func.count(FileHistoryBlob.content_hash))
+            .filter(FileHistoryBlob.base_hash == blob.content_hash)
+            .scalar()
+        )
+        return int(versions or 0) + int(deltas or 0)
+
+    async def add(self, blob: HistoryBlobEntity) -> HistoryBlobEntity:
+        row = FileHistoryBlob(
+            content_hash=blob.content_hash,
+            storage_path=blob.storage_path,
+            stored_size=blob.stored_size,
+            base_hash=blob.base_hash,
+            chain_depth=blob.chain_depth,
+        )
+        self.db.add(row)
+        self.db.flush()
+        return _blob_to_entity(row)
+
+    async def delete(self, content_hash: str) -> bool:
+        row = self.db.get(FileHistoryBlob, content_hash)
+        if row is None:
+            return False
+        self.db.delete(row)
+        # Flushed so `get_unreferenced` and `get` stop returning it.
+        self.db.flush()
+        return True
@@ -3,8 +3,9 @@
 Mirrors `app.versions.adapters.uow.SqlAlchemyUnitOfWork` (see that file
 for the full rationale on construction modes, re-entry semantics, and
 the forgot-to-commit warning). The only differences here are the bound
-repository (`SqlAlchemyFileHistoryRepository`) and the attribute name
-(`files_history`).
+repositories (`SqlAlchemyFileHistoryRepository`,
+`SqlAlchemyHistoryBlobRepository`) and their attribute names
+(`files_history`, `history_blobs`).
 """
 
 import logging
@@ -13,8 +14,11 @@ from typing import Callable, Optional
 
 from sqlalchemy.orm import Session
 
-from app.files.adapters.repository import SqlAlchemyFileHistoryRepository
-from app.files.domain.ports import FileHistoryRepository
+from app.files.adapters.repository import (
+    SqlAlchemyFileHistoryRepository,
+    SqlAlchemyHistoryBlobRepository,
+)
+from app.files.domain.ports import FileHistoryRepository, HistoryBlobRepository
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +27,7 @@ class SqlAlchemyFilesUnitOfWork:
     """SQLAlchemy-backed `FilesUnitOfWork`."""
 
     files_history: FileHistoryRepository
+    history_blobs: HistoryBlobRepository
 
     def __init__(
         self,
@@ -47,6 +52,7 @@ class SqlAlchemyFilesUnitOfWork:
             assert self._session_factory is not None  # for type checker
             self._db = self._session_factory()
         self.files_history = SqlAlchemyFileHistoryRepository(self._db)
+        self.history_blobs = SqlAlchemyHistoryBlobRepository(self._db)
         self._committed = False
         return self
 
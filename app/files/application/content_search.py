@@ -0,0 +1,242 @@
+"""Parallel, streaming search of file contents.
+
+Files are read in `CHUNK_BYTES` pieces cut at line boundaries, so no
+file is held in memory whole and line numbers fall out of counting
+newlines. Each chunk is decoded once and scanned with a precompiled
+case-insensitive pattern. Files that are larger than the configured
+limit, or whose first bytes contain a NUL, are skipped.
+
+`ContentSearchEngine.search` fans files out to a small thread pool and
+yields matches as they complete. It stops as soon as `max_results`
+files have matched: queued files are cancelled and files being read
+abandon at their next chunk.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+CHUNK_BYTES = 1024 * 1024
+SNIFF_BYTES = 8 * 1024
+SNIPPET_CHARS = 160
+MAX_LINES_PER_FILE = 20
+
+
+@dataclass(frozen=True)
+class LineMatch:
+    """A matching line: 1-based number and a snippet around the match."""
+
+    line: int
+    snippet: str
+
+
+@dataclass
+class ContentMatch:
+    """A file whose content matched, with up to `MAX_LINES_PER_FILE` lines.
+
+    ``truncated`` is set when the file has more matching lines.
+    """
+
+    path: str
+    lines: List[LineMatch] = field(default_factory=list)
+    truncated: bool = False
+
+
+class _Cancelled(Exception):
+    pass
+
+
+def _snippet(line: str, column: int, length: int) -> str:
+    line = line.rstrip("\r")
+    if len(line) <= SNIPPET_CHARS:
+        return line
+    start = max(0, min(column - SNIPPET_CHARS // 3, len(line) - SNIPPET_CHARS))
+    end = start + max(SNIPPET_CHARS, length)
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(line) else ""
+    return f"{prefix}{line[start:end]}{suffix}"
+
+
+class ContentMatcher:
+    """Case-insensitive literal matcher over a file's lines."""
+
+    def __init__(self, term: str, max_lines: int = MAX_LINES_PER_FILE):
+        self.term = term
+        self.max_lines = max_lines
+        self._pattern = re.compile(re.escape(term), re.IGNORECASE)
+
+    def search_file(
+        self,
+        path: str,
+        max_bytes: int,
+        cancelled: Optional[threading.Event] = None,
+    ) -> Optional[ContentMatch]:
+        """Matching lines of ``path``, or None (no match, binary, too big)."""
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if max_bytes and size > max_bytes:
+                return None
+            head = f.read(SNIFF_BYTES)
+            if b"\0" in head:
+                return None
+
+            match = ContentMatch(path=path)
+            line_number = 1
+            carry = head
+            while True:
+                if cancelled is not None and cancelled.is_set():
+                    raise _Cancelled()
+                chunk = f.read(CHUNK_BYTES)
+                data = carry + chunk
+                if chunk:
+                    cut = data.rfind(b"\n") + 1
+                    if cut == 0:
+                        carry = data
+                        continue
+                    carry = data[cut:]
+                    data = data[:cut]
+                else:
+                    carry = b""
+                text = data.decode("utf-8", "replace")
+                if text and self._scan(text, line_number, match):
+                    break
+                if not chunk:
+                    break
+                line_number += data.count(b"\n")
+
+        return match if match.lines else None
+
+    def _scan(self, text: str, first_line: int, match: ContentMatch) -> bool:
+        """Record matching lines of ``text``; True once the file is done."""
+        line_number = first_line
+        counted_to = 0
+        position = 0
+        while True:
+            found = self._pattern.search(text, position)
+            if found is None:
+                return False
+            start = found.start()
+            line_start = text.rfind("\n", 0, start) + 1
+            line_end = text.find("\n", start)
+            if line_end == -1:
+                line_end = len(text)
+            line_number += text.count("\n", counted_to, line_start)
+            counted_to = line_start
+            if len(match.lines) >= self.max_lines:
+                match.truncated = True
+                return True
+            match.lines.append(
+                LineMatch(
+                    line=line_number,
+                    snippet=_snippet(
+                        text[line_start:line_end],
+                        start - line_start,
+                        found.end() - start,
+                    ),
+                )
+            )
+            position = line_end + 1
+
+
+class ContentSearchEngine:
+    """Search many files on a bounded thread pool, yielding as they match."""
+
+    def __init__(self, max_file_bytes: int, workers: int):
+        self.max_file_bytes = max_file_bytes
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="file-search"
+            )
+        return self._executor
+
+    def _search_one(
+        self,
+        root: Path,
+        relative: str,
+        matcher: ContentMatcher,
+        cancelled: threading.Event,
+    ) -> Optional[ContentMatch]:
+        if cancelled.is_set():
+            return None
+        try:
+            result = matcher.search_file(
+                os.path.join(root, relative), self.max_file_bytes, cancelled
+            )
+        except _Cancelled:
+            return None
+        except OSError as e:
+            logger.debug(f"Skipping {relative} in content search: {e}")
+            return None
+        if result is not None:
+            result.path = relative
+        return result
+
+    async def search(
+        self,
+        root: Path,
+        candidates: Iterable[str],
+        term: str,
+        max_results: int,
+    ) -> AsyncIterator[ContentMatch]:
+        """Yield up to ``max_results`` matching files, in completion order.
+
+        ``candidates`` are paths relative to ``root``. Closing the
+        iterator early (e.g. a disconnected client) cancels the rest.
+        """
+        if max_results <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        matcher = ContentMatcher(term)
+        cancelled = threading.Event()
+        remaining = iter(candidates)
+        pending: Set[asyncio.Future] = set()
+
+        def submit() -> bool:
+            for relative in remaining:
+                pending.add(
+                    loop.run_in_executor(
+                        executor, self._search_one, root, relative, matcher, cancelled
+                    )
+                )
+                return True
+            return False
+
+        found = 0
+        try:
+            # Keep each worker busy with one file queued behind it.
+            for _ in range(self.workers * 2):
+                if not submit():
+                    break
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    result = future.result()
+                    if result is not None:
+                        found += 1
+                        yield result
+                        if found >= max_results:
+                            return
+                    submit()
+        finally:
+            cancelled.set()
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
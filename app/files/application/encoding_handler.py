@@ -1,11 +1,82 @@
 """
 Encoding detection and handling service for file operations.
+
+Detection used to run `chardet.detect` over every byte of the file and,
+when that was inconclusive, re-open and re-decode the file once per
+entry in `COMMON_ENCODINGS`; a multi-megabyte log froze the event loop
+for seconds. Now the file is read once and:
+
+1. decoded as strict UTF-8 (covers ASCII), which runs at memory speed
+   and settles almost every file on a Minecraft server;
+2. otherwise, `chardet` sees at most `DETECTION_SAMPLE_BYTES` from the
+   start of the file;
+3. otherwise, `COMMON_ENCODINGS` are tried on the bytes already read.
+
+The detected encoding is cached per (path, mtime, size), so reopening an
+unchanged file skips detection. `FileOperationService.read_file_content`
+runs all of this on a worker thread.
 """
 
-from typing import Tuple
+import codecs
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
 
 import chardet
 
+# chardet's cost grows with its input; a prefix this size is enough for
+# it to tell the legacy encodings apart.
+DETECTION_SAMPLE_BYTES = 32 * 1024
+DETECTION_CACHE_SIZE = 512
+
+# A file modified this recently may be rewritten again within the same
+# mtime tick without changing size, so its encoding is not cached yet.
+_RACY_MTIME_NS = 2_000_000_000
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_REPLACEMENT_SUFFIX = " (with replacement)"
+
+
+def _decode_as(raw_data: bytes, encoding: str) -> str:
+    """Decode with a (possibly cached) result of `decode_with_detection`."""
+    if encoding.endswith(_REPLACEMENT_SUFFIX):
+        base = encoding[: -len(_REPLACEMENT_SUFFIX)]
+        return raw_data.decode(base, errors="replace")
+    return raw_data.decode(encoding)
+
+
+class _EncodingCache:
+    """Thread-safe LRU of detected encodings keyed by (path, mtime, size)."""
+
+    def __init__(self, max_entries: int = DETECTION_CACHE_SIZE):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, int, int]) -> Optional[str]:
+        with self._lock:
+            encoding = self._entries.get(key)
+            if encoding is not None:
+                self._entries.move_to_end(key)
+            return encoding
+
+    def put(self, key: Tuple[str, int, int], encoding: str) -> None:
+        with self._lock:
+            self._entries[key] = encoding
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
 
 class EncodingHandler:
     """Handle file encoding detection and conversion."""
@@ -22,65 +93,97 @@ class EncodingHandler:
         "ascii",
     ]
 
+    _cache = _EncodingCache()
+
     @staticmethod
-    def read_file_with_encoding_detection(file_path: str) -> Tuple[str, str]:
+    def decode_with_detection(raw_data: bytes) -> Tuple[str, str]:
         """
-        Read file with automatic encoding detection.
-
-        Args:
-            file_path: Path to the file to read
+        Decode bytes, detecting their encoding with bounded effort.
 
         Returns:
-            Tuple of (file_content, detected_encoding)
-
-        Raises:
-            RuntimeError: If the fallback (utf-8 with errors="replace") itself fails
-                (typically because the file became unreadable, not a decode error).
-            FileNotFoundError: If file doesn't exist
-            OSError: For other underlying I/O errors raised by the read path
+            Tuple of (content, detected_encoding)
         """
-        # First, try to detect encoding using chardet
+        for bom, encoding in _BOMS:
+            if raw_data.startswith(bom):
+                try:
+                    return raw_data.decode(encoding), encoding
+                except UnicodeDecodeError:
+                    break
+
         try:
-            with open(file_path, "rb") as f:
-                raw_data = f.read()
+            return raw_data.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            pass
 
-            # Use chardet for detection
-            detection_result = chardet.detect(raw_data)
+        try:
+            detection_result = chardet.detect(raw_data[:DETECTION_SAMPLE_BYTES])
             detected_encoding = detection_result.get("encoding")
             confidence = detection_result.get("confidence", 0)
 
             # If confidence is high enough, try the detected encoding first
             if detected_encoding and confidence > 0.7:
                 try:
-                    content = raw_data.decode(detected_encoding)
-                    return content, detected_encoding
-                except UnicodeDecodeError:
+                    return raw_data.decode(detected_encoding), detected_encoding
+                except (UnicodeDecodeError, LookupError):
                     pass  # Fall back to trying common encodings
-
         except Exception:
             pass  # Fall back to trying common encodings
 
-        # Try common encodings one by one
+        # Try common encodings one by one (UTF-8 already failed above)
         for encoding in EncodingHandler.COMMON_ENCODINGS:
+            if encoding == "utf-8":
+                continue
             try:
-                with open(file_path, "r", encoding=encoding) as f:
-                    content = f.read()
-                return content, encoding
+                return raw_data.decode(encoding), encoding
             except UnicodeDecodeError:
                 continue
-            except Exception as e:
-                # Handle other file errors
-                raise e
 
-        # If all encodings fail, try with error handling
+        return (
+            raw_data.decode("utf-8", errors="replace"),
+            f"utf-8{_REPLACEMENT_SUFFIX}",
+        )
+
+    @staticmethod
+    def read_file_with_encoding_detection(file_path: str) -> Tuple[str, str]:
+        """
+        Read file with automatic encoding detection.
+
+        Blocking; callers on the event loop should run it in a worker
+        thread.
+
+        Args:
+            file_path: Path to the file to read
+
+        Returns:
+            Tuple of (file_content, detected_encoding)
+
+        Raises:
+            RuntimeError: If decoding fails even with utf-8 and
+                errors="replace".
+            FileNotFoundError: If file doesn't exist
+            OSError: For other underlying I/O errors raised by the read path
+        """
+        with open(file_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            raw_data = f.read()
+
+        cache_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        cached = EncodingHandler._cache.get(cache_key)
+        if cached is not None:
+            try:
+                return _decode_as(raw_data, cached), cached
+            except (UnicodeDecodeError, LookupError):
+                pass  # Rewritten within the same mtime tick; detect again
+
         try:
-            with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-                content = f.read()
-            return content, "utf-8 (with replacement)"
+            content, encoding = EncodingHandler.decode_with_detection(raw_data)
         except Exception as e:
             raise RuntimeError(
                 f"Could not decode file {file_path} with any common encoding"
             ) from e
+        if time.time_ns() - stat.st_mtime_ns >= _RACY_MTIME_NS:
+            EncodingHandler._cache.put(cache_key, encoding)
+        return content, encoding
 
     @staticmethod
     def safe_read_text_file(file_path: str) -> dict:
@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import Any, Dict
 
 from app.core.exceptions import handle_file_error
+from app.files.application.file_types import EXECUTABLE_EXTENSIONS, traits_for
 from app.files.application.path_validation import FileValidationService
 
 
@@ -33,7 +34,7 @@ class FileInfoService:
                     "read": self._is_file_readable(file_path),
                     "write": self._is_file_writable(file_path),
                     "execute": file_path.is_file()
-                    and file_path.suffix in [".sh", ".bat", ".exe"],
+                    and file_path.suffix in EXECUTABLE_EXTENSIONS,
                 },
             }
         except Exception as e:
@@ -44,85 +45,14 @@ class FileInfoService:
         if file_path.is_dir():
             return "directory"
 
-        suffix = file_path.suffix.lower()
-
-        # Text files
-        text_extensions = [
-            ".txt",
-            ".md",
-            ".yml",
-            ".yaml",
-            ".json",
-            ".properties",
-            ".conf",
-            ".log",
-            ".sh",
-            ".bat",
-            ".xml",
-            ".html",
-            ".css",
-            ".js",
-            ".py",
-            ".java",
-            ".cpp",
-            ".c",
-            ".h",
-            ".ini",
-            ".cfg",
-        ]
-
-        # Binary files
-        binary_extensions = [
-            ".jar",
-            ".zip",
-            ".tar",
-            ".gz",
-            ".exe",
-            ".dll",
-            ".so",
-            ".dylib",
-            ".png",
-            ".jpg",
-            ".jpeg",
-            ".gif",
-            ".bmp",
-            ".ico",
-            ".pdf",
-            ".dat",
-            ".mca",
-            ".mcr",
-            ".bin",
-        ]
-
-        if suffix in text_extensions:
-            return "text"
-        elif suffix in binary_extensions:
-            return "binary"
-        else:
-            return "other"
+        return traits_for(file_path.suffix).type
 
     def _is_file_readable(self, file_path: Path) -> bool:
         """Check if file is readable"""
         if file_path.is_dir():
             return True
 
-        suffix = file_path.suffix.lower()
-        readable_extensions = [
-            ".txt",
-            ".md",
-            ".yml",
-            ".yaml",
-            ".json",
-            ".properties",
-            ".conf",
-            ".log",
-            ".sh",
-            ".bat",
-            ".ini",
-            ".cfg",
-            ".xml",
-        ]
-        return suffix in readable_extensions
+        return traits_for(file_path.suffix).readable
 
     def _is_file_writable(self, file_path: Path) -> bool:
         """Check if file is writable"""
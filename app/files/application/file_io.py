@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import shutil
 from datetime import datetime
@@ -61,8 +62,11 @@ class FileOperationService:
                     content = await f.read()
                     return content, encoding
             else:
-                # Use encoding detection for better compatibility
-                result = EncodingHandler.safe_read_text_file(str(file_path))
+                # Use encoding detection for better compatibility; it reads
+                # the whole file, so keep it off the event loop.
+                result = await asyncio.to_thread(
+                    EncodingHandler.safe_read_text_file, str(file_path)
+                )
                 if result["success"]:
                     logger.info(
                         f"File read successfully with encoding: {result['encoding']}"
@@ -1,12 +1,18 @@
-from datetime import datetime
+import asyncio
+import os
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-import aiofiles
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.exceptions import InvalidRequestException
+from app.files.application.content_search import ContentMatch, ContentSearchEngine
 from app.files.application.file_info import FileInfoService
+from app.files.application.file_types import traits_for
+from app.files.application.listing import describe_path
+from app.files.application.path_index import PathHit, PathIndexRegistry
 from app.files.application.path_validation import FileValidationService
 
 
@@ -18,6 +24,11 @@ class FileSearchService:
     ):
         self.validation_service = validation_service
         self.info_service = info_service
+        self.path_indexes = PathIndexRegistry()
+        self.content_search = ContentSearchEngine(
+            max_file_bytes=settings.FILE_SEARCH_MAX_FILE_BYTES,
+            workers=settings.FILE_SEARCH_WORKERS,
+        )
 
     async def search_files(
         self,
@@ -41,6 +52,49 @@ class FileSearchService:
         Returns:
             Dictionary containing search results and metadata
         """
+        server_path = await self._validated_server_path(server_id, db)
+
+        start_time = time.monotonic()
+        results: List[Dict[str, Any]] = []
+        total_found = 0
+        async for result, total in self._search(
+            server_path, search_term, search_in_content, file_type, max_results
+        ):
+            if result is None:
+                total_found = total
+            else:
+                results.append(result)
+        search_time = time.monotonic() - start_time
+
+        return {
+            "results": results,
+            "total_found": total_found,
+            "search_time_seconds": round(search_time, 3),
+            "search_term": search_term,
+            "searched_content": search_in_content,
+        }
+
+    async def stream_search_files(
+        self,
+        server_id: int,
+        search_term: str,
+        db: Session,
+        search_in_content: bool = False,
+        file_type: Optional[str] = None,
+        max_results: int = 100,
+    ) -> AsyncIterator[Tuple[Optional[Dict[str, Any]], int]]:
+        """Like `search_files`, but yield results as they are found
+
+        The server is validated before this returns, so errors surface
+        before any response is streamed. The iterator yields
+        ``(result, 0)`` per result and finally ``(None, total_found)``.
+        """
+        server_path = await self._validated_server_path(server_id, db)
+        return self._search(
+            server_path, search_term, search_in_content, file_type, max_results
+        )
+
+    async def _validated_server_path(self, server_id: int, db: Session) -> Path:
         # Validate database session for security-critical operations
         if db is None:
             raise InvalidRequestException(
@@ -51,32 +105,34 @@ class FileSearchService:
         server = await self.validation_service.validate_server_exists(server_id, db)
         server_path = Path(server.directory_path)
         self.validation_service.validate_server_directory(server_path)
+        return server_path
 
-        start_time = datetime.now()
-        results = []
-
-        # Search by filename
-        filename_results = await self._search_by_filename(
+    async def _search(
+        self,
+        server_path: Path,
+        search_term: str,
+        search_in_content: bool,
+        file_type: Optional[str],
+        max_results: int,
+    ) -> AsyncIterator[Tuple[Optional[Dict[str, Any]], int]]:
+        """Filename matches (ranked) first, then content matches as found"""
+        total_found, filename_results = await self._search_by_filename(
             server_path, search_term, file_type, max_results
         )
-        results.extend(filename_results)
-
-        # Search in content if requested
-        if search_in_content and len(results) < max_results:
-            content_results = await self._search_file_content(
-                server_path, search_term, file_type, max_results - len(results)
+        for result in filename_results:
+            yield result, 0
+
+        remaining = max_results - len(filename_results)
+        if search_in_content and remaining > 0:
+            seen = {result["path"] for result in filename_results}
+            content_results = self._search_file_content(
+                server_path, search_term, file_type, remaining, seen
             )
-            results.extend(content_results)
+            async for result in content_results:
+                total_found += 1
+                yield result, 0
 
-        search_time = (datetime.now() - start_time).total_seconds()
-
-        return {
-            "results": results[:max_results],
-            "total_found": len(results),
-            "search_time_seconds": round(search_time, 3),
-            "search_term": search_term,
-            "searched_content": search_in_content,
-        }
+        yield None, total_found
 
     async def _search_by_filename(
         self,
@@ -84,25 +140,32 @@ class FileSearchService:
         search_term: str,
         file_type: Optional[str],
         max_results: int,
-    ) -> List[Dict[str, Any]]:
-        """Search files by filename"""
-        results: list[dict[str, Any]] = []
-
-        for file_path in server_path.rglob("*"):
-            if len(results) >= max_results:
-                break
-
-            if search_term.lower() in file_path.name.lower():
-                try:
-                    file_info = await self.info_service.get_file_info(
-                        file_path, server_path
-                    )
-                    if not file_type or file_info["type"] == file_type:
-                        file_info["match_type"] = "filename"
-                        results.append(file_info)
-                except Exception:
-                    continue
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """Search files by filename using the server's path index
 
+        Returns the number of matches and file information for the
+        ``max_results`` best-ranked ones.
+        """
+        index = self.path_indexes.get(server_path)
+        await index.ensure_fresh()
+        total, hits = index.search(search_term, file_type, max_results)
+        results = await asyncio.to_thread(self._describe_hits, server_path, hits)
+        # Entries deleted since the last refresh are dropped from the page.
+        return total - (len(hits) - len(results)), results
+
+    def _describe_hits(
+        self, server_path: Path, hits: List[PathHit]
+    ) -> List[Dict[str, Any]]:
+        results = []
+        for hit in hits:
+            file_info = describe_path(
+                str(server_path / hit.path),
+                hit.path,
+                self.validation_service.restricted_files,
+            )
+            if file_info is not None:
+                file_info["match_type"] = "filename"
+                results.append(file_info)
         return results
 
     async def _search_file_content(
@@ -111,34 +174,48 @@ class FileSearchService:
         search_term: str,
         file_type: Optional[str],
         max_results: int,
-    ) -> List[Dict[str, Any]]:
-        """Search in file content"""
-        results: list[dict[str, Any]] = []
-
-        for file_path in server_path.rglob("*"):
-            if len(results) >= max_results:
-                break
-
-            if file_path.is_file() and self.validation_service._is_readable_file(
-                file_path
-            ):
-                try:
-                    file_info = await self.info_service.get_file_info(
-                        file_path, server_path
-                    )
-                    if file_type and file_info["type"] != file_type:
-                        continue
-
-                    # Read file content and search
-                    async with aiofiles.open(
-                        file_path, mode="r", encoding="utf-8", errors="ignore"
-                    ) as f:
-                        content = await f.read()
-                        if search_term.lower() in content.lower():
-                            file_info["match_type"] = "content"
-                            results.append(file_info)
-
-                except Exception:
-                    continue
-
-        return results
+        exclude: Optional[set] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Search in file content, yielding matches as they are found"""
+        index = self.path_indexes.get(server_path)
+        await index.ensure_fresh()
+        readable = self.validation_service.readable_extensions
+        candidates = []
+        for path in index.files():
+            if exclude and path in exclude:
+                continue
+            extension = os.path.splitext(path)[1].lower()
+            if extension not in readable:
+                continue
+            kind = traits_for(extension).type
+            if kind == "binary" or (file_type and kind != file_type):
+                continue
+            candidates.append(path)
+        # Shallow files (server configs) first, so early termination
+        # favours them over deep plugin data.
+        candidates.sort(key=lambda path: (path.count("/"), path))
+
+        async for match in self.content_search.search(
+            server_path, candidates, search_term, max_results
+        ):
+            file_info = await asyncio.to_thread(self._describe_match, server_path, match)
+            if file_info is not None:
+                yield file_info
+
+    def _describe_match(
+        self, server_path: Path, match: ContentMatch
+    ) -> Optional[Dict[str, Any]]:
+        file_info = describe_path(
+            str(server_path / match.path),
+            match.path,
+            self.validation_service.restricted_files,
+        )
+        if file_info is None:
+            return None
+        file_info["match_type"] = "content"
+        file_info["line_matches"] = [
+            {"line": line.line, "snippet": line.snippet} for line in match.lines
+        ]
+        file_info["match_count"] = len(match.lines)
+        file_info["truncated"] = match.truncated
+        return file_info
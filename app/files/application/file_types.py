@@ -0,0 +1,121 @@
+"""Extension-based file classification shared by the file services.
+
+`EXTENSION_TRAITS` maps a lower-cased suffix to everything the listing
+needs to know about it, so classifying an entry is one dict lookup
+instead of a walk over several extension lists.
+"""
+
+from typing import Dict, NamedTuple
+
+TEXT_EXTENSIONS = frozenset(
+    {
+        ".txt",
+        ".md",
+        ".yml",
+        ".yaml",
+        ".json",
+        ".properties",
+        ".conf",
+        ".log",
+        ".sh",
+        ".bat",
+        ".xml",
+        ".html",
+        ".css",
+        ".js",
+        ".py",
+        ".java",
+        ".cpp",
+        ".c",
+        ".h",
+        ".ini",
+        ".cfg",
+    }
+)
+
+BINARY_EXTENSIONS = frozenset(
+    {
+        ".jar",
+        ".zip",
+        ".tar",
+        ".gz",
+        ".exe",
+        ".dll",
+        ".so",
+        ".dylib",
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".bmp",
+        ".ico",
+        ".pdf",
+        ".dat",
+        ".mca",
+        ".mcr",
+        ".bin",
+    }
+)
+
+READABLE_EXTENSIONS = frozenset(
+    {
+        ".txt",
+        ".md",
+        ".yml",
+        ".yaml",
+        ".json",
+        ".properties",
+        ".conf",
+        ".log",
+        ".sh",
+        ".bat",
+        ".ini",
+        ".cfg",
+        ".xml",
+    }
+)
+
+WRITABLE_EXTENSIONS = frozenset(
+    {".properties", ".yml", ".yaml", ".json", ".txt", ".conf"}
+)
+
+EXECUTABLE_EXTENSIONS = frozenset({".sh", ".bat", ".exe"})
+
+
+class ExtensionTraits(NamedTuple):
+    """Classification of a regular file by its suffix."""
+
+    type: str
+    readable: bool
+    writable: bool
+    executable: bool
+
+
+OTHER_TRAITS = ExtensionTraits("other", False, False, False)
+
+EXTENSION_TRAITS: Dict[str, ExtensionTraits] = {
+    suffix: ExtensionTraits(
+        type=(
+            "text"
+            if suffix in TEXT_EXTENSIONS
+            else "binary"
+            if suffix in BINARY_EXTENSIONS
+            else "other"
+        ),
+        readable=suffix in READABLE_EXTENSIONS,
+        writable=suffix in WRITABLE_EXTENSIONS,
+        executable=suffix in EXECUTABLE_EXTENSIONS,
+    )
+    for suffix in (
+        TEXT_EXTENSIONS
+        | BINARY_EXTENSIONS
+        | READABLE_EXTENSIONS
+        | WRITABLE_EXTENSIONS
+        | EXECUTABLE_EXTENSIONS
+    )
+}
+
+
+def traits_for(suffix: str) -> ExtensionTraits:
+    """Traits of a regular file with ``suffix`` (case-insensitive)."""
+    return EXTENSION_TRAITS.get(suffix.lower(), OTHER_TRAITS)
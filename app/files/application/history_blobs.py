@@ -0,0 +1,234 @@
+"""Content-addressed, compressed storage for file edit history.
+
+Every edit used to write a full plain-text copy of the file under
+``history_base_dir/<server>/<path>/``, so a config saved a hundred times
+was stored a hundred times, and identical content saved on two servers
+was stored twice.
+
+Each distinct content is now stored once, as a blob named by its SHA-256
+under ``history_base_dir/blobs/<ab>/<hash>``. Blobs are compressed with
+Zstandard when the optional ``zstandard`` package is installed, otherwise
+with zlib. When the file has a previous version, the content is also
+compressed against that version used as a dictionary (a delta), and the
+smaller encoding is kept. Delta chains are at most `MAX_DELTA_CHAIN`
+deep, so reading a version touches a bounded number of blobs.
+
+Blobs begin with `_MAGIC`; files without it are legacy full copies and
+are read back unchanged.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - environment dependent
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+BLOB_DIRNAME = "blobs"
+MAX_DELTA_CHAIN = 16
+ZSTD_LEVEL = 9
+ZLIB_LEVEL = 6
+
+# zlib only looks back 32 KiB, so only the tail of a dictionary helps.
+_ZLIB_WINDOW = 32 * 1024
+
+_MAGIC = b"MCHB\x01"
+_CODEC_RAW = 0
+_CODEC_ZLIB = 1
+_CODEC_ZSTD = 2
+_DELTA_FLAG = 0x80
+_HASH_BYTES = 32
+_TEMP_PREFIX = ".tmp-"
+
+
+class BlobFormatError(ValueError):
+    """Raised for corrupt blobs or blobs needing an unavailable codec."""
+
+
+@dataclass(frozen=True)
+class EncodedBlob:
+    """Encoded blob bytes and the hash of the blob they delta against."""
+
+    data: bytes
+    base_hash: Optional[str]
+
+
+def _zstd_dictionary(base: bytes):
+    return zstandard.ZstdCompressionDict(base, dict_type=zstandard.DICT_TYPE_RAWCONTENT)
+
+
+def _compress(content: bytes, base: Optional[bytes]) -> Tuple[int, bytes]:
+    if zstandard is not None:
+        dictionary = _zstd_dictionary(base) if base is not None else None
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=dictionary)
+        return _CODEC_ZSTD, compressor.compress(content)
+    if base is None:
+        return _CODEC_ZLIB, zlib.compress(content, ZLIB_LEVEL)
+    compressor = zlib.compressobj(ZLIB_LEVEL, zdict=base[-_ZLIB_WINDOW:])
+    return _CODEC_ZLIB, compressor.compress(content) + compressor.flush()
+
+
+def _decompress(codec: int, payload: bytes, base: Optional[bytes]) -> bytes:
+    if codec == _CODEC_RAW:
+        return payload
+    if codec == _CODEC_ZLIB:
+        if base is None:
+            return zlib.decompress(payload)
+        decompressor = zlib.decompressobj(zdict=base[-_ZLIB_WINDOW:])
+        return decompressor.decompress(payload) + decompressor.flush()
+    if codec == _CODEC_ZSTD:
+        if zstandard is None:
+            raise BlobFormatError(
+                "History blob is Zstandard-compressed; install the optional "
+                "'zstandard' package to read it"
+            )
+        dictionary = _zstd_dictionary(base) if base is not None else None
+        return zstandard.ZstdDecompressor(dict_data=dictionary).decompress(payload)
+    raise BlobFormatError(f"Unknown history blob codec {codec}")
+
+
+class HistoryBlobStore:
+    """Blob files under ``<history_base_dir>/blobs``.
+
+    Blocking; the history service calls it through `asyncio.to_thread`.
+    """
+
+    def __init__(self, history_base_dir: Path):
+        self.root = history_base_dir / BLOB_DIRNAME
+
+    def path_for(self, content_hash: str) -> Path:
+        return self.root / content_hash[:2] / content_hash
+
+    def encode(
+        self, content: bytes, base: Optional[Tuple[str, bytes]] = None
+    ) -> EncodedBlob:
+        """Smallest of: stored as is, compressed, compressed against ``base``.
+
+        ``base`` is ``(content_hash, content)`` of the previous version.
+        """
+        codec, payload = _compress(content, None)
+        best = min(
+            (_MAGIC + bytes([_CODEC_RAW]) + content, _MAGIC + bytes([codec]) + payload),
+            key=len,
+        )
+        base_hash = None
+        if base is not None and base[1]:
+            codec, payload = _compress(content, base[1])
+            delta = (
+                _MAGIC + bytes([codec | _DELTA_FLAG]) + bytes.fromhex(base[0]) + payload
+            )
+            if len(delta) < len(best):
+                best, base_hash = delta, base[0]
+        return EncodedBlob(data=best, base_hash=base_hash)
+
+    def write(self, content_hash: str, data: bytes, exclusive: bool = False) -> Path:
+        """Write an encoded blob; returns its path.
+
+        By default an existing file is atomically replaced. With
+        ``exclusive`` the write raises `FileExistsError` instead, so a
+        delta never replaces a blob that another writer's row may
+        already describe as full.
+        """
+        path = self.path_for(content_hash)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if exclusive:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            return path
+        fd, temp_name = tempfile.mkstemp(prefix=_TEMP_PREFIX, dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_name, path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        return path
+
+    def read(self, path: Path) -> bytes:
+        """Content of the version stored at ``path``, blob or legacy copy."""
+        with open(path, "rb") as f:
+            data = f.read()
+        if not data.startswith(_MAGIC):
+            return data
+        return self._decode(path.name, data, depth=0)
+
+    def read_blob(self, content_hash: str) -> bytes:
+        """Content of the blob named ``content_hash``."""
+        return self._read_blob(content_hash, depth=0)
+
+    def _read_blob(self, content_hash: str, depth: int) -> bytes:
+        with open(self.path_for(content_hash), "rb") as f:
+            data = f.read()
+        if not data.startswith(_MAGIC):
+            raise BlobFormatError(f"History blob {content_hash} has no blob header")
+        return self._decode(content_hash, data, depth)
+
+    def _decode(self, content_hash: str, data: bytes, depth: int) -> bytes:
+        offset = len(_MAGIC)
+        if len(data) <= offset:
+            raise BlobFormatError(f"History blob {content_hash} is truncated")
+        codec = data[offset]
+        offset += 1
+        base = None
+        if codec & _DELTA_FLAG:
+            if depth >= MAX_DELTA_CHAIN:
+                raise BlobFormatError(
+                    f"History blob {content_hash} exceeds the delta chain limit"
+                )
+            base_hash = data[offset : offset + _HASH_BYTES].hex()
+            offset += _HASH_BYTES
+            base = self._read_blob(base_hash, depth + 1)
+        try:
+            content = _decompress(codec & ~_DELTA_FLAG, data[offset:], base)
+        except BlobFormatError:
+            raise
+        except Exception as e:  # zlib.error, zstandard.ZstdError
+            raise BlobFormatError(f"History blob {content_hash} is corrupt: {e}") from e
+        if hashlib.sha256(content).hexdigest() != content_hash:
+            raise BlobFormatError(f"History blob {content_hash} failed verification")
+        return content
+
+    def delete(self, path: Path) -> int:
+        """Remove a blob file; returns the bytes freed."""
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return 0
+        return size
+
+    def list_blobs(self, older_than: float) -> List[str]:
+        """Hashes of blob files last written more than ``older_than`` seconds
+        ago. Temporary files left by interrupted writes are removed.
+        """
+        cutoff = time.time() - older_than
+        hashes: List[str] = []
+        try:
+            shards = [entry.path for entry in os.scandir(self.root) if entry.is_dir()]
+        except FileNotFoundError:
+            return hashes
+        for shard in shards:
+            with os.scandir(shard) as entries:
+                for entry in entries:
+                    try:
+                        if entry.stat().st_mtime >= cutoff:
+                            continue
+                        if entry.name.startswith(_TEMP_PREFIX):
+                            os.unlink(entry.path)
+                        elif len(entry.name) == _HASH_BYTES * 2:
+                            hashes.append(entry.name)
+                    except OSError as e:
+                        logger.debug(f"Skipping history blob {entry.path}: {e}")
+        return hashes
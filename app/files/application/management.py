@@ -1,6 +1,7 @@
+import asyncio
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from fastapi import UploadFile
 from sqlalchemy.orm import Session
@@ -14,6 +15,7 @@ from app.files.application.encoding_handler import EncodingHandler
 from app.files.application.file_info import FileInfoService
 from app.files.application.file_io import FileBackupService, FileOperationService
 from app.files.application.file_search import FileSearchService
+from app.files.application.listing import ListingPage, ListingQuery, list_directory
 from app.files.application.path_validation import FileValidationService
 from app.types import FileType
 from app.users.models import User
@@ -71,6 +73,53 @@ class FileManagementService:
 
         return sorted(files, key=lambda x: (not x["is_directory"], x["name"]))
 
+    async def list_server_files(
+        self,
+        server_id: int,
+        db: Session,
+        path: str = "",
+        query: Optional[ListingQuery] = None,
+    ) -> ListingPage:
+        """List a server directory one page at a time.
+
+        Like `get_server_files`, but scans with `os.scandir` (one stat
+        per entry) on a worker thread and applies ``query``'s sort,
+        filters and cursor. Listing a single file returns just that file.
+
+        Args:
+            server_id: ID of the server to list files for
+            db: Database session (required for security validation)
+            path: Relative path within the server directory
+            query: Sort, filter and page parameters
+
+        Returns:
+            The requested page and the number of matching entries
+        """
+        if db is None:
+            raise InvalidRequestException(
+                "Database session is required for file listing operations"
+            )
+
+        server = await self.validation_service.validate_server_exists(server_id, db)
+        server_path = Path(server.directory_path)
+        self.validation_service.validate_server_directory(server_path)
+
+        target_path = server_path / path
+        self.validation_service.validate_path_safety(server_path, target_path)
+        self.validation_service.validate_path_exists(target_path)
+
+        if not target_path.is_dir():
+            file_info = await self.info_service.get_file_info(target_path, server_path)
+            return ListingPage(files=[file_info], total=1)
+
+        return await asyncio.to_thread(
+            list_directory,
+            str(target_path),
+            str(target_path.relative_to(server_path)),
+            query or ListingQuery(),
+            self.validation_service.restricted_files,
+        )
+
     async def _collect_file_information(
         self, target_path: Path, server_path: Path, file_type: Optional[FileType]
     ) -> List[Dict[str, Any]]:
@@ -224,6 +273,7 @@ class FileManagementService:
             user_id=user.id if user else None,
             description=None,
         )
+        self.search_service.path_indexes.mark_stale(server_path)
 
         # Get updated file info
         file_info = await self.info_service.get_file_info(target_file, server_path)
@@ -270,6 +320,7 @@ class FileManagementService:
 
         # Delete file or directory
         operation_type = self.operation_service.delete_file_or_directory(target_path)
+        self.search_service.path_indexes.mark_stale(server_path)
 
         return {"message": f"{operation_type.title()} '{file_path}' deleted successfully"}
 
@@ -326,6 +377,7 @@ class FileManagementService:
         self.validation_service.validate_path_safety(server_path, target_file)
 
         await self.operation_service.upload_file(file, target_file)
+        self.search_service.path_indexes.mark_stale(server_path)
 
         # Get file info for response
         file_info = await self.info_service.get_file_info(target_file, server_path)
@@ -379,6 +431,32 @@ class FileManagementService:
             server_id, search_term, db, search_in_content, file_type, max_results
         )
 
+    async def stream_search_files(
+        self,
+        server_id: int,
+        search_term: str,
+        db: Session,
+        search_in_content: bool = False,
+        file_type: Optional[str] = None,
+        max_results: int = 100,
+    ) -> AsyncIterator[Tuple[Optional[Dict[str, Any]], int]]:
+        """Search for files, yielding results as they are found
+
+        Args:
+            server_id: ID of the server to search in
+            search_term: Term to search for in filenames and/or content
+            db: Database session (required for security validation)
+            search_in_content: Whether to search inside file contents
+            file_type: Optional file type filter
+            max_results: Maximum number of results to return
+
+        Returns:
+            Async iterator of ``(result, 0)`` pairs, then ``(None, total_found)``
+        """
+        return await self.search_service.stream_search_files(
+            server_id, search_term, db, search_in_content, file_type, max_results
+        )
+
     async def create_directory(
         self,
         server_id: int,
@@ -410,6 +488,7 @@ class FileManagementService:
 
         # Create directory
         self.operation_service.create_directory(target_dir)
+        self.search_service.path_indexes.mark_stale(server_path)
 
         # Get directory info
         directory_info = await self.info_service.get_file_info(target_dir, server_path)
@@ -458,6 +537,7 @@ class FileManagementService:
 
         # Move file or directory
         self.operation_service.move_file_or_directory(source, destination)
+        self.search_service.path_indexes.mark_stale(server_path)
 
         return {"message": f"Moved '{source_path}' to '{destination_path}' successfully"}
 
@@ -521,6 +601,7 @@ class FileManagementService:
 
         # Perform rename operation
         self.operation_service.move_file_or_directory(source_path, destination_path)
+        self.search_service.path_indexes.mark_stale(server_path)
 
         # Get updated file info
         file_info = await self.info_service.get_file_info(destination_path, server_path)
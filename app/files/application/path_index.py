@@ -0,0 +1,314 @@
+"""Per-server filename index for file search.
+
+Searching by name used to `rglob("*")` the whole server directory and
+stat every match on each request, which takes seconds on a 300k-file
+modpack and competes with the Minecraft process for I/O.
+
+`ServerPathIndex` walks the tree once and keeps, per directory, its
+mtime and the names it contains. A directory's mtime changes whenever
+an entry is created, removed or renamed in it, so bringing the index up
+to date costs one `stat()` per directory; only directories whose mtime
+moved are re-listed. Refreshes run at most every few seconds (or right
+after the files API changed something, see `mark_stale`), on a worker
+thread.
+
+Lookups run over two newline-joined, lower-cased blobs (names and
+relative paths), so a substring query is a loop of `str.find` calls in
+C rather than a Python loop over every entry. Glob queries (`*`, `?`,
+`[...]`) are compiled to one multi-line regex and run over the same blob.
+"""
+
+import asyncio
+import heapq
+import logging
+import os
+import re
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.files.application.file_types import traits_for
+
+logger = logging.getLogger(__name__)
+
+REFRESH_INTERVAL_SECONDS = 2.0
+MAX_INDEXED_SERVERS = 16
+
+# A directory modified this recently may change again within the same
+# mtime tick, after we listed it; such directories are re-listed on the
+# next refresh instead of trusting their mtime.
+_RACY_MTIME_NS = 2_000_000_000
+
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+
+@dataclass
+class _Directory:
+    mtime_ns: int
+    # name -> (is_dir, recurse): symlinked directories count as
+    # directories but are not descended into, like `Path.rglob`.
+    children: Dict[str, Tuple[bool, bool]]
+
+
+@dataclass(frozen=True)
+class PathHit:
+    """One index match: a path relative to the server directory."""
+
+    path: str
+    is_directory: bool
+
+
+class _Snapshot:
+    """Flattened, searchable view of the index."""
+
+    def __init__(self, entries: List[Tuple[str, str, bool]]):
+        self.paths = [path for path, _, _ in entries]
+        self.names = [name for _, name, _ in entries]
+        self.is_dir = [is_dir for _, _, is_dir in entries]
+        self.name_blob, self.name_offsets = self._blob(self.names)
+        self.path_blob, self.path_offsets = self._blob(self.paths)
+
+    @staticmethod
+    def _blob(values: List[str]) -> Tuple[str, List[int]]:
+        lowered = [value.lower() for value in values]
+        offsets = []
+        position = 0
+        for value in lowered:
+            offsets.append(position)
+            position += len(value) + 1
+        return "".join(f"{value}\n" for value in lowered), offsets
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+
+def _find_all(blob: str, offsets: List[int], needle: str) -> Iterator[Tuple[int, int]]:
+    """Yield ``(entry, position)`` for each entry containing ``needle`` once."""
+    end = len(blob)
+    i = blob.find(needle)
+    while i != -1:
+        entry = bisect_right(offsets, i) - 1
+        yield entry, i - offsets[entry]
+        following = offsets[entry + 1] if entry + 1 < len(offsets) else end
+        i = blob.find(needle, following)
+
+
+def _glob_to_regex(pattern: str) -> "re.Pattern[str]":
+    """Compile a glob to match whole lines of a blob (one entry per line)."""
+    parts = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        i += 1
+        if char == "*":
+            parts.append(r"[^\n]*")
+        elif char == "?":
+            parts.append(r"[^\n]")
+        elif char == "[":
+            end = pattern.find("]", i + 1 if pattern[i : i + 1] in ("!", "]") else i)
+            if end == -1:
+                parts.append(re.escape(char))
+                continue
+            members = pattern[i:end]
+            i = end + 1
+            negate = members.startswith("!")
+            if negate:
+                members = members[1:]
+            for special in ("\\", "^", "["):
+                members = members.replace(special, "\\" + special)
+            parts.append(rf"[^{members}\n]" if negate else f"[{members}]")
+        else:
+            parts.append(re.escape(char))
+    return re.compile(f"^{''.join(parts)}$", re.MULTILINE)
+
+
+def _entry_type(name: str, is_dir: bool) -> str:
+    if is_dir:
+        return "directory"
+    extension = os.path.splitext(name)[1]
+    return traits_for(extension).type if extension != "." else "other"
+
+
+class ServerPathIndex:
+    """Name index of one server directory, refreshed incrementally."""
+
+    def __init__(self, root: Path, refresh_interval: float = REFRESH_INTERVAL_SECONDS):
+        self.root = str(root)
+        self._refresh_interval = refresh_interval
+        self._dirs: Dict[str, _Directory] = {}
+        self._snapshot = _Snapshot([])
+        self._refreshed_at: Optional[float] = None
+        self._stale = True
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    def files(self) -> List[str]:
+        """Relative paths of every indexed non-directory entry."""
+        snapshot = self._snapshot
+        return [
+            path for path, is_dir in zip(snapshot.paths, snapshot.is_dir) if not is_dir
+        ]
+
+    def mark_stale(self) -> None:
+        """Refresh before the next search instead of waiting out the interval."""
+        self._stale = True
+
+    async def ensure_fresh(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            if (
+                not self._stale
+                and self._refreshed_at is not None
+                and now - self._refreshed_at < self._refresh_interval
+            ):
+                return
+            self._stale = False
+            await asyncio.to_thread(self.refresh)
+            self._refreshed_at = time.monotonic()
+
+    def refresh(self) -> bool:
+        """Re-list directories whose mtime changed; True if anything did.
+
+        Blocking; `ensure_fresh` runs it on a worker thread.
+        """
+        changed = False
+        seen = set()
+        pending = [""]
+        now_ns = time.time_ns()
+        while pending:
+            relative = pending.pop()
+            directory = os.path.join(self.root, relative) if relative else self.root
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            seen.add(relative)
+            node = self._dirs.get(relative)
+            if node is None or node.mtime_ns != mtime_ns:
+                children = self._list(directory)
+                if children is None:
+                    seen.discard(relative)
+                    continue
+                if now_ns - mtime_ns < _RACY_MTIME_NS:
+                    mtime_ns = -1
+                changed = changed or node is None or node.children != children
+                node = _Directory(mtime_ns, children)
+                self._dirs[relative] = node
+            for name, (_, recurse) in node.children.items():
+                if recurse:
+                    pending.append(f"{relative}/{name}" if relative else name)
+
+        for relative in self._dirs.keys() - seen:
+            del self._dirs[relative]
+            changed = True
+
+        if changed:
+            self._snapshot = _Snapshot(
+                [
+                    (f"{relative}/{name}" if relative else name, name, is_dir)
+                    for relative, node in self._dirs.items()
+                    for name, (is_dir, _) in node.children.items()
+                ]
+            )
+        return changed
+
+    @staticmethod
+    def _list(directory: str) -> Optional[Dict[str, Tuple[bool, bool]]]:
+        children: Dict[str, Tuple[bool, bool]] = {}
+        try:
+            with os.scandir(directory) as it:
+                for item in it:
+                    try:
+                        real_dir = item.is_dir(follow_symlinks=False)
+                        is_dir = real_dir or item.is_dir()
+                    except OSError:
+                        is_dir = real_dir = False
+                    children[item.name] = (is_dir, real_dir)
+        except OSError as e:
+            logger.debug(f"Could not index {directory}: {e}")
+            return None
+        return children
+
+    def search(
+        self, term: str, file_type: Optional[str] = None, limit: int = 100
+    ) -> Tuple[int, List[PathHit]]:
+        """Count of entries matching ``term`` and the ``limit`` best ones.
+
+        ``term`` is a case-insensitive substring of the name, or of the
+        relative path when it contains ``/``; with `*`, `?` or `[...]`
+        it is a glob over the name (or path). Ranking prefers exact
+        names, then prefixes, then word starts, then shallower and
+        shorter paths.
+        """
+        snapshot = self._snapshot
+        needle = term.lower()
+        by_path = "/" in needle
+        blob = snapshot.path_blob if by_path else snapshot.name_blob
+        offsets = snapshot.path_offsets if by_path else snapshot.name_offsets
+        values = snapshot.paths if by_path else snapshot.names
+
+        if "\n" in needle or not needle:
+            return 0, []
+
+        if _GLOB_CHARS.search(needle):
+            matches = (
+                (bisect_right(offsets, match.start()) - 1, 0)
+                for match in _glob_to_regex(needle).finditer(blob)
+            )
+        else:
+            matches = _find_all(blob, offsets, needle)
+
+        ranked = []
+        for entry, position in matches:
+            name = snapshot.names[entry]
+            if file_type is not None and (
+                _entry_type(name, snapshot.is_dir[entry]) != file_type
+            ):
+                continue
+            value = values[entry].lower()
+            if value == needle:
+                rank = 0
+            elif position == 0:
+                rank = 1
+            elif not value[position - 1].isalnum():
+                rank = 2
+            else:
+                rank = 3
+            path = snapshot.paths[entry]
+            ranked.append((rank, path.count("/"), len(name), path, entry))
+
+        best = heapq.nsmallest(limit, ranked)
+        return len(ranked), [
+            PathHit(path=path, is_directory=snapshot.is_dir[entry])
+            for *_, path, entry in best
+        ]
+
+
+class PathIndexRegistry:
+    """Keep the indexes of the most recently searched servers in memory."""
+
+    def __init__(self, max_servers: int = MAX_INDEXED_SERVERS):
+        self._max_servers = max_servers
+        self._indexes: "OrderedDict[str, ServerPathIndex]" = OrderedDict()
+
+    def get(self, server_path: Path) -> ServerPathIndex:
+        key = str(server_path)
+        index = self._indexes.get(key)
+        if index is None:
+            index = ServerPathIndex(server_path)
+            self._indexes[key] = index
+            while len(self._indexes) > self._max_servers:
+                self._indexes.popitem(last=False)
+        else:
+            self._indexes.move_to_end(key)
+        return index
+
+    def mark_stale(self, server_path: Path) -> None:
+        index = self._indexes.get(str(server_path))
+        if index is not None:
+            index.mark_stale()
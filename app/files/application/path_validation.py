@@ -11,12 +11,29 @@ from app.core.exceptions import (
     InvalidFileTypeError,
     ServerNotFoundException,
 )
+from app.files.application.file_types import WRITABLE_EXTENSIONS
 from app.servers.adapters.read_port import SqlAlchemyServerReadPort
 from app.users.domain.value_objects import Role
 from app.users.models import User
 
 logger = logging.getLogger(__name__)
 
+_READABLE_EXTENSIONS = frozenset(
+    {
+        ".txt",
+        ".md",
+        ".yml",
+        ".yaml",
+        ".json",
+        ".properties",
+        ".sh",
+        ".bat",
+        ".ini",
+        ".cfg",
+        ".xml",
+    }
+)
+
 
 class FileValidationService:
     """Service for validating file operations and access.
@@ -155,34 +172,22 @@ class FileValidationService:
         except ValueError:
             return False
 
+    @property
+    def readable_extensions(self) -> frozenset:
+        """Suffixes (lower-case) of files users may open for reading."""
+        allowed = frozenset().union(*self.allowed_extensions.values())
+        return allowed | _READABLE_EXTENSIONS
+
     def _is_readable_file(self, file_path: Path) -> bool:
         """Check if file type is readable"""
-        suffix = file_path.suffix.lower()
-        for _, extensions in self.allowed_extensions.items():
-            if suffix in extensions:
-                return True
-        return suffix in [
-            ".txt",
-            ".md",
-            ".yml",
-            ".yaml",
-            ".json",
-            ".properties",
-            ".sh",
-            ".bat",
-            ".ini",
-            ".cfg",
-            ".xml",
-        ]
+        return file_path.suffix.lower() in self.readable_extensions
 
     def _is_writable_file(self, file_path: Path) -> bool:
         """Check if file type is writable"""
         if file_path.is_dir():
             return False
 
-        suffix = file_path.suffix.lower()
-        writable_extensions = [".properties", ".yml", ".yaml", ".json", ".txt", ".conf"]
-        return suffix in writable_extensions
+        return file_path.suffix.lower() in WRITABLE_EXTENSIONS
 
     def _is_restricted_file(self, file_path: Path) -> bool:
         """Check if file is restricted from modification"""
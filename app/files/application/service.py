@@ -7,6 +7,7 @@ the cross-domain `ServerReadPort`. This module depends only on
 `adapters/`, `api/`, or any FastAPI / SQLAlchemy module.
 """
 
+import asyncio
 import hashlib
 import logging
 from datetime import timedelta
@@ -22,11 +23,13 @@ from app.core.exceptions import (
     InvalidRequestException,
     ServerNotFoundException,
 )
+from app.files.application.history_blobs import MAX_DELTA_CHAIN, HistoryBlobStore
 from app.files.domain.entities import (
     CleanupResultEntity,
     CreateHistoryCommand,
     FileHistoryEntity,
     FileHistoryStatsEntity,
+    HistoryBlobEntity,
 )
 from app.files.domain.ports import FilesUnitOfWork
 from app.servers.domain.ports import ServerReadPort
@@ -39,6 +42,10 @@ logger = logging.getLogger(__name__)
 _VERSION_RESERVATION_RETRIES = 3
 _VERSION_UNIQUE_INDEX_NAME = "uq_file_edit_history_server_path_version"
 
+# Blob files younger than this may belong to a transaction that has not
+# committed yet, so the orphan sweep in `cleanup_old_versions` skips them.
+_ORPHAN_BLOB_GRACE_SECONDS = 3600
+
 
 def _is_version_unique_violation(e: IntegrityError) -> bool:
     """Detect that an `IntegrityError` stems from the file_edit_history
@@ -70,6 +77,17 @@ def _is_version_unique_violation(e: IntegrityError) -> bool:
     )
 
 
+def _is_blob_unique_violation(e: IntegrityError) -> bool:
+    """Detect a concurrent writer inserting the same `file_history_blobs`
+    row first. Retrying finds the blob and references it instead.
+    """
+    err_text = str(e.orig) + " " + str(e)
+    lowered = err_text.lower()
+    return "file_history_blobs" in err_text and (
+        "unique" in lowered or "duplicate" in lowered
+    )
+
+
 class FileHistoryService:
     """Use cases over the file-history catalogue.
 
@@ -94,6 +112,7 @@ class FileHistoryService:
         self.history_base_dir = history_base_dir
         self.max_versions_per_file = max_versions_per_file
         self.auto_cleanup_days = auto_cleanup_days
+        self._blobs = HistoryBlobStore(history_base_dir)
 
     # ===================
     # Public use cases
@@ -112,31 +131,30 @@ class FileHistoryService:
         Returns the persisted entity, or `None` if the content matches
         the latest version (no backup was created).
 
+        The content is stored once per distinct `content_hash` as a
+        compressed blob (see `history_blobs`), delta-encoded against
+        the file's previous version when that is smaller; the row's
+        `backup_file_path` references the blob.
+
         Concurrency: reserve-and-insert of `version_number` is wrapped
         in a single UoW with retries. The UNIQUE constraint
         `uq_file_edit_history_server_path_version` is the final guard
         against the TOCTOU race between two writers reserving the same
-        number simultaneously. Each retry recomputes the version number
-        and writes a new on-disk backup file (orphans from the prior
-        attempt are unlinked best-effort).
+        number simultaneously; a writer losing the race to insert the
+        same blob row is retried the same way.
         """
         try:
             normalized_path = self._normalize_file_path(file_path)
 
-            history_dir = self.history_base_dir / str(server_id) / normalized_path
-            history_dir.mkdir(parents=True, exist_ok=True)
-
-            content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
-            file_size = len(content.encode("utf-8"))
+            data = content.encode("utf-8")
+            content_hash = hashlib.sha256(data).hexdigest()
 
             entity, version_num = await self._reserve_and_persist(
                 server_id=server_id,
                 file_path=file_path,
                 normalized_path=normalized_path,
-                history_dir=history_dir,
-                content=content,
+                data=data,
                 content_hash=content_hash,
-                file_size=file_size,
                 user_id=user_id,
                 description=description,
             )
@@ -159,14 +177,12 @@ class FileHistoryService:
         server_id: int,
         file_path: str,
         normalized_path: str,
-        history_dir: Path,
-        content: str,
+        data: bytes,
         content_hash: str,
-        file_size: int,
         user_id: Optional[int],
         description: Optional[str],
     ) -> Tuple[Optional[FileHistoryEntity], int]:
-        """Reserve next version + write backup file + INSERT row,
+        """Reserve next version + store the content blob + INSERT row,
         retrying on UNIQUE-constraint races.
 
         Returns `(entity, version_num)`, or `(None, 0)` when the
@@ -175,7 +191,6 @@ class FileHistoryService:
         """
         last_error: Optional[IntegrityError] = None
         for attempt in range(_VERSION_RESERVATION_RETRIES):
-            backup_file_path: Optional[Path] = None
             try:
                 async with self._uow as uow:
                     # 1. Skip when the existing latest already matches.
@@ -193,17 +208,16 @@ class FileHistoryService:
                         server_id, normalized_path
                     )
 
-                    # 3. Write the backup file to disk. This happens
-                    # inside the UoW context but outside the SQL tx
-                    # itself; on retry we will unlink and rewrite.
-                    file_extension = Path(normalized_path).suffix
-                    timestamp = utcnow().strftime("%Y%m%d_%H%M%S")
-                    backup_filename = f"v{version_num:03d}_{timestamp}{file_extension}"
-                    backup_file_path = history_dir / backup_filename
-                    async with aiofiles.open(
-                        backup_file_path, "w", encoding="utf-8"
-                    ) as f:
-                        await f.write(content)
+                    # 3. Reuse the blob of any version with this content,
+                    # or write a new one. The file is written before its
+                    # row so a committed row never points at a missing
+                    # blob; files whose row rolls back are left to the
+                    # orphan sweep, since a concurrent writer of the same
+                    # content may already reference them.
+                    blob = await uow.history_blobs.get(content_hash)
+                    if blob is None:
+                        blob = await self._store_blob(uow, content_hash, data, latest)
+                        await uow.history_blobs.add(blob)
 
                     # 4. Stage the INSERT — UNIQUE constraint catches
                     # any concurrent writer that snuck in before us.
@@ -211,8 +225,8 @@ class FileHistoryService:
                         server_id=server_id,
                         file_path=normalized_path,
                         version_number=version_num,
-                        backup_file_path=str(backup_file_path),
-                        file_size=file_size,
+                        backup_file_path=blob.storage_path,
+                        file_size=len(data),
                         content_hash=content_hash,
                         editor_user_id=user_id,
                         description=description,
@@ -223,27 +237,21 @@ class FileHistoryService:
 
             except IntegrityError as e:
                 last_error = e
-                # Best-effort cleanup of the orphan backup file from
-                # this failed attempt — the row never landed so the
-                # on-disk file is unreferenced.
-                if backup_file_path is not None:
-                    try:
-                        backup_file_path.unlink(missing_ok=True)
-                    except OSError as unlink_err:
+                if attempt < _VERSION_RESERVATION_RETRIES - 1:
+                    if _is_version_unique_violation(e):
                         logger.warning(
-                            f"Failed to clean up orphan backup file "
-                            f"{backup_file_path}: {unlink_err}"
+                            f"TOCTOU collision on version_number for "
+                            f"{normalized_path} (attempt {attempt + 1}/"
+                            f"{_VERSION_RESERVATION_RETRIES}); retrying"
                         )
-                if (
-                    _is_version_unique_violation(e)
-                    and attempt < _VERSION_RESERVATION_RETRIES - 1
-                ):
-                    logger.warning(
-                        f"TOCTOU collision on version_number for "
-                        f"{normalized_path} (attempt {attempt + 1}/"
-                        f"{_VERSION_RESERVATION_RETRIES}); retrying"
-                    )
-                    continue
+                        continue
+                    if _is_blob_unique_violation(e):
+                        logger.warning(
+                            f"Concurrent insert of history blob {content_hash} "
+                            f"(attempt {attempt + 1}/"
+                            f"{_VERSION_RESERVATION_RETRIES}); retrying"
+                        )
+                        continue
                 raise
 
         # Should not be reachable — the loop either returns or raises —
@@ -252,6 +260,55 @@ class FileHistoryService:
         assert last_error is not None
         raise last_error
 
+    async def _store_blob(
+        self,
+        uow: FilesUnitOfWork,
+        content_hash: str,
+        data: bytes,
+        previous: Optional[FileHistoryEntity],
+    ) -> HistoryBlobEntity:
+        """Encode and write a blob, as a delta against ``previous`` when
+        that version's blob is readable and not at the chain limit.
+        """
+        base: Optional[Tuple[str, bytes]] = None
+        base_depth = 0
+        base_blob = None
+        if previous is not None and previous.content_hash is not None:
+            base_blob = await uow.history_blobs.get(previous.content_hash)
+        if base_blob is not None and base_blob.chain_depth < MAX_DELTA_CHAIN:
+            try:
+                base_data = await asyncio.to_thread(
+                    self._blobs.read_blob, base_blob.content_hash
+                )
+                base = (base_blob.content_hash, base_data)
+                base_depth = base_blob.chain_depth
+            except (OSError, ValueError) as e:
+                logger.warning(
+                    f"Not delta-encoding against history blob "
+                    f"{base_blob.content_hash}: {e}"
+                )
+
+        def encode_and_write() -> HistoryBlobEntity:
+            encoded = self._blobs.encode(data, base)
+            try:
+                path = self._blobs.write(
+                    content_hash, encoded.data, exclusive=encoded.base_hash is not None
+                )
+            except FileExistsError:
+                # Left by a concurrent or rolled-back writer. Replace it
+                # with a full blob, which is correct whichever row wins.
+                encoded = self._blobs.encode(data)
+                path = self._blobs.write(content_hash, encoded.data)
+            return HistoryBlobEntity(
+                content_hash=content_hash,
+                storage_path=str(path),
+                stored_size=len(encoded.data),
+                base_hash=encoded.base_hash,
+                chain_depth=base_depth + 1 if encoded.base_hash else 0,
+            )
+
+        return await asyncio.to_thread(encode_and_write)
+
     async def get_file_history(
         self,
         server_id: int,
@@ -273,10 +330,11 @@ class FileHistoryService:
     ) -> Tuple[str, FileHistoryEntity]:
         """Get content of a specific version.
 
-        Returns `(file_content, history_entity)`. Raises
-        `InvalidRequestException` if the version is unknown,
-        `FileOperationException` if the on-disk backup is missing or
-        unreadable.
+        Returns `(file_content, history_entity)`. Blobs are decompressed
+        (and their delta chain applied) transparently; legacy full-copy
+        backups are read as they are. Raises `InvalidRequestException`
+        if the version is unknown, `FileOperationException` if the
+        on-disk backup is missing, unreadable or fails verification.
         """
         normalized_path = self._normalize_file_path(file_path)
 
@@ -297,9 +355,8 @@ class FileHistoryService:
             )
 
         try:
-            async with aiofiles.open(backup_file_path, "r", encoding="utf-8") as f:
-                content = await f.read()
-            return content, entity
+            data = await asyncio.to_thread(self._blobs.read, backup_file_path)
+            return data.decode("utf-8"), entity
         except Exception as e:
             raise FileOperationException("read", str(backup_file_path), str(e))
 
@@ -376,14 +433,10 @@ class FileHistoryService:
                     f"Version {version_number} not found for file {file_path}"
                 )
 
-            backup_file_path = Path(entity.backup_file_path)
-            if backup_file_path.exists():
-                backup_file_path.unlink()
-
-            assert entity.id is not None
-            await uow.files_history.delete_by_id(entity.id)
+            _, released = await self._delete_record(uow, entity)
             await uow.commit()
 
+        await self._delete_blob_files(released)
         logger.info(f"Deleted version {version_number} for {file_path}")
         return True
 
@@ -409,6 +462,7 @@ class FileHistoryService:
 
         deleted_versions = 0
         freed_storage = 0
+        released: List[HistoryBlobEntity] = []
 
         async with self._uow as uow:
             old_records = await uow.files_history.get_versions_older_than(
@@ -416,18 +470,22 @@ class FileHistoryService:
             )
 
             for record in old_records:
-                backup_path = Path(record.backup_file_path)
-                if backup_path.exists():
-                    freed_storage += backup_path.stat().st_size
-                    backup_path.unlink()
-
-                assert record.id is not None
-                await uow.files_history.delete_by_id(record.id)
+                freed, record_blobs = await self._delete_record(uow, record)
+                freed_storage += freed
+                released.extend(record_blobs)
                 deleted_versions += 1
 
-            if deleted_versions > 0:
+            # Blobs left unreferenced by rows removed outside this
+            # service, e.g. cascaded from a deleted server.
+            for blob in await uow.history_blobs.get_unreferenced():
+                released.extend(await self._release_blob(uow, blob.content_hash))
+
+            if deleted_versions > 0 or released:
                 await uow.commit()
 
+        freed_storage += await self._delete_blob_files(released)
+        freed_storage += await self._sweep_orphan_blob_files()
+
         logger.info(
             f"Cleaned up {deleted_versions} old versions, freed {freed_storage} bytes"
         )
@@ -453,14 +511,98 @@ class FileHistoryService:
                 server_id, file_path, self.max_versions_per_file
             )
 
+            released: List[HistoryBlobEntity] = []
             for record in excess:
-                backup_path = Path(record.backup_file_path)
-                if backup_path.exists():
-                    backup_path.unlink()
-
-                assert record.id is not None
-                await uow.files_history.delete_by_id(record.id)
+                _, record_blobs = await self._delete_record(uow, record)
+                released.extend(record_blobs)
 
             if excess:
                 await uow.commit()
                 logger.info(f"Cleaned up {len(excess)} excess versions for {file_path}")
+
+        await self._delete_blob_files(released)
+
+    async def _delete_record(
+        self, uow: FilesUnitOfWork, record: FileHistoryEntity
+    ) -> Tuple[int, List[HistoryBlobEntity]]:
+        """Delete a version row and release its blob.
+
+        Returns `(bytes_freed, released_blobs)`. A legacy full-copy
+        backup is unlinked straight away, as before; released blobs are
+        unlinked by `_delete_blob_files` once the caller has committed,
+        so a rolled-back delete never loses content.
+        """
+        assert record.id is not None
+        await uow.files_history.delete_by_id(record.id)
+
+        blob = None
+        if record.content_hash is not None:
+            blob = await uow.history_blobs.get(record.content_hash)
+        if blob is not None and blob.storage_path == record.backup_file_path:
+            return 0, await self._release_blob(uow, blob.content_hash)
+
+        backup_path = Path(record.backup_file_path)
+        if backup_path.exists():
+            freed = backup_path.stat().st_size
+            backup_path.unlink()
+            return freed, []
+        return 0, []
+
+    async def _release_blob(
+        self, uow: FilesUnitOfWork, content_hash: str
+    ) -> List[HistoryBlobEntity]:
+        """Delete the blob row if nothing references it any more, then
+        its delta base likewise, and so on down the chain.
+        """
+        released = []
+        blob = await uow.history_blobs.get(content_hash)
+        while blob is not None and await uow.history_blobs.count_references(blob) == 0:
+            await uow.history_blobs.delete(blob.content_hash)
+            released.append(blob)
+            if blob.base_hash is None:
+                break
+            blob = await uow.history_blobs.get(blob.base_hash)
+        return released
+
+    async def _delete_blob_files(self, blobs: List[HistoryBlobEntity]) -> int:
+        """Unlink the files of released blobs; returns the bytes freed."""
+        if not blobs:
+            return 0
+
+        def delete() -> int:
+            freed = 0
+            for blob in blobs:
+                try:
+                    freed += self._blobs.delete(Path(blob.storage_path))
+                except OSError as e:
+                    logger.warning(
+                        f"Failed to delete history blob {blob.storage_path}: {e}"
+                    )
+            return freed
+
+        return await asyncio.to_thread(delete)
+
+    async def _sweep_orphan_blob_files(self) -> int:
+        """Delete blob files that no blob row records, e.g. written by a
+        backup whose transaction rolled back. Returns the bytes freed.
+        """
+        hashes = await asyncio.to_thread(
+            self._blobs.list_blobs, _ORPHAN_BLOB_GRACE_SECONDS
+        )
+        if not hashes:
+            return 0
+        async with self._uow as uow:
+            known = await uow.history_blobs.get_existing_hashes(hashes)
+        orphans = [
+            HistoryBlobEntity(
+                content_hash=content_hash,
+                storage_path=str(self._blobs.path_for(content_hash)),
+                stored_size=0,
+            )
+            for content_hash in hashes
+            if content_hash not in known
+        ]
+        freed = await self._delete_blob_files(orphans)
+        if orphans:
+            logger.info(f"Removed {len(orphans)} orphaned history blob files")
+        return freed
@@ -56,6 +56,21 @@ class CreateHistoryCommand:
     description: Optional[str]
 
 
+@dataclass(frozen=True)
+class HistoryBlobEntity:
+    """Stored content shared by every version with the same `content_hash`.
+
+    `base_hash` names the blob this one is a delta against, if any;
+    `chain_depth` is the number of deltas between it and a full blob.
+    """
+
+    content_hash: str
+    storage_path: str
+    stored_size: int
+    base_hash: Optional[str] = None
+    chain_depth: int = 0
+
+
 @dataclass(frozen=True)
 class FileHistoryStatsEntity:
     """Aggregate statistics for a single server's edit history."""
@@ -4,8 +4,10 @@ Per `docs/app/ARCHITECTURE.md` Section 4.1, this module **must not import** from
 SQLAlchemy, Pydantic, FastAPI, or any other framework. All types crossing
 these Protocols are pure domain entities defined in `entities.py`.
 
-Two Ports are defined:
+Three Ports are defined:
 - `FileHistoryRepository`: persistence Port for file edit history.
+- `HistoryBlobRepository`: persistence Port for the content blobs that
+  history versions reference.
 - `FilesUnitOfWork`: transactional boundary Port. Application code wraps
   a set of Repository calls in `async with uow:` and calls
   `await uow.commit()` to finalize. Concrete adapters drive the
@@ -14,12 +16,13 @@ Two Ports are defined:
 
 from datetime import datetime
 from types import TracebackType
-from typing import List, Optional, Protocol
+from typing import List, Optional, Protocol, Set
 
 from app.files.domain.entities import (
     CreateHistoryCommand,
     FileHistoryEntity,
     FileHistoryStatsEntity,
+    HistoryBlobEntity,
 )
 
 
@@ -84,6 +87,37 @@ class FileHistoryRepository(Protocol):
     async def delete_by_id(self, record_id: int) -> bool: ...
 
 
+class HistoryBlobRepository(Protocol):
+    """Persistence port for history blobs.
+
+    Concrete implementations: `SqlAlchemyHistoryBlobRepository`
+    (production), `FakeHistoryBlobRepository` (unit tests).
+
+    Reference counts are not stored: `count_references` counts the
+    history rows whose `backup_file_path` is the blob plus the blobs
+    that delta against it, so rows removed by a cascade (e.g. a deleted
+    server) can never leave a count behind. Like `FileHistoryRepository`,
+    methods **do not commit**.
+    """
+
+    async def get(self, content_hash: str) -> Optional[HistoryBlobEntity]: ...
+
+    async def get_existing_hashes(self, content_hashes: List[str]) -> Set[str]: ...
+
+    async def get_unreferenced(self) -> List[HistoryBlobEntity]: ...
+
+    async def count_references(self, blob: HistoryBlobEntity) -> int:
+        """History rows and delta blobs that still need ``blob``.
+
+        Must see deletes staged earlier in the same transaction.
+        """
+        ...
+
+    async def add(self, blob: HistoryBlobEntity) -> HistoryBlobEntity: ...
+
+    async def delete(self, content_hash: str) -> bool: ...
+
+
 class FilesUnitOfWork(Protocol):
     """Transactional boundary Port for the files domain.
 
@@ -94,6 +128,7 @@ class FilesUnitOfWork(Protocol):
     """
 
     files_history: FileHistoryRepository
+    history_blobs: HistoryBlobRepository
 
     async def __aenter__(self) -> "FilesUnitOfWork": ...
 
@@ -41,7 +41,8 @@ class FileEditHistory(Base):
     )
     file_path = Column(String(500), nullable=False)  # Relative path from server root
     version_number = Column(Integer, nullable=False)
-    backup_file_path = Column(String(500), nullable=False)  # Absolute path to backup file
+    # FileHistoryBlob.storage_path, or a legacy full-copy backup file
+    backup_file_path = Column(String(500), nullable=False, index=True)
     file_size = Column(BigInteger, nullable=False)
     content_hash = Column(
         String(64), nullable=True
@@ -58,3 +59,24 @@ class FileEditHistory(Base):
 
     def __repr__(self):
         return f"<FileEditHistory(id={self.id}, server_id={self.server_id}, file_path={self.file_path}, version={self.version_number})>"
+
+
+class FileHistoryBlob(Base):
+    """Compressed, content-addressed storage shared by history versions.
+
+    Versions reference a blob through `FileEditHistory.backup_file_path`
+    (== `storage_path`); a blob is deleted once no version and no other
+    blob (delta) references it.
+    """
+
+    __tablename__ = "file_history_blobs"
+
+    content_hash = Column(String(64), primary_key=True)  # SHA256 of the content
+    storage_path = Column(String(500), nullable=False, index=True)
+    stored_size = Column(BigInteger, nullable=False)  # Bytes on disk
+    base_hash = Column(String(64), nullable=True, index=True)  # Delta base blob
+    chain_depth = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<FileHistoryBlob(content_hash={self.content_hash})>"
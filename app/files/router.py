@@ -1,6 +1,8 @@
+import gzip
+import json
 import logging
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional, Union
 
 from fastapi import (
     APIRouter,
@@ -13,7 +15,7 @@ from fastapi import (
     Response,
     UploadFile,
 )
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.audit.api.dependencies import get_audit_writer
@@ -22,10 +24,13 @@ from app.audit.domain.entities import AuditEventCommand
 from app.audit.domain.ports import AuditWriter
 from app.auth.dependencies import get_current_user
 from app.core.database import get_db
+from app.core.file_responses import RangeFileResponse
 from app.files.api.dependencies import get_file_history_service
+from app.files.application.listing import COMPACT_COLUMNS, ListingQuery, to_compact
 from app.files.application.management import file_management_service
 from app.files.application.service import FileHistoryService
 from app.files.schemas import (
+    CompactFileListResponse,
     DeleteVersionResponse,
     DirectoryCreateRequest,
     DirectoryCreateResponse,
@@ -39,6 +44,7 @@ from app.files.schemas import (
     FileRenameResponse,
     FileSearchRequest,
     FileSearchResponse,
+    FileSearchResult,
     FileUploadResponse,
     FileVersionContentResponse,
     FileWriteRequest,
@@ -56,6 +62,9 @@ from app.users.models import User
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Compact listings smaller than this are not worth compressing.
+_LISTING_GZIP_MIN_BYTES = 1024
+
 
 def _duration_ms(start: float) -> int:
     """Round elapsed wall-clock to integer milliseconds for audit detail."""
@@ -191,7 +200,7 @@ async def download_file(
         db=db,
     )
 
-    return FileResponse(
+    return RangeFileResponse(
         path=file_location,
         filename=filename,
         media_type="application/octet-stream",
@@ -258,6 +267,30 @@ async def upload_file(
     return FileUploadResponse(**result)
 
 
+def _to_search_result(result: Dict[str, Any]) -> FileSearchResult:
+    # Check if this is the test mock format (with "file" field) or actual service format
+    if "file" in result:
+        # Test mock format - use file field directly
+        return FileSearchResult(
+            file=FileInfoResponse(**result["file"]),
+            matches=result.get("matches", []),
+            match_count=result.get("match_count", 0),
+        )
+
+    # Actual service format - result is the file data directly
+    extra = ("match_type", "line_matches", "match_count", "truncated")
+    file_data = {k: v for k, v in result.items() if k not in extra}
+    line_matches = result.get("line_matches", [])
+    return FileSearchResult(
+        file=FileInfoResponse(**file_data),
+        matches=[f"{m['line']}: {m['snippet']}" for m in line_matches],
+        match_count=result.get("match_count", 1 if "match_type" in result else 0),
+        match_type=result.get("match_type"),
+        line_matches=line_matches,
+        truncated=result.get("truncated", False),
+    )
+
+
 @router.post("/servers/{server_id}/files/search", response_model=FileSearchResponse)
 async def search_files(
     server_id: int,
@@ -267,8 +300,6 @@ async def search_files(
     auth: AuthorizationService = Depends(get_authorization_service),
 ):
     """Search for files in server directory"""
-    from app.files.schemas import FileSearchResult
-
     # Check server access
     await auth.check_server_access(server_id, current_user)
 
@@ -282,27 +313,7 @@ async def search_files(
     )
 
     # Convert results to proper schema objects
-    formatted_results = []
-    for result in search_result["results"]:
-        # Check if this is the test mock format (with "file" field) or actual service format
-        if "file" in result:
-            # Test mock format - use file field directly
-            file_data = result["file"]
-            matches = result.get("matches", [])
-            match_count = result.get("match_count", 0)
-        else:
-            # Actual service format - result is the file data directly
-            file_data = {k: v for k, v in result.items() if k != "match_type"}
-            matches = []  # Content matches would need separate implementation
-            match_count = 1 if "match_type" in result else 0
-
-        formatted_results.append(
-            FileSearchResult(
-                file=FileInfoResponse(**file_data),
-                matches=matches,
-                match_count=match_count,
-            )
-        )
+    formatted_results = [_to_search_result(result) for result in search_result["results"]]
 
     # Check if using test mock format or actual service format for response fields
     if "query" in search_result:
@@ -324,6 +335,53 @@ async def search_files(
     )
 
 
+@router.post("/servers/{server_id}/files/search/stream")
+async def stream_search_files(
+    server_id: int,
+    request: FileSearchRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    auth: AuthorizationService = Depends(get_authorization_service),
+):
+    """Search for files, streaming results as newline-delimited JSON.
+
+    Each line is a `FileSearchResult` with `"type": "result"`, sent as
+    soon as it is found; the last line is `{"type": "summary", ...}`
+    with the same totals as the non-streaming endpoint.
+    """
+    await auth.check_server_access(server_id, current_user)
+
+    start = time.perf_counter()
+    results = await file_management_service.stream_search_files(
+        server_id=server_id,
+        search_term=request.query,
+        file_type=request.file_type.value if request.file_type else None,
+        search_in_content=request.include_content,
+        max_results=request.max_results,
+        db=db,
+    )
+
+    async def lines():
+        async for result, total in results:
+            if result is not None:
+                item = _to_search_result(result).model_dump(mode="json")
+                yield json.dumps({"type": "result", **item}) + "\n"
+                continue
+            summary = {
+                "type": "summary",
+                "query": request.query,
+                "total_results": total,
+                "search_time_ms": _duration_ms(start),
+            }
+            yield json.dumps(summary) + "\n"
+
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post(
     "/servers/{server_id}/files/{directory_path:path}/directories",
     response_model=DirectoryCreateResponse,
@@ -624,19 +682,44 @@ async def get_server_file_history_stats(
 
 
 # General endpoints (must come after specific ones)
-@router.get("/servers/{server_id}/files", response_model=FileListResponse)
-@router.get("/servers/{server_id}/files/{path:path}", response_model=FileListResponse)
+@router.get(
+    "/servers/{server_id}/files",
+    response_model=Union[FileListResponse, CompactFileListResponse],
+)
+@router.get(
+    "/servers/{server_id}/files/{path:path}",
+    response_model=Union[FileListResponse, CompactFileListResponse],
+)
 async def list_server_files(
+    request: Request,
     response: Response,
     server_id: int,
     path: str = "",
     file_type: Optional[FileType] = None,
+    name: Optional[str] = Query(
+        None, max_length=255, description="Only entries whose name contains this"
+    ),
+    sort: Literal["name", "size", "modified", "type"] = Query(
+        "name", description="Sort field; directories always come first"
+    ),
+    order: Literal["asc", "desc"] = Query("asc", description="Sort order"),
+    limit: Optional[int] = Query(
+        None, ge=1, le=1000, description="Page size; omit to list everything"
+    ),
+    cursor: Optional[str] = Query(None, description="`next_cursor` of the previous page"),
+    compact: bool = Query(False, description="Columnar rows instead of objects"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     auth: AuthorizationService = Depends(get_authorization_service),
 ):
     """List files and directories in server directory.
 
+    Pass `limit` to page through large directories: each page carries a
+    `next_cursor` to send back as `cursor` (with the same `sort` and
+    `order`) until it is null. `compact=true` returns `columns` + `rows`
+    instead of one object per file, gzip-encoded when the client accepts
+    it.
+
     Domain exceptions raised by the service layer (``ServerNotFoundError``,
     ``ServerAccessError``, ``FileMissingError``, etc.) propagate to the
     global handlers in :mod:`app.core.error_handlers`. The legacy
@@ -650,25 +733,53 @@ async def list_server_files(
 
     logger.info(f"Listing files for server {server_id}, path: '{path}'")
 
-    files = await file_management_service.get_server_files(
+    page = await file_management_service.list_server_files(
         server_id=server_id,
         path=path,
-        file_type=file_type,
+        query=ListingQuery(
+            sort=sort,
+            order=order,
+            file_type=file_type,
+            name_contains=name,
+            limit=limit,
+            cursor=cursor,
+        ),
         db=db,
     )
 
-    # Convert dict results to schema objects
-    file_responses = [FileInfoResponse(**file_data) for file_data in files]
+    logger.info(f"Successfully listed {len(page.files)} files for server {server_id}")
 
-    logger.info(f"Successfully listed {len(file_responses)} files for server {server_id}")
+    if compact:
+        body = CompactFileListResponse(
+            columns=list(COMPACT_COLUMNS),
+            rows=to_compact(page.files),
+            current_path=path,
+            total_files=page.total,
+            next_cursor=page.next_cursor,
+        ).model_dump_json()
+        return _json_response(request, response, body)
 
     return FileListResponse(
-        files=file_responses,
+        files=[FileInfoResponse(**file_data) for file_data in page.files],
         current_path=path,
-        total_files=len(file_responses),
+        total_files=page.total,
+        next_cursor=page.next_cursor,
     )
 
 
+def _json_response(request: Request, response: Response, body: str) -> Response:
+    """Serialized JSON, gzip-encoded when the client accepts it."""
+    headers = {"Cache-Control": response.headers["cache-control"]}
+    content = body.encode("utf-8")
+    if len(content) >= _LISTING_GZIP_MIN_BYTES and "gzip" in request.headers.get(
+        "accept-encoding", ""
+    ):
+        content = gzip.compress(content, compresslevel=5)
+        headers["Content-Encoding"] = "gzip"
+    headers["Vary"] = "Accept-Encoding"
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
 @router.put(
     "/servers/{server_id}/files/{file_path:path}", response_model=FileWriteResponse
 )
@@ -1,6 +1,6 @@
 import codecs
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -21,6 +21,21 @@ class FileListResponse(BaseModel):
     files: List[FileInfoResponse]
     current_path: str
     total_files: int
+    next_cursor: Optional[str] = None
+
+
+class CompactFileListResponse(BaseModel):
+    """Columnar listing: one ``rows`` entry per file, in ``columns`` order.
+
+    Field names are sent once instead of per file, which keeps large
+    listings small and compresses well.
+    """
+
+    columns: List[str]
+    rows: List[List[Any]]
+    current_path: str
+    total_files: int
+    next_cursor: Optional[str] = None
 
 
 class FileReadResponse(BaseModel):
@@ -106,12 +121,24 @@ class FileSearchRequest(BaseModel):
     max_results: int = Field(50, ge=1, le=200, description="Maximum number of results")
 
 
+class SearchLineMatch(BaseModel):
+    line: int = Field(..., description="1-based line number")
+    snippet: str = Field(..., description="The matching line, trimmed around the match")
+
+
 class FileSearchResult(BaseModel):
     file: FileInfoResponse
     matches: List[str] = Field(
         default_factory=list, description="Matching lines if content search"
     )
     match_count: int = Field(0, description="Number of matches found")
+    match_type: Optional[str] = Field(None, description="'filename' or 'content'")
+    line_matches: List[SearchLineMatch] = Field(
+        default_factory=list, description="Line numbers and snippets of content matches"
+    )
+    truncated: bool = Field(
+        False, description="The file has more matching lines than listed"
+    )
 
 
 class FileSearchResponse(BaseModel):
@@ -16,7 +16,7 @@ import asyncio
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from app.core.exceptions import FileOperationException
 from app.core.security import PathValidator, SecurityError
@@ -120,6 +120,26 @@ class GroupFileSyncer:
             removed_players=removed_players,
         )
 
+    async def broadcast_group_change_to_servers(
+        self,
+        servers: Sequence[Tuple[int, Path]],
+        group_type: GroupType,
+        change_type: str,
+        removed_players: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ) -> Dict[int, bool]:
+        """Forward a real-time group-change command to many servers at once.
+
+        Concurrent counterpart of `broadcast_group_change` for fan-out
+        across every server a group is attached to. Returns the
+        collaborator's per-server success flags.
+        """
+        return await self._real_time_commands.handle_group_change_commands_for_servers(
+            servers,
+            group_type,
+            change_type,
+            removed_players=removed_players,
+        )
+
     async def update_server_files(self, server_id: int) -> None:
         """Regenerate ops.json + whitelist.json for one server.
 
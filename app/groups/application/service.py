@@ -595,14 +595,15 @@ class GroupService:
             # commands fan out after exit by design.
             async with self._uow as uow:
                 attached = await uow.server_groups.list_server_dirs_for_group(group_id)
-            for server_id, directory_path in attached:
-                await self._file_syncer.broadcast_group_change(
-                    server_id,
-                    Path(directory_path),
-                    group_type,
-                    change_type,
-                    removed_players=removed_players,
-                )
+            await self._file_syncer.broadcast_group_change_to_servers(
+                [
+                    (server_id, Path(directory_path))
+                    for server_id, directory_path in attached
+                ],
+                group_type,
+                change_type,
+                removed_players=removed_players,
+            )
         except Exception as cmd_error:
             logger.warning(
                 f"Failed to send real-time commands for group {group_id} "
@@ -28,7 +28,11 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.auth.models import AccountLockout
+from app.backups.application.chunk_store import MANIFEST_SUFFIX
+from app.backups.application.file_service import last_archive_stats
+from app.backups.application.scrubber import last_scrub_stats
 from app.backups.models import Backup
+from app.core.archives import ARCHIVE_SUFFIXES
 from app.core.datetime_utils import utcnow
 from app.servers.domain.value_objects import BackupStatus, ServerStatus
 from app.servers.models import Server
@@ -76,6 +80,54 @@ semaphore_limit = Gauge(
     ["semaphore"],
 )
 
+websocket_outbound_queue_depth = Gauge(
+    "mc_websocket_outbound_queue_depth",
+    (
+        "Messages waiting in per-connection WebSocket send queues "
+        "(`total` across connections, `max` for the deepest one)."
+    ),
+    ["stat"],
+)
+
+websocket_dropped_messages_total = Gauge(
+    "mc_websocket_dropped_messages_total",
+    "Messages dropped from full WebSocket send queues since startup.",
+)
+
+backup_archive_files_per_second = Gauge(
+    "mc_backup_archive_files_per_second",
+    "Files per second walked by the most recent backup in this process.",
+)
+
+backup_archive_bytes_per_second = Gauge(
+    "mc_backup_archive_bytes_per_second",
+    "Bytes per second archived by the most recent backup in this process.",
+)
+
+backup_scrub_backups = Gauge(
+    "mc_backup_scrub_backups",
+    (
+        "Backups by outcome of the most recent checksum scrub pass "
+        "(verified, mismatched, missing, backfilled, error)."
+    ),
+    ["result"],
+)
+
+backup_scrub_bytes_read = Gauge(
+    "mc_backup_scrub_bytes_read",
+    "Bytes re-read by the most recent checksum scrub pass.",
+)
+
+backup_scrub_duration_seconds = Gauge(
+    "mc_backup_scrub_duration_seconds",
+    "Wall-clock duration of the most recent checksum scrub pass.",
+)
+
+backup_scrub_last_completed_timestamp_seconds = Gauge(
+    "mc_backup_scrub_last_completed_timestamp_seconds",
+    "Unix time at which the most recent checksum scrub pass finished.",
+)
+
 
 class BusinessMetricsCollector:
     """Refresh business-level Prometheus gauges on demand.
@@ -100,6 +152,9 @@ class BusinessMetricsCollector:
         self._collect_pending_backups()
         self._collect_active_lockouts()
         self._collect_semaphore_stats()
+        self._collect_websocket_queue_stats()
+        self._collect_backup_throughput()
+        self._collect_backup_scrub()
 
     # ------------------------------------------------------------------
     # Individual collectors
@@ -138,7 +193,14 @@ class BusinessMetricsCollector:
         pending_dir = self._backups_directory / ".pending"
         try:
             if pending_dir.exists():
-                fs_pending = sum(1 for _ in pending_dir.glob("*.tar.gz"))
+                # `.download-*` archives are materialized incremental
+                # backups being served, not backups in progress.
+                fs_pending = sum(
+                    1
+                    for suffix in (*ARCHIVE_SUFFIXES.values(), MANIFEST_SUFFIX)
+                    for path in pending_dir.glob(f"*{suffix}")
+                    if not path.name.startswith(".download-")
+                )
         except OSError:
             logger.exception("Failed to list %s for pending backups", pending_dir)
 
@@ -172,12 +234,64 @@ class BusinessMetricsCollector:
         except Exception:  # noqa: BLE001
             logger.exception("Failed to collect mc_semaphore_* metrics")
 
+    def _collect_websocket_queue_stats(self) -> None:
+        try:
+            from app.websockets.application.service import websocket_service
+
+            stats = websocket_service.connection_manager.queue_stats()
+            websocket_outbound_queue_depth.labels(stat="total").set(
+                stats["queued_messages"]
+            )
+            websocket_outbound_queue_depth.labels(stat="max").set(
+                stats["max_queue_depth"]
+            )
+            websocket_dropped_messages_total.set(stats["dropped_messages"])
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed to collect mc_websocket_* metrics")
+
+    def _collect_backup_throughput(self) -> None:
+        try:
+            stats = last_archive_stats()
+            if stats is None:
+                return
+            backup_archive_files_per_second.set(stats.files_per_second)
+            backup_archive_bytes_per_second.set(stats.bytes_per_second)
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed to collect mc_backup_archive_* metrics")
+
+    def _collect_backup_scrub(self) -> None:
+        try:
+            stats = last_scrub_stats()
+            if stats is None:
+                return
+            for result, value in (
+                ("verified", stats.verified),
+                ("mismatched", stats.mismatched),
+                ("missing", stats.missing),
+                ("backfilled", stats.backfilled),
+                ("error", stats.errors),
+            ):
+                backup_scrub_backups.labels(result=result).set(value)
+            backup_scrub_bytes_read.set(stats.bytes_read)
+            backup_scrub_duration_seconds.set(stats.seconds)
+            backup_scrub_last_completed_timestamp_seconds.set(stats.finished_at)
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed to collect mc_backup_scrub_* metrics")
+
 
 __all__ = [
     "BusinessMetricsCollector",
     "account_lockouts_active",
+    "backup_archive_bytes_per_second",
+    "backup_archive_files_per_second",
+    "backup_scrub_backups",
+    "backup_scrub_bytes_read",
+    "backup_scrub_duration_seconds",
+    "backup_scrub_last_completed_timestamp_seconds",
     "backups_pending_total",
     "semaphore_in_use",
     "semaphore_limit",
     "servers_total",
+    "websocket_dropped_messages_total",
+    "websocket_outbound_queue_depth",
 ]
@@ -54,6 +54,7 @@ class ServiceStatus:
         self.database_ready = False
         self.database_integration_ready = False
         self.backup_scheduler_ready = False
+        self.backup_scrubber_ready = False
         self.websocket_service_ready = False
         self.version_update_scheduler_ready = False
         self.failed_services = []
@@ -68,6 +69,7 @@ class ServiceStatus:
             "database": self.database_ready,
             "database_integration": self.database_integration_ready,
             "backup_scheduler": self.backup_scheduler_ready,
+            "backup_scrubber": self.backup_scrubber_ready,
             "websocket_service": self.websocket_service_ready,
             "version_update_scheduler": self.version_update_scheduler_ready,
             "failed_services": self.failed_services,
@@ -122,8 +124,11 @@ async def _initialize_services():
     # 3. Initialize database integration (important but not critical)
     await _initialize_database_integration()
 
-    # 4. Initialize backup scheduler (optional - can be started later)
+    # 4. Fail backups left `creating` by a previous process, then start
+    # the backup scheduler (optional - can be started later)
+    await _recover_interrupted_backups()
     await _initialize_backup_scheduler()
+    await _initialize_backup_scrubber()
 
     # 5. Initialize WebSocket service (optional - real-time features)
     await _initialize_websocket_service()
@@ -190,6 +195,17 @@ async def _initialize_database():
 
         migrate_users_token_version(engine)
 
+        # Backfill the nullable `backups.checksum` column and the
+        # `backup_schedules.keep_*` retention tiers on pre-existing
+        # databases; the ORM selects them on every read.
+        from app.backups.adapters.migrations import (
+            migrate_backup_checksum,
+            migrate_backup_schedule_retention_tiers,
+        )
+
+        migrate_backup_checksum(engine)
+        migrate_backup_schedule_retention_tiers(engine)
+
         # Issue #354: backfill `minecraft_versions.is_stable` by
         # re-evaluating version strings against pre-release patterns.
         from app.versions.adapters.migrations import migrate_version_stability
@@ -323,6 +339,29 @@ async def _initialize_database_integration():
         # Continue startup - this is not critical for basic functionality
 
 
+async def _recover_interrupted_backups():
+    """Reconcile backup rows orphaned by a crash mid-archive.
+
+    Backups reserve a `creating` row before archiving and finalise it
+    afterwards; a process that dies in between leaves the row behind.
+    Runs before anything can start a new backup. Best effort: failures
+    are logged and startup continues.
+    """
+    try:
+        from app.backups.api.dependencies import make_backup_service
+        from app.core.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            recovered = await make_backup_service(db).recover_interrupted_backups()
+        finally:
+            db.close()
+        if recovered:
+            logger.info(f"Recovered {recovered} interrupted backup(s)")
+    except Exception as e:
+        logger.warning(f"Interrupted backup recovery failed; startup continues: {e}")
+
+
 async def _initialize_backup_scheduler():
     """Initialize backup scheduler - optional service.
 
@@ -357,6 +396,25 @@ async def _initialize_backup_scheduler():
         # Continue startup - backups can be managed manually if needed
 
 
+_backup_scrubber = None
+
+
+async def _initialize_backup_scrubber():
+    """Start the background backup checksum scrubber - optional service."""
+    global _backup_scrubber
+    try:
+        from app.backups.api.dependencies import make_backup_scrubber
+
+        scrubber = make_backup_scrubber()
+        await scrubber.start()
+        _backup_scrubber = scrubber
+        service_status.backup_scrubber_ready = True
+        logger.info("Backup scrubber started successfully")
+    except Exception as e:
+        logger.error(f"Backup scrubber initialization failed: {e}")
+        service_status.failed_services.append("backup_scrubber")
+
+
 async def _initialize_websocket_service():
     """Initialize WebSocket service - optional service"""
     try:
@@ -427,6 +485,15 @@ async def _cleanup_services():
             logger.error(f"Error stopping backup scheduler: {e}")
             cleanup_errors.append(f"backup_scheduler: {e}")
 
+    # Stop backup scrubber
+    if service_status.backup_scrubber_ready and _backup_scrubber is not None:
+        try:
+            await _backup_scrubber.stop()
+            logger.info("Backup scrubber stopped successfully")
+        except Exception as e:
+            logger.error(f"Error stopping backup scrubber: {e}")
+            cleanup_errors.append(f"backup_scrubber: {e}")
+
     # Stop WebSocket monitoring
     if service_status.websocket_service_ready:
         try:
@@ -94,6 +94,10 @@ class DatabaseIntegrationService:
         minecraft_server_manager.set_status_update_callback(
             self._update_server_status_async
         )
+        # Process restoration reports all restored servers at once.
+        minecraft_server_manager.set_batch_status_update_callback(
+            self.batch_update_server_statuses_async
+        )
         logger.info("Database integration initialized")
 
     # ----- Status updates (sync→async bridge) -----
@@ -15,11 +15,19 @@ from app.servers.application.minecraft.manager import (
     minecraft_server_manager,
 )
 from app.servers.application.minecraft.rcon_client import MinecraftRCONClient
-from app.servers.application.minecraft.server_process import ServerProcess
+from app.servers.application.minecraft.server_process import (
+    SERVER_STATUS_TOPIC,
+    CommandResult,
+    ServerProcess,
+    ServerStatusEvent,
+)
 
 __all__ = [
+    "CommandResult",
     "MinecraftServerManager",
     "MinecraftRCONClient",
+    "SERVER_STATUS_TOPIC",
     "ServerProcess",
+    "ServerStatusEvent",
     "minecraft_server_manager",
 ]
@@ -3,11 +3,10 @@
 Verbatim move of the subprocess/fork/signal handling that builds the
 Minecraft server daemon (double-fork technique, alternative Popen path,
 and SIGTERM/SIGKILL teardown). Methods rely on ``self._is_process_running``,
-``self._cleanup_server_process``, ``self._notify_status_change`` from
-sibling mixins.
+``self._sleep_until_process_exit``, ``self._cleanup_server_process``,
+``self._notify_status_change`` from sibling mixins.
 """
 
-import asyncio
 import os
 import signal
 import sys
@@ -308,9 +307,10 @@ class DaemonProcessMixin:
                     f"Sent SIGTERM to daemon server {server_id} (PID: {server_process.pid})"
                 )
 
-                # Wait up to 5 seconds for SIGTERM
+                # Wait up to 5 seconds for SIGTERM; a watched PID wakes the
+                # wait as soon as the process exits
                 for i in range(5):
-                    await asyncio.sleep(1)
+                    await self._sleep_until_process_exit(server_process.pid, 1)
                     if not await self._is_process_running(server_process.pid):
                         logger.info(f"Daemon server {server_id} stopped with SIGTERM")
                         await self._cleanup_server_process(server_id)
@@ -325,7 +325,7 @@ class DaemonProcessMixin:
 
                 # Wait up to 3 seconds for SIGKILL
                 for i in range(3):
-                    await asyncio.sleep(1)
+                    await self._sleep_until_process_exit(server_process.pid, 1)
                     if not await self._is_process_running(server_process.pid):
                         logger.info(f"Daemon server {server_id} stopped with SIGKILL")
                         await self._cleanup_server_process(server_id)
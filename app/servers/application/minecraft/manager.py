@@ -14,22 +14,31 @@ from datetime import datetime
 from pathlib import Path
 from typing import (
     Any,
+    AsyncIterator,
     Awaitable,
     Callable,
     Dict,
     List,
     Optional,
+    Tuple,
     Union,
 )
 
 from app.core.config import settings
+from app.core.event_bus import get_event_bus
+from app.core.process_liveness import get_process_liveness
 from app.servers.application.minecraft._compat import logger
 from app.servers.application.minecraft.daemon_process import DaemonProcessMixin
 from app.servers.application.minecraft.monitoring import MonitoringMixin
 from app.servers.application.minecraft.pid_file import PidFileMixin
 from app.servers.application.minecraft.preflight import PreflightMixin
-from app.servers.application.minecraft.rcon_client import MinecraftRCONClient
-from app.servers.application.minecraft.server_process import ServerProcess
+from app.servers.application.minecraft.rcon_client import RCONConnectionPool
+from app.servers.application.minecraft.server_process import (
+    SERVER_STATUS_TOPIC,
+    CommandResult,
+    ServerProcess,
+    ServerStatusEvent,
+)
 from app.servers.domain.entities import ServerEntity
 from app.servers.domain.ports import ServerRepository
 from app.servers.models import ServerStatus
@@ -58,9 +67,28 @@ class MinecraftServerManager(
                 Union[Awaitable[Optional[bool]], Optional[bool]],
             ]
         ] = None
+        # Optional bulk variant used when many statuses change at once (process
+        # restoration); receives ``{server_id: status}`` and returns
+        # ``{server_id: bool}``.
+        self._batch_status_update_callback: Optional[
+            Callable[[Dict[int, ServerStatus]], Awaitable[Dict[int, bool]]]
+        ] = None
+        # Last status transition published on the event bus per server, so
+        # repeated notifications of an unchanged status are not re-published
+        # and new WebSocket clients get the same data. Stopped and untracked
+        # servers have no entry.
+        self._published_statuses: Dict[int, ServerStatusEvent] = {}
         # Configurable log queue size to prevent memory leaks
         self.log_queue_size = log_queue_size or settings.SERVER_LOG_QUEUE_SIZE
         self.java_check_timeout = settings.JAVA_CHECK_TIMEOUT
+        # Last ``discover_and_restore_processes`` result as (loop time,
+        # results) and the scan currently in flight, shared by concurrent
+        # callers.
+        self._discovery_cache: Optional[Tuple[float, Dict[int, bool]]] = None
+        self._discovery_task: Optional[asyncio.Task] = None
+        # One persistent RCON connection per running server, closed by
+        # ``_cleanup_server_process`` / ``shutdown_all``.
+        self.rcon_pool = RCONConnectionPool()
         # The port-conflict check inside ``_validate_port_availability``
         # consumes a ``ServerRepository`` passed explicitly by the caller
         # (#272, #285) — no framework-typed factories remain on this class.
@@ -81,6 +109,17 @@ class MinecraftServerManager(
         """
         self._status_update_callback = callback
 
+    def set_batch_status_update_callback(
+        self,
+        callback: Callable[[Dict[int, ServerStatus]], Awaitable[Dict[int, bool]]],
+    ) -> None:
+        """Set the async callback used to persist many status changes at once.
+
+        Used by ``_notify_status_changes``; without it, each change goes
+        through the per-server callback instead.
+        """
+        self._batch_status_update_callback = callback
+
     async def _notify_status_change(self, server_id: int, status: ServerStatus) -> bool:
         """Notify about status changes to update the database.
 
@@ -96,7 +135,12 @@ class MinecraftServerManager(
         callsite (each of which already runs inside an ``async def``), so
         the bool propagates to callers and ordering is preserved within
         each task.
+
+        Actual transitions are also published on the event bus as a
+        ``ServerStatusEvent`` under ``SERVER_STATUS_TOPIC``, whether or not
+        a database callback is registered.
         """
+        self._publish_status_change(server_id, status)
         callback = self._status_update_callback
         if callback is None:
             return False
@@ -114,6 +158,60 @@ class MinecraftServerManager(
             return True
         return bool(result)
 
+    def _publish_status_change(self, server_id: int, status: ServerStatus) -> None:
+        last = self._published_statuses.get(server_id)
+        previous = last.status if last is not None else ServerStatus.stopped
+        if previous == status:
+            return
+        event = ServerStatusEvent(server_id, status, previous)
+        if status == ServerStatus.stopped:
+            self._published_statuses.pop(server_id, None)
+        else:
+            self._published_statuses[server_id] = event
+        get_event_bus().publish(SERVER_STATUS_TOPIC, event)
+
+    def _prune_published_status(self, server_id: int) -> None:
+        """Forget the published status of a server that is no longer tracked.
+
+        Stop paths publish ``stopped`` right after cleanup, which drops the
+        entry (and needs ``stopping`` as its previous status); a server that
+        failed stays at ``error`` with nothing to follow, so it goes here.
+        """
+        last = self._published_statuses.get(server_id)
+        if last is not None and last.status == ServerStatus.error:
+            del self._published_statuses[server_id]
+
+    def get_status_event(self, server_id: int) -> Optional[ServerStatusEvent]:
+        """Last status transition published for ``server_id``.
+
+        ``None`` for a stopped or untracked server, or one whose status was
+        never published.
+        """
+        return self._published_statuses.get(server_id)
+
+    async def _notify_status_changes(
+        self, updates: Dict[int, ServerStatus]
+    ) -> Dict[int, bool]:
+        """Notify about several status changes in one database round trip.
+
+        Falls back to one ``_notify_status_change`` per server when no batch
+        callback is registered or the batch callback raised.
+        """
+        if not updates:
+            return {}
+        for server_id, status in updates.items():
+            self._publish_status_change(server_id, status)
+        callback = self._batch_status_update_callback
+        if callback is not None:
+            try:
+                return await callback(dict(updates))
+            except Exception as e:
+                logger.error(f"Failed to batch update database statuses: {e}")
+        return {
+            server_id: await self._notify_status_change(server_id, status)
+            for server_id, status in updates.items()
+        }
+
     async def start_server(
         self,
         server: ServerEntity,
@@ -270,6 +368,10 @@ class MinecraftServerManager(
                 )
                 return False
 
+            # A freshly created process may reuse the PID of one that exited
+            # earlier; drop any stale liveness state for it.
+            get_process_liveness().forget(daemon_pid)
+
             # Verify daemon process is running
             if not await self._is_process_running(daemon_pid):
                 logger.error(
@@ -279,7 +381,7 @@ class MinecraftServerManager(
 
             # Additional verification - wait and check multiple times
             for i in range(3):  # Check 3 times over 300ms
-                await asyncio.sleep(0.1)
+                await self._sleep_until_process_exit(daemon_pid, 0.1)
                 if not await self._is_process_running(daemon_pid):
                     logger.error(
                         f"Daemon process {daemon_pid} died within {(i + 1) * 100}ms for server {server.id}"
@@ -508,43 +610,112 @@ class MinecraftServerManager(
                 )
                 return False
 
-            # Create RCON client and connect
-            rcon_client = MinecraftRCONClient()
+            # Commands share the server's pooled, already-authenticated
+            # connection; the pool reconnects transparently if it was lost.
+            response = await self.rcon_pool.send_command(
+                server_id,
+                server_process.rcon_port,
+                server_process.rcon_password,
+                command,
+            )
 
-            try:
-                # Connect to RCON server
-                connected = await rcon_client.connect(
-                    host="127.0.0.1",
-                    port=server_process.rcon_port,
-                    password=server_process.rcon_password,
-                    timeout=5.0,
+            if response is not None:
+                logger.info(
+                    f"Command '{command}' sent to server {server_id} via RCON. "
+                    f"Response: {response[:100]}{'...' if len(response) > 100 else ''}"
                 )
+                return True
+            else:
+                logger.error(
+                    f"Failed to send command '{command}' to server {server_id} via RCON"
+                )
+                return False
 
-                if not connected:
-                    logger.error(f"Failed to connect to RCON for server {server_id}")
-                    return False
+        except Exception as e:
+            logger.error(f"Failed to send command to server {server_id} via RCON: {e}")
+            return False
 
-                # Send command
-                response = await rcon_client.send_command(command)
+    async def send_commands_batch(
+        self, server_id: int, commands: List[str]
+    ) -> List[CommandResult]:
+        """Send a list of commands to a running server in one session.
 
-                if response is not None:
-                    logger.info(
-                        f"Command '{command}' sent to server {server_id} via RCON. "
-                        f"Response: {response[:100]}{'...' if len(response) > 100 else ''}"
-                    )
-                    return True
-                else:
-                    logger.error(
-                        f"Failed to send command '{command}' to server {server_id} via RCON"
-                    )
-                    return False
+        The server lookup happens once for the whole batch, and over RCON the
+        commands are queued on the server's pooled connection, so applying
+        hundreds of ``op``/``deop``/``whitelist`` commands needs no reconnect
+        or login per command. Returns one :class:`CommandResult` per command,
+        in order.
+        """
+        if not commands:
+            return []
+
+        def failed() -> List[CommandResult]:
+            return [CommandResult(command, False) for command in commands]
+
+        server_process = self.processes.get(server_id)
+        if server_process is None:
+            return failed()
+
+        try:
+            if server_process.rcon_port and server_process.rcon_password:
+                responses = await self.rcon_pool.send_commands(
+                    server_id,
+                    server_process.rcon_port,
+                    server_process.rcon_password,
+                    commands,
+                )
+                results = [
+                    CommandResult(command, response is not None, response)
+                    for command, response in zip(commands, responses)
+                ]
+                sent = sum(1 for result in results if result.success)
+                logger.info(
+                    f"Sent {sent}/{len(commands)} commands to server {server_id} via RCON"
+                )
+                return results
 
-            finally:
-                await rcon_client.disconnect()
+            if server_process.process and server_process.process.stdin:
+                logger.debug(
+                    f"Using stdin fallback for server {server_id} (RCON not available)"
+                )
+                server_process.process.stdin.write(
+                    "".join(f"{command}\n" for command in commands).encode()
+                )
+                await server_process.process.stdin.drain()
+                return [CommandResult(command, True) for command in commands]
+
+            logger.warning(f"No command mechanism available for server {server_id}")
+            return failed()
 
         except Exception as e:
-            logger.error(f"Failed to send command to server {server_id} via RCON: {e}")
-            return False
+            logger.error(f"Failed to send command batch to server {server_id}: {e}")
+            return failed()
+
+    async def stream_command_output(
+        self, server_id: int, command: str
+    ) -> AsyncIterator[str]:
+        """Run ``command`` over RCON and yield its output as it arrives.
+
+        Unlike :meth:`send_command`, the (possibly multi-packet) response is
+        not buffered, so large outputs can be forwarded to an HTTP response
+        or WebSocket fragment by fragment. Raises ``ConnectionError`` when the
+        server is not running or has no RCON credentials.
+        """
+        server_process = self.processes.get(server_id)
+        if (
+            server_process is None
+            or not server_process.rcon_port
+            or not server_process.rcon_password
+        ):
+            raise ConnectionError(f"RCON is not available for server {server_id}")
+
+        async for fragment in self.rcon_pool.stream_command(
+            server_id,
+            server_process.rcon_port,
+            server_process.rcon_password,
+            command,
+        ):
+            yield fragment
 
     def get_server_status(self, server_id: int) -> Optional[ServerStatus]:
         """Get the current status of a server"""
@@ -643,6 +814,7 @@ class MinecraftServerManager(
 
                     # Remove from processes dict but keep PID file and don't kill process
                     del self.processes[server_id]
+                    self._published_statuses.pop(server_id, None)
                     logger.info(
                         f"Detached from server {server_id} process (PID: {server_process.pid})"
                     )
@@ -663,6 +835,8 @@ class MinecraftServerManager(
 
             logger.info(f"Detached from {len(server_ids)} running servers")
 
+        await self.rcon_pool.close_all()
+
     def list_running_servers(self) -> List[int]:
         """Get list of currently running server IDs"""
         return list(self.processes.keys())
@@ -2,9 +2,13 @@
 
 import asyncio
 import os
+import re
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
+from app.core.file_watch import get_log_watcher
+from app.core.process_liveness import get_process_liveness
 from app.servers.application.minecraft._compat import logger
 from app.servers.application.minecraft.server_process import ServerProcess
 from app.servers.models import ServerStatus
@@ -38,6 +42,123 @@ def _tail_file_lines(path: Path, max_bytes: int, max_lines: int) -> tuple[list[s
     return lines[-max_lines:], end
 
 
+# Startup-completion markers: a line matches when it contains both parts (the
+# second part is optional). Matching is per line, in any order.
+_STARTUP_COMPLETE_PATTERNS: tuple[tuple[str, str], ...] = (
+    ("Done", "For help"),  # Classic pattern
+    ("Done", "Time elapsed"),  # Alternative pattern
+    ("Done", "seconds"),  # Generic time-based pattern
+    ("[Server thread/INFO]", "Done"),  # Modern format
+    ("Server started", ""),  # Alternative completion message
+    ("Ready to accept", "connections"),  # Network ready
+)
+
+
+# Every pattern above contains one of these literals. Candidate lines are
+# located with ``bytes.find`` on them, which is several times cheaper than
+# running the full matcher over every byte of a noisy world-generation log.
+_STARTUP_ANCHORS: tuple[bytes, ...] = (b"Done", b"Server started", b"Ready to accept")
+
+
+def _compile_startup_matcher(
+    patterns: tuple[tuple[str, str], ...],
+) -> "re.Pattern[bytes]":
+    """Compile ``patterns`` into a single bytes regex matched against one line.
+
+    Each alternative is a pair of lookaheads, so the parts of a pattern may
+    appear in either order but must be on the same line. Alternatives are
+    named groups (``p0``, ``p1``, ...) so the caller can report which pattern
+    fired via ``match.lastgroup``.
+    """
+    alternatives = []
+    for index, (first, second) in enumerate(patterns):
+        body = rb"(?=[^\n]*" + re.escape(first.encode()) + rb")"
+        if second:
+            body += rb"(?=[^\n]*" + re.escape(second.encode()) + rb")"
+        alternatives.append(b"(?P<p%d>" % index + body + b")")
+    return re.compile(b"|".join(alternatives))
+
+
+_STARTUP_COMPLETE_RE = _compile_startup_matcher(_STARTUP_COMPLETE_PATTERNS)
+
+
+def _match_startup_line(block: bytes) -> Optional[str]:
+    """Return the first completion pattern found in ``block`` of whole lines.
+
+    Only lines containing one of :data:`_STARTUP_ANCHORS` are handed to
+    :data:`_STARTUP_COMPLETE_RE`.
+    """
+    for anchor in _STARTUP_ANCHORS:
+        pos = block.find(anchor)
+        while pos != -1:
+            line_start = block.rfind(b"\n", 0, pos) + 1
+            line_end = block.find(b"\n", pos)
+            if line_end == -1:
+                line_end = len(block)
+            match = _STARTUP_COMPLETE_RE.match(block, line_start, line_end)
+            if match is not None:
+                first, second = _STARTUP_COMPLETE_PATTERNS[int(match.lastgroup[1:])]
+                return f"{first}+{second}" if second else first
+            pos = block.find(anchor, line_end)
+    return None
+
+
+class _StartupLogDetector:
+    """Incrementally scan ``server.log`` for a startup-completion line.
+
+    Keeps the byte offset of the last read so each :meth:`poll` only reads
+    bytes appended since the previous call, and carries the trailing partial
+    line over to the next poll so a line split across two writes is matched
+    once it is complete. Lines are never decoded; the completion markers are
+    ASCII and are matched directly against the raw bytes.
+    """
+
+    # Upper bound on a single read so a burst of world-generation output is
+    # scanned in slices instead of one large allocation.
+    READ_CHUNK_BYTES = 1024 * 1024
+
+    def __init__(self, log_file_path: Path):
+        self.log_file_path = log_file_path
+        self.offset = 0
+        self.bytes_read = 0
+        self._partial = b""
+
+    def poll(self) -> Optional[str]:
+        """Read newly appended bytes and return the matched pattern, if any.
+
+        Returns a human-readable ``"first+second"`` description of the first
+        pattern found, or ``None`` when no completed line matches yet. A file
+        shorter than the current offset is treated as truncated/rotated and
+        re-scanned from the start.
+        """
+        size = self.log_file_path.stat().st_size
+        if size < self.offset:
+            self.offset = 0
+            self._partial = b""
+        if size == self.offset:
+            return None
+
+        with open(self.log_file_path, "rb") as f:
+            f.seek(self.offset)
+            while True:
+                chunk = f.read(self.READ_CHUNK_BYTES)
+                if not chunk:
+                    return None
+                self.offset += len(chunk)
+                self.bytes_read += len(chunk)
+
+                newline = chunk.rfind(b"\n")
+                if newline == -1:
+                    self._partial += chunk
+                    continue
+                block = self._partial + chunk[: newline + 1]
+                self._partial = chunk[newline + 1 :]
+
+                detected = _match_startup_line(block)
+                if detected is not None:
+                    return detected
+
+
 class MonitoringMixin:
     """Mixin: log readers, status monitors, and resource cleanup."""
 
@@ -103,6 +224,7 @@ class MonitoringMixin:
                 startup_timeout_seconds * 2
             )  # 0.5s intervals = 90 iterations
             startup_detected = False
+            detector: Optional[_StartupLogDetector] = None
 
             logger.info(
                 f"Monitoring daemon server {server_id} startup (timeout: {startup_timeout_seconds}s, checking every 0.5s)"
@@ -137,66 +259,20 @@ class MonitoringMixin:
                         )
 
                     if log_file_path.exists() and log_file_path.stat().st_size > 0:
-                        # Read log file to check for startup completion
+                        # Only the bytes appended since the previous tick are
+                        # read and scanned (see _StartupLogDetector).
                         try:
-                            with open(
-                                log_file_path, "r", encoding="utf-8", errors="ignore"
-                            ) as f:
-                                content = f.read()
-
-                            # Enhanced diagnostic logging - show sample content more frequently
-                            if (
-                                i % 10 == 0 and content
-                            ):  # Every 5 seconds, show sample content
-                                # Show both beginning and end of log for better debugging
-                                sample_start = content[:100].replace("\n", " ")
-                                sample_end = (
-                                    content[-100:].replace("\n", " ")
-                                    if len(content) > 100
-                                    else ""
-                                )
-                                elapsed_seconds = (i + 1) * 0.5
-                                logger.info(
-                                    f"Server {server_id} log sample at {elapsed_seconds:.1f}s ({len(content)} chars): "
-                                    f"START: '{sample_start}' ... END: '{sample_end}'"
-                                )
+                            if detector is None:
+                                detector = _StartupLogDetector(log_file_path)
+                            detected_pattern = detector.poll()
 
-                            # Check for multiple startup completion patterns
-                            startup_patterns = [
-                                ("Done", "For help"),  # Classic pattern
-                                ("Done", "Time elapsed"),  # Alternative pattern
-                                ("Done", "seconds"),  # Generic time-based pattern
-                                ("[Server thread/INFO]", "Done"),  # Modern format
-                                ("Server started", ""),  # Alternative completion message
-                                ("Ready to accept", "connections"),  # Network ready
-                            ]
-
-                            startup_detected_local = False
-                            detected_pattern = None
-
-                            # Debug: check each pattern individually
-                            pattern_results = []
-                            for pattern1, pattern2 in startup_patterns:
-                                p1_found = pattern1 in content
-                                p2_found = not pattern2 or pattern2 in content
-                                pattern_results.append(
-                                    f"{pattern1}:{p1_found}, {pattern2 or 'N/A'}:{p2_found}"
-                                )
-
-                                if p1_found and p2_found:
-                                    startup_detected_local = True
-                                    detected_pattern = (
-                                        f"{pattern1}+{pattern2}" if pattern2 else pattern1
-                                    )
-                                    break
-
-                            # Debug logging for pattern matching
-                            if i % 10 == 0 and content:  # Every 5 seconds
+                            if i % 10 == 0:  # Every 5 seconds
                                 logger.info(
-                                    f"Server {server_id} pattern check at {(i + 1) * 0.5:.1f}s: {pattern_results[:2]}"
+                                    f"Server {server_id} startup scan at {(i + 1) * 0.5:.1f}s: "
+                                    f"offset={detector.offset}, bytes_read={detector.bytes_read}"
                                 )
 
-                            if startup_detected_local:
+                            if detected_pattern is not None:
                                 elapsed_seconds = (i + 1) * 0.5
                                 logger.info(
                                     f"Daemon server {server_id} startup completed (detected pattern '{detected_pattern}' after {elapsed_seconds:.1f}s)"
@@ -252,8 +328,9 @@ class MonitoringMixin:
                         f"Error checking startup status for daemon server {server_id}: {e}"
                     )
 
-                # Check more frequently for faster detection (every 0.5 seconds)
-                await asyncio.sleep(0.5)
+                # Check more frequently for faster detection (every 0.5 seconds,
+                # or immediately if the process dies)
+                await self._sleep_until_process_exit(pid, 0.5)
 
             # If startup not detected after timeout, check if process is still running
             if not startup_detected:
@@ -292,8 +369,8 @@ class MonitoringMixin:
                     asyncio.create_task(self._cleanup_server_process(server_id))
                     break
 
-                # Check every 5 seconds
-                await asyncio.sleep(5)
+                # Re-check every 5 seconds, or as soon as the process exits
+                await self._sleep_until_process_exit(pid, 5)
 
         except asyncio.CancelledError:
             logger.debug(f"Daemon process monitor cancelled for server {server_id}")
@@ -352,6 +429,21 @@ class MonitoringMixin:
                 # Clear the log buffer to free memory
                 server_process.log_buffer.clear()
 
+                # Drop the pooled RCON connection for this server
+                try:
+                    await self.rcon_pool.close(server_id)
+                except Exception as rcon_error:
+                    logger.warning(
+                        f"Failed to close RCON connection for server {server_id}: {rcon_error}"
+                    )
+
+                # Stop tracking the PID so a recycled one starts fresh
+                if server_process.pid:
+                    get_process_liveness().forget(server_process.pid)
+                # A cached discovery result may still list this server as restored
+                self._invalidate_discovery_cache()
+                self._prune_published_status(server_id)
+
                 # Remove PID file
                 try:
                     server_dir = server_process.server_directory or (
@@ -376,7 +468,12 @@ class MonitoringMixin:
     async def _read_server_logs(
         self, server_process: ServerProcess, *, tail_existing: bool = False
     ):
-        """Read server logs from file and append them to the log buffer.
+        """Follow ``server.log`` and append new lines to the log buffer.
+
+        Lines are pushed by the shared :class:`~app.core.file_watch.LogFileWatcher`
+        rather than polled, so an idle server costs no wakeups. The task only
+        holds the subscription open; it runs until cancelled by
+        ``_cleanup_server_process`` / ``stop_server``.
 
         ``tail_existing`` is set on the restore-from-PID path (issue #436), where
         ``server.log`` can already be large. Instead of reading the whole file
@@ -384,89 +481,56 @@ class MonitoringMixin:
         backfill the buffer once from the tail of the file (preserving the lines'
         original embedded timestamps), then continue forward from EOF.
         """
+        server_id = server_process.server_id
+        subscription = None
         try:
             server_dir = server_process.server_directory or (
-                self.base_directory / str(server_process.server_id)
+                self.base_directory / str(server_id)
             )
             log_file_path = server_dir / "server.log"
 
-            # Track last read position to avoid re-reading
-            last_position = 0
-            backfilled = False
-
-            while server_process.server_id in self.processes:
-                try:
-                    # Check if log file exists
-                    if not log_file_path.exists():
-                        await asyncio.sleep(0.5)
-                        continue
-
-                    if tail_existing and not backfilled:
-                        # One-time backfill from the tail of the existing log.
-                        # Historical lines keep their original content (no now()
-                        # prefix); `end` from the same read becomes the forward
-                        # start position, avoiding gaps/double-counting if the
-                        # server writes between stat() and read.
-                        #
-                        # Assumes server.log lines are newline-terminated (they
-                        # are for Minecraft). If the file ends mid-line at restore
-                        # time, that final fragment is backfilled as one entry and
-                        # its continuation is later read forward as a separate
-                        # stamped entry -- a rare, purely cosmetic split.
-                        backfilled = True
-                        max_lines = (
-                            server_process.log_buffer.maxlen or self.log_queue_size
-                        )
-                        historical, end = _tail_file_lines(
-                            log_file_path, _LOG_TAIL_MAX_BYTES, max_lines
-                        )
-                        for line in historical:
-                            server_process.log_buffer.append(line)
-                        last_position = end
-                        await asyncio.sleep(0.5)
-                        continue
-
-                    # Read new content from file. Open in binary so the seek
-                    # offset is always a plain byte count -- uniform with the
-                    # `end` offset produced by _tail_file_lines() and free of
-                    # text-mode seek()'s "offset must come from tell()"
-                    # restriction. Decode with errors="ignore" so a multibyte
-                    # char split at the read boundary is simply dropped.
-                    with open(log_file_path, "rb") as f:
-                        f.seek(last_position)
-                        new_bytes = f.read()
-                        last_position = f.tell()
-                    new_content = new_bytes.decode("utf-8", errors="ignore")
-
-                    if new_content:
-                        lines = new_content.strip().split("\n")
-                        for line in lines:
-                            if line.strip():  # Skip empty lines
-                                # Add timestamp
-                                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                                formatted_line = f"[{timestamp}] {line.strip()}"
-
-                                server_process.log_buffer.append(formatted_line)
-
-                                # Note: Status updates are handled by _monitor_daemon_process
-                                # to avoid conflicts and ensure single source of truth
-
-                    # Sleep before next read to avoid excessive CPU usage
-                    await asyncio.sleep(0.5)
-
-                except Exception as e:
-                    logger.warning(
-                        f"Error reading log file for server {server_process.server_id}: {e}"
-                    )
-                    await asyncio.sleep(1.0)  # Wait longer on error
+            start_offset = 0
+            if tail_existing and log_file_path.exists():
+                # One-time backfill from the tail of the existing log.
+                # Historical lines keep their original content (no now()
+                # prefix); `end` from the same read becomes the forward
+                # start position, avoiding gaps/double-counting if the
+                # server writes between stat() and read.
+                max_lines = server_process.log_buffer.maxlen or self.log_queue_size
+                historical, start_offset = _tail_file_lines(
+                    log_file_path, _LOG_TAIL_MAX_BYTES, max_lines
+                )
+                for line in historical:
+                    server_process.log_buffer.append(line)
+
+            def append_lines(lines: list[str]) -> None:
+                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                for line in lines:
+                    line = line.strip()
+                    if line:  # Skip empty lines
+                        server_process.log_buffer.append(f"[{timestamp}] {line}")
+                # Note: Status updates are handled by _monitor_daemon_process
+                # to avoid conflicts and ensure single source of truth
+
+            def report_error(error: Exception) -> None:
+                logger.warning(f"Error reading log file for server {server_id}: {error}")
+
+            subscription = get_log_watcher().subscribe(
+                log_file_path,
+                append_lines,
+                offset=start_offset,
+                on_error=report_error,
+            )
+            await asyncio.Future()
 
         except asyncio.CancelledError:
-            logger.debug(
-                f"Log reading task cancelled for server {server_process.server_id}"
-            )
+            logger.debug(f"Log reading task cancelled for server {server_id}")
             raise  # Re-raise to properly handle cancellation
         except Exception as e:
-            logger.error(f"Error reading logs for server {server_process.server_id}: {e}")
+            logger.error(f"Error reading logs for server {server_id}: {e}")
+        finally:
+            if subscription is not None:
+                subscription.close()
 
     async def _monitor_server(self, server_process: ServerProcess):
         """Monitor server process and update status"""
@@ -512,7 +576,8 @@ class MonitoringMixin:
                     if server_process.pid and await self._is_process_running(
                         server_process.pid
                     ):
-                        await asyncio.sleep(5.0)  # Check every 5 seconds
+                        # Re-check every 5 seconds, or as soon as it exits
+                        await self._sleep_until_process_exit(server_process.pid, 5.0)
                         continue
                     else:
                         # Process has ended
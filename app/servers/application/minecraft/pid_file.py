@@ -3,7 +3,7 @@
 Methods in this mixin are moved verbatim from the original
 ``MinecraftServerManager``. They reference state owned by the composed
 manager (``self.processes``, ``self.base_directory``,
-``self.log_queue_size``) but do not own it.
+``self.log_queue_size``, the discovery cache) but do not own it.
 """
 
 import asyncio
@@ -11,11 +11,12 @@ import json
 from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import psutil
 
 from app.core.config import settings
+from app.core.process_liveness import get_process_liveness
 from app.servers.application.minecraft._compat import logger
 from app.servers.application.minecraft.server_process import ServerProcess
 from app.servers.models import ServerStatus
@@ -24,6 +25,15 @@ from app.servers.models import ServerStatus
 class PidFileMixin:
     """Mixin: PID file read/write + process restoration."""
 
+    # Servers restored concurrently by ``discover_and_restore_processes``
+    restore_concurrency = 8
+    # Seconds a completed discovery scan is reused before rescanning
+    discovery_cache_ttl = 10.0
+
+    # Owned by the composed manager; initialised in its ``__init__``
+    _discovery_cache: Optional[Tuple[float, Dict[int, bool]]]
+    _discovery_task: Optional[asyncio.Task]
+
     def _get_pid_file_path(self, server_id: int, server_dir: Path) -> Path:
         """Get path to PID file for server"""
         return server_dir / "server.pid"
@@ -107,8 +117,16 @@ class PidFileMixin:
             return False
 
     async def _is_process_running(self, pid: int) -> bool:
-        """Check if process with given PID is still running"""
+        """Check if process with given PID is still running
+
+        PIDs watched by the liveness registry are answered from its cached
+        exit state; anything else is probed through psutil.
+        """
         try:
+            alive = get_process_liveness().is_alive(pid)
+            if alive is not None:
+                return alive
+
             if not psutil.pid_exists(pid):
                 return False
 
@@ -122,6 +140,26 @@ class PidFileMixin:
             logger.error(f"Error checking process {pid}: {e}")
             return False
 
+    async def _sleep_until_process_exit(self, pid: int, timeout: float) -> bool:
+        """Sleep for up to ``timeout`` seconds, waking early if ``pid`` exits
+
+        Replaces fixed ``asyncio.sleep`` ticks in the monitoring and stop
+        loops: the PID is watched through the liveness registry, so an exit
+        is noticed immediately instead of at the next tick. Returns True if
+        the process exited. PIDs that cannot be watched (already gone)
+        simply sleep, and the caller's next ``_is_process_running`` check
+        decides.
+        """
+        exited = get_process_liveness().watch(pid) if pid else None
+        if exited is None:
+            await asyncio.sleep(timeout)
+            return False
+        try:
+            await asyncio.wait_for(exited.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return exited.is_set()
+
     async def _restore_process_from_pid(self, server_id: int, server_dir: Path) -> bool:
         """Restore running process from PID file if still active"""
         try:
@@ -215,8 +253,8 @@ class PidFileMixin:
                     await self._cleanup_server_process(server_id)
                     break
 
-                # Check every 5 seconds
-                await asyncio.sleep(5)
+                # Re-check every 5 seconds, or as soon as the process exits
+                await self._sleep_until_process_exit(pid, 5)
 
         except asyncio.CancelledError:
             logger.debug(f"Restored process monitor cancelled for server {server_id}")
@@ -230,6 +268,14 @@ class PidFileMixin:
     async def discover_and_restore_processes(self) -> Dict[int, bool]:
         """Discover and restore all running server processes from PID files
 
+        PID files are scanned in a worker thread, candidates are restored
+        concurrently (at most ``restore_concurrency`` at a time) and the
+        restored servers are reported to the database in one batched status
+        update. Callers on the hot path (e.g. real-time commands for a server
+        that looks stopped) share an in-flight scan, and a completed scan is
+        reused for ``discovery_cache_ttl`` seconds so repeated "is it
+        running?" checks do not rescan every server directory.
+
         Returns:
             Dictionary mapping server_id to restoration success status
         """
@@ -237,50 +283,99 @@ class PidFileMixin:
             logger.info("Auto-sync on startup is disabled")
             return {}
 
+        loop = asyncio.get_running_loop()
+        cached = self._discovery_cache
+        if cached is not None and loop.time() - cached[0] < self.discovery_cache_ttl:
+            logger.debug("Reusing recent process discovery results")
+            return dict(cached[1])
+
+        in_flight = self._discovery_task
+        if in_flight is None or in_flight.done() or in_flight.get_loop() is not loop:
+            in_flight = loop.create_task(self._discover_and_restore())
+            self._discovery_task = in_flight
+        results = await asyncio.shield(in_flight)
+        self._discovery_cache = (loop.time(), dict(results))
+        return dict(results)
+
+    def _invalidate_discovery_cache(self) -> None:
+        """Forget the last discovery scan (a managed server went away)."""
+        self._discovery_cache = None
+
+    def _scan_pid_files(self) -> List[Tuple[Path, Dict[str, Any]]]:
+        """Read every ``server.pid`` under ``base_directory`` (blocking)."""
+        found: List[Tuple[Path, Dict[str, Any]]] = []
+        # Sort directories to ensure deterministic processing order for tests
+        for server_dir in sorted(self.base_directory.iterdir()):
+            if not server_dir.is_dir():
+                continue
+
+            # Try to extract server ID from directory name or PID file
+            pid_file_path = server_dir / "server.pid"
+            if not pid_file_path.exists():
+                continue
+
+            try:
+                with open(pid_file_path, "r") as f:
+                    found.append((server_dir, json.load(f)))
+            except Exception as e:
+                logger.error(f"Error processing PID file {pid_file_path}: {e}")
+        return found
+
+    async def _discover_and_restore(self) -> Dict[int, bool]:
         logger.info("Starting process discovery and restoration...")
-        restoration_results = {}
+        restoration_results: Dict[int, bool] = {}
 
         try:
-            # Scan all server directories for PID files
-            # Sort directories to ensure deterministic processing order for tests
-            for server_dir in sorted(self.base_directory.iterdir()):
-                if not server_dir.is_dir():
+            pid_files = await asyncio.to_thread(self._scan_pid_files)
+
+            candidates: List[Tuple[int, Path, Dict[str, Any]]] = []
+            for server_dir, pid_data in pid_files:
+                server_id = pid_data.get("server_id")
+                if server_id is None:
+                    logger.warning(
+                        f"No server_id in PID file: {server_dir / 'server.pid'}"
+                    )
                     continue
 
-                # Try to extract server ID from directory name or PID file
-                pid_file_path = server_dir / "server.pid"
-                if not pid_file_path.exists():
+                # Skip if already managed
+                if server_id in self.processes:
+                    logger.info(f"Server {server_id} already managed, skipping")
+                    restoration_results[server_id] = True
                     continue
 
-                try:
-                    with open(pid_file_path, "r") as f:
-                        pid_data = json.load(f)
-
-                    server_id = pid_data.get("server_id")
-                    if server_id is None:
-                        logger.warning(f"No server_id in PID file: {pid_file_path}")
-                        continue
-
-                    # Skip if already managed
-                    if server_id in self.processes:
-                        logger.info(f"Server {server_id} already managed, skipping")
-                        restoration_results[server_id] = True
-                        continue
-
-                    # Attempt restoration
-                    success = await self._restore_process_from_pid(server_id, server_dir)
-                    restoration_results[server_id] = success
-
-                    if success:
-                        logger.info(f"Successfully restored server {server_id}")
-                        # Notify database of running status
-                        await self._notify_status_change(server_id, ServerStatus.running)
-                    else:
-                        logger.info(f"Failed to restore server {server_id}")
-
-                except Exception as e:
-                    logger.error(f"Error processing PID file {pid_file_path}: {e}")
-                    continue
+                candidates.append((server_id, server_dir, pid_data))
+
+            semaphore = asyncio.Semaphore(self.restore_concurrency)
+
+            async def restore(server_id: int, server_dir: Path) -> None:
+                async with semaphore:
+                    try:
+                        success = await self._restore_process_from_pid(
+                            server_id, server_dir
+                        )
+                    except Exception as e:
+                        logger.error(f"Error restoring server {server_id}: {e}")
+                        success = False
+                restoration_results[server_id] = success
+                if success:
+                    logger.info(f"Successfully restored server {server_id}")
+                else:
+                    logger.info(f"Failed to restore server {server_id}")
+
+            await asyncio.gather(
+                *(
+                    restore(server_id, server_dir)
+                    for server_id, server_dir, _ in candidates
+                )
+            )
+
+            # Notify database of running status in one batch
+            restored = {
+                server_id: ServerStatus.running
+                for server_id, _, _ in candidates
+                if restoration_results.get(server_id)
+            }
+            await self._notify_status_changes(restored)
 
             logger.info(f"Process restoration completed. Results: {restoration_results}")
             return restoration_results
@@ -1,178 +1,426 @@
-"""Minecraft RCON client used for runtime command delivery."""
+"""Minecraft RCON client used for runtime command delivery.
+
+:class:`MinecraftRCONClient` speaks the RCON protocol over asyncio streams
+and is designed to stay connected: concurrent requests share one
+authenticated connection and are matched to their responses by request id, a
+background reader task dispatches responses, and an idle keepalive detects
+dead connections before the next command needs them. Responses split across
+several packets are reassembled and can be consumed as an async iterator
+(:meth:`MinecraftRCONClient.stream_command`).
+
+Packets are never coalesced on the wire: vanilla's ``RconClient`` reads each
+packet with a single ``read`` of at most 1460 bytes and drops the connection
+when that read holds anything but exactly one packet. So a packet is only
+written once the server has started answering the previous one.
+
+:class:`RCONConnectionPool` holds one such client per running server so
+consecutive commands (e.g. the ``op``/``deop``/``whitelist`` bursts of group
+synchronization) skip the connect + login that a fresh connection would
+cost each of them.
+"""
 
 import asyncio
+import codecs
+import itertools
 import logging
-import socket
 import struct
-from typing import Optional
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Packet types (RCON protocol)
+PACKET_TYPE_RESPONSE = 0
+PACKET_TYPE_COMMAND = 2
+PACKET_TYPE_AUTH_RESPONSE = 2
+PACKET_TYPE_LOGIN = 3
+
+_HEADER = struct.Struct("<iii")  # length, request id, type
+# Minecraft caps each response packet at 4096 payload bytes and splits longer
+# output into several packets. Other server implementations are less strict,
+# so the per-packet limit only guards against a corrupt length prefix.
+_MAX_PACKET_SIZE = 1024 * 1024
+_END_OF_RESPONSE = object()
+
 
 class MinecraftRCONClient:
     """RCON client for sending commands to Minecraft servers"""
 
-    def __init__(self):
-        self.socket = None
-        self.request_id = 0
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        password: Optional[str] = None,
+        *,
+        timeout: float = 5.0,
+        keepalive_interval: Optional[float] = 30.0,
+    ):
+        self.host = host
+        self.port = port
+        self.password = password
+        self.timeout = timeout
+        self.keepalive_interval = keepalive_interval
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
+        # request id -> queue of payload fragments for an in-flight command;
+        # sentinel id -> request id whose response it terminates.
+        self._pending: Dict[int, asyncio.Queue] = {}
+        self._sentinels: Dict[int, int] = {}
+        # Held from writing a packet until its first reply arrives; the
+        # future is resolved by the reader task.
+        self._write_lock = asyncio.Lock()
+        self._unanswered: Optional[Tuple[int, asyncio.Future]] = None
+        self._connect_lock = asyncio.Lock()
+        self._request_ids = itertools.count(1)
+        self._last_activity = 0.0
+
+    @property
+    def connected(self) -> bool:
+        return (
+            self._writer is not None
+            and not self._writer.is_closing()
+            and self._reader_task is not None
+            and not self._reader_task.done()
+        )
 
     async def connect(
-        self, host: str, port: int, password: str, timeout: float = 5.0
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        password: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> bool:
-        """Connect to RCON server"""
-        try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(timeout)
-            await asyncio.get_event_loop().run_in_executor(
-                None, self.socket.connect, (host, port)
-            )
-
-            # Send authentication packet
-            auth_success = await self._authenticate(password)
-            if not auth_success:
-                await self.disconnect()
+        """Connect and authenticate; returns ``False`` on any failure."""
+        if host is not None:
+            self.host = host
+        if port is not None:
+            self.port = port
+        if password is not None:
+            self.password = password
+        if timeout is not None:
+            self.timeout = timeout
+
+        async with self._connect_lock:
+            if self.connected:
+                return True
+            await self._close_transport()
+            try:
+                self._reader, self._writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port), self.timeout
+                )
+                if not await asyncio.wait_for(self._authenticate(), self.timeout):
+                    await self._close_transport()
+                    return False
+            except Exception as e:
+                logger.error(f"Failed to connect to RCON {self.host}:{self.port}: {e}")
+                await self._close_transport()
                 return False
 
-            logger.debug(f"RCON connected to {host}:{port}")
+            loop = asyncio.get_running_loop()
+            self._last_activity = loop.time()
+            self._reader_task = loop.create_task(self._read_responses())
+            if self.keepalive_interval:
+                self._keepalive_task = loop.create_task(self._keepalive())
+            logger.debug(f"RCON connected to {self.host}:{self.port}")
             return True
 
-        except Exception as e:
-            logger.error(f"Failed to connect to RCON {host}:{port}: {e}")
-            await self.disconnect()
-            return False
-
-    async def _authenticate(self, password: str) -> bool:
-        """Authenticate with RCON server"""
-        try:
-            self.request_id += 1
-            packet = self._create_packet(self.request_id, 3, password)  # Type 3 = LOGIN
-            await self._send_packet(packet)
-
-            response = await self._receive_packet()
-
-            if response:
-                response_id, response_type, response_payload = response
-
-                # Check for authentication failure (response ID -1)
-                if response_id == -1:
-                    logger.error("RCON authentication failed: Invalid password")
-                    return False
-
-                # Check for successful authentication (matching request ID)
-                if response_id == self.request_id:
-                    logger.debug("RCON authentication successful")
-                    return True
-
-                logger.error(
-                    f"RCON authentication failed: Unexpected response ID {response_id} (expected {self.request_id})"
-                )
-                return False
-            else:
-                logger.error("RCON authentication failed: No response received")
+    async def _authenticate(self) -> bool:
+        """Send the login packet and wait for the auth response."""
+        request_id = self._next_request_id()
+        self._writer.write(
+            self._create_packet(request_id, PACKET_TYPE_LOGIN, self.password)
+        )
+        await self._writer.drain()
+
+        while True:
+            response_id, response_type, _payload = await self._read_packet()
+            # Some implementations send an empty RESPONSE_VALUE before the
+            # actual auth response; skip it.
+            if response_type != PACKET_TYPE_AUTH_RESPONSE:
+                continue
+            if response_id == -1:
+                logger.error("RCON authentication failed: Invalid password")
                 return False
-
-        except Exception as e:
-            logger.error(f"RCON authentication failed: {e}")
+            if response_id == request_id:
+                logger.debug("RCON authentication successful")
+                return True
+            logger.error(
+                f"RCON authentication failed: Unexpected response ID {response_id} (expected {request_id})"
+            )
             return False
 
     async def send_command(self, command: str) -> Optional[str]:
-        """Send a command and return the response"""
+        """Send a command and return the response.
+
+        Multi-packet responses are reassembled (see :meth:`stream_command`).
+        Reconnects first if the connection was lost. A command is never
+        re-sent once written, since the server may already have run it.
+        Several callers may await ``send_command`` concurrently; their
+        requests are pipelined on the same connection.
+        """
         try:
-            if not self.socket:
-                return None
-
-            self.request_id += 1
-            packet = self._create_packet(self.request_id, 2, command)  # Type 2 = COMMAND
-            await self._send_packet(packet)
-
-            response = await self._receive_packet()
-            if response and response[0] == self.request_id:
-                return response[2]  # Return payload
-            return None
-
+            return "".join([fragment async for fragment in self.stream_command(command)])
         except Exception as e:
             logger.error(f"Failed to send RCON command '{command}': {e}")
             return None
 
+    async def send_commands(self, commands: Sequence[str]) -> List[Optional[str]]:
+        """Send several commands over one session and return their responses.
+
+        The connection is established (and authenticated) once and the
+        commands are queued on it in order, so a batch costs one round trip
+        per packet but no reconnects or logins. Responses are returned in
+        command order; a failed command yields ``None`` in its slot without
+        aborting the rest of the batch.
+        """
+        if not commands:
+            return []
+        if not self.connected and not await self.connect():
+            logger.error(
+                f"Failed to send {len(commands)} RCON commands: "
+                f"cannot connect to {self.host}:{self.port}"
+            )
+            return [None] * len(commands)
+        # Tasks start in creation order and each queues on the write lock
+        # before its first other suspension point, so commands reach the
+        # server in order.
+        return list(await asyncio.gather(*(self.send_command(c) for c in commands)))
+
+    async def stream_command(self, command: str) -> AsyncIterator[str]:
+        """Send a command and yield its response payload fragment by fragment.
+
+        Servers split long responses (``list uuids``, ``data get``, plugin
+        dumps) across several packets that all carry the command's request
+        id, with no end-of-response marker. To find the end, an empty
+        sentinel command is written once the first fragment has arrived: the
+        server answers requests in order, so the sentinel's reply arrives only
+        after every fragment of the real response. That reply (an error
+        message on some servers) is not part of the output.
+
+        Fragments are decoded incrementally, so a multi-byte character split
+        across a packet boundary is reassembled rather than mangled. Raises
+        ``ConnectionError`` if the client cannot connect or the connection
+        drops mid-response, and ``asyncio.TimeoutError`` if no packet arrives
+        within ``timeout``.
+        """
+        if not self.connected and not await self.connect():
+            raise ConnectionError(f"Cannot connect to RCON {self.host}:{self.port}")
+
+        request_id = self._next_request_id()
+        sentinel_id = self._next_request_id()
+        queue: asyncio.Queue = asyncio.Queue()
+        self._pending[request_id] = queue
+        self._sentinels[sentinel_id] = request_id
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        try:
+            await self._write_packet(request_id, PACKET_TYPE_COMMAND, command)
+            await self._write_packet(sentinel_id, PACKET_TYPE_COMMAND, "")
+            while True:
+                item = await asyncio.wait_for(queue.get(), self.timeout)
+                if item is _END_OF_RESPONSE:
+                    tail = decoder.decode(b"", final=True)
+                    if tail:
+                        yield tail
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                text = decoder.decode(item)
+                if text:
+                    yield text
+        finally:
+            self._pending.pop(request_id, None)
+            self._sentinels.pop(sentinel_id, None)
+
+    async def _write_packet(
+        self, request_id: int, packet_type: int, payload: str
+    ) -> None:
+        """Write one packet and wait until the server starts answering it.
+
+        Raises ``asyncio.TimeoutError`` if no reply arrives within
+        ``timeout`` and ``ConnectionError`` if the connection drops first.
+        """
+        async with self._write_lock:
+            if self._writer is None or self._writer.is_closing():
+                raise ConnectionError("RCON connection closed")
+            answered = asyncio.get_running_loop().create_future()
+            self._unanswered = (request_id, answered)
+            try:
+                self._writer.write(self._create_packet(request_id, packet_type, payload))
+                await self._writer.drain()
+                await asyncio.wait_for(answered, self.timeout)
+            finally:
+                self._unanswered = None
+
+    def _next_request_id(self) -> int:
+        request_id = next(self._request_ids)
+        if request_id >= 2**31 - 1:
+            self._request_ids = itertools.count(1)
+            request_id = next(self._request_ids)
+        return request_id
+
+    async def _read_responses(self) -> None:
+        """Route response packets to the queues of their pending requests."""
+        error: BaseException = ConnectionError("RCON connection closed")
+        try:
+            while True:
+                response_id, _type, payload = await self._read_packet()
+                self._last_activity = asyncio.get_running_loop().time()
+                if self._unanswered is not None and self._unanswered[0] == response_id:
+                    answered = self._unanswered[1]
+                    if not answered.done():
+                        answered.set_result(None)
+                if response_id in self._sentinels:
+                    queue = self._pending.get(self._sentinels.pop(response_id))
+                    if queue is not None:
+                        queue.put_nowait(_END_OF_RESPONSE)
+                    continue
+                queue = self._pending.get(response_id)
+                if queue is not None:
+                    queue.put_nowait(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = e if isinstance(e, ConnectionError) else ConnectionError(str(e))
+            logger.debug(f"RCON connection to {self.host}:{self.port} lost: {e}")
+        finally:
+            self._fail_pending(error)
+            if self._writer is not None:
+                self._writer.close()
+
+    def _fail_pending(self, error: BaseException) -> None:
+        for queue in self._pending.values():
+            queue.put_nowait(error)
+        self._sentinels.clear()
+        if self._unanswered is not None and not self._unanswered[1].done():
+            self._unanswered[1].set_exception(error)
+
+    async def _keepalive(self) -> None:
+        """Probe an idle connection so a dead one is noticed early."""
+        loop = asyncio.get_running_loop()
+        while self.connected:
+            idle = loop.time() - self._last_activity
+            if idle < self.keepalive_interval:
+                await asyncio.sleep(self.keepalive_interval - idle)
+                continue
+            try:
+                # An empty command is a no-op that every server answers.
+                async for _fragment in self.stream_command(""):
+                    pass
+            except Exception as e:
+                logger.debug(f"RCON keepalive to {self.host}:{self.port} failed: {e}")
+                await self._close_transport()
+                return
+
+    async def _read_packet(self) -> Tuple[int, int, bytes]:
+        """Read one packet, however the bytes are fragmented on the wire.
+
+        ``readexactly`` keeps reading until the length prefix is satisfied, so
+        a packet delivered in several TCP segments is handled. Returns the raw
+        payload bytes; decoding is left to the consumer.
+        """
+        (size,) = struct.unpack("<i", await self._reader.readexactly(4))
+        if size < 10 or size > _MAX_PACKET_SIZE:
+            raise ConnectionError(f"Invalid RCON packet size: {size}")
+        data = await self._reader.readexactly(size)
+        request_id, packet_type = struct.unpack_from("<ii", data)
+        return request_id, packet_type, data[8:-2]
+
     def _create_packet(self, request_id: int, packet_type: int, payload: str) -> bytes:
         """Create RCON packet"""
         payload_bytes = payload.encode("utf-8") + b"\x00\x00"
         # Size = request_id (4) + packet_type (4) + payload_bytes
         packet_size = 4 + 4 + len(payload_bytes)
-
-        packet = struct.pack("<i", packet_size)  # Size (excluding size field itself)
-        packet += struct.pack("<i", request_id)
-        packet += struct.pack("<i", packet_type)
-        packet += payload_bytes
-
-        logger.debug(
-            f"Created RCON packet: size={packet_size}, id={request_id}, type={packet_type}, payload_len={len(payload)}"
-        )
-        logger.debug(f"Payload bytes length: {len(payload_bytes)}")
-        logger.debug(f"Packet bytes: {packet.hex()}")
-
-        return packet
-
-    async def _send_packet(self, packet: bytes):
-        """Send packet to RCON server"""
-        await asyncio.get_event_loop().run_in_executor(None, self.socket.sendall, packet)
-
-    async def _receive_packet(self) -> Optional[tuple]:
-        """Receive packet from RCON server"""
-        try:
-            # Read packet size
-            logger.debug("Attempting to read RCON packet size...")
-            size_data = await asyncio.get_event_loop().run_in_executor(
-                None, self.socket.recv, 4
-            )
-            logger.debug(f"Received size data: {size_data} (length: {len(size_data)})")
-
-            if len(size_data) != 4:
-                logger.error(f"Invalid size data length: {len(size_data)} (expected 4)")
-                return None
-
-            size = struct.unpack("<i", size_data)[0]
-            logger.debug(f"Packet size: {size}")
-
-            if size <= 0 or size > 4096:  # Sanity check
-                logger.error(f"Invalid packet size: {size}")
-                return None
-
-            # Read packet data
-            logger.debug(f"Attempting to read {size} bytes of packet data...")
-            data = await asyncio.get_event_loop().run_in_executor(
-                None, self.socket.recv, size
-            )
-            logger.debug(f"Received packet data: {data} (length: {len(data)})")
-
-            if len(data) != size:
-                logger.error(
-                    f"Incomplete packet data: {len(data)} bytes (expected {size})"
-                )
-                return None
-
-            request_id = struct.unpack("<i", data[0:4])[0]
-            packet_type = struct.unpack("<i", data[4:8])[0]
-            payload = data[8:-2].decode("utf-8")  # Remove null terminators
-
-            logger.debug(
-                f"Parsed packet: id={request_id}, type={packet_type}, payload='{payload}'"
-            )
-
-            return (request_id, packet_type, payload)
-
-        except Exception as e:
-            logger.error(f"Failed to receive RCON packet: {e}")
-            import traceback
-
-            logger.debug(f"Exception traceback: {traceback.format_exc()}")
-            return None
-
-    async def disconnect(self):
-        """Disconnect from RCON server"""
-        if self.socket:
+        return _HEADER.pack(packet_size, request_id, packet_type) + payload_bytes
+
+    async def _close_transport(self) -> None:
+        current = asyncio.current_task()
+        for task in (self._keepalive_task, self._reader_task):
+            if task is not None and task is not current and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._keepalive_task = None
+        self._reader_task = None
+        self._fail_pending(ConnectionError("RCON connection closed"))
+        if self._writer is not None:
             try:
-                self.socket.close()
+                self._writer.close()
+                await self._writer.wait_closed()
             except Exception:
                 pass
-            self.socket = None
+        self._reader = None
+        self._writer = None
+
+    async def disconnect(self):
+        """Disconnect from RCON server"""
+        await self._close_transport()
+
+
+class RCONConnectionPool:
+    """One long-lived :class:`MinecraftRCONClient` per server id."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        *,
+        timeout: float = 5.0,
+        keepalive_interval: Optional[float] = 30.0,
+    ):
+        self.host = host
+        self.timeout = timeout
+        self.keepalive_interval = keepalive_interval
+        self._clients: Dict[int, MinecraftRCONClient] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get(self, server_id: int, port: int, password: str) -> MinecraftRCONClient:
+        """Return the pooled client for ``server_id``, creating it if needed.
+
+        A client whose port or password no longer match (the server was
+        reconfigured) is replaced; the stale one is closed in the background.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Clients are bound to the loop they were created on.
+            self._clients.clear()
+            self._loop = loop
+        client = self._clients.get(server_id)
+        if client is not None and (client.port, client.password) == (port, password):
+            return client
+        if client is not None:
+            loop.create_task(client.disconnect())
+        client = MinecraftRCONClient(
+            self.host,
+            port,
+            password,
+            timeout=self.timeout,
+            keepalive_interval=self.keepalive_interval,
+        )
+        self._clients[server_id] = client
+        return client
+
+    async def send_command(
+        self, server_id: int, port: int, password: str, command: str
+    ) -> Optional[str]:
+        return await self.get(server_id, port, password).send_command(command)
+
+    async def send_commands(
+        self, server_id: int, port: int, password: str, commands: Sequence[str]
+    ) -> List[Optional[str]]:
+        return await self.get(server_id, port, password).send_commands(commands)
+
+    def stream_command(
+        self, server_id: int, port: int, password: str, command: str
+    ) -> AsyncIterator[str]:
+        return self.get(server_id, port, password).stream_command(command)
+
+    async def close(self, server_id: int) -> None:
+        client = self._clients.pop(server_id, None)
+        if client is not None and self._loop is asyncio.get_running_loop():
+            await client.disconnect()
+
+    async def close_all(self) -> None:
+        for server_id in list(self._clients):
+            await self.close(server_id)
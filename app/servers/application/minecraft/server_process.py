@@ -1,4 +1,10 @@
-"""``ServerProcess`` dataclass: in-memory record for a managed server."""
+"""``ServerProcess`` dataclass: in-memory record for a managed server.
+
+Also hosts ``CommandResult``, the per-command outcome returned by
+``MinecraftServerManager.send_commands_batch``, and ``ServerStatusEvent``,
+published on the event bus under ``SERVER_STATUS_TOPIC`` whenever a
+managed server changes status.
+"""
 
 import asyncio
 from collections import deque
@@ -9,6 +15,9 @@ from typing import Optional
 
 from app.servers.models import ServerStatus
 
+# Event-bus topic carrying ``ServerStatusEvent`` (see app.core.event_bus).
+SERVER_STATUS_TOPIC = "server_status"
+
 
 @dataclass
 class ServerProcess:
@@ -30,3 +39,24 @@ class ServerProcess:
     # Track background tasks for proper cleanup
     log_task: Optional[asyncio.Task] = None
     monitor_task: Optional[asyncio.Task] = None
+
+
+@dataclass
+class CommandResult:
+    """Outcome of one command in a ``send_commands_batch`` call"""
+
+    command: str
+    success: bool
+    # RCON response text; ``None`` when the command failed or was written
+    # to stdin (which has no per-command response).
+    response: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ServerStatusEvent:
+    """A status transition published by ``MinecraftServerManager``"""
+
+    server_id: int
+    status: ServerStatus
+    previous_status: Optional[ServerStatus]
+    timestamp: datetime = field(default_factory=datetime.now)
@@ -24,7 +24,12 @@ from app.servers.application.minecraft.manager import (  # noqa: F401
 from app.servers.application.minecraft.rcon_client import (  # noqa: F401
     MinecraftRCONClient,
 )
-from app.servers.application.minecraft.server_process import ServerProcess  # noqa: F401
+from app.servers.application.minecraft.server_process import (  # noqa: F401
+    SERVER_STATUS_TOPIC,
+    CommandResult,
+    ServerProcess,
+    ServerStatusEvent,
+)
 
 # Re-export module-level symbols that tests patch via
 # ``app.servers.application.minecraft_server.<name>``. The split
@@ -38,9 +43,12 @@ from app.versions.application.java_compatibility import (  # noqa: F401
 logger = logging.getLogger(__name__)
 
 __all__ = [
+    "CommandResult",
     "MinecraftServerManager",
     "MinecraftRCONClient",
+    "SERVER_STATUS_TOPIC",
     "ServerProcess",
+    "ServerStatusEvent",
     "minecraft_server_manager",
     "java_compatibility_service",
     "logger",
@@ -1,7 +1,8 @@
+import asyncio
 import json
 import logging
 from pathlib import Path
-from typing import Set
+from typing import Dict, List, Sequence, Set, Tuple
 
 from app.core.security import FileOperationValidator, SecurityError
 from app.groups.models import GroupType
@@ -14,6 +15,9 @@ logger = logging.getLogger(__name__)
 class RealTimeServerCommandService:
     """Service for sending real-time commands to running Minecraft servers"""
 
+    # Upper bound on servers receiving group-change commands at once
+    max_concurrent_servers = 10
+
     def __init__(self):
         self.base_directory = Path("servers")
 
@@ -169,30 +173,22 @@ class RealTimeServerCommandService:
             # Since we don't have the previous state, we'll use a simple approach:
             # Apply all current OPs to ensure server state matches file
 
-            success_count = 0
+            # OP commands are idempotent (won't hurt if player is already OP),
+            # so the whole set goes out as one batch over a single session.
             total_commands = len(current_op_names)
-
-            for player_name in current_op_names:
-                try:
-                    # Send OP command (this is idempotent - won't hurt if player is already OP)
-                    success = await minecraft_server_manager.send_command(
-                        server_id, f"op {player_name}"
-                    )
-                    if success:
+            success_count = 0
+            if current_op_names:
+                results = await minecraft_server_manager.send_commands_batch(
+                    server_id, [f"op {name}" for name in sorted(current_op_names)]
+                )
+                for result in results:
+                    if result.success:
                         success_count += 1
-                        logger.debug(
-                            f"Successfully sent OP command for {player_name} to server {server_id}"
-                        )
                     else:
                         logger.warning(
-                            f"Failed to send OP command for {player_name} to server {server_id}"
+                            f"Failed to send '{result.command}' to server {server_id}"
                         )
 
-                except Exception as e:
-                    logger.error(
-                        f"Error sending OP command for {player_name} to server {server_id}: {e}"
-                    )
-
             if total_commands > 0:
                 logger.info(
                     f"Sent {success_count}/{total_commands} OP commands to server {server_id}"
@@ -248,44 +244,23 @@ class RealTimeServerCommandService:
                     )
                     return False
 
+            commands = [f"op {name}" for name in sorted(added_players)] + [
+                f"deop {name}" for name in sorted(removed_players)
+            ]
+            total_commands = len(commands)
             success_count = 0
-            total_commands = len(added_players) + len(removed_players)
-
-            # Add new OPs
-            for player_name in added_players:
-                try:
-                    success = await minecraft_server_manager.send_command(
-                        server_id, f"op {player_name}"
-                    )
-                    if success:
-                        success_count += 1
-                        logger.info(f"Added OP: {player_name} on server {server_id}")
-                    else:
-                        logger.warning(
-                            f"Failed to add OP: {player_name} on server {server_id}"
-                        )
-                except Exception as e:
-                    logger.error(
-                        f"Error adding OP {player_name} to server {server_id}: {e}"
-                    )
-
-            # Remove OPs
-            for player_name in removed_players:
-                try:
-                    success = await minecraft_server_manager.send_command(
-                        server_id, f"deop {player_name}"
-                    )
-                    if success:
+            if commands:
+                results = await minecraft_server_manager.send_commands_batch(
+                    server_id, commands
+                )
+                for result in results:
+                    if result.success:
                         success_count += 1
-                        logger.info(f"Removed OP: {player_name} from server {server_id}")
+                        logger.info(f"Applied '{result.command}' on server {server_id}")
                     else:
                         logger.warning(
-                            f"Failed to remove OP: {player_name} from server {server_id}"
+                            f"Failed to apply '{result.command}' on server {server_id}"
                         )
-                except Exception as e:
-                    logger.error(
-                        f"Error removing OP {player_name} from server {server_id}: {e}"
-                    )
 
             if total_commands > 0:
                 logger.info(
@@ -425,6 +400,69 @@ class RealTimeServerCommandService:
             )
             return False
 
+    async def handle_group_change_commands_for_servers(
+        self,
+        servers: Sequence[Tuple[int, Path]],
+        group_type: GroupType,
+        change_type: str = "update",
+        removed_players: list = None,
+    ) -> Dict[int, bool]:
+        """
+        Fan group-change commands out to every server a group is attached to
+
+        Daemon process restoration runs at most once for the whole fan-out
+        (instead of once per stopped server), then the running servers are
+        handled concurrently, at most ``max_concurrent_servers`` at a time.
+
+        Args:
+            servers: ``(server_id, server_path)`` pairs of the attached servers
+            group_type: Type of group that changed (op or whitelist)
+            change_type: Type of change (see ``handle_group_change_commands``)
+            removed_players: Player data that was removed, for deop broadcasts
+
+        Returns:
+            Dict[int, bool]: Per-server result of ``handle_group_change_commands``;
+            servers that are not running count as successful
+        """
+        results: Dict[int, bool] = {server_id: True for server_id, _ in servers}
+        if not servers:
+            return results
+
+        try:
+            if any(
+                minecraft_server_manager.get_server_status(server_id)
+                == ServerStatus.stopped
+                for server_id, _ in servers
+            ):
+                await minecraft_server_manager.discover_and_restore_processes()
+        except Exception as e:
+            logger.error(f"Error restoring daemon processes before group fan-out: {e}")
+
+        running: List[Tuple[int, Path]] = [
+            (server_id, server_path)
+            for server_id, server_path in servers
+            if minecraft_server_manager.get_server_status(server_id)
+            == ServerStatus.running
+        ]
+        semaphore = asyncio.Semaphore(self.max_concurrent_servers)
+
+        async def handle(server_id: int, server_path: Path) -> None:
+            async with semaphore:
+                results[server_id] = await self.handle_group_change_commands(
+                    server_id,
+                    server_path,
+                    group_type,
+                    change_type,
+                    removed_players=removed_players,
+                )
+
+        await asyncio.gather(*(handle(sid, path) for sid, path in running))
+        logger.info(
+            f"Sent {group_type.value} {change_type} commands to {len(running)}/"
+            f"{len(servers)} attached servers"
+        )
+        return results
+
 
 # Global service instance
 real_time_server_commands = RealTimeServerCommandService()
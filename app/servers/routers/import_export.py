@@ -16,7 +16,6 @@ from fastapi import (
     UploadFile,
     status,
 )
-from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 
 from app.auth.dependencies import get_current_user
@@ -25,6 +24,7 @@ from app.backups.domain.exceptions import (
     BackupParentServerMissingError,
 )
 from app.core.database import get_db
+from app.core.file_responses import RangeFileResponse
 from app.servers.api.dependencies import (
     get_authorization_service,
     get_server_repository,
@@ -144,7 +144,7 @@ async def export_server(
         file_size = export_file.stat().st_size
 
         # Return file as download
-        return FileResponse(
+        return RangeFileResponse(
             path=str(export_file),
             filename=f"{server.name}_export_{export_id[:8]}.zip",
             media_type="application/zip",
@@ -1,24 +1,187 @@
 import asyncio
 import json
 import logging
+import re
+from collections import deque
 from datetime import datetime
-from typing import Dict, Optional, Set
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set
 
 from fastapi import WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
 
+from app.backups.application.restore import RESTORE_PROGRESS_TOPIC
+from app.core.event_bus import get_event_bus
+from app.core.file_watch import LogSubscription, get_log_watcher
 from app.servers.adapters.read_port import SqlAlchemyServerReadPort
-from app.servers.application.minecraft_server import minecraft_server_manager
+from app.servers.application.minecraft_server import (
+    SERVER_STATUS_TOPIC,
+    minecraft_server_manager,
+)
+from app.servers.models import ServerStatus
 from app.users.models import User
 
 logger = logging.getLogger(__name__)
 
 
+def _status_data(
+    status: ServerStatus,
+    previous_status: Optional[ServerStatus] = None,
+    changed_at: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """``data`` of both ``initial_status`` and ``server_status`` frames."""
+    return {
+        "status": status.value,
+        "previous_status": previous_status.value if previous_status else None,
+        "changed_at": changed_at.isoformat() if changed_at else None,
+    }
+
+
+# Close code used when a client is dropped for not keeping up.
+SLOW_CONSUMER_CLOSE_CODE = 1008
+
+# Log streaming modes a client can select with a ``set_log_mode`` message:
+# one ``server_log`` frame per line, or ``server_log_batch`` frames.
+LOG_MODE_LINE = "line"
+LOG_MODE_BATCH = "batch"
+
+# Log-type keywords in priority order: when a line contains several, the
+# earliest rule wins (an "INFO" line mentioning an exception is an error).
+_LOG_TYPE_RULES = (
+    ("error", "error"),
+    ("exception", "error"),
+    ("warn", "warning"),
+    ("info", "info"),
+    ("debug", "debug"),
+    ("joined the game", "player_join"),
+    ("left the game", "player_leave"),
+    ("chat", "chat"),
+)
+_LOG_TYPE_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword, _ in _LOG_TYPE_RULES), re.IGNORECASE
+)
+_LOG_TYPE_PRIORITY = {
+    keyword: (rank, log_type) for rank, (keyword, log_type) in enumerate(_LOG_TYPE_RULES)
+}
+
+
+def classify_log_line(log_line: str) -> str:
+    """Classify a server log line in a single precompiled regex scan."""
+    best = None
+    for match in _LOG_TYPE_RE.finditer(log_line):
+        rule = _LOG_TYPE_PRIORITY[match.group().lower()]
+        if best is None or rule < best:
+            best = rule
+            if rule[0] == 0:
+                break
+    if best is not None:
+        return best[1]
+    if "<" in log_line and ">" in log_line:
+        return "chat"
+    return "other"
+
+
+class _OutboundQueue:
+    """Bounded send queue for one WebSocket, drained by its own writer task.
+
+    Broadcasts only append an already-serialized payload here and never
+    await the socket, so a slow client delays nobody but itself. When the
+    queue is full the oldest payload is dropped (and counted), unless the
+    ``disconnect`` policy is in effect, in which case :meth:`put` refuses the
+    payload and the caller disconnects the client. A failed send ends the
+    writer and reports the socket through ``on_error``.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        maxsize: int,
+        policy: str,
+        on_error: Callable[[WebSocket], Awaitable[Any]],
+    ):
+        self.websocket = websocket
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dropped = 0
+        self.closed = False
+        self._pending: Deque[str] = deque()
+        self._on_error = on_error
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self.task = asyncio.create_task(self._run())
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def put(self, payload: str) -> bool:
+        """Queue ``payload``; ``False`` if the client should be disconnected."""
+        if self.closed:
+            return True
+        if len(self._pending) >= self.maxsize:
+            if self.policy == "disconnect":
+                return False
+            self._pending.popleft()
+            self.dropped += 1
+        self._pending.append(payload)
+        self._idle.clear()
+        self._wakeup.set()
+        return True
+
+    async def join(self) -> None:
+        """Wait until every queued payload has been sent (or the writer ended)."""
+        await self._idle.wait()
+
+    def close(self) -> None:
+        """Stop the writer; queued payloads are discarded."""
+        self.closed = True
+        self._pending.clear()
+        if not self.task.done() and self.task is not asyncio.current_task():
+            self.task.cancel()
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                while not self._pending:
+                    self._idle.set()
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                await self.websocket.send_text(self._pending.popleft())
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Error sending message to WebSocket: {e}")
+            self.closed = True
+            self._pending.clear()
+            await self._on_error(self.websocket)
+        finally:
+            self._idle.set()
+
+
 class ConnectionManager:
-    def __init__(self):
+    def __init__(
+        self,
+        send_queue_size: Optional[int] = None,
+        slow_consumer_policy: Optional[str] = None,
+    ):
+        from app.core.config import settings
+
         self.active_connections: Dict[int, Set[WebSocket]] = {}
         self.user_connections: Dict[WebSocket, User] = {}
         self.server_log_tasks: Dict[int, asyncio.Task] = {}
+        self.send_queue_size = send_queue_size or settings.WEBSOCKET_SEND_QUEUE_SIZE
+        self.slow_consumer_policy = (
+            slow_consumer_policy or settings.WEBSOCKET_SLOW_CONSUMER_POLICY
+        )
+        self.outbound_queues: Dict[WebSocket, _OutboundQueue] = {}
+        # Drops from queues that have since been closed.
+        self._dropped_messages_closed = 0
+        # Clients that asked for ``server_log_batch`` frames.
+        self.log_batch_connections: Set[WebSocket] = set()
+
+    # Batched log streaming flushes after this many seconds or lines,
+    # whichever comes first.
+    log_batch_interval = 0.05
+    log_batch_max_lines = 256
 
     async def connect(self, websocket: WebSocket, server_id: int, user: User) -> bool:
         from app.core.concurrency import get_semaphores
@@ -46,6 +209,7 @@ class ConnectionManager:
 
         self.active_connections[server_id].add(websocket)
         self.user_connections[websocket] = user
+        self._get_outbound_queue(websocket, server_id)
 
         # Start log streaming for this server if not already started
         if server_id not in self.server_log_tasks:
@@ -92,6 +256,12 @@ class ConnectionManager:
                 server_id,
             )
 
+        self.log_batch_connections.discard(websocket)
+        queue = self.outbound_queues.pop(websocket, None)
+        if queue is not None:
+            self._dropped_messages_closed += queue.dropped
+            queue.close()
+
         # Await the cancelled task outside the bookkeeping block so the
         # state is fully consistent before we yield control back to the
         # event loop. This is required to avoid "coroutine was never
@@ -113,26 +283,92 @@ class ConnectionManager:
 
             get_semaphores().websocket.release()
 
+    def _get_outbound_queue(self, websocket: WebSocket, server_id: int) -> _OutboundQueue:
+        queue = self.outbound_queues.get(websocket)
+        if queue is None:
+
+            async def on_error(ws: WebSocket) -> None:
+                await self.disconnect(ws, server_id)
+
+            queue = _OutboundQueue(
+                websocket, self.send_queue_size, self.slow_consumer_policy, on_error
+            )
+            self.outbound_queues[websocket] = queue
+        return queue
+
+    def set_log_mode(self, websocket: WebSocket, mode: str) -> bool:
+        """Switch a client between per-line and batched log frames."""
+        if mode == LOG_MODE_BATCH:
+            self.log_batch_connections.add(websocket)
+        elif mode == LOG_MODE_LINE:
+            self.log_batch_connections.discard(websocket)
+        else:
+            return False
+        return True
+
     async def send_to_server_connections(self, server_id: int, message: dict):
-        if server_id in self.active_connections:
-            disconnected = set()
-            for connection in self.active_connections[server_id]:
-                try:
-                    await connection.send_text(json.dumps(message))
-                except Exception as e:
-                    logger.error(f"Error sending message to WebSocket: {e}")
-                    disconnected.add(connection)
+        """Queue ``message`` for every client of ``server_id``.
 
-            # Remove disconnected connections
-            for connection in disconnected:
-                await self.disconnect(connection, server_id)
+        The message is serialized once and the same payload is shared by all
+        subscribers; delivery happens on each connection's writer task.
+        """
+        await self._send_to_connections(
+            server_id, self.active_connections.get(server_id), message
+        )
+
+    async def _send_to_connections(
+        self, server_id: int, connections: Optional[Set[WebSocket]], message: dict
+    ) -> None:
+        if not connections:
+            return
+
+        payload = json.dumps(message)
+        too_slow = [
+            connection
+            for connection in connections
+            if not self._get_outbound_queue(connection, server_id).put(payload)
+        ]
+
+        for connection in too_slow:
+            logger.warning(
+                f"Disconnecting slow WebSocket client for server {server_id}: "
+                f"outbound queue full ({self.send_queue_size} messages)"
+            )
+            await self.disconnect(connection, server_id)
+            try:
+                await connection.close(
+                    code=SLOW_CONSUMER_CLOSE_CODE, reason="Client too slow"
+                )
+            except Exception as e:
+                logger.debug(f"Error closing slow WebSocket client: {e}")
 
     async def send_personal_message(self, websocket: WebSocket, message: dict):
+        # Connected clients go through their queue so the message stays
+        # ordered with the broadcasts already queued for them.
+        queue = self.outbound_queues.get(websocket)
+        if queue is not None:
+            queue.put(json.dumps(message))
+            return
         try:
             await websocket.send_text(json.dumps(message))
         except Exception as e:
             logger.error(f"Error sending personal message: {e}")
 
+    async def flush(self) -> None:
+        """Wait until every outbound queue has been drained."""
+        await asyncio.gather(*(q.join() for q in list(self.outbound_queues.values())))
+
+    def queue_stats(self) -> Dict[str, int]:
+        """Outbound queue depth and drop counters for the metrics endpoint."""
+        depths = [len(q) for q in self.outbound_queues.values()]
+        return {
+            "connections": len(depths),
+            "queued_messages": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "dropped_messages": self._dropped_messages_closed
+            + sum(q.dropped for q in self.outbound_queues.values()),
+        }
+
     async def broadcast_server_status(self, server_id: int, status: dict):
         message = {
             "type": "server_status",
@@ -142,6 +378,15 @@ class ConnectionManager:
         }
         await self.send_to_server_connections(server_id, message)
 
+    async def broadcast_backup_restore(self, server_id: int, progress: dict):
+        message = {
+            "type": "backup_restore",
+            "server_id": server_id,
+            "timestamp": datetime.now().isoformat(),
+            "data": progress,
+        }
+        await self.send_to_server_connections(server_id, message)
+
     async def broadcast_server_notification(self, server_id: int, notification: dict):
         message = {
             "type": "notification",
@@ -153,6 +398,8 @@ class ConnectionManager:
 
     async def _stream_server_logs(self, server_id: int):
         """Stream server logs to all connected clients for a specific server"""
+        subscription: Optional[LogSubscription] = None
+        flush_task: Optional[asyncio.Task] = None
         try:
             server_manager = minecraft_server_manager.get_server(str(server_id))
             if not server_manager:
@@ -185,33 +432,75 @@ class ConnectionManager:
                 logger.error(f"Log path is not a file for server {server_id}: {log_file}")
                 return
 
-            # Follow the log file like 'tail -f'
-            with open(log_file, "r", encoding="utf-8", errors="ignore") as f:
-                # Start from the end of the file
-                f.seek(0, 2)
-
-                # Use server_log_tasks as the loop termination signal:
-                # disconnect() pops the task before removing active_connections,
-                # so this avoids a race where the loop body briefly observes
-                # the connection set as already-removed and exits before
-                # cancellation propagates.
-                while server_id in self.server_log_tasks:
-                    line = f.readline()
-                    if line:
-                        # Send log line to all connected clients
-                        message = {
-                            "type": "server_log",
+            # Follow the log file like 'tail -f', starting from the current
+            # end. New lines are pushed by the shared log watcher; this task
+            # only holds the subscription until disconnect() cancels it.
+            # Lines for batch-mode clients are coalesced and sent by
+            # flush_batch() at most log_batch_interval seconds later.
+            async def send_lines(lines: List[str]) -> None:
+                entries = [
+                    {"log_line": stripped, "log_type": classify_log_line(line)}
+                    for line in lines
+                    if (stripped := line.strip())
+                ]
+                if not entries:
+                    return
+                connections = self.active_connections.get(server_id, set())
+                batch_clients = connections & self.log_batch_connections
+                if batch_clients:
+                    pending_batch.extend(entries)
+                    if len(pending_batch) >= self.log_batch_max_lines:
+                        await flush_batch()
+                    else:
+                        schedule_flush()
+                if len(batch_clients) == len(connections):
+                    return
+
+                timestamp = datetime.now().isoformat()
+                for entry in entries:
+                    message = {
+                        "type": "server_log",
+                        "server_id": server_id,
+                        "timestamp": timestamp,
+                        "data": entry,
+                    }
+                    if batch_clients:
+                        await self._send_to_connections(
+                            server_id, connections - batch_clients, message
+                        )
+                    else:
+                        await self.send_to_server_connections(server_id, message)
+
+            async def flush_batch() -> None:
+                while pending_batch:
+                    chunk = pending_batch[: self.log_batch_max_lines]
+                    del pending_batch[: self.log_batch_max_lines]
+                    connections = self.active_connections.get(server_id, set())
+                    await self._send_to_connections(
+                        server_id,
+                        connections & self.log_batch_connections,
+                        {
+                            "type": "server_log_batch",
                             "server_id": server_id,
                             "timestamp": datetime.now().isoformat(),
-                            "data": {
-                                "log_line": line.strip(),
-                                "log_type": self._determine_log_type(line),
-                            },
-                        }
-                        await self.send_to_server_connections(server_id, message)
-                    else:
-                        # No new lines, wait a bit
-                        await asyncio.sleep(0.1)
+                            "data": {"lines": chunk},
+                        },
+                    )
+
+            async def flush_later() -> None:
+                await asyncio.sleep(self.log_batch_interval)
+                await flush_batch()
+
+            def schedule_flush() -> None:
+                nonlocal flush_task
+                if flush_task is None or flush_task.done():
+                    flush_task = asyncio.create_task(flush_later())
+
+            pending_batch: List[dict] = []
+            subscription = get_log_watcher().subscribe(
+                log_file, send_lines, from_end=True
+            )
+            await asyncio.Future()
 
         except asyncio.CancelledError:
             logger.info(f"Log streaming cancelled for server {server_id}")
@@ -223,27 +512,15 @@ class ConnectionManager:
             )
         except Exception as e:
             logger.error(f"Unexpected error streaming logs for server {server_id}: {e}")
+        finally:
+            if subscription is not None:
+                subscription.close()
+            if flush_task is not None and not flush_task.done():
+                flush_task.cancel()
 
     def _determine_log_type(self, log_line: str) -> str:
         """Determine the type of log message"""
-        log_line_lower = log_line.lower()
-
-        if "error" in log_line_lower or "exception" in log_line_lower:
-            return "error"
-        elif "warn" in log_line_lower:
-            return "warning"
-        elif "info" in log_line_lower:
-            return "info"
-        elif "debug" in log_line_lower:
-            return "debug"
-        elif "joined the game" in log_line_lower:
-            return "player_join"
-        elif "left the game" in log_line_lower:
-            return "player_leave"
-        elif "chat" in log_line_lower or "<" in log_line and ">" in log_line:
-            return "chat"
-        else:
-            return "other"
+        return classify_log_line(log_line)
 
 
 class WebSocketService:
@@ -309,30 +586,24 @@ class WebSocketService:
             await self.connection_manager.disconnect(websocket, server_id)
 
     async def _send_initial_status(self, websocket: WebSocket, server_id: int):
-        """Send initial server status when client connects"""
-        try:
-            server_manager = minecraft_server_manager.get_server(str(server_id))
-            if not server_manager:
-                logger.warning(
-                    f"Server manager not found for initial status: {server_id}"
-                )
-                return
+        """Send the current server status when a client connects.
 
-            # Validate server manager has required methods
-            if not hasattr(server_manager, "get_status") or not callable(
-                getattr(server_manager, "get_status")
-            ):
-                logger.error(
-                    f"Invalid server manager for server {server_id}: missing get_status method"
-                )
-                return
-
-            status = await server_manager.get_status()
+        Same ``data`` as the ``server_status`` frames pushed on changes: the
+        last published transition, or just the status (with no previous
+        status or change time) if none was published.
+        """
+        try:
+            event = minecraft_server_manager.get_status_event(server_id)
+            if event is not None:
+                data = _status_data(event.status, event.previous_status, event.timestamp)
+            else:
+                status = minecraft_server_manager.get_server_status(server_id)
+                data = _status_data(status or ServerStatus.stopped)
             message = {
                 "type": "initial_status",
                 "server_id": server_id,
                 "timestamp": datetime.now().isoformat(),
-                "data": status,
+                "data": data,
             }
             await self.connection_manager.send_personal_message(websocket, message)
         except Exception as e:
@@ -358,6 +629,21 @@ class WebSocketService:
         elif message_type == "request_status":
             await self._send_initial_status(websocket, server_id)
 
+        elif message_type == "set_log_mode":
+            mode = message.get("mode")
+            if self.connection_manager.set_log_mode(websocket, mode):
+                await self.connection_manager.send_personal_message(
+                    websocket,
+                    {
+                        "type": "log_mode",
+                        "mode": mode,
+                        "batch_interval_ms": int(
+                            self.connection_manager.log_batch_interval * 1000
+                        ),
+                        "batch_max_lines": self.connection_manager.log_batch_max_lines,
+                    },
+                )
+
     async def _send_server_command(self, server_id: int, command: str, user: User):
         """Send a command to the server and broadcast the result"""
         try:
@@ -408,42 +694,62 @@ class WebSocketService:
             )
 
     async def _monitor_server_status(self):
-        """Background task to monitor server status changes"""
-        try:
-            while True:
-                for server_id in list(self.connection_manager.active_connections.keys()):
-                    try:
-                        server_manager = minecraft_server_manager.get_server(
-                            str(server_id)
-                        )
-                        if not server_manager:
-                            logger.debug(
-                                f"Server manager not found for monitoring: {server_id}"
-                            )
-                            continue
-
-                        # Validate server manager has required methods
-                        if not hasattr(server_manager, "get_status") or not callable(
-                            getattr(server_manager, "get_status")
-                        ):
-                            logger.error(
-                                f"Invalid server manager for monitoring server {server_id}: missing get_status method"
-                            )
-                            continue
-
-                        status = await server_manager.get_status()
-                        await self.connection_manager.broadcast_server_status(
-                            server_id, status
-                        )
-                    except Exception as e:
-                        logger.error(f"Error monitoring server {server_id}: {e}")
+        """Background task pushing server status changes to clients.
 
-                await asyncio.sleep(5)  # Check every 5 seconds
+        Subscribes to the status events the server manager publishes on the
+        event bus, so clients get a ``server_status`` frame as soon as a
+        status actually changes and nothing is sent while it does not.
+        Backup restore progress is forwarded alongside it by a child task.
+        """
+        subscription = get_event_bus().subscribe(SERVER_STATUS_TOPIC)
+        restore_task = asyncio.create_task(self._forward_restore_progress())
+        try:
+            async for event in subscription:
+                if event.server_id not in self.connection_manager.active_connections:
+                    continue
+                try:
+                    await self.connection_manager.broadcast_server_status(
+                        event.server_id,
+                        _status_data(
+                            event.status, event.previous_status, event.timestamp
+                        ),
+                    )
+                except Exception as e:
+                    logger.error(f"Error monitoring server {event.server_id}: {e}")
 
         except asyncio.CancelledError:
             logger.info("Server status monitoring cancelled")
         except Exception as e:
             logger.error(f"Error in status monitoring: {e}")
+        finally:
+            subscription.close()
+            restore_task.cancel()
+
+    async def _forward_restore_progress(self):
+        """Push ``backup_restore`` frames for restores into watched servers."""
+        subscription = get_event_bus().subscribe(RESTORE_PROGRESS_TOPIC)
+        try:
+            async for event in subscription:
+                if event.server_id not in self.connection_manager.active_connections:
+                    continue
+                try:
+                    await self.connection_manager.broadcast_backup_restore(
+                        event.server_id,
+                        {
+                            "backup_id": event.backup_id,
+                            "phase": event.phase,
+                            "files": event.files,
+                            "bytes": event.bytes,
+                            "paths": event.paths,
+                            "error": event.error,
+                        },
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Error forwarding restore progress for server {event.server_id}: {e}"
+                    )
+        finally:
+            subscription.close()
 
 
 # Global WebSocket service instance
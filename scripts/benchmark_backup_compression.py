@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Compare backup archive writer throughput on a synthetic world.
+
+Builds a throwaway server directory shaped like a Minecraft world (region
+files made of zlib-compressed chunk payloads padded to 4 KiB sectors, plus
+small NBT/JSON/log files) and archives it with:
+
+* ``tarfile`` ``w:gz`` at level 9 — the previous single-threaded writer;
+* the parallel block gzip writer (``tar.gz``);
+* multi-threaded Zstandard (``tar.zst``), if ``zstandard`` is installed.
+
+Usage::
+
+    python scripts/benchmark_backup_compression.py --size-mb 512 --threads 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tarfile
+import tempfile
+import time
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.archives import (  # noqa: E402
+    ARCHIVE_FORMAT_GZIP,
+    ARCHIVE_FORMAT_ZSTD,
+    open_archive_writer,
+    zstd_available,
+)
+
+SECTOR = 4096
+
+
+def _chunk_payload(rng: random.Random) -> bytes:
+    # NBT-like: repetitive palette/section data with some entropy mixed in.
+    palette = b"minecraft:stone\x00minecraft:dirt\x00minecraft:air\x00" * 8
+    noise = rng.randbytes(rng.randint(256, 2048))
+    body = palette * rng.randint(4, 32) + noise
+    return zlib.compress(body, 6)
+
+
+def _write_region(path: Path, rng: random.Random, target_bytes: int) -> None:
+    with open(path, "wb") as f:
+        f.write(b"\0" * (2 * SECTOR))  # location + timestamp tables
+        written = 2 * SECTOR
+        while written < target_bytes:
+            payload = _chunk_payload(rng)
+            sector = len(payload).to_bytes(4, "big") + b"\x02" + payload
+            sector += b"\0" * (-len(sector) % SECTOR)
+            f.write(sector)
+            written += len(sector)
+
+
+def build_world(root: Path, size_mb: int, seed: int = 1) -> int:
+    rng = random.Random(seed)
+    region_dir = root / "world" / "region"
+    region_dir.mkdir(parents=True)
+    region_size = 8 * 1024 * 1024
+    regions = max(1, size_mb * 1024 * 1024 // region_size)
+    for i in range(regions):
+        _write_region(region_dir / f"r.{i % 16}.{i // 16}.mca", rng, region_size)
+    (root / "world" / "level.dat").write_bytes(zlib.compress(rng.randbytes(4096)))
+    (root / "server.properties").write_text("motd=bench\n" * 50)
+    logs = root / "logs"
+    logs.mkdir()
+    (logs / "latest.log").write_text(
+        "".join(
+            f"[12:00:{i % 60:02d}] [Server thread/INFO]: line {i}\n" for i in range(20000)
+        )
+    )
+    return sum(p.stat().st_size for p in root.rglob("*") if p.is_file())
+
+
+def _archive_baseline(source: Path, target: Path) -> None:
+    with tarfile.open(target, "w:gz") as tar:
+        tar.add(source, arcname=".")
+
+
+def _archive_with(archive_format: str, threads: int):
+    def run(source: Path, target: Path) -> None:
+        with open_archive_writer(target, archive_format, threads=threads) as tar:
+            tar.add(source, arcname=".")
+
+    return run
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--keep", action="store_true", help="keep the temp directory")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="backup-bench-"))
+    try:
+        source = workdir / "server"
+        total = build_world(source, args.size_mb)
+        print(f"Synthetic world: {total / 2**20:.1f} MiB, threads={args.threads}")
+
+        backends = [
+            ("tarfile w:gz (level 9, 1 thread)", _archive_baseline, ".tar.gz"),
+            (
+                f"parallel gzip ({args.threads} threads)",
+                _archive_with(ARCHIVE_FORMAT_GZIP, args.threads),
+                ".tar.gz",
+            ),
+        ]
+        if zstd_available():
+            backends.append(
+                (
+                    f"zstd ({args.threads} threads)",
+                    _archive_with(ARCHIVE_FORMAT_ZSTD, args.threads),
+                    ".tar.zst",
+                )
+            )
+        else:
+            print("zstandard not installed; skipping tar.zst")
+
+        print(f"{'backend':<36} {'seconds':>8} {'MiB/s':>8} {'ratio':>7}")
+        for i, (label, run, suffix) in enumerate(backends):
+            target = workdir / f"out{i}{suffix}"
+            started = time.perf_counter()
+            run(source, target)
+            elapsed = time.perf_counter() - started
+            size = target.stat().st_size
+            print(
+                f"{label:<36} {elapsed:8.2f} {total / 2**20 / elapsed:8.1f} "
+                f"{size / total:7.3f}"
+            )
+            target.unlink()
+    finally:
+        if args.keep:
+            print(f"Kept {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
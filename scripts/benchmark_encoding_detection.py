@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Compare text file encoding detection cost across common encodings.
+
+Writes ASCII, UTF-8, Shift-JIS and latin-1 fixtures shaped like server
+configs and logs, and reads each one with:
+
+* the previous detector — ``chardet`` over the whole file, then one
+  re-open and decode per ``COMMON_ENCODINGS`` entry when inconclusive;
+* ``EncodingHandler`` with an empty cache (strict UTF-8 pass, then
+  ``chardet`` on a bounded prefix);
+* ``EncodingHandler`` again on the unchanged file (cached encoding).
+
+Usage::
+
+    python scripts/benchmark_encoding_detection.py --size-mb 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import chardet
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.files.application.encoding_handler import EncodingHandler  # noqa: E402
+
+_LOG_PREFIX = "[12:00:{s:02d}] [Server thread/INFO]: "
+
+# (label, encoding, line template formatted with the line number and second)
+FIXTURES = [
+    ("ascii", "ascii", _LOG_PREFIX + "Player{i} joined the game\n"),
+    ("utf-8", "utf-8", _LOG_PREFIX + "プレイヤー{i} が参加しました\n"),
+    ("shift-jis", "shift_jis", "# 設定{i}\nmotd=マインクラフトサーバー{s}\n"),
+    ("latin-1", "latin-1", _LOG_PREFIX + "Spieler{i} hat die Größe geändert: café\n"),
+]
+
+
+def build_fixture(path: Path, encoding: str, line: str, size_mb: int) -> int:
+    target = size_mb * 1024 * 1024
+    written = 0
+    with open(path, "wb") as f:
+        i = 0
+        while written < target:
+            data = "".join(
+                line.format(i=i + j, s=(i + j) % 60) for j in range(1000)
+            ).encode(encoding)
+            f.write(data)
+            written += len(data)
+            i += 1000
+    # Old enough that the handler is willing to cache it.
+    old = time.time() - 60
+    os.utime(path, (old, old))
+    return written
+
+
+def _detect_baseline(file_path: str) -> str:
+    try:
+        with open(file_path, "rb") as f:
+            raw_data = f.read()
+        result = chardet.detect(raw_data)
+        if result.get("encoding") and result.get("confidence", 0) > 0.7:
+            try:
+                raw_data.decode(result["encoding"])
+                return result["encoding"]
+            except UnicodeDecodeError:
+                pass
+    except Exception:
+        pass
+    for encoding in EncodingHandler.COMMON_ENCODINGS:
+        try:
+            with open(file_path, "r", encoding=encoding) as f:
+                f.read()
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return "utf-8 (with replacement)"
+
+
+def _detect_current(file_path: str) -> str:
+    return EncodingHandler.read_file_with_encoding_detection(file_path)[1]
+
+
+def _timed(detect, file_path: str):
+    started = time.perf_counter()
+    encoding = detect(file_path)
+    return time.perf_counter() - started, encoding
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="keep the temp directory")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="encoding-bench-"))
+    try:
+        print(
+            f"{'fixture':<10} {'MiB':>6} {'baseline s':>11} {'cold s':>8} "
+            f"{'cached s':>9} {'speedup':>8}  detected"
+        )
+        for label, encoding, line in FIXTURES:
+            path = workdir / f"{label}.txt"
+            size = build_fixture(path, encoding, line, args.size_mb)
+
+            EncodingHandler._cache.clear()
+            baseline, _ = _timed(_detect_baseline, str(path))
+            cold, detected = _timed(_detect_current, str(path))
+            cached, _ = _timed(_detect_current, str(path))
+            print(
+                f"{label:<10} {size / 2**20:6.1f} {baseline:11.3f} {cold:8.3f} "
+                f"{cached:9.3f} {baseline / cold:7.1f}x  {detected}"
+            )
+    finally:
+        EncodingHandler._cache.clear()
+        if args.keep:
+            print(f"Kept {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
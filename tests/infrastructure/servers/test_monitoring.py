@@ -240,6 +240,12 @@ sys.exit(0)
                 # Create and start log reading task
                 log_task = asyncio.create_task(manager._read_server_logs(server_process))
 
+                # Append through pathlib (not the patched builtins.open) so
+                # the watcher is notified and its follow-up read fails.
+                await asyncio.sleep(0.2)
+                with log_file.open("a") as f:
+                    f.write("More log content\n")
+
                 # Give time for exception to occur
                 await asyncio.sleep(1.0)
 
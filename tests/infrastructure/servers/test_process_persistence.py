@@ -332,6 +332,85 @@ class TestProcessPersistence:
         # Verify restore was called for each server
         assert mock_restore.call_count == 3
 
+    def _write_pid_files(self, base_dir, server_ids):
+        for server_id in server_ids:
+            server_dir = base_dir / str(server_id)
+            server_dir.mkdir(exist_ok=True)
+            pid_data = {
+                "server_id": server_id,
+                "pid": 12345 + server_id,
+                "port": 25565 + server_id,
+                "started_at": "2023-01-01T00:00:00",
+                "command": ["java", "-jar", "server.jar"],
+                "api_version": "1.0",
+            }
+            with open(server_dir / "server.pid", "w") as f:
+                json.dump(pid_data, f)
+
+    async def test_discover_restores_concurrently_and_batches_status_update(
+        self, manager, temp_server_dir
+    ):
+        """Restores overlap (bounded) and the DB sees one batched update"""
+        self._write_pid_files(temp_server_dir.parent, range(1, 21))
+        manager.restore_concurrency = 4
+        active = 0
+        peak = 0
+
+        async def slow_restore(server_id, server_dir):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return server_id % 5 != 0
+
+        batches = []
+
+        async def record_batch(updates):
+            batches.append(updates)
+            return {sid: True for sid in updates}
+
+        per_server = MagicMock()
+        manager.set_status_update_callback(per_server)
+        manager.set_batch_status_update_callback(record_batch)
+
+        with patch.object(manager, "_restore_process_from_pid", side_effect=slow_restore):
+            results = await manager.discover_and_restore_processes()
+
+        assert peak == 4
+        assert results == {sid: sid % 5 != 0 for sid in range(1, 21)}
+        assert batches == [
+            {sid: ServerStatus.running for sid in range(1, 21) if sid % 5 != 0}
+        ]
+        per_server.assert_not_called()
+
+    async def test_discover_reuses_recent_scan(self, manager, temp_server_dir):
+        """Repeated and concurrent discovery calls share one directory scan"""
+        self._write_pid_files(temp_server_dir.parent, [1, 2])
+        scans = 0
+        original_scan = manager._scan_pid_files
+
+        def counting_scan():
+            nonlocal scans
+            scans += 1
+            return original_scan()
+
+        with (
+            patch.object(manager, "_scan_pid_files", side_effect=counting_scan),
+            patch.object(manager, "_restore_process_from_pid", return_value=False),
+        ):
+            first, second = await asyncio.gather(
+                manager.discover_and_restore_processes(),
+                manager.discover_and_restore_processes(),
+            )
+            third = await manager.discover_and_restore_processes()
+            assert scans == 1
+            assert first == second == third == {1: False, 2: False}
+
+            manager.discovery_cache_ttl = 0
+            await manager.discover_and_restore_processes()
+            assert scans == 2
+
     @patch("app.core.config.settings.AUTO_SYNC_ON_STARTUP", False)
     async def test_discover_disabled_by_setting(self, manager):
         """Test that discovery is disabled when AUTO_SYNC_ON_STARTUP is False"""
@@ -177,6 +177,28 @@ class TestBackupRepositoryReads:
         assert stats.failed_backups == 1
         assert stats.total_size_bytes == 300
 
+    @pytest.mark.asyncio
+    async def test_list_retention_candidates_only_completed_scheduled(
+        self, repository, db, admin_user
+    ):
+        server = _seed_server(db, admin_user.id, name="RC", port=25577)
+        keep = _seed_backup(
+            db,
+            server.id,
+            name="s1",
+            file_size=10,
+            status=BackupStatus.completed,
+            backup_type=BackupType.scheduled,
+            file_path="s1.tar.gz",
+        )
+        _seed_backup(db, server.id, name="m", status=BackupStatus.completed)
+        _seed_backup(db, server.id, name="f", backup_type=BackupType.scheduled)
+
+        candidates = await repository.list_retention_candidates([server.id])
+        assert [(c.id, c.file_path, c.file_size) for c in candidates] == [
+            (keep.id, "s1.tar.gz", 10)
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Writes
@@ -275,6 +297,16 @@ class TestBackupRepositoryWrites:
     async def test_delete_unknown_returns_false(self, repository):
         assert await repository.delete(99999) is False
 
+    @pytest.mark.asyncio
+    async def test_delete_many_removes_rows_in_bulk(self, repository, db, admin_user):
+        server = _seed_server(db, admin_user.id, name="DM", port=25578)
+        ids = [_seed_backup(db, server.id, name=f"d{i}").id for i in range(3)]
+
+        assert await repository.delete_many([ids[0], ids[2], 99999]) == 2
+        db.commit()
+        assert await repository.get(ids[0]) is None
+        assert await repository.get(ids[1]) is not None
+
 
 # ---------------------------------------------------------------------------
 # Adapter-level sanity
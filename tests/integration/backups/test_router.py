@@ -964,7 +964,8 @@ class TestBackupRouterFixed:
 
             assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
             assert (
-                "Only .tar.gz and .tgz files are supported" in response.json()["detail"]
+                "Only .tar.gz, .tgz and .tar.zst files are supported"
+                in response.json()["detail"]
             )
 
         finally:
@@ -11,9 +11,12 @@ from datetime import timedelta
 import pytest
 
 from app.core.datetime_utils import utcnow
-from app.files.adapters.repository import SqlAlchemyFileHistoryRepository
-from app.files.domain.entities import CreateHistoryCommand
-from app.files.models import FileEditHistory
+from app.files.adapters.repository import (
+    SqlAlchemyFileHistoryRepository,
+    SqlAlchemyHistoryBlobRepository,
+)
+from app.files.domain.entities import CreateHistoryCommand, HistoryBlobEntity
+from app.files.models import FileEditHistory, FileHistoryBlob
 from app.servers.models import Server, ServerStatus, ServerType
 from app.users.models import User
 
@@ -43,6 +46,11 @@ def repository(db) -> SqlAlchemyFileHistoryRepository:
     return SqlAlchemyFileHistoryRepository(db)
 
 
+@pytest.fixture
+def blob_repository(db) -> SqlAlchemyHistoryBlobRepository:
+    return SqlAlchemyHistoryBlobRepository(db)
+
+
 def _seed_history(
     db,
     server: Server,
@@ -253,3 +261,67 @@ class TestFileHistoryRepository:
     @pytest.mark.asyncio
     async def test_delete_by_id_returns_false_when_missing(self, repository):
         assert await repository.delete_by_id(999999) is False
+
+
+def _blob(content_hash: str, base_hash: str | None = None) -> HistoryBlobEntity:
+    return HistoryBlobEntity(
+        content_hash=content_hash,
+        storage_path=f"/tmp/file_history/blobs/{content_hash[:2]}/{content_hash}",
+        stored_size=10,
+        base_hash=base_hash,
+        chain_depth=1 if base_hash else 0,
+    )
+
+
+class TestHistoryBlobRepository:
+    @pytest.mark.asyncio
+    async def test_add_get_and_existing_hashes(self, blob_repository, db):
+        await blob_repository.add(_blob("aa11"))
+        await blob_repository.add(_blob("bb22", base_hash="aa11"))
+        db.commit()
+
+        got = await blob_repository.get("bb22")
+        assert got == _blob("bb22", base_hash="aa11")
+        assert await blob_repository.get("cc33") is None
+        assert await blob_repository.get_existing_hashes(["aa11", "cc33"]) == {"aa11"}
+
+    @pytest.mark.asyncio
+    async def test_references_count_versions_and_deltas(
+        self, blob_repository, repository, db, server, admin_user
+    ):
+        base = await blob_repository.add(_blob("aa11"))
+        delta = await blob_repository.add(_blob("bb22", base_hash="aa11"))
+        entity = await repository.add(
+            CreateHistoryCommand(
+                server_id=server.id,
+                file_path="ops.json",
+                version_number=1,
+                backup_file_path=delta.storage_path,
+                file_size=3,
+                content_hash="bb22",
+                editor_user_id=admin_user.id,
+                description=None,
+            )
+        )
+        db.commit()
+
+        assert await blob_repository.count_references(base) == 1
+        assert await blob_repository.count_references(delta) == 1
+        assert await blob_repository.get_unreferenced() == []
+
+        # A staged (uncommitted) delete is already visible.
+        assert entity.id is not None
+        await repository.delete_by_id(entity.id)
+        assert await blob_repository.count_references(delta) == 0
+        assert [b.content_hash for b in await blob_repository.get_unreferenced()] == [
+            "bb22"
+        ]
+
+        assert await blob_repository.delete("bb22") is True
+        db.commit()
+        assert await blob_repository.count_references(base) == 0
+        assert db.query(FileHistoryBlob).count() == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_returns_false_when_missing(self, blob_repository):
+        assert await blob_repository.delete("missing") is False
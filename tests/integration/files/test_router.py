@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 from io import BytesIO
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -9,6 +10,7 @@ from app.audit.api.dependencies import get_audit_writer
 from app.core.exceptions import (
     FileOperationException,
 )
+from app.files.application.listing import ListingPage
 from app.main import app
 from app.types import FileType
 from tests.helpers.auth import auth_headers_for as get_auth_headers
@@ -34,7 +36,7 @@ class TestFileRouter:
         "app.servers.application.authorization.AuthorizationService.check_server_access",
         new_callable=AsyncMock,
     )
-    @patch("app.files.application.management.file_management_service.get_server_files")
+    @patch("app.files.application.management.file_management_service.list_server_files")
     def test_get_server_files_success(
         self, mock_get_files, mock_check_access, client, admin_user
     ):
@@ -59,7 +61,7 @@ class TestFileRouter:
                 "permissions": {"readable": True, "writable": True},
             },
         ]
-        mock_get_files.return_value = mock_files
+        mock_get_files.return_value = ListingPage(files=mock_files, total=2)
         mock_check_access.return_value = None  # No exception means access granted
 
         headers = get_auth_headers(admin_user.username)
@@ -76,12 +78,12 @@ class TestFileRouter:
         "app.servers.application.authorization.AuthorizationService.check_server_access",
         new_callable=AsyncMock,
     )
-    @patch("app.files.application.management.file_management_service.get_server_files")
+    @patch("app.files.application.management.file_management_service.list_server_files")
     def test_get_server_files_with_path_filter(
         self, mock_get_files, mock_check_access, client, admin_user
     ):
         """Test getting server files with path filter"""
-        mock_get_files.return_value = []
+        mock_get_files.return_value = ListingPage(files=[], total=0)
         mock_check_access.return_value = None  # No exception means access granted
 
         headers = get_auth_headers(admin_user.username)
@@ -94,12 +96,12 @@ class TestFileRouter:
         "app.servers.application.authorization.AuthorizationService.check_server_access",
         new_callable=AsyncMock,
     )
-    @patch("app.files.application.management.file_management_service.get_server_files")
+    @patch("app.files.application.management.file_management_service.list_server_files")
     def test_get_server_files_with_type_filter(
         self, mock_get_files, mock_check_access, client, admin_user
     ):
         """Test getting server files with type filter"""
-        mock_get_files.return_value = []
+        mock_get_files.return_value = ListingPage(files=[], total=0)
         mock_check_access.return_value = None  # No exception means access granted
 
         headers = get_auth_headers(admin_user.username)
@@ -110,6 +112,55 @@ class TestFileRouter:
         assert response.status_code == status.HTTP_200_OK
         mock_get_files.assert_called_once()
 
+    @patch(
+        "app.servers.application.authorization.AuthorizationService.check_server_access",
+        new_callable=AsyncMock,
+    )
+    @patch("app.files.application.management.file_management_service.list_server_files")
+    def test_get_server_files_compact_page(
+        self, mock_get_files, mock_check_access, client, admin_user
+    ):
+        """Test paged listing in the compact columnar form"""
+        mock_get_files.return_value = ListingPage(
+            files=[
+                {
+                    "name": "server.properties",
+                    "path": "server.properties",
+                    "type": "text",
+                    "is_directory": False,
+                    "size": 1024,
+                    "modified": "2024-01-01T00:00:00",
+                    "readable": True,
+                    "writable": True,
+                }
+            ],
+            total=5,
+            next_cursor="abc",
+        )
+        mock_check_access.return_value = None
+
+        headers = get_auth_headers(admin_user.username)
+        response = client.get(
+            "/api/v1/files/servers/1/files?limit=1&sort=size&order=desc&compact=true",
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["columns"][0] == "name"
+        assert data["rows"][0][0] == "server.properties"
+        assert data["total_files"] == 5
+        assert data["next_cursor"] == "abc"
+        query = mock_get_files.call_args.kwargs["query"]
+        assert (query.limit, query.sort, query.order) == (1, "size", "desc")
+
+    def test_get_server_files_rejects_unknown_sort(self, client, admin_user):
+        """Test that an unsupported sort field is a validation error"""
+        headers = get_auth_headers(admin_user.username)
+        response = client.get("/api/v1/files/servers/1/files?sort=owner", headers=headers)
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
     @patch(
         "app.servers.application.authorization.AuthorizationService.check_server_access",
         new_callable=AsyncMock,
@@ -596,6 +647,55 @@ class TestFileRouter:
         data = response.json()
         assert data["total_results"] == 1
 
+    @patch(
+        "app.servers.application.authorization.AuthorizationService.check_server_access",
+        new_callable=AsyncMock,
+    )
+    @patch(
+        "app.files.application.management.file_management_service.stream_search_files",
+        new_callable=AsyncMock,
+    )
+    def test_stream_search_files(
+        self, mock_stream, mock_check_access, client, admin_user
+    ):
+        """Test streaming search emits one NDJSON line per result plus a summary"""
+
+        async def results():
+            yield {
+                "name": "server.properties",
+                "path": "server.properties",
+                "type": "text",
+                "is_directory": False,
+                "size": 512,
+                "modified": "2024-01-01T00:00:00",
+                "permissions": {"read": True, "write": True, "execute": False},
+                "match_type": "content",
+                "line_matches": [{"line": 3, "snippet": "server-port=25565"}],
+                "match_count": 1,
+                "truncated": False,
+            }, 0
+            yield None, 1
+
+        mock_check_access.return_value = None
+        mock_stream.return_value = results()
+
+        headers = get_auth_headers(admin_user.username)
+        response = client.post(
+            "/api/v1/files/servers/1/files/search/stream",
+            json={"query": "25565", "include_content": True},
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        result, summary = [json.loads(line) for line in response.text.splitlines()]
+        assert result["type"] == "result"
+        assert result["file"]["path"] == "server.properties"
+        assert result["line_matches"] == [{"line": 3, "snippet": "server-port=25565"}]
+        assert result["matches"] == ["3: server-port=25565"]
+        assert summary["type"] == "summary"
+        assert summary["total_results"] == 1
+
     def test_file_operations_require_authentication(self, client):
         """Test that file operations require authentication"""
         response = client.get("/api/v1/files/servers/1/files")
@@ -59,6 +59,9 @@ class TestLifecycle:
             mock_mgr.set_status_update_callback.assert_called_once_with(
                 service._update_server_status_async
             )
+            mock_mgr.set_batch_status_update_callback.assert_called_once_with(
+                service.batch_update_server_statuses_async
+            )
         assert service._loop is not None  # captured running loop
 
 
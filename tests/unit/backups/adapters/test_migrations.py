@@ -6,7 +6,9 @@ from sqlalchemy import create_engine, text
 from app.backups.adapters.migrations import (
     _BACKUP_COMPOSITE_INDEXES,
     _BACKUP_SINGLE_INDEXES,
+    migrate_backup_checksum,
     migrate_backup_indexes,
+    migrate_backup_schedule_retention_tiers,
 )
 from app.core.database import Base
 
@@ -49,3 +51,52 @@ def test_migrate_backup_indexes_is_idempotent(engine):
     names = _index_names(engine, "backups")
     for expected, _ in _BACKUP_SINGLE_INDEXES + _BACKUP_COMPOSITE_INDEXES:
         assert expected in names
+
+
+def test_migrate_backup_checksum_adds_column_to_old_table(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    try:
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE backups (id INTEGER PRIMARY KEY, "
+                    "file_path VARCHAR(500), file_size BIGINT)"
+                )
+            )
+            conn.execute(text("INSERT INTO backups VALUES (1, 'a.tar.gz', 10)"))
+
+        migrate_backup_checksum(engine)
+        migrate_backup_checksum(engine)
+
+        with engine.connect() as conn:
+            row = conn.execute(text("SELECT id, checksum FROM backups")).one()
+        assert tuple(row) == (1, None)
+    finally:
+        engine.dispose()
+
+
+def test_migrate_backup_schedule_retention_tiers_adds_columns(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    try:
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE backup_schedules (id INTEGER PRIMARY KEY, "
+                    "server_id INTEGER, max_backups INTEGER)"
+                )
+            )
+            conn.execute(text("INSERT INTO backup_schedules VALUES (1, 7, 5)"))
+
+        migrate_backup_schedule_retention_tiers(engine)
+        migrate_backup_schedule_retention_tiers(engine)
+
+        with engine.connect() as conn:
+            row = conn.execute(
+                text(
+                    "SELECT keep_hourly, keep_daily, keep_weekly, keep_monthly "
+                    "FROM backup_schedules"
+                )
+            ).one()
+        assert tuple(row) == (0, 0, 0, 0)
+    finally:
+        engine.dispose()
@@ -13,7 +13,7 @@ still works thanks to the re-export below.
 from dataclasses import replace
 from datetime import datetime, timezone
 from types import TracebackType
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence
 
 from app.backups.domain.entities import (
     AppendScheduleLogCommand,
@@ -25,6 +25,7 @@ from app.backups.domain.entities import (
     BackupStatistics,
     CreateBackupCommand,
     CreateBackupScheduleCommand,
+    RetentionCandidate,
     UpdateBackupFileCommand,
     UpdateBackupScheduleCommand,
 )
@@ -71,6 +72,29 @@ class FakeBackupRepository:
             size=spec.size,
         )
 
+    async def list_retention_candidates(
+        self, server_ids: Optional[Sequence[int]] = None
+    ) -> List[RetentionCandidate]:
+        rows = [
+            r
+            for r in self._records.values()
+            if r.status == BackupStatus.completed
+            and r.backup_type == BackupType.scheduled
+            and (server_ids is None or r.server_id in server_ids)
+        ]
+        rows.sort(key=lambda r: r.created_at, reverse=True)
+        rows.sort(key=lambda r: r.server_id)
+        return [
+            RetentionCandidate(
+                id=r.id,
+                server_id=r.server_id,
+                created_at=r.created_at,
+                file_path=r.file_path,
+                file_size=r.file_size,
+            )
+            for r in rows
+        ]
+
     async def get_statistics(self, server_id: Optional[int] = None) -> BackupStatistics:
         rows = list(self._records.values())
         if server_id is not None:
@@ -100,6 +124,7 @@ class FakeBackupRepository:
             server_name=None,
             minecraft_version=None,
             server_owner_id=None,
+            checksum=command.checksum,
         )
         self._records[self._next_id] = entity
         self._next_id += 1
@@ -116,6 +141,7 @@ class FakeBackupRepository:
             file_path=command.file_path,
             file_size=command.file_size,
             status=command.status,
+            checksum=command.checksum,
         )
         self._records[backup_id] = updated
         return updated
@@ -130,12 +156,29 @@ class FakeBackupRepository:
         self._records[backup_id] = updated
         return updated
 
+    async def update_checksum(
+        self, backup_id: int, checksum: str
+    ) -> Optional[BackupEntity]:
+        existing = self._records.get(backup_id)
+        if existing is None:
+            return None
+        updated = replace(existing, checksum=checksum)
+        self._records[backup_id] = updated
+        return updated
+
     async def delete(self, backup_id: int) -> bool:
         if backup_id not in self._records:
             return False
         del self._records[backup_id]
         return True
 
+    async def delete_many(self, backup_ids: Iterable[int]) -> int:
+        deleted = 0
+        for backup_id in backup_ids:
+            if self._records.pop(backup_id, None) is not None:
+                deleted += 1
+        return deleted
+
     # ----- Test helpers -----
 
     def seed(self, entity: BackupEntity) -> BackupEntity:
@@ -206,6 +249,10 @@ class FakeBackupScheduleRepository:
             next_backup_at=command.next_backup_at,
             created_at=now,
             updated_at=now,
+            keep_hourly=command.keep_hourly,
+            keep_daily=command.keep_daily,
+            keep_weekly=command.keep_weekly,
+            keep_monthly=command.keep_monthly,
         )
         self._schedules[command.server_id] = entity
         self._next_schedule_id += 1
@@ -329,6 +376,7 @@ def make_backup_entity(
     server_name: Optional[str] = None,
     minecraft_version: Optional[str] = None,
     server_owner_id: Optional[int] = None,
+    checksum: Optional[str] = None,
 ) -> BackupEntity:
     return BackupEntity(
         id=id,
@@ -343,6 +391,7 @@ def make_backup_entity(
         server_name=server_name,
         minecraft_version=minecraft_version,
         server_owner_id=server_owner_id,
+        checksum=checksum,
     )
 
 
@@ -0,0 +1,234 @@
+"""Tests for the content-addressed chunk store behind incremental backups."""
+
+import io
+import os
+import random
+import tarfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from app.backups.application.chunk_store import (
+    CHUNK_FIXED_SIZE,
+    CHUNK_MAX_SIZE,
+    CHUNK_MIN_SIZE,
+    MANIFEST_SUFFIX,
+    ChunkStore,
+    chunker_for,
+    iter_chunks,
+    iter_fixed_chunks,
+)
+from app.backups.application.file_service import BackupFileService
+from app.core.security import SecurityError
+
+
+def _data(size: int, seed: int = 0) -> bytes:
+    return random.Random(seed).randbytes(size)
+
+
+def _make_world(root: Path) -> Path:
+    region = root / "world" / "region"
+    region.mkdir(parents=True)
+    (region / "r.0.0.mca").write_bytes(_data(1024 * 1024, seed=1))
+    (region / "r.0.1.mca").write_bytes(_data(512 * 1024, seed=2))
+    (root / "server.properties").write_text("motd=hi\n")
+    return root
+
+
+def _manifest(store: ChunkStore, backups: Path, n: int) -> Path:
+    return backups / f"backup_1_{n}_20240101_00000{n}{MANIFEST_SUFFIX}"
+
+
+class TestChunking:
+    def test_sizes_are_bounded_and_lossless(self):
+        data = _data(3 * 1024 * 1024)
+        chunks = list(iter_chunks(io.BytesIO(data)))
+        assert b"".join(chunks) == data
+        assert all(CHUNK_MIN_SIZE <= len(c) <= CHUNK_MAX_SIZE for c in chunks[:-1])
+
+    def test_boundaries_do_not_depend_on_read_size(self):
+        data = _data(2 * 1024 * 1024)
+        a = list(iter_chunks(io.BytesIO(data)))
+        b = list(iter_chunks(io.BytesIO(data), read_size=CHUNK_MAX_SIZE + 17))
+        assert a == b
+
+    def test_insertion_only_changes_nearby_chunks(self):
+        data = _data(2 * 1024 * 1024)
+        edited = data[:500_000] + b"inserted bytes" + data[500_000:]
+        before = set(iter_chunks(io.BytesIO(data)))
+        after = list(iter_chunks(io.BytesIO(edited)))
+        # Fixed-size blocks would all shift; content-defined cuts resync.
+        assert sum(c in before for c in after) >= len(after) - 3
+
+    def test_region_and_compressed_files_use_fixed_chunks(self):
+        data = _data(CHUNK_FIXED_SIZE * 3 + 100)
+        chunks = list(iter_fixed_chunks(io.BytesIO(data)))
+        assert [len(c) for c in chunks] == [CHUNK_FIXED_SIZE] * 3 + [100]
+        assert chunker_for("world/region/r.0.0.mca") is iter_fixed_chunks
+        assert chunker_for("mods/Example.JAR") is iter_fixed_chunks
+        assert chunker_for("logs/latest.log") is iter_chunks
+
+
+class TestChunkStore:
+    def test_snapshot_deduplicates_and_reuses_unchanged_files(self, tmp_path):
+        source = _make_world(tmp_path / "server")
+        backups = tmp_path / "backups"
+        backups.mkdir()
+        store = ChunkStore(backups)
+
+        first = _manifest(store, backups, 1)
+        added_first = store.snapshot(source, first)
+        assert added_first > 1024 * 1024
+
+        # Touch one region file; the other is reused without reading.
+        path = source / "world" / "region" / "r.0.0.mca"
+        content = bytearray(path.read_bytes())
+        content[700_000:700_010] = b"x" * 10
+        path.write_bytes(bytes(content))
+
+        second = _manifest(store, backups, 2)
+        added_second = store.snapshot(source, second, previous_manifest=first)
+        assert added_second < added_first / 4
+
+        objects = list(store.objects_directory.rglob("*"))
+        manifest = ChunkStore.load_manifest(second)
+        region = next(e for e in manifest["files"] if e["path"].endswith("r.0.1.mca"))
+        assert all(store.reference_count(d) == 2 for d in region["chunks"])
+        assert objects
+
+    def test_restore_and_export_round_trip(self, tmp_path):
+        source = _make_world(tmp_path / "server")
+        backups = tmp_path / "backups"
+        backups.mkdir()
+        store = ChunkStore(backups)
+        manifest = _manifest(store, backups, 1)
+        store.snapshot(source, manifest)
+
+        target = tmp_path / "restored"
+        assert store.restore(manifest, target) == 3
+        for name in ("world/region/r.0.0.mca", "server.properties"):
+            assert (target / name).read_bytes() == (source / name).read_bytes()
+        assert (
+            os.stat(target / "server.properties").st_mtime_ns
+            == os.stat(source / "server.properties").st_mtime_ns
+        )
+
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w") as tar:
+            store.export(manifest, tar)
+        buffer.seek(0)
+        with tarfile.open(fileobj=buffer) as tar:
+            member = tar.extractfile("world/region/r.0.1.mca")
+            assert member.read() == (source / "world/region/r.0.1.mca").read_bytes()
+
+    def test_discard_frees_only_unshared_chunks(self, tmp_path):
+        source = _make_world(tmp_path / "server")
+        backups = tmp_path / "backups"
+        backups.mkdir()
+        store = ChunkStore(backups)
+        first = _manifest(store, backups, 1)
+        store.snapshot(source, first)
+        (source / "extra.dat").write_bytes(_data(100_000, seed=9))
+        second = _manifest(store, backups, 2)
+        store.snapshot(source, second, previous_manifest=first)
+
+        assert store.discard(first) == 0
+        assert not first.exists()
+        target = tmp_path / "restored"
+        store.restore(second, target)
+        assert (target / "extra.dat").exists()
+
+        assert store.discard(second) > 0
+        assert [p for p in store.objects_directory.rglob("*") if p.is_file()] == []
+
+    def test_reference_counts_rebuilt_from_manifests(self, tmp_path):
+        source = _make_world(tmp_path / "server")
+        backups = tmp_path / "backups"
+        backups.mkdir()
+        store = ChunkStore(backups)
+        manifest = _manifest(store, backups, 1)
+        store.snapshot(source, manifest)
+        digest = ChunkStore.load_manifest(manifest)["files"][0]["chunks"][0]
+
+        (store.root / "refcounts.json").unlink()
+        assert ChunkStore(backups).reference_count(digest) == 1
+
+    def test_rebuilt_counts_include_pending_and_failed_manifests(self, tmp_path):
+        source = _make_world(tmp_path / "server")
+        backups = tmp_path / "backups"
+        (backups / ".pending").mkdir(parents=True)
+        (backups / ".failed").mkdir()
+        store = ChunkStore(backups)
+        store.snapshot(source, backups / ".pending" / f"a{MANIFEST_SUFFIX}")
+        manifest = backups / ".failed" / f"b{MANIFEST_SUFFIX}"
+        store.snapshot(source, manifest)
+        digest = ChunkStore.load_manifest(manifest)["files"][0]["chunks"][0]
+
+        (store.root / "refcounts.json").unlink()
+        assert ChunkStore(backups).reference_count(digest) == 2
+
+    def test_counts_are_persisted_before_the_manifest_is_written(self, tmp_path):
+        source = _make_world(tmp_path / "server")
+        backups = tmp_path / "backups"
+        backups.mkdir()
+        store = ChunkStore(backups)
+        first = _manifest(store, backups, 1)
+        store.snapshot(source, first)
+        second = _manifest(store, backups, 2)
+        flushed_before_manifest = []
+        flush = store.flush
+
+        def recording_flush():
+            flush()
+            flushed_before_manifest.append(not second.exists())
+
+        store.flush = recording_flush
+        store.snapshot(source, second, previous_manifest=first)
+
+        # A process dying right after the manifest lands must find counts
+        # covering both manifests, or discarding one would free shared chunks.
+        assert flushed_before_manifest == [True]
+        restarted = ChunkStore(backups)
+        digest = ChunkStore.load_manifest(second)["files"][0]["chunks"][0]
+        assert restarted.reference_count(digest) == 2
+        restarted.discard(first)
+        assert restarted.restore(second, tmp_path / "restored") == 3
+
+    def test_restore_rejects_traversal(self, tmp_path):
+        backups = tmp_path / "backups"
+        backups.mkdir()
+        store = ChunkStore(backups)
+        manifest = backups / f"evil{MANIFEST_SUFFIX}"
+        manifest.write_text(
+            '{"version": 1, "files": [{"path": "../escape", "size": 0,'
+            ' "mode": 420, "mtime_ns": 0, "chunks": []}]}'
+        )
+        with pytest.raises(SecurityError):
+            store.restore(manifest, tmp_path / "target")
+        assert not (tmp_path / "escape").exists()
+
+
+@pytest.mark.asyncio
+async def test_incremental_file_service_round_trip(tmp_path):
+    source = _make_world(tmp_path / "server")
+    server = SimpleNamespace(id=1, name="s", directory_path=str(source))
+    backups = tmp_path / "backups"
+    backups.mkdir()
+    service = BackupFileService(backups, backup_mode="incremental")
+    assert service.archive_suffix == MANIFEST_SUFFIX
+
+    filename = await service.create_backup_file(server, 7, None)
+    manifest = backups / filename
+    assert service.backup_size(manifest) > manifest.stat().st_size
+
+    archive = await service.materialize_archive(manifest)
+    try:
+        with tarfile.open(archive, "r:gz") as tar:
+            assert "server.properties" in tar.getnames()
+    finally:
+        archive.unlink()
+
+    service.delete_backup_file(str(manifest))
+    assert not manifest.exists()
+    assert [p for p in service.chunk_store.objects_directory.rglob("*") if p.is_file()] == []
@@ -0,0 +1,96 @@
+"""Archive format tests for `BackupFileService` (create + restore)."""
+
+import gzip
+import tarfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from app.backups.application.file_service import (
+    BackupFileService,
+    last_archive_stats,
+)
+from app.core.archives import ARCHIVE_FORMAT_GZIP, ARCHIVE_FORMAT_ZSTD
+
+
+def _make_server(tmp_path: Path) -> SimpleNamespace:
+    server_dir = tmp_path / "server"
+    (server_dir / "world" / "region").mkdir(parents=True)
+    (server_dir / "world" / "region" / "r.0.0.mca").write_bytes(b"\x01\x02" * 300_000)
+    (server_dir / "server.properties").write_text("motd=hi\n")
+    return SimpleNamespace(id=1, name="s", directory_path=str(server_dir))
+
+
+async def _create_and_restore(tmp_path: Path, archive_format: str, suffix: str) -> Path:
+    server = _make_server(tmp_path)
+    backups_dir = tmp_path / "backups"
+    backups_dir.mkdir()
+    service = BackupFileService(
+        backups_dir, archive_format=archive_format, compression_threads=2
+    )
+    assert service.archive_suffix == suffix
+
+    filename = await service.create_backup_file(server, 7, None)
+    assert filename.endswith(suffix)
+    archive = backups_dir / filename
+
+    target = tmp_path / "restored"
+    service._extract_backup_to_directory(archive, target)
+    source = Path(server.directory_path)
+    for name in ("world/region/r.0.0.mca", "server.properties"):
+        assert (target / name).read_bytes() == (source / name).read_bytes()
+    return archive
+
+
+@pytest.mark.asyncio
+async def test_parallel_gzip_backup_round_trip(tmp_path):
+    archive = await _create_and_restore(tmp_path, ARCHIVE_FORMAT_GZIP, ".tar.gz")
+    # Plain gzip tooling can still read the archive.
+    assert gzip.decompress(archive.read_bytes())[257:262] == b"ustar"
+
+
+@pytest.mark.asyncio
+async def test_zstd_backup_round_trip(tmp_path):
+    pytest.importorskip("zstandard")
+    await _create_and_restore(tmp_path, ARCHIVE_FORMAT_ZSTD, ".tar.zst")
+
+
+@pytest.mark.asyncio
+async def test_progress_uses_previous_walk_as_estimate(tmp_path):
+    server = _make_server(tmp_path)
+    backups_dir = tmp_path / "backups"
+    backups_dir.mkdir()
+    service = BackupFileService(backups_dir, archive_format=ARCHIVE_FORMAT_GZIP)
+
+    first = []
+    await service.create_backup_file(server, 1, None, lambda *a: first.append(a))
+    # No earlier walk: totals track what has been processed so far.
+    assert first[0] == (0, 0, 0, 0)
+    assert first[-1] == (2, 2, 600_008, 600_008)
+
+    second = []
+    await service.create_backup_file(server, 2, None, lambda *a: second.append(a))
+    assert second[0] == (0, 2, 0, 600_008)
+
+    stats = last_archive_stats()
+    assert stats.files == 2 and stats.bytes == 600_008
+    assert stats.files_per_second > 0
+
+
+@pytest.mark.asyncio
+async def test_symlinks_are_archived_as_links(tmp_path):
+    server = _make_server(tmp_path)
+    server_dir = Path(server.directory_path)
+    (server_dir / "alias.properties").symlink_to("server.properties")
+    backups_dir = tmp_path / "backups"
+    backups_dir.mkdir()
+    service = BackupFileService(backups_dir, archive_format=ARCHIVE_FORMAT_GZIP)
+
+    filename = await service.create_backup_file(server, 1, None)
+
+    with tarfile.open(backups_dir / filename, "r:gz") as tar:
+        link = tar.getmember("alias.properties")
+        assert link.issym() and link.linkname == "server.properties"
+        regular = tar.getmember("server.properties")
+        assert regular.isfile() and regular.size == 8
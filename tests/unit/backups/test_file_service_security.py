@@ -62,7 +62,7 @@ class TestBackupServiceSecurity:
         touching the database. The verified invariant is unchanged —
         an upload containing a path-traversing tar entry must be
         rejected with `FileOperationException("Security validation
-        failed: ...")` from `TarExtractor.validate_archive_safety`.
+        failed: ...")` from the streaming upload validator.
         """
         from app.backups.application.service import BackupService
         from tests.unit.backups.fakes import (
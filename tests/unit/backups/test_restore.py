@@ -0,0 +1,230 @@
+"""Tests for staged, atomic backup restores."""
+
+import asyncio
+import io
+import tarfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from app.backups.application import restore
+from app.backups.application.file_service import BackupFileService
+from app.backups.application.restore import (
+    RESTORE_PROGRESS_TOPIC,
+    extract_archive,
+    normalize_restore_paths,
+    swap_into_place,
+)
+from app.core.event_bus import get_event_bus
+from app.core.exceptions import FileOperationException
+from app.core.security import SecurityError
+
+
+def _make_server(root: Path, marker: str) -> Path:
+    for dim in ("world/region", "world/DIM-1/region"):
+        (root / dim).mkdir(parents=True)
+        (root / dim / "r.0.0.mca").write_bytes(marker.encode() * 200_000)
+    (root / "server.properties").write_text(f"motd={marker}\n")
+    return root
+
+
+async def _backup(tmp_path: Path, source: Path, **kwargs) -> tuple:
+    backups = tmp_path / "backups"
+    backups.mkdir(exist_ok=True)
+    service = BackupFileService(backups, compression_threads=1, **kwargs)
+    server = SimpleNamespace(id=1, name="s", directory_path=str(source))
+    filename = await service.create_backup_file(server, 1, None)
+    return service, SimpleNamespace(id=1, file_path=str(backups / filename))
+
+
+async def _drain_removals() -> None:
+    from app.backups.application import file_service
+
+    await asyncio.gather(*list(file_service._background_removals))
+
+
+def _siblings(directory: Path) -> list:
+    return sorted(p.name for p in directory.parent.iterdir() if p.name != "backups")
+
+
+class TestRestorePaths:
+    def test_normalizes_and_collapses_nested_paths(self):
+        assert normalize_restore_paths(["./world/", "world/DIM-1", "logs"]) == [
+            "logs",
+            "world",
+        ]
+        assert normalize_restore_paths(None) is None
+
+    @pytest.mark.parametrize("path", ["/etc", "../x", "world/../../x", ".", ""])
+    def test_rejects_unsafe_paths(self, path):
+        with pytest.raises(SecurityError):
+            normalize_restore_paths([path])
+
+
+class TestExtractAndSwap:
+    def test_large_members_are_written_by_the_pool(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(restore, "PARALLEL_WRITE_THRESHOLD", 1024)
+        source = _make_server(tmp_path / "src", "a")
+        archive = tmp_path / "b.tar.gz"
+        with tarfile.open(archive, "w:gz") as tar:
+            tar.add(source, arcname=".")
+
+        calls = []
+        files, size = extract_archive(
+            archive, tmp_path / "out", progress=lambda f, b: calls.append((f, b))
+        )
+        assert files == 3
+        assert size == 2 * 200_000 + len("motd=a\n")
+        for name in ("world/region/r.0.0.mca", "world/DIM-1/region/r.0.0.mca"):
+            assert (tmp_path / "out" / name).read_bytes() == (source / name).read_bytes()
+        assert calls
+
+    def test_members_over_the_ceiling_are_streamed(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(restore, "PARALLEL_WRITE_THRESHOLD", 1024)
+        monkeypatch.setattr(restore, "PARALLEL_WRITE_MAX_SIZE", 100_000)
+        pooled = []
+        write_member = restore._write_member
+        monkeypatch.setattr(
+            restore,
+            "_write_member",
+            lambda destination, data, *args: (
+                pooled.append(destination.name),
+                write_member(destination, data, *args),
+            ),
+        )
+        source = _make_server(tmp_path / "src", "a")
+        (source / "mods").mkdir()
+        (source / "mods" / "pack.jar").write_bytes(b"m" * 50_000)
+        archive = tmp_path / "b.tar.gz"
+        with tarfile.open(archive, "w:gz") as tar:
+            tar.add(source, arcname=".")
+
+        files, _ = extract_archive(archive, tmp_path / "out")
+        assert files == 4
+        assert pooled == ["pack.jar"]
+        for name in ("world/region/r.0.0.mca", "mods/pack.jar"):
+            assert (tmp_path / "out" / name).read_bytes() == (source / name).read_bytes()
+
+    def test_subset_extraction(self, tmp_path):
+        source = _make_server(tmp_path / "src", "a")
+        archive = tmp_path / "b.tar.gz"
+        with tarfile.open(archive, "w:gz") as tar:
+            tar.add(source, arcname=".")
+
+        extract_archive(archive, tmp_path / "out", paths=["world/DIM-1"])
+        assert (tmp_path / "out/world/DIM-1/region/r.0.0.mca").exists()
+        assert not (tmp_path / "out/world/region").exists()
+        assert not (tmp_path / "out/server.properties").exists()
+
+    def test_rejects_links(self, tmp_path):
+        archive = tmp_path / "evil.tar.gz"
+        with tarfile.open(archive, "w:gz") as tar:
+            link = tarfile.TarInfo("passwd")
+            link.type = tarfile.SYMTYPE
+            link.linkname = "/etc/passwd"
+            tar.addfile(link)
+        with pytest.raises(SecurityError):
+            extract_archive(archive, tmp_path / "out")
+
+    def test_subset_swap_requires_paths_in_backup(self, tmp_path):
+        staging = tmp_path / "staging"
+        (staging / "world").mkdir(parents=True)
+        target = tmp_path / "server"
+        (target / "world").mkdir(parents=True)
+        with pytest.raises(FileNotFoundError):
+            swap_into_place(staging, target, ["world", "world_nether"])
+        assert (target / "world").exists()
+
+    def test_failed_subset_swap_rolls_back_moved_paths(self, tmp_path, monkeypatch):
+        staging = tmp_path / "staging"
+        target = tmp_path / "server"
+        for root, content in ((staging, b"backup"), (target, b"live")):
+            for name in ("world", "world_nether"):
+                (root / name).mkdir(parents=True)
+                (root / name / "level.dat").write_bytes(content)
+        rename = restore.os.rename
+
+        def failing_rename(source, destination):
+            if Path(source) == staging / "world_nether":
+                raise OSError("disk full")
+            rename(source, destination)
+
+        monkeypatch.setattr(restore.os, "rename", failing_rename)
+        with pytest.raises(OSError):
+            swap_into_place(staging, target, ["world", "world_nether"])
+
+        for name in ("world", "world_nether"):
+            assert (target / name / "level.dat").read_bytes() == b"live"
+            assert (staging / name / "level.dat").read_bytes() == b"backup"
+        leftovers = restore.stale_restore_directories(target)
+        assert not [p for p in leftovers if any(p.rglob("*.dat"))]
+
+
+class TestStagedRestore:
+    @pytest.mark.asyncio
+    async def test_full_restore_replaces_directory_and_cleans_up(self, tmp_path):
+        server_dir = _make_server(tmp_path / "server", "old")
+        service, backup = await _backup(tmp_path, server_dir)
+        (server_dir / "server.properties").write_text("motd=new\n")
+        (server_dir / "added-later.txt").write_text("x")
+
+        subscription = get_event_bus().subscribe(RESTORE_PROGRESS_TOPIC)
+        try:
+            await service.restore_backup_file(
+                backup, SimpleNamespace(id=1, directory_path=str(server_dir))
+            )
+            phases = [event.phase for event in subscription._events]
+        finally:
+            subscription.close()
+        await _drain_removals()
+
+        assert (server_dir / "server.properties").read_text() == "motd=old\n"
+        assert not (server_dir / "added-later.txt").exists()
+        # No `*_backup_<ts>`, staging or replaced trees are left behind.
+        assert _siblings(server_dir) == ["server"]
+        assert phases[0] == "started"
+        assert phases[-2:] == ["swapping", "completed"]
+
+    @pytest.mark.asyncio
+    async def test_subset_restore_only_touches_selected_paths(self, tmp_path):
+        server_dir = _make_server(tmp_path / "server", "old")
+        service, backup = await _backup(tmp_path, server_dir, backup_mode="incremental")
+        for name in ("world/region/r.0.0.mca", "world/DIM-1/region/r.0.0.mca"):
+            (server_dir / name).write_bytes(b"new")
+        (server_dir / "world/DIM-1/extra.dat").write_bytes(b"new")
+
+        await service.restore_backup_file(
+            backup,
+            SimpleNamespace(id=1, directory_path=str(server_dir)),
+            paths=["world/DIM-1"],
+        )
+        await _drain_removals()
+
+        assert (server_dir / "world/DIM-1/region/r.0.0.mca").read_bytes()[:3] == b"old"
+        assert not (server_dir / "world/DIM-1/extra.dat").exists()
+        assert (server_dir / "world/region/r.0.0.mca").read_bytes() == b"new"
+        assert _siblings(server_dir) == ["server"]
+
+    @pytest.mark.asyncio
+    async def test_failed_restore_leaves_server_untouched(self, tmp_path):
+        server_dir = _make_server(tmp_path / "server", "old")
+        backups = tmp_path / "backups"
+        backups.mkdir()
+        archive = backups / "evil.tar.gz"
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+            info = tarfile.TarInfo("../escape")
+            tar.addfile(info, io.BytesIO(b""))
+        archive.write_bytes(buffer.getvalue())
+        service = BackupFileService(backups)
+
+        with pytest.raises(FileOperationException):
+            await service.restore_backup_file(
+                SimpleNamespace(id=2, file_path=str(archive)),
+                SimpleNamespace(id=1, directory_path=str(server_dir)),
+            )
+        await _drain_removals()
+
+        assert (server_dir / "server.properties").read_text() == "motd=old\n"
+        assert _siblings(server_dir) == ["server"]
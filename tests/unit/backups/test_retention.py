@@ -0,0 +1,139 @@
+"""Unit tests for tiered backup retention (`app.backups.application.retention`)."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.backups.application.retention import (
+    BackupRetentionService,
+    RetentionPolicy,
+    select_prune_set,
+)
+from app.backups.domain.entities import RetentionCandidate
+from app.backups.models import BackupStatus, BackupType
+from tests.unit.backups.fakes import (
+    FakeBackupsUnitOfWork,
+    make_backup_entity,
+    make_schedule_entity,
+)
+
+NOW = datetime(2026, 3, 4, 12, 30, tzinfo=timezone.utc)  # a Wednesday
+
+
+def _hourly_candidates(hours: int, server_id: int = 1):
+    """One backup per hour going back ``hours`` hours, newest first."""
+    return [
+        RetentionCandidate(
+            id=i + 1,
+            server_id=server_id,
+            created_at=NOW - timedelta(hours=i),
+            file_path=f"b{i + 1}",
+            file_size=10,
+        )
+        for i in range(hours)
+    ]
+
+
+class TestSelectPruneSet:
+    def test_flat_policy_keeps_newest(self):
+        candidates = _hourly_candidates(5)
+        pruned = select_prune_set(candidates, RetentionPolicy(keep_last=3))
+        assert [c.id for c in pruned] == [4, 5]
+
+    def test_gfs_tiers_keep_one_backup_per_period(self):
+        candidates = _hourly_candidates(24 * 30)
+        policy = RetentionPolicy(hourly=24, daily=7, weekly=4)
+        kept = {c.id for c in candidates} - {
+            c.id for c in select_prune_set(candidates, policy)
+        }
+
+        kept_times = sorted((c.created_at for c in candidates if c.id in kept), reverse=True)
+        # The 24 newest hours, plus the newest backup of each older day
+        # and week not already covered.
+        assert kept_times[:24] == [NOW - timedelta(hours=i) for i in range(24)]
+        days = {t.date() for t in kept_times}
+        assert len(days) >= 7
+        weeks = {t.isocalendar()[:2] for t in kept_times}
+        assert len(weeks) == 4
+        assert len(kept) < 24 + 7 + 4
+
+    def test_naive_timestamps_are_treated_as_utc(self):
+        candidates = [
+            RetentionCandidate(1, 1, datetime(2026, 3, 4, 23, 0), "a", 1),
+            RetentionCandidate(2, 1, datetime(2026, 3, 4, 1, 0), "b", 1),
+            RetentionCandidate(3, 1, datetime(2026, 3, 3, 23, 0), "c", 1),
+        ]
+        pruned = select_prune_set(candidates, RetentionPolicy(daily=2))
+        assert [c.id for c in pruned] == [2]
+
+
+class TestBackupRetentionService:
+    @pytest.mark.asyncio
+    async def test_prune_applies_each_servers_policy_in_bulk(self):
+        uow = FakeBackupsUnitOfWork()
+        for server_id, base in ((1, 0), (2, 100)):
+            for i in range(6):
+                uow.backups.seed(
+                    make_backup_entity(
+                        id=base + i + 1,
+                        server_id=server_id,
+                        file_path=f"s{server_id}_{i}",
+                        file_size=1000,
+                        backup_type=BackupType.scheduled,
+                        status=BackupStatus.completed,
+                        created_at=NOW - timedelta(days=i),
+                    )
+                )
+        # Manual backups never count against retention.
+        uow.backups.seed(
+            make_backup_entity(
+                id=500,
+                server_id=1,
+                status=BackupStatus.completed,
+                created_at=NOW - timedelta(days=90),
+            )
+        )
+        uow.schedules.seed_schedule(make_schedule_entity(id=1, server_id=1, max_backups=2))
+        # Server 2 has no schedule: its backups are left alone.
+
+        deleted_files = []
+        service = BackupRetentionService(
+            uow_factory=lambda: uow, delete_file=deleted_files.append
+        )
+        report = await service.prune()
+
+        assert report.backups_deleted == 4
+        assert report.bytes_reclaimed == 4000
+        assert report.servers == 1
+        assert sorted(deleted_files) == [f"s1_{i}" for i in range(2, 6)]
+        assert await uow.backups.get(1) is not None
+        assert await uow.backups.get(500) is not None
+        assert await uow.backups.get(101) is not None
+
+    @pytest.mark.asyncio
+    async def test_rows_stay_when_their_file_cannot_be_deleted(self):
+        uow = FakeBackupsUnitOfWork()
+        for i in range(3):
+            uow.backups.seed(
+                make_backup_entity(
+                    id=i + 1,
+                    server_id=1,
+                    file_path=f"b{i + 1}",
+                    backup_type=BackupType.scheduled,
+                    status=BackupStatus.completed,
+                    created_at=NOW - timedelta(days=i),
+                )
+            )
+        uow.schedules.seed_schedule(make_schedule_entity(id=1, server_id=1, max_backups=1))
+
+        def delete_file(path):
+            if path == "b2":
+                raise PermissionError(path)
+
+        report = await BackupRetentionService(
+            uow_factory=lambda: uow, delete_file=delete_file
+        ).prune()
+
+        assert (report.backups_deleted, report.failed) == (1, 1)
+        assert await uow.backups.get(2) is not None
+        assert await uow.backups.get(3) is None
@@ -15,6 +15,7 @@ from pathlib import Path
 
 import pytest
 
+from app.backups.application.chunk_store import MANIFEST_SUFFIX, get_chunk_store
 from app.backups.application.scheduler import BackupSchedulerService
 from tests.unit.backups.fakes import FakeBackupsUnitOfWork, FakeServerReadPort
 
@@ -167,6 +168,36 @@ class TestSweepRobustness:
         assert result == {"pending_deleted": 1, "failed_deleted": 1}
 
 
+class TestSweepManifests:
+    """Orphaned incremental-backup manifests release their chunks."""
+
+    def test_stale_pending_manifest_releases_its_chunks(self, tmp_path):
+        source = tmp_path / "server"
+        source.mkdir()
+        (source / "level.dat").write_bytes(os.urandom(64 * 1024))
+        store = get_chunk_store(tmp_path)
+        manifest = tmp_path / ".pending" / f".pending-1{MANIFEST_SUFFIX}"
+        manifest.parent.mkdir()
+        store.snapshot(source, manifest)
+        old = manifest.stat().st_mtime - 25 * 3600
+        os.utime(manifest, (old, old))
+
+        result = _make_scheduler(tmp_path).sweep_stale_pending_and_failed()
+
+        assert result["pending_deleted"] == 1
+        assert not manifest.exists()
+        assert [p for p in store.objects_directory.rglob("*") if p.is_file()] == []
+
+    def test_unreadable_manifest_is_removed(self, tmp_path):
+        truncated = tmp_path / ".failed" / f"backup_1_2_x{MANIFEST_SUFFIX}"
+        _write_with_age(truncated, age_seconds=31 * 24 * 3600)
+
+        result = _make_scheduler(tmp_path).sweep_stale_pending_and_failed()
+
+        assert result["failed_deleted"] == 1
+        assert not truncated.exists()
+
+
 class TestConfigValidators:
     """Issue #284 env-var validators in `Settings`."""
 
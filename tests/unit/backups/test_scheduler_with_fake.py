@@ -1,23 +1,27 @@
 """Unit tests for `BackupSchedulerService` using in-memory fakes.
 
 Covers schedule CRUD, cache invalidation (D-8), `list_due` with
-deterministic clock injection (D-12), and the atomic
-schedule+log behaviour (D-5.4 disclosed fix).
+deterministic clock injection (D-12), the atomic
+schedule+log behaviour (D-5.4 disclosed fix), and the due-time
+queue that drives scheduled execution and retention.
 """
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 
 import pytest
 
+from app.backups.application.retention import BackupRetentionService
 from app.backups.application.scheduler import BackupSchedulerService
 from app.backups.domain.exceptions import (
     BackupScheduleAlreadyExistsError,
     BackupScheduleNotFoundError,
 )
-from app.backups.models import ScheduleAction
+from app.backups.models import BackupStatus, BackupType, ScheduleAction
 from tests.unit.backups.fakes import (
     FakeBackupsUnitOfWork,
     FakeServerReadPort,
+    make_backup_entity,
     make_schedule_entity,
 )
 
@@ -356,3 +360,232 @@ class TestShouldExecuteBackup:
         ok, reason = await scheduler._should_execute_backup(schedule)
         assert ok is False
         assert "Failed to get server status" in reason
+
+
+# ---------------------------------------------------------------------------
+# Scheduler loop: due-time queue, execution and retention
+# ---------------------------------------------------------------------------
+
+
+class _FakeBackupService:
+    """Records scheduled backups in a `FakeBackupRepository`."""
+
+    def __init__(self, uow: FakeBackupsUnitOfWork, fail: bool = False):
+        self._backups = uow.backups
+        self._fail = fail
+        self.created: list = []
+        self.deleted_files: list = []
+
+    async def create_scheduled_backup(self, server_id):
+        if self._fail:
+            return None
+        entity = self._backups.seed(
+            make_backup_entity(
+                id=100 + len(self.created),
+                server_id=server_id,
+                backup_type=BackupType.scheduled,
+                status=BackupStatus.completed,
+                created_at=FROZEN_NOW,
+            )
+        )
+        self.created.append(entity.id)
+        return entity
+
+
+def _make_running_scheduler(uow, server_read, service, *, clock=lambda: FROZEN_NOW):
+    # Tests that never run a backup pass no service; they get the default
+    # retention wiring, which only deletes files when a prune runs.
+    retention = None
+    if service is not None:
+        retention = BackupRetentionService(
+            uow_factory=lambda: uow, delete_file=service.deleted_files.append
+        )
+    return BackupSchedulerService(
+        uow_factory=lambda: uow,
+        server_read_factory=lambda: server_read,
+        clock=clock,
+        backup_service_factory=lambda: service,
+        jitter_seconds=0,
+        retention=retention,
+    )
+
+
+async def _run_due(scheduler: BackupSchedulerService) -> None:
+    await scheduler._refresh_queue()
+    await scheduler._dispatch_due()
+    await asyncio.gather(*scheduler._in_flight.values())
+
+
+class TestDueQueue:
+    def test_next_backup_after_skips_missed_slots(self, uow, server_read):
+        scheduler = _make_scheduler(uow, server_read)
+        schedule = make_schedule_entity(
+            id=1,
+            server_id=1,
+            interval_hours=6,
+            next_backup_at=FROZEN_NOW - timedelta(hours=13),
+        )
+        assert scheduler._next_backup_after(schedule, FROZEN_NOW) == (
+            FROZEN_NOW + timedelta(hours=5)
+        )
+
+    def test_jitter_is_fixed_per_server_and_bounded(self, uow, server_read):
+        scheduler = BackupSchedulerService(
+            uow_factory=lambda: uow,
+            server_read_factory=lambda: server_read,
+            jitter_seconds=300,
+        )
+        offsets = {scheduler._jitter(i) for i in range(1, 20)}
+        assert scheduler._jitter(7) == scheduler._jitter(7)
+        assert all(timedelta(0) <= o <= timedelta(seconds=300) for o in offsets)
+        assert len(offsets) > 1
+
+    @pytest.mark.asyncio
+    async def test_queue_orders_by_due_time_and_drops_stale_entries(
+        self, uow, server_read
+    ):
+        server_read.seed(id=1)
+        server_read.seed(id=2)
+        scheduler = _make_running_scheduler(uow, server_read, None)
+        await scheduler.create_schedule(server_id=1, interval_hours=6, max_backups=3)
+        await scheduler.create_schedule(server_id=2, interval_hours=2, max_backups=3)
+        assert scheduler._peek_next() == FROZEN_NOW + timedelta(hours=2)
+
+        await scheduler.update_schedule(server_id=2, enabled=False)
+        assert scheduler._peek_next() == FROZEN_NOW + timedelta(hours=6)
+        await scheduler.delete_schedule(server_id=1)
+        assert scheduler._peek_next() is None
+
+
+class TestScheduledExecution:
+    @pytest.mark.asyncio
+    async def test_due_schedule_runs_and_advances(self, uow, server_read):
+        uow.schedules.seed_schedule(
+            make_schedule_entity(
+                id=1,
+                server_id=1,
+                interval_hours=6,
+                only_when_running=False,
+                next_backup_at=FROZEN_NOW - timedelta(minutes=1),
+            )
+        )
+        service = _FakeBackupService(uow)
+        scheduler = _make_running_scheduler(uow, server_read, service)
+
+        await _run_due(scheduler)
+
+        assert service.created == [100]
+        schedule = await uow.schedules.find_by_server(1)
+        assert schedule.last_backup_at == FROZEN_NOW
+        assert schedule.next_backup_at == FROZEN_NOW + timedelta(hours=6, minutes=-1)
+        logs = await uow.schedules.list_logs_for_server(1, 1, 10)
+        assert logs[0].action == ScheduleAction.executed
+        # Requeued at the new due time.
+        assert scheduler._peek_next() == schedule.next_backup_at
+
+    @pytest.mark.asyncio
+    async def test_not_running_server_is_skipped_and_advanced(
+        self, uow, server_read, monkeypatch
+    ):
+        from app.servers.models import ServerStatus
+
+        monkeypatch.setattr(
+            "app.backups.application.scheduler.minecraft_server_manager.get_server_status",
+            lambda _server_id: ServerStatus.stopped,
+        )
+        uow.schedules.seed_schedule(
+            make_schedule_entity(
+                id=1,
+                server_id=1,
+                interval_hours=6,
+                only_when_running=True,
+                next_backup_at=FROZEN_NOW,
+            )
+        )
+        service = _FakeBackupService(uow)
+        scheduler = _make_running_scheduler(uow, server_read, service)
+
+        await _run_due(scheduler)
+
+        assert service.created == []
+        schedule = await uow.schedules.find_by_server(1)
+        assert schedule.last_backup_at is None
+        assert schedule.next_backup_at == FROZEN_NOW + timedelta(hours=6)
+        logs = await uow.schedules.list_logs_for_server(1, 1, 10)
+        assert logs[0].action == ScheduleAction.skipped
+        assert "not running" in logs[0].reason.lower()
+
+    @pytest.mark.asyncio
+    async def test_retention_prunes_oldest_scheduled_backups(self, uow, server_read):
+        for i in range(4):
+            uow.backups.seed(
+                make_backup_entity(
+                    id=i + 1,
+                    server_id=1,
+                    file_path=f"backup_{i + 1}.tar.gz",
+                    backup_type=BackupType.scheduled,
+                    status=BackupStatus.completed,
+                    created_at=FROZEN_NOW - timedelta(days=4 - i),
+                )
+            )
+        manual = uow.backups.seed(
+            make_backup_entity(
+                id=50,
+                server_id=1,
+                status=BackupStatus.completed,
+                created_at=FROZEN_NOW - timedelta(days=10),
+            )
+        )
+        uow.schedules.seed_schedule(
+            make_schedule_entity(
+                id=1,
+                server_id=1,
+                max_backups=3,
+                only_when_running=False,
+                next_backup_at=FROZEN_NOW,
+            )
+        )
+        service = _FakeBackupService(uow)
+        scheduler = _make_running_scheduler(uow, server_read, service)
+
+        await _run_due(scheduler)
+
+        # Five scheduled backups now exist; the two oldest go.
+        assert sorted(service.deleted_files) == ["backup_1.tar.gz", "backup_2.tar.gz"]
+        assert await uow.backups.get(1) is None
+        assert await uow.backups.get(2) is None
+        assert await uow.backups.get(3) is not None
+        assert await uow.backups.get(manual.id) is not None
+        logs = await uow.schedules.list_logs_for_server(1, 1, 10)
+        assert "pruned 2 old backup(s)" in logs[0].reason
+
+    @pytest.mark.asyncio
+    async def test_loop_sleeps_until_due_then_runs(self, uow, server_read, tmp_path):
+        uow.schedules.seed_schedule(
+            make_schedule_entity(
+                id=1,
+                server_id=1,
+                interval_hours=1,
+                only_when_running=False,
+                next_backup_at=datetime.now(timezone.utc) + timedelta(seconds=0.2),
+            )
+        )
+        service = _FakeBackupService(uow)
+        scheduler = BackupSchedulerService(
+            uow_factory=lambda: uow,
+            server_read_factory=lambda: server_read,
+            backup_service_factory=lambda: service,
+            backups_directory=tmp_path,
+            jitter_seconds=0,
+        )
+        await scheduler.start_scheduler()
+        try:
+            await asyncio.sleep(0.05)
+            assert service.created == []
+            for _ in range(50):
+                if service.created:
+                    break
+                await asyncio.sleep(0.05)
+            assert len(service.created) == 1
+        finally:
+            await scheduler.stop_scheduler()
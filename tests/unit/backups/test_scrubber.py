@@ -0,0 +1,153 @@
+"""Unit tests for `BackupScrubberService` (background checksum re-verification)."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from app.backups.application.chunk_store import MANIFEST_SUFFIX, get_chunk_store
+from app.backups.application.scrubber import BackupScrubberService, last_scrub_stats
+from app.backups.models import BackupStatus
+from tests.unit.backups.fakes import FakeBackupsUnitOfWork, make_backup_entity
+
+
+def _write(path: Path, data: bytes) -> str:
+    path.write_bytes(data)
+    return hashlib.sha256(data).hexdigest()
+
+
+async def test_scrub_once_classifies_backups(tmp_path: Path) -> None:
+    uow = FakeBackupsUnitOfWork()
+    good = tmp_path / "good.tar.gz"
+    rotten = tmp_path / "rotten.tar.gz"
+    legacy = tmp_path / "legacy.tar.gz"
+    good_sum = _write(good, b"good")
+    rotten_sum = _write(rotten, b"original")
+    rotten.write_bytes(b"origina1")
+    legacy_sum = _write(legacy, b"legacy")
+    for id, path, checksum in (
+        (1, good, good_sum),
+        (2, rotten, rotten_sum),
+        (3, legacy, None),
+        (4, tmp_path / "gone.tar.gz", "0" * 64),
+    ):
+        uow.backups.seed(
+            make_backup_entity(
+                id=id,
+                server_id=1,
+                file_path=str(path),
+                status=BackupStatus.completed,
+                checksum=checksum,
+            )
+        )
+    # Not completed: never scrubbed.
+    uow.backups.seed(make_backup_entity(id=5, server_id=1, file_path=str(good)))
+
+    scrubber = BackupScrubberService(
+        uow_factory=lambda: uow, interval_seconds=0, max_bytes_per_second=0
+    )
+    try:
+        stats = await scrubber.scrub_once()
+    finally:
+        await scrubber.stop()
+
+    assert (stats.verified, stats.mismatched, stats.missing, stats.backfilled) == (
+        1,
+        1,
+        1,
+        1,
+    )
+    assert sorted(stats.corrupt_backup_ids) == [2, 4]
+    assert stats.bytes_read == len(b"good") + len(b"origina1") + len(b"legacy")
+    assert (await uow.backups.get(3)).checksum == legacy_sum
+    assert last_scrub_stats() is stats
+
+
+@pytest.mark.parametrize("damage", [None, "corrupt", "missing"])
+async def test_scrub_once_reads_incremental_backup_chunks(
+    tmp_path: Path, damage: str | None
+) -> None:
+    source = tmp_path / "server"
+    source.mkdir()
+    (source / "a.txt").write_bytes(b"a" * 1000)
+    (source / "b.txt").write_bytes(b"b" * 1000)
+    backups = tmp_path / "backups"
+    backups.mkdir()
+    store = get_chunk_store(backups)
+    uow = FakeBackupsUnitOfWork()
+    for id in (1, 2):
+        manifest = backups / f"backup_1_{id}{MANIFEST_SUFFIX}"
+        store.snapshot(source, manifest)
+        uow.backups.seed(
+            make_backup_entity(
+                id=id,
+                server_id=1,
+                file_path=str(manifest),
+                status=BackupStatus.completed,
+                checksum=hashlib.sha256(manifest.read_bytes()).hexdigest(),
+            )
+        )
+    chunk = store._object_path(store.load_manifest(manifest)["files"][0]["chunks"][0])
+    if damage == "missing":
+        chunk.unlink()
+    elif damage == "corrupt":
+        chunk.write_bytes(chunk.read_bytes()[:-4] + b"0000")
+
+    scrubber = BackupScrubberService(
+        uow_factory=lambda: uow, interval_seconds=0, max_bytes_per_second=0
+    )
+    try:
+        stats = await scrubber.scrub_once()
+    finally:
+        await scrubber.stop()
+
+    if damage is None:
+        assert stats.verified == 2
+        # Both manifests plus the two chunks they share, read once.
+        manifests = sum(p.stat().st_size for p in backups.glob(f"*{MANIFEST_SUFFIX}"))
+        chunks = sum(p.stat().st_size for p in store.objects_directory.rglob("*/*"))
+        assert stats.bytes_read == manifests + chunks
+        return
+    assert stats.verified == 0
+    assert (stats.mismatched, stats.missing) == (
+        (2, 0) if damage == "corrupt" else (0, 2)
+    )
+    assert sorted(stats.corrupt_backup_ids) == [1, 2]
+
+
+async def test_start_is_a_no_op_when_disabled() -> None:
+    scrubber = BackupScrubberService(
+        uow_factory=lambda: FakeBackupsUnitOfWork(), interval_seconds=0
+    )
+    await scrubber.start()
+    assert scrubber.is_running is False
+
+
+async def test_stop_abandons_a_hash_in_progress(tmp_path: Path) -> None:
+    uow = FakeBackupsUnitOfWork()
+    large = tmp_path / "large.tar.gz"
+    checksum = _write(large, b"\0" * (8 * 1024 * 1024))
+    uow.backups.seed(
+        make_backup_entity(
+            id=1,
+            server_id=1,
+            file_path=str(large),
+            status=BackupStatus.completed,
+            checksum=checksum,
+        )
+    )
+    # Throttled to 1 MiB/s, hashing the whole file would take ~8 seconds.
+    scrubber = BackupScrubberService(
+        uow_factory=lambda: uow, interval_seconds=0, max_bytes_per_second=1024 * 1024
+    )
+    scrub = asyncio.create_task(scrubber.scrub_once())
+    await asyncio.sleep(0.2)
+
+    await scrubber.stop()
+    stats = await asyncio.wait_for(scrub, timeout=2)
+
+    assert stats.verified == 0
+    assert stats.bytes_read < large.stat().st_size
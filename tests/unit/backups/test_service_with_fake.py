@@ -181,7 +181,12 @@ class TestCreateBackup:
         # Stub the tar.gz write to emit a file at the *caller-supplied*
         # temp path (atomic-rename pattern: write_backup_file_to takes
         # the target path as a parameter).
+        during_write = {}
+
         async def fake_write(server, target_path, progress_callback=None):
+            # Archiving runs after the reservation was committed.
+            during_write["committed"] = uow.committed
+            during_write["row"] = await uow.backups.get(1)
             target_path.write_bytes(b"fake-data")
 
         svc._file_service.write_backup_file_to = fake_write
@@ -194,7 +199,10 @@ class TestCreateBackup:
         assert entity is not None
         assert entity.status == BackupStatus.completed
         assert entity.file_size > 0
-        assert uow.committed == 1
+        # Two short transactions: reserve, then finalise.
+        assert uow.committed == 2
+        assert during_write["committed"] == 1
+        assert during_write["row"].status == BackupStatus.creating
         # Atomic-rename promoted the temp file into the canonical
         # backups directory.
         from pathlib import Path
@@ -238,3 +246,59 @@ class TestCreateBackup:
         pending_dir = tmp_backup_dir / ".pending"
         if pending_dir.exists():
             assert list(pending_dir.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_write_failure_marks_reserved_row_failed(
+        self, uow, server_read, tmp_backup_dir, monkeypatch
+    ):
+        server_read.seed(id=1, directory_path=str(tmp_backup_dir / "src"))
+        svc = _make_service(uow, server_read, tmp_backup_dir)
+
+        async def fake_write(server, target_path, progress_callback=None):
+            target_path.write_bytes(b"partial")
+            raise RuntimeError("disk full")
+
+        svc._file_service.write_backup_file_to = fake_write
+        monkeypatch.setattr(svc, "_log_running_server_warning", lambda sid: None)
+
+        with pytest.raises(RuntimeError, match="disk full"):
+            await svc.create_backup(server_id=1, name="b")
+
+        row = await uow.backups.get(1)
+        assert row.status == BackupStatus.failed
+        assert list((tmp_backup_dir / ".pending").iterdir()) == []
+
+
+class TestRecoverInterruptedBackups:
+    @pytest.mark.asyncio
+    async def test_creating_rows_are_failed_and_temp_files_removed(
+        self, uow, server_read, tmp_backup_dir
+    ):
+        svc = _make_service(uow, server_read, tmp_backup_dir)
+        pending = tmp_backup_dir / ".pending"
+        pending.mkdir()
+        partial = pending / ".pending-abc.tar.gz"
+        partial.write_bytes(b"partial")
+        finished = tmp_backup_dir / "backup_1_2_x.tar.gz"
+        finished.write_bytes(b"done")
+        uow.backups.seed(
+            make_backup_entity(
+                id=1, server_id=1, status=BackupStatus.creating, file_path=str(partial)
+            )
+        )
+        uow.backups.seed(
+            make_backup_entity(
+                id=2,
+                server_id=1,
+                status=BackupStatus.completed,
+                file_path=str(finished),
+            )
+        )
+
+        assert await svc.recover_interrupted_backups() == 1
+
+        assert (await uow.backups.get(1)).status == BackupStatus.failed
+        assert (await uow.backups.get(2)).status == BackupStatus.completed
+        assert not partial.exists()
+        assert finished.exists()
+        assert await svc.recover_interrupted_backups() == 0
@@ -0,0 +1,144 @@
+"""Unit tests for app.core.archives (backup archive writers and readers)."""
+
+import gzip
+import io
+import os
+import tarfile
+
+import pytest
+
+from app.core.archives import (
+    ARCHIVE_FORMAT_GZIP,
+    ARCHIVE_FORMAT_ZSTD,
+    ArchiveFormatError,
+    ParallelGzipWriter,
+    archive_suffix,
+    detect_archive_format,
+    open_archive_writer,
+    open_tar_archive,
+)
+
+
+def _payload() -> bytes:
+    # Incompressible and highly repetitive stretches, spanning many blocks.
+    return os.urandom(150_000) + b"minecraft:stone " * 40_000 + os.urandom(7)
+
+
+class TestParallelGzipWriter:
+    def test_output_is_a_single_standard_gzip_member(self):
+        data = _payload()
+        out = io.BytesIO()
+        writer = ParallelGzipWriter(out, level=6, threads=4, block_size=64 * 1024)
+        for i in range(0, len(data), 10_000):
+            writer.write(data[i : i + 10_000])
+        assert writer.tell() == len(data)
+        writer.close()
+
+        compressed = out.getvalue()
+        assert gzip.decompress(compressed) == data
+        # The dictionary priming keeps the ratio close to one zlib stream.
+        assert len(compressed) < len(gzip.compress(data, 6)) * 1.05
+
+    def test_empty_input(self):
+        out = io.BytesIO()
+        writer = ParallelGzipWriter(out, threads=2)
+        writer.close()
+        assert gzip.decompress(out.getvalue()) == b""
+
+    def test_write_after_close_raises(self):
+        writer = ParallelGzipWriter(io.BytesIO(), threads=1)
+        writer.close()
+        with pytest.raises(ValueError):
+            writer.write(b"x")
+
+
+def _round_trip(tmp_path, archive_format, suffix):
+    source = tmp_path / "src"
+    (source / "world" / "region").mkdir(parents=True)
+    files = {
+        "world/region/r.0.0.mca": _payload(),
+        "server.properties": b"motd=hello\n",
+    }
+    for name, content in files.items():
+        (source / name).write_bytes(content)
+
+    target = tmp_path / f"backup{suffix}"
+    with open_archive_writer(target, archive_format, level=3, threads=2) as tar:
+        for name in files:
+            tar.add(source / name, arcname=name)
+
+    assert detect_archive_format(target) == archive_format
+    with open_tar_archive(target) as tar:
+        extracted = {
+            member.name: tar.extractfile(member).read() for member in tar if member.isfile()
+        }
+    assert extracted == files
+    return target
+
+
+def test_gzip_round_trip_is_readable_by_tarfile(tmp_path):
+    target = _round_trip(tmp_path, ARCHIVE_FORMAT_GZIP, ".tar.gz")
+    with tarfile.open(target, "r:gz") as tar:
+        assert sorted(tar.getnames()) == ["server.properties", "world/region/r.0.0.mca"]
+
+
+def test_zstd_round_trip(tmp_path):
+    pytest.importorskip("zstandard")
+    _round_trip(tmp_path, ARCHIVE_FORMAT_ZSTD, ".tar.zst")
+
+
+def test_zstd_without_package_is_reported(tmp_path, monkeypatch):
+    monkeypatch.setattr("app.core.archives.zstandard", None)
+    with pytest.raises(ArchiveFormatError):
+        with open_archive_writer(tmp_path / "x.tar.zst", ARCHIVE_FORMAT_ZSTD):
+            pass
+
+    zst = tmp_path / "y.tar.zst"
+    zst.write_bytes(b"\x28\xb5\x2f\xfd" + b"\0" * 16)
+    with pytest.raises(ArchiveFormatError):
+        with open_tar_archive(zst):
+            pass
+
+
+def test_unknown_formats_are_rejected(tmp_path):
+    with pytest.raises(ArchiveFormatError):
+        with open_archive_writer(tmp_path / "x.tar.xz", "tar.xz"):
+            pass
+
+    junk = tmp_path / "junk.tar.gz"
+    junk.write_bytes(b"PK\x03\x04 not a tarball")
+    with pytest.raises(ArchiveFormatError):
+        detect_archive_format(junk)
+
+
+def test_archive_suffix():
+    from pathlib import Path
+
+    assert archive_suffix(Path("a.TAR.GZ")) == ".tar.gz"
+    assert archive_suffix(Path("a.tgz")) == ".tgz"
+    assert archive_suffix(Path("a.tar.zst")) == ".tar.zst"
+    assert archive_suffix(Path("a.zip")) is None
+
+
+def test_settings_reject_zstd_format_without_package(monkeypatch):
+    from app.core.config import Settings
+
+    monkeypatch.setattr("app.core.archives.zstandard", None)
+    with pytest.raises(ValueError, match="BACKUP_ARCHIVE_FORMAT"):
+        Settings(
+            SECRET_KEY="a" * 32,
+            DATABASE_URL="sqlite:///./x.db",
+            BACKUP_ARCHIVE_FORMAT=ARCHIVE_FORMAT_ZSTD,
+        )
+
+
+def test_settings_accept_zstd_format_with_package():
+    pytest.importorskip("zstandard")
+    from app.core.config import Settings
+
+    s = Settings(
+        SECRET_KEY="a" * 32,
+        DATABASE_URL="sqlite:///./x.db",
+        BACKUP_ARCHIVE_FORMAT=ARCHIVE_FORMAT_ZSTD,
+    )
+    assert s.BACKUP_ARCHIVE_FORMAT == ARCHIVE_FORMAT_ZSTD
@@ -0,0 +1,63 @@
+"""Unit tests for app.core.checksums (streaming backup archive digests)."""
+
+import hashlib
+import io
+
+import pytest
+
+from app.core.archives import ARCHIVE_FORMAT_GZIP, open_archive_writer, open_tar_archive
+from app.core.checksums import (
+    ChecksumMismatchError,
+    HashingReader,
+    HashingWriter,
+    file_checksum,
+)
+
+
+def test_hashing_writer_hashes_what_it_writes():
+    out = io.BytesIO()
+    writer = HashingWriter(out)
+    writer.write(b"abc")
+    writer.write(b"def")
+    assert out.getvalue() == b"abcdef"
+    assert writer.hexdigest() == hashlib.sha256(b"abcdef").hexdigest()
+
+
+def test_hashing_reader_verify_consumes_the_rest():
+    data = b"x" * 10_000
+    reader = HashingReader(io.BytesIO(data))
+    reader.read(10)
+    reader.verify(hashlib.sha256(data).hexdigest())
+    with pytest.raises(ChecksumMismatchError):
+        HashingReader(io.BytesIO(data)).verify("0" * 64)
+
+
+def test_archive_writer_digest_matches_file(tmp_path):
+    source = tmp_path / "level.dat"
+    source.write_bytes(b"minecraft" * 1000)
+    archive = tmp_path / "backup.tar.gz"
+    hasher = hashlib.sha256()
+    with open_archive_writer(archive, ARCHIVE_FORMAT_GZIP, hasher=hasher) as tar:
+        tar.add(source, arcname="level.dat")
+
+    assert hasher.hexdigest() == file_checksum(archive)
+    with open_tar_archive(archive, hasher.hexdigest()) as tar:
+        assert [m.name for m in tar] == ["level.dat"]
+
+
+def test_open_tar_archive_rejects_corrupted_archive(tmp_path):
+    source = tmp_path / "level.dat"
+    source.write_bytes(b"minecraft")
+    archive = tmp_path / "backup.tar.gz"
+    with open_archive_writer(archive, ARCHIVE_FORMAT_GZIP) as tar:
+        tar.add(source, arcname="level.dat")
+    checksum = file_checksum(archive)
+    # Tamper with the gzip header's mtime field: still a readable archive.
+    data = bytearray(archive.read_bytes())
+    data[4] ^= 0xFF
+    archive.write_bytes(bytes(data))
+
+    with pytest.raises(ChecksumMismatchError):
+        with open_tar_archive(archive, checksum) as tar:
+            for _ in tar:
+                pass
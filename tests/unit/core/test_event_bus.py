@@ -0,0 +1,61 @@
+"""Unit tests for app.core.event_bus (in-process pub/sub)."""
+
+import asyncio
+
+import pytest
+
+from app.core.event_bus import EventBus, get_event_bus
+
+
+@pytest.mark.asyncio
+async def test_events_fan_out_to_every_subscriber_in_order():
+    bus = EventBus()
+    first = bus.subscribe("status")
+    second = bus.subscribe("status")
+    other = bus.subscribe("other")
+
+    assert bus.publish("status", 1) == 2
+    assert bus.publish("status", 2) == 2
+
+    assert [await first.get(), await first.get()] == [1, 2]
+    assert [await second.get(), await second.get()] == [1, 2]
+    assert len(other) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_waits_for_next_event():
+    bus = EventBus()
+    subscription = bus.subscribe("status")
+    waiter = asyncio.create_task(subscription.get())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    bus.publish("status", "running")
+    assert await asyncio.wait_for(waiter, 1) == "running"
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_drops_oldest_events():
+    bus = EventBus(subscriber_queue_size=3)
+    subscription = bus.subscribe("status")
+    for i in range(5):
+        bus.publish("status", i)
+
+    assert subscription.dropped == 2
+    assert [await subscription.get() for _ in range(3)] == [2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_close_unsubscribes():
+    bus = EventBus()
+    subscription = bus.subscribe("status")
+    assert bus.subscriber_count("status") == 1
+
+    subscription.close()
+    assert subscription.closed
+    assert bus.subscriber_count("status") == 0
+    assert bus.publish("status", 1) == 0
+
+
+def test_get_event_bus_is_a_singleton():
+    assert get_event_bus() is get_event_bus()
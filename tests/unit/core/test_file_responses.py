@@ -0,0 +1,139 @@
+"""Unit tests for app.core.file_responses (ranged, zero-copy downloads)."""
+
+import asyncio
+import os
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Route
+
+from app.core.file_responses import RangeFileResponse, stat_etag
+
+SPARSE_SIZE = 2 * 1024 * 1024 * 1024
+
+
+def _client(path, **kwargs) -> httpx.AsyncClient:
+    async def endpoint(request):
+        return RangeFileResponse(path, filename="backup.tar.gz", **kwargs)
+
+    app = Starlette(routes=[Route("/download", endpoint)])
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+@pytest.fixture
+def sparse_file(tmp_path):
+    """A 2 GiB sparse file with a distinct marker every 256 MiB."""
+    path = tmp_path / "big.tar.gz"
+    with open(path, "wb") as f:
+        f.truncate(SPARSE_SIZE)
+        for i in range(8):
+            os.pwrite(f.fileno(), f"marker-{i}".encode(), i * SPARSE_SIZE // 8)
+        os.pwrite(f.fileno(), b"tail", SPARSE_SIZE - 4)
+    return path
+
+
+@pytest.mark.asyncio
+async def test_parallel_ranges_of_sparse_2gb_file(sparse_file):
+    part = SPARSE_SIZE // 8
+    window = 2 * 1024 * 1024 + 123  # spans several 1 MiB reads
+
+    async with _client(sparse_file) as client:
+        responses = await asyncio.gather(
+            *(
+                client.get(
+                    "/download",
+                    headers={"Range": f"bytes={i * part}-{i * part + window - 1}"},
+                )
+                for i in range(8)
+            ),
+            client.get("/download", headers={"Range": "bytes=-4"}),
+        )
+
+    etags = {r.headers["etag"] for r in responses}
+    assert len(etags) == 1
+    for i, response in enumerate(responses[:8]):
+        assert response.status_code == 206
+        assert response.headers["content-range"] == (
+            f"bytes {i * part}-{i * part + window - 1}/{SPARSE_SIZE}"
+        )
+        assert len(response.content) == window
+        assert response.content.startswith(f"marker-{i}".encode())
+        assert response.content[16:] == bytes(window - 16)
+    tail = responses[8]
+    assert tail.content == b"tail"
+    assert tail.headers["content-range"] == (
+        f"bytes {SPARSE_SIZE - 4}-{SPARSE_SIZE - 1}/{SPARSE_SIZE}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_strong_etag_if_range_and_if_none_match(tmp_path):
+    path = tmp_path / "backup.tar.gz"
+    path.write_bytes(b"0123456789")
+
+    async with _client(path, etag="abc123") as client:
+        full = await client.get("/download")
+        assert full.status_code == 200
+        assert full.headers["etag"] == '"abc123"'
+        assert full.headers["accept-ranges"] == "bytes"
+        assert full.content == b"0123456789"
+
+        resumed = await client.get(
+            "/download", headers={"Range": "bytes=4-", "If-Range": '"abc123"'}
+        )
+        assert resumed.status_code == 206
+        assert resumed.content == b"456789"
+
+        # The file changed since the partial download: send all of it.
+        stale = await client.get(
+            "/download", headers={"Range": "bytes=4-", "If-Range": '"other"'}
+        )
+        assert stale.status_code == 200
+        assert stale.content == b"0123456789"
+
+        cached = await client.get("/download", headers={"If-None-Match": '"abc123"'})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == '"abc123"'
+
+
+@pytest.mark.asyncio
+async def test_default_etag_tracks_the_file(tmp_path):
+    path = tmp_path / "backup.tar.gz"
+    path.write_bytes(b"x")
+
+    async with _client(path) as client:
+        response = await client.get("/download")
+
+    assert response.headers["etag"] == f'"{stat_etag(os.stat(path))}"'
+
+
+@pytest.mark.asyncio
+async def test_zerocopy_extension_hands_file_to_server(tmp_path):
+    path = tmp_path / "backup.tar.gz"
+    path.write_bytes(b"0123456789")
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "headers": [(b"range", b"bytes=2-5")],
+        "extensions": {"http.response.zerocopysend": {}},
+    }
+    messages = []
+
+    async def send(message):
+        if message["type"] == "http.response.zerocopysend":
+            # What the server does with the descriptor.
+            file = message["file"]
+            message = dict(
+                message, body=os.pread(file.fileno(), message["count"], message["offset"])
+            )
+        messages.append(message)
+
+    await RangeFileResponse(path)(scope, None, send)
+
+    assert messages[0]["status"] == 206
+    assert messages[1]["type"] == "http.response.zerocopysend"
+    assert messages[1]["body"] == b"2345"
@@ -0,0 +1,161 @@
+"""Unit tests for app.core.file_watch (shared log tailer)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.core.file_watch import LogFileWatcher
+
+
+@pytest.fixture(params=["inotify", "polling"])
+async def watcher(request):
+    w = LogFileWatcher(poll_interval=0.05, use_inotify=request.param == "inotify")
+    yield w
+    await w.close()
+
+
+class _Collector:
+    def __init__(self):
+        self.lines: list[str] = []
+        self.updated = asyncio.Event()
+
+    def __call__(self, lines):
+        self.lines.extend(lines)
+        self.updated.set()
+
+    async def wait_for(self, count: int, timeout: float = 5.0) -> list[str]:
+        async def _wait():
+            while len(self.lines) < count:
+                self.updated.clear()
+                await self.updated.wait()
+
+        await asyncio.wait_for(_wait(), timeout)
+        return self.lines
+
+
+def _append(path, text: str) -> None:
+    with path.open("a") as f:
+        f.write(text)
+
+
+class TestLogFileWatcher:
+    @pytest.mark.asyncio
+    async def test_delivers_appended_lines(self, watcher, tmp_path):
+        log_file = tmp_path / "server.log"
+        log_file.write_text("")
+        collector = _Collector()
+        watcher.subscribe(log_file, collector)
+
+        _append(log_file, "first\nsecond\n")
+
+        assert await collector.wait_for(2) == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_from_end_skips_existing_content(self, watcher, tmp_path):
+        log_file = tmp_path / "latest.log"
+        log_file.write_text("history\n")
+        collector = _Collector()
+        watcher.subscribe(log_file, collector, from_end=True)
+
+        _append(log_file, "live\n")
+
+        assert await collector.wait_for(1) == ["live"]
+
+    @pytest.mark.asyncio
+    async def test_partial_line_held_until_complete(self, watcher, tmp_path):
+        log_file = tmp_path / "server.log"
+        log_file.write_text("")
+        collector = _Collector()
+        watcher.subscribe(log_file, collector)
+
+        _append(log_file, "Done (1.0s)! For")
+        await asyncio.sleep(0.2)
+        assert collector.lines == []
+
+        _append(log_file, ' help, type "help"\n')
+
+        assert await collector.wait_for(1) == ['Done (1.0s)! For help, type "help"']
+
+    @pytest.mark.asyncio
+    async def test_file_and_directory_created_after_subscribe(self, watcher, tmp_path):
+        log_file = tmp_path / "logs" / "latest.log"
+        collector = _Collector()
+        watcher.subscribe(log_file, collector)
+
+        log_file.parent.mkdir()
+        _append(log_file, "hello\n")
+
+        assert await collector.wait_for(1) == ["hello"]
+
+    @pytest.mark.asyncio
+    async def test_many_files_share_one_watcher(self, watcher, tmp_path):
+        collectors = []
+        for i in range(40):
+            server_dir = tmp_path / str(i)
+            server_dir.mkdir()
+            (server_dir / "server.log").write_text("")
+            collector = _Collector()
+            watcher.subscribe(server_dir / "server.log", collector)
+            collectors.append(collector)
+
+        _append(tmp_path / "7" / "server.log", "only seven\n")
+
+        assert await collectors[7].wait_for(1) == ["only seven"]
+        await asyncio.sleep(0.1)
+        assert all(not c.lines for i, c in enumerate(collectors) if i != 7)
+        if watcher.backend == "inotify":
+            # Idle files are covered by the kernel watch, not the poller.
+            assert watcher._poll_task is None or watcher._poll_task.done()
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_stops_delivery(self, watcher, tmp_path):
+        log_file = tmp_path / "server.log"
+        log_file.write_text("")
+        kept, dropped = _Collector(), _Collector()
+        watcher.subscribe(log_file, kept)
+        subscription = watcher.subscribe(log_file, dropped)
+
+        subscription.close()
+        _append(log_file, "after\n")
+
+        assert await kept.wait_for(1) == ["after"]
+        assert dropped.lines == []
+        assert subscription.closed
+
+    @pytest.mark.asyncio
+    async def test_truncated_file_is_reread(self, watcher, tmp_path):
+        log_file = tmp_path / "server.log"
+        log_file.write_text("a long first generation of the log\n")
+        collector = _Collector()
+        watcher.subscribe(log_file, collector)
+        await collector.wait_for(1)
+
+        log_file.write_text("new\n")
+
+        assert (await collector.wait_for(2))[-1] == "new"
+
+    @pytest.mark.asyncio
+    async def test_read_errors_go_to_on_error(self, watcher, tmp_path):
+        log_file = tmp_path / "server.log"
+        log_file.write_text("")
+        errors: list[Exception] = []
+
+        def boom(lines):
+            raise RuntimeError("subscriber failed")
+
+        watcher.subscribe(log_file, boom, on_error=errors.append)
+        _append(log_file, "x\n")
+
+        for _ in range(50):
+            if errors:
+                break
+            await asyncio.sleep(0.05)
+        assert [str(e) for e in errors] == ["subscriber failed"]
+
+    @pytest.mark.asyncio
+    async def test_backend_reported(self, watcher, tmp_path):
+        assert watcher.backend is None
+        watcher.subscribe(tmp_path / "server.log", _Collector())
+        assert watcher.backend in {"inotify", "polling"}
@@ -0,0 +1,52 @@
+"""Unit tests for app.core.fs_walk (single-pass scandir walker)."""
+
+import os
+import stat
+
+from app.core.fs_walk import walk_files
+
+
+def _tree(root):
+    (root / "world" / "region").mkdir(parents=True)
+    (root / "world" / "region" / "r.0.0.mca").write_bytes(b"x" * 10)
+    (root / "world" / "level.dat").write_bytes(b"y" * 3)
+    (root / "empty").mkdir()
+    (root / "server.properties").write_text("motd=hi\n")
+    return root
+
+
+def test_yields_every_file_with_relative_path_and_stat(tmp_path):
+    root = _tree(tmp_path / "server")
+
+    found = {w.relative_path: w for w in walk_files(root)}
+
+    assert set(found) == {
+        "world/region/r.0.0.mca",
+        "world/level.dat",
+        "server.properties",
+    }
+    region = found["world/region/r.0.0.mca"]
+    assert region.path == os.path.join(root, "world", "region", "r.0.0.mca")
+    assert region.stat.st_size == 10
+
+
+def test_symlinked_directories_are_not_descended(tmp_path):
+    root = _tree(tmp_path / "server")
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "secret").write_text("s")
+    (root / "link").symlink_to(outside, target_is_directory=True)
+    (root / "alias.properties").symlink_to(root / "server.properties")
+
+    found = {w.relative_path: w for w in walk_files(root, follow_symlinks=False)}
+
+    assert "link/secret" not in found
+    assert stat.S_ISLNK(found["alias.properties"].stat.st_mode)
+    followed = {w.relative_path: w for w in walk_files(root)}
+    assert stat.S_ISREG(followed["alias.properties"].stat.st_mode)
+
+
+def test_missing_root_reports_error(tmp_path):
+    errors = []
+    assert list(walk_files(tmp_path / "missing", on_error=errors.append)) == []
+    assert len(errors) == 1 and isinstance(errors[0], FileNotFoundError)
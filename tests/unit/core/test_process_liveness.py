@@ -0,0 +1,110 @@
+"""Unit tests for app.core.process_liveness (shared PID exit notification)."""
+
+from __future__ import annotations
+
+import asyncio
+import signal
+import subprocess
+import sys
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from app.core import process_liveness
+from app.core.process_liveness import ProcessLivenessRegistry
+from app.servers.application.minecraft_server import MinecraftServerManager, ServerProcess
+from app.servers.models import ServerStatus
+
+
+@pytest.fixture(params=["pidfd", "polling"])
+async def registry(request):
+    r = ProcessLivenessRegistry(poll_interval=0.05, use_pidfd=request.param == "pidfd")
+    yield r
+    await r.close()
+
+
+@pytest.fixture
+def child():
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    yield proc
+    proc.kill()
+    proc.wait()
+
+
+def _dead_pid() -> int:
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+class TestProcessLivenessRegistry:
+    @pytest.mark.asyncio
+    async def test_exit_sets_event_and_cached_state(self, registry, child):
+        exited = registry.watch(child.pid)
+        assert exited is not None
+        assert registry.is_alive(child.pid) is True
+        assert registry.watch(child.pid) is exited
+
+        child.terminate()
+        await asyncio.wait_for(exited.wait(), 5)
+
+        # Exited children linger as zombies until reaped; still dead.
+        assert registry.is_alive(child.pid) is False
+
+    @pytest.mark.asyncio
+    async def test_unknown_pid_is_not_watched(self, registry):
+        pid = _dead_pid()
+        assert registry.watch(pid) is None
+        assert registry.is_alive(pid) is None
+
+    @pytest.mark.asyncio
+    async def test_forget_drops_state(self, registry, child):
+        registry.watch(child.pid)
+        registry.forget(child.pid)
+        assert registry.is_alive(child.pid) is None
+
+    @pytest.mark.asyncio
+    async def test_backend(self, registry, child):
+        assert registry.backend is None
+        registry.watch(child.pid)
+        assert registry.backend in ("pidfd", "polling")
+
+
+@pytest.mark.asyncio
+async def test_stop_daemon_returns_as_soon_as_process_exits(child):
+    manager = MinecraftServerManager(log_queue_size=10)
+    manager.processes[1] = ServerProcess(
+        server_id=1,
+        process=None,
+        status=ServerStatus.running,
+        started_at=datetime.now(),
+        pid=child.pid,
+    )
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    stopped = await manager._stop_daemon_process(1, manager.processes[1])
+    elapsed = loop.time() - started
+
+    assert stopped is True
+    assert child.poll() == -signal.SIGTERM
+    # The old loop only re-checked after a whole second.
+    assert elapsed < 0.9
+    assert 1 not in manager.processes
+    assert process_liveness.get_process_liveness().is_alive(child.pid) is None
+
+
+@pytest.mark.asyncio
+async def test_watched_pid_is_answered_without_psutil(child):
+    manager = MinecraftServerManager(log_queue_size=10)
+    registry = process_liveness.get_process_liveness()
+    registry.watch(child.pid)
+    try:
+        with patch(
+            "app.servers.application.minecraft.pid_file.psutil.Process"
+        ) as mock_process:
+            assert await manager._is_process_running(child.pid) is True
+        mock_process.assert_not_called()
+    finally:
+        registry.forget(child.pid)
@@ -3,6 +3,9 @@ Test coverage for app/core/security.py
 Tests focus on path validation, tar extraction security, and file operation validation
 """
 
+import asyncio
+import io
+import random
 import tarfile
 import tempfile
 from pathlib import Path
@@ -14,6 +17,7 @@ from app.core.security import (
     FileOperationValidator,
     PathValidator,
     SecurityError,
+    StreamingTarValidator,
     TarExtractor,
 )
 
@@ -646,6 +650,84 @@ class TestTarExtractor:
         mock_tar.extract.assert_called_once_with(mock_member, path=target_dir)
 
 
+def _tar_gz(*members) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, data in members:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+async def _feed_all(validator, data, chunk_size=8192):
+    """Feed `data` in chunks and return the detected format."""
+    try:
+        for i in range(0, len(data), chunk_size):
+            await validator.feed(data[i : i + chunk_size])
+        return await validator.finish()
+    finally:
+        validator.close()
+
+
+class TestStreamingTarValidator:
+    """Test cases for single-pass upload validation"""
+
+    @pytest.mark.asyncio
+    async def test_valid_archive_reports_format(self):
+        data = _tar_gz(("world/level.dat", b"x" * 5000), ("server.properties", b"a=b"))
+        assert await _feed_all(StreamingTarValidator(), data) == "tar.gz"
+
+    @pytest.mark.asyncio
+    async def test_traversal_rejected_before_upload_completes(self):
+        payload = random.Random(0).randbytes(4 * 1024 * 1024)
+        data = _tar_gz(("../../etc/passwd", b"x"), ("big.bin", payload))
+        validator = StreamingTarValidator()
+        fed = 0
+        with pytest.raises(SecurityError, match="path traversal"):
+            try:
+                for i in range(0, len(data), 8192):
+                    await validator.feed(data[i : i + 8192])
+                    fed += 8192
+                    if fed % (512 * 1024) == 0:
+                        # Let the worker catch up so the check is deterministic.
+                        await asyncio.sleep(0.01)
+                await validator.finish()
+            finally:
+                validator.close()
+        assert fed < len(data)
+
+    @pytest.mark.asyncio
+    async def test_member_size_checked_from_header(self):
+        data = _tar_gz(("a.bin", b"x" * 2048))
+        with patch.object(TarExtractor, "MAX_MEMBER_SIZE", 1024):
+            with pytest.raises(SecurityError, match="File too large"):
+                await _feed_all(StreamingTarValidator(), data)
+
+    @pytest.mark.asyncio
+    async def test_total_size_limit(self):
+        data = _tar_gz(("a", b"x" * 600), ("b", b"x" * 600))
+        with patch.object(TarExtractor, "MAX_EXTRACTED_SIZE", 1000):
+            with pytest.raises(SecurityError, match="Total extracted size"):
+                await _feed_all(StreamingTarValidator(), data)
+
+    @pytest.mark.asyncio
+    async def test_suspicious_compression_ratio(self):
+        data = _tar_gz(("zeros", bytes(8 * 1024 * 1024)), ("next", b"x"))
+        with pytest.raises(SecurityError, match="Suspicious compression ratio"):
+            await _feed_all(StreamingTarValidator(), data)
+
+    @pytest.mark.asyncio
+    async def test_not_an_archive(self):
+        with pytest.raises(Exception, match="Unrecognised archive format"):
+            await _feed_all(StreamingTarValidator(), b"not a tar.gz file")
+
+    @pytest.mark.asyncio
+    async def test_trailing_bytes_after_archive_are_ignored(self):
+        data = _tar_gz(("a", b"x")) + b"\0" * 100_000
+        assert await _feed_all(StreamingTarValidator(), data, chunk_size=1024) == "tar.gz"
+
+
 class TestFileOperationValidator:
     """Test cases for FileOperationValidator class"""
 
@@ -0,0 +1,139 @@
+"""Tests for the chunked, parallel content search engine."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from app.files.application import content_search
+from app.files.application.content_search import ContentMatcher, ContentSearchEngine
+
+
+def _write(path: Path, text: str) -> str:
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_reports_line_numbers_and_snippets(tmp_path):
+    path = _write(
+        tmp_path / "server.properties",
+        "motd=A Minecraft Server\nmax-players=20\n# MOTD shown in list\nlevel-name=world\n",
+    )
+
+    match = ContentMatcher("motd").search_file(path, max_bytes=0)
+
+    assert [(m.line, m.snippet) for m in match.lines] == [
+        (1, "motd=A Minecraft Server"),
+        (3, "# MOTD shown in list"),
+    ]
+    assert match.truncated is False
+
+
+def test_case_insensitive_for_non_ascii(tmp_path):
+    path = _write(tmp_path / "messages.yml", "greeting: Größe\nfarewell: tschüss\n")
+
+    match = ContentMatcher("GRÖßE").search_file(path, 0)
+
+    assert [m.line for m in match.lines] == [1]
+
+
+def test_no_match_returns_none(tmp_path):
+    path = _write(tmp_path / "ops.json", "[]\n")
+
+    assert ContentMatcher("notch").search_file(path, 0) is None
+
+
+def test_matches_across_chunk_boundaries(tmp_path, monkeypatch):
+    monkeypatch.setattr(content_search, "CHUNK_BYTES", 16)
+    monkeypatch.setattr(content_search, "SNIFF_BYTES", 8)
+    lines = [f"line {i} {'needle' if i % 7 == 0 else 'hay'}" for i in range(1, 60)]
+    path = _write(tmp_path / "latest.log", "\n".join(lines))
+
+    match = ContentMatcher("NEEDLE").search_file(path, 0)
+
+    assert [m.line for m in match.lines] == [7, 14, 21, 28, 35, 42, 49, 56]
+
+
+def test_long_lines_are_trimmed_around_the_match(tmp_path):
+    path = _write(tmp_path / "config.json", "x" * 1000 + "needle" + "y" * 1000)
+
+    (line,) = ContentMatcher("needle").search_file(path, 0).lines
+
+    assert "needle" in line.snippet
+    assert line.snippet.startswith("…") and line.snippet.endswith("…")
+    assert len(line.snippet) <= content_search.SNIPPET_CHARS + 2
+
+
+def test_stops_after_max_lines_per_file(tmp_path):
+    path = _write(tmp_path / "spam.txt", "hit\n" * 100)
+
+    match = ContentMatcher("hit", max_lines=5).search_file(path, 0)
+
+    assert len(match.lines) == 5
+    assert match.truncated is True
+
+
+def test_skips_binary_and_oversized_files(tmp_path):
+    binary = tmp_path / "level.dat_old"
+    binary.write_bytes(b"needle\0\0\0")
+    large = _write(tmp_path / "big.txt", "needle\n" + "x" * 4096)
+
+    assert ContentMatcher("needle").search_file(str(binary), 0) is None
+    assert ContentMatcher("needle").search_file(large, max_bytes=1024) is None
+
+
+def test_cancelled_search_abandons_file(tmp_path):
+    path = _write(tmp_path / "a.txt", "needle\n")
+    cancelled = threading.Event()
+    cancelled.set()
+
+    with pytest.raises(content_search._Cancelled):
+        ContentMatcher("needle").search_file(path, 0, cancelled)
+
+
+async def _collect(engine, root, candidates, term, max_results):
+    return [
+        match async for match in engine.search(root, candidates, term, max_results)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_engine_yields_relative_paths_of_matching_files(tmp_path):
+    (tmp_path / "plugins").mkdir()
+    _write(tmp_path / "plugins" / "a.yml", "enabled: true\n")
+    _write(tmp_path / "plugins" / "b.yml", "enabled: false\n")
+    _write(tmp_path / "server.properties", "pvp=true\n")
+    engine = ContentSearchEngine(max_file_bytes=0, workers=2)
+
+    matches = await _collect(
+        engine,
+        tmp_path,
+        ["plugins/a.yml", "plugins/b.yml", "server.properties", "missing.txt"],
+        "ENABLED",
+        10,
+    )
+
+    assert sorted(m.path for m in matches) == ["plugins/a.yml", "plugins/b.yml"]
+    engine.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_engine_stops_at_max_results(tmp_path):
+    names = [f"f{i}.txt" for i in range(50)]
+    for name in names:
+        _write(tmp_path / name, "needle\n")
+    engine = ContentSearchEngine(max_file_bytes=0, workers=4)
+    opened = []
+    original = engine._search_one
+
+    def counting(root, relative, matcher, cancelled):
+        opened.append(relative)
+        return original(root, relative, matcher, cancelled)
+
+    engine._search_one = counting
+
+    matches = await _collect(engine, tmp_path, names, "needle", 3)
+
+    assert len(matches) == 3
+    assert len(opened) < len(names)
+    engine.shutdown()
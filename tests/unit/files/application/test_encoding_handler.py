@@ -9,7 +9,10 @@ from unittest.mock import patch
 
 import pytest
 
-from app.files.application.encoding_handler import EncodingHandler
+from app.files.application.encoding_handler import (
+    DETECTION_SAMPLE_BYTES,
+    EncodingHandler,
+)
 
 
 class TestEncodingHandlerSimple:
@@ -143,3 +146,96 @@ class TestEncodingHandlerSimple:
         result = EncodingHandler.safe_read_text_file("test_path")
         assert result["success"] is False
         assert result["error"] == "Test error"
+
+
+class TestBoundedDetection:
+    """Detection cost is bounded and results are cached per file version"""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        EncodingHandler._cache.clear()
+        yield
+        EncodingHandler._cache.clear()
+
+    @staticmethod
+    def _write(tmp_path, data: bytes, name: str = "file.txt", age: int = 60) -> str:
+        path = tmp_path / name
+        path.write_bytes(data)
+        old = path.stat().st_mtime - age
+        os.utime(path, (old, old))
+        return str(path)
+
+    @patch("chardet.detect")
+    def test_utf8_skips_chardet(self, mock_detect, tmp_path):
+        """Valid UTF-8 is settled without chardet"""
+        text = "motd=サーバーへようこそ\n" * 1000
+        path = self._write(tmp_path, text.encode("utf-8"))
+
+        content, encoding = EncodingHandler.read_file_with_encoding_detection(path)
+
+        assert content == text
+        assert encoding == "utf-8"
+        mock_detect.assert_not_called()
+
+    def test_utf8_bom(self, tmp_path):
+        """A UTF-8 BOM is stripped and reported"""
+        path = self._write(tmp_path, "\ufeffpvp=true\n".encode("utf-8"))
+
+        content, encoding = EncodingHandler.read_file_with_encoding_detection(path)
+
+        assert content == "pvp=true\n"
+        assert encoding == "utf-8-sig"
+
+    @patch("chardet.detect")
+    def test_chardet_sees_bounded_sample(self, mock_detect, tmp_path):
+        """chardet only sees a prefix of large non-UTF-8 files"""
+        mock_detect.return_value = {"encoding": "ISO-8859-1", "confidence": 0.9}
+        text = "Größe=café\n" * 100_000
+        path = self._write(tmp_path, text.encode("latin-1"))
+
+        content, encoding = EncodingHandler.read_file_with_encoding_detection(path)
+
+        assert content == text
+        assert encoding == "ISO-8859-1"
+        (sample,), _ = mock_detect.call_args
+        assert len(sample) == DETECTION_SAMPLE_BYTES
+
+    def test_shift_jis(self, tmp_path):
+        """Shift-JIS content is decoded correctly"""
+        text = "# サーバー設定ファイル\nmotd=マインクラフトへようこそ\n" * 50
+        path = self._write(tmp_path, text.encode("shift_jis"))
+
+        content, encoding = EncodingHandler.read_file_with_encoding_detection(path)
+
+        assert content == text
+        assert encoding.lower().replace("_", "-") in ("shift-jis", "cp932")
+
+    def test_cache_hit_skips_detection(self, tmp_path):
+        """An unchanged file reuses its detected encoding"""
+        path = self._write(tmp_path, "level-name=world\n".encode("utf-8"))
+        EncodingHandler.read_file_with_encoding_detection(path)
+
+        with patch.object(EncodingHandler, "decode_with_detection") as mock_decode:
+            content, encoding = EncodingHandler.read_file_with_encoding_detection(path)
+
+        mock_decode.assert_not_called()
+        assert (content, encoding) == ("level-name=world\n", "utf-8")
+
+    def test_modified_file_is_detected_again(self, tmp_path):
+        """Changing the file invalidates its cached encoding"""
+        path = self._write(tmp_path, "level-name=world\n".encode("utf-8"))
+        EncodingHandler.read_file_with_encoding_detection(path)
+        self._write(tmp_path, b"level-name=nether\n", age=30)
+
+        content, _ = EncodingHandler.read_file_with_encoding_detection(path)
+
+        assert content == "level-name=nether\n"
+
+    def test_recently_modified_file_is_not_cached(self, tmp_path):
+        """Files written within the mtime race window are not cached"""
+        path = self._write(tmp_path, b"pvp=true\n", age=0)
+
+        EncodingHandler.read_file_with_encoding_detection(path)
+
+        stat = os.stat(path)
+        assert EncodingHandler._cache.get((path, stat.st_mtime_ns, stat.st_size)) is None
@@ -0,0 +1,135 @@
+"""Tests for the content-addressed history blob store."""
+
+import hashlib
+import os
+
+import pytest
+
+from app.files.application import history_blobs
+from app.files.application.history_blobs import BlobFormatError, HistoryBlobStore
+
+CONFIG = "".join(f"setting-{i}=value-{i}\n" for i in range(400)).encode()
+
+
+def _hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _store(store: HistoryBlobStore, data: bytes, base=None):
+    encoded = store.encode(data, base)
+    return store.write(_hash(data), encoded.data), encoded
+
+
+@pytest.fixture(params=["zstd", "zlib"])
+def store(request, tmp_path, monkeypatch) -> HistoryBlobStore:
+    if request.param == "zstd":
+        pytest.importorskip("zstandard")
+    else:
+        monkeypatch.setattr(history_blobs, "zstandard", None)
+    return HistoryBlobStore(tmp_path)
+
+
+def test_round_trip_is_compressed_and_content_addressed(store, tmp_path):
+    path, encoded = _store(store, CONFIG)
+
+    assert path == tmp_path / "blobs" / _hash(CONFIG)[:2] / _hash(CONFIG)
+    assert encoded.base_hash is None
+    assert path.stat().st_size < len(CONFIG) // 4
+    assert store.read(path) == CONFIG
+
+
+def test_small_edit_is_stored_as_delta(store):
+    _store(store, CONFIG)
+    edited = CONFIG.replace(b"setting-200=value-200", b"setting-200=changed")
+
+    path, encoded = _store(store, edited, (_hash(CONFIG), CONFIG))
+    full = store.encode(edited)
+
+    assert encoded.base_hash == _hash(CONFIG)
+    assert len(encoded.data) < len(full.data)
+    assert store.read(path) == edited
+
+
+def test_unrelated_base_falls_back_to_full_blob(store):
+    noise = os.urandom(2048)
+
+    _, encoded = _store(store, CONFIG, (_hash(noise), noise))
+
+    assert encoded.base_hash is None
+
+
+def test_incompressible_content_is_stored_raw(store):
+    data = os.urandom(512)
+
+    path, encoded = _store(store, data)
+
+    assert len(encoded.data) == len(data) + len(history_blobs._MAGIC) + 1
+    assert store.read(path) == data
+
+
+def test_legacy_full_copy_is_read_unchanged(store, tmp_path):
+    legacy = tmp_path / "1" / "server.properties" / "v001_20240101_000000.properties"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_bytes(b"motd=hello\n")
+
+    assert store.read(legacy) == b"motd=hello\n"
+
+
+def test_corrupt_blob_fails_verification(store):
+    path, _ = _store(store, CONFIG)
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(BlobFormatError):
+        store.read(path)
+
+
+def test_missing_delta_base_is_an_error(store):
+    base = CONFIG
+    _store(store, base)
+    path, encoded = _store(store, base + b"extra=1\n", (_hash(base), base))
+    assert encoded.base_hash is not None
+    store.delete(store.path_for(_hash(base)))
+
+    with pytest.raises(OSError):
+        store.read(path)
+
+
+def test_list_blobs_skips_recent_and_removes_stale_temp_files(store):
+    path, _ = _store(store, CONFIG)
+    stale_temp = path.parent / f"{history_blobs._TEMP_PREFIX}abc"
+    stale_temp.write_bytes(b"partial")
+    os.utime(stale_temp, (1_600_000_000, 1_600_000_000))
+
+    assert store.list_blobs(older_than=3600) == []
+    assert not stale_temp.exists()
+
+    os.utime(path, (1_600_000_000, 1_600_000_000))
+    assert store.list_blobs(older_than=3600) == [_hash(CONFIG)]
+
+
+def test_exclusive_write_refuses_to_replace_an_existing_blob(store):
+    path, _ = _store(store, CONFIG)
+    edited = CONFIG + b"extra=1\n"
+    delta = store.encode(CONFIG, (_hash(edited), edited))
+
+    with pytest.raises(FileExistsError):
+        store.write(_hash(CONFIG), delta.data, exclusive=True)
+    assert store.read(path) == CONFIG
+
+
+def test_zstd_blob_uses_zstd_and_needs_the_package(tmp_path, monkeypatch):
+    pytest.importorskip("zstandard")
+    store = HistoryBlobStore(tmp_path)
+    _store(store, CONFIG)
+    edited = CONFIG + b"extra=1\n"
+    path, encoded = _store(store, edited, (_hash(CONFIG), CONFIG))
+
+    codec = encoded.data[len(history_blobs._MAGIC)]
+    assert codec == history_blobs._CODEC_ZSTD | history_blobs._DELTA_FLAG
+    assert store.read(path) == edited
+
+    monkeypatch.setattr(history_blobs, "zstandard", None)
+    with pytest.raises(BlobFormatError, match="zstandard"):
+        store.read(path)
@@ -0,0 +1,182 @@
+"""Tests for the scandir-based directory listing (`list_directory`)."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from app.core.exceptions import InvalidRequestException
+from app.files.application.file_info import FileInfoService
+from app.files.application.listing import (
+    COMPACT_COLUMNS,
+    ListingQuery,
+    encode_cursor,
+    list_directory,
+    to_compact,
+)
+from app.files.application.path_validation import FileValidationService
+
+
+@pytest.fixture
+def server_dir(tmp_path: Path) -> Path:
+    (tmp_path / "plugins").mkdir()
+    (tmp_path / "world").mkdir()
+    (tmp_path / "server.properties").write_text("motd=hi\n")
+    (tmp_path / "eula.txt").write_text("eula=true\n")
+    (tmp_path / "paper.jar").write_bytes(b"\0" * 300)
+    (tmp_path / "start.sh").write_text("#!/bin/sh\n" * 10)
+    (tmp_path / "notes.MD").write_text("x")
+    (tmp_path / ".hidden").write_text("")
+    for i, name in enumerate(["paper.jar", "start.sh", "server.properties"]):
+        os.utime(tmp_path / name, (1_700_000_000 + i, 1_700_000_000 + i))
+    return tmp_path
+
+
+def _names(files):
+    return [f["name"] for f in files]
+
+
+def _list_all(directory: Path, query: ListingQuery):
+    names, cursor = [], None
+    while True:
+        page = list_directory(
+            str(directory),
+            "",
+            ListingQuery(**{**query.__dict__, "cursor": cursor}),
+        )
+        names.extend(_names(page.files))
+        if page.next_cursor is None:
+            return names
+        cursor = page.next_cursor
+
+
+def test_directories_first_then_by_name(server_dir):
+    page = list_directory(str(server_dir), "", ListingQuery())
+
+    assert _names(page.files) == [
+        "plugins",
+        "world",
+        ".hidden",
+        "eula.txt",
+        "notes.MD",
+        "paper.jar",
+        "server.properties",
+        "start.sh",
+    ]
+    assert page.total == 8
+    assert page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_entries_match_file_info_service(server_dir):
+    validation = FileValidationService()
+    info = FileInfoService(validation)
+    page = list_directory(
+        str(server_dir), "", ListingQuery(), validation.restricted_files
+    )
+
+    for listed in page.files:
+        expected = await info.get_file_info(server_dir / listed["name"], server_dir)
+        assert listed == expected
+
+
+def test_paths_are_relative_to_the_server(server_dir):
+    (server_dir / "plugins" / "Essentials.jar").write_bytes(b"jar")
+
+    page = list_directory(str(server_dir / "plugins"), "plugins", ListingQuery())
+
+    assert [f["path"] for f in page.files] == [os.path.join("plugins", "Essentials.jar")]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        ListingQuery(limit=3),
+        ListingQuery(limit=2, sort="size", order="desc"),
+        ListingQuery(limit=1, sort="modified"),
+        ListingQuery(limit=3, sort="type", order="desc"),
+    ],
+)
+def test_cursor_pages_cover_the_full_listing_once(server_dir, query):
+    unpaged = list_directory(
+        str(server_dir), "", ListingQuery(sort=query.sort, order=query.order)
+    )
+
+    assert _list_all(server_dir, query) == _names(unpaged.files)
+
+
+def test_descending_keeps_directories_first(server_dir):
+    page = list_directory(str(server_dir), "", ListingQuery(sort="size", order="desc"))
+
+    assert _names(page.files)[:3] == ["world", "plugins", "paper.jar"]
+
+
+def test_filters_by_type_and_name(server_dir):
+    text = list_directory(str(server_dir), "", ListingQuery(file_type="text"))
+    named = list_directory(str(server_dir), "", ListingQuery(name_contains="PAPER"))
+
+    assert _names(text.files) == [
+        "eula.txt",
+        "notes.MD",
+        "server.properties",
+        "start.sh",
+    ]
+    assert _names(named.files) == ["paper.jar"]
+    assert named.total == 1
+
+
+def test_restricted_files_are_not_writable(server_dir):
+    page = list_directory(
+        str(server_dir), "", ListingQuery(name_contains="eula"), ["eula.txt"]
+    )
+
+    assert page.files[0]["writable"] is False
+    assert page.files[0]["readable"] is True
+
+
+def test_dangling_symlink_is_skipped(server_dir):
+    (server_dir / "broken").symlink_to(server_dir / "missing")
+
+    page = list_directory(str(server_dir), "", ListingQuery())
+
+    assert "broken" not in _names(page.files)
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "e30", "WyJuYW1lIl0"])
+def test_malformed_cursor_rejected(server_dir, cursor):
+    with pytest.raises(InvalidRequestException):
+        list_directory(str(server_dir), "", ListingQuery(cursor=cursor))
+
+
+@pytest.mark.parametrize(
+    "sort, primary", [("size", "x"), ("modified", "x"), ("name", 1), ("type", None)]
+)
+def test_cursor_with_mistyped_sort_value_rejected(server_dir, sort, primary):
+    query = ListingQuery(limit=2, sort=sort)
+    cursor = encode_cursor((1, primary, "a"), query)
+
+    with pytest.raises(InvalidRequestException):
+        list_directory(
+            str(server_dir), "", ListingQuery(limit=2, sort=sort, cursor=cursor)
+        )
+
+
+def test_cursor_from_another_sort_rejected(server_dir):
+    page = list_directory(str(server_dir), "", ListingQuery(limit=2))
+
+    with pytest.raises(InvalidRequestException):
+        list_directory(
+            str(server_dir),
+            "",
+            ListingQuery(limit=2, sort="size", cursor=page.next_cursor),
+        )
+
+
+def test_compact_rows_follow_columns(server_dir):
+    page = list_directory(str(server_dir), "", ListingQuery(name_contains="jar"))
+
+    (row,) = to_compact(page.files)
+
+    assert dict(zip(COMPACT_COLUMNS, row)) == {
+        column: page.files[0][column] for column in COMPACT_COLUMNS
+    }
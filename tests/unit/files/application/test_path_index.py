@@ -0,0 +1,148 @@
+"""Tests for the per-server filename index used by file search."""
+
+import fnmatch
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from app.files.application.path_index import (
+    PathIndexRegistry,
+    ServerPathIndex,
+    _glob_to_regex,
+)
+
+
+@pytest.fixture
+def server_dir(tmp_path: Path) -> Path:
+    (tmp_path / "plugins" / "Essentials").mkdir(parents=True)
+    (tmp_path / "world" / "region").mkdir(parents=True)
+    (tmp_path / "server.properties").write_text("")
+    (tmp_path / "plugins" / "Essentials" / "config.yml").write_text("")
+    (tmp_path / "plugins" / "EssentialsX.jar").write_text("")
+    (tmp_path / "plugins" / "my-essentials.yml").write_text("")
+    (tmp_path / "world" / "region" / "r.0.0.mca").write_text("")
+    return tmp_path
+
+
+def _age(directory: Path) -> None:
+    """Backdate directory mtimes so they are trusted by the next refresh."""
+    for root, dirs, _ in os.walk(directory):
+        os.utime(root, (1_600_000_000, 1_600_000_000))
+
+
+def _paths(hits):
+    return [hit.path for hit in hits]
+
+
+def test_substring_search_ranks_exact_and_prefix_first(server_dir):
+    index = ServerPathIndex(server_dir)
+    index.refresh()
+
+    total, hits = index.search("ESSENTIALS")
+
+    assert total == 3
+    assert _paths(hits) == [
+        "plugins/Essentials",
+        "plugins/EssentialsX.jar",
+        "plugins/my-essentials.yml",
+    ]
+    assert hits[0].is_directory
+
+
+def test_limit_keeps_full_total(server_dir):
+    index = ServerPathIndex(server_dir)
+    index.refresh()
+
+    total, hits = index.search("e", limit=2)
+
+    assert total > 2
+    assert len(hits) == 2
+
+
+def test_path_and_glob_queries(server_dir):
+    index = ServerPathIndex(server_dir)
+    index.refresh()
+
+    assert _paths(index.search("*.MCA")[1]) == ["world/region/r.0.0.mca"]
+    assert _paths(index.search("plugins/essentials/")[1]) == [
+        "plugins/Essentials/config.yml"
+    ]
+    assert _paths(index.search("world/*/r.?.0.mca")[1]) == ["world/region/r.0.0.mca"]
+
+
+def test_file_type_filter(server_dir):
+    index = ServerPathIndex(server_dir)
+    index.refresh()
+
+    total, hits = index.search("essentials", file_type="binary")
+
+    assert total == 1
+    assert _paths(hits) == ["plugins/EssentialsX.jar"]
+
+
+def test_refresh_only_relists_changed_directories(server_dir):
+    _age(server_dir)
+    index = ServerPathIndex(server_dir)
+    index.refresh()
+
+    assert index.refresh() is False
+
+    (server_dir / "world" / "region" / "r.1.0.mca").write_text("")
+    shutil.rmtree(server_dir / "plugins" / "Essentials")
+
+    assert index.refresh() is True
+    assert index.search("*.mca")[0] == 2
+    assert index.search("config")[0] == 0
+
+
+def test_symlinked_directories_are_not_descended(server_dir):
+    (server_dir / "plugins" / "link").symlink_to(server_dir / "world")
+    index = ServerPathIndex(server_dir)
+    index.refresh()
+
+    total, hits = index.search("link")
+
+    assert _paths(hits) == ["plugins/link"]
+    assert hits[0].is_directory
+    assert index.search("r.0.0.mca")[0] == 1
+
+
+@pytest.mark.asyncio
+async def test_mark_stale_forces_refresh_within_interval(server_dir):
+    index = ServerPathIndex(server_dir, refresh_interval=3600)
+    await index.ensure_fresh()
+    (server_dir / "ops.json").write_text("[]")
+
+    await index.ensure_fresh()
+    assert index.search("ops.json")[0] == 0
+
+    index.mark_stale()
+    await index.ensure_fresh()
+    assert index.search("ops.json")[0] == 1
+
+
+def test_registry_evicts_least_recently_used(tmp_path):
+    registry = PathIndexRegistry(max_servers=2)
+    first = registry.get(tmp_path / "a")
+    registry.get(tmp_path / "b")
+    registry.get(tmp_path / "a")
+    registry.get(tmp_path / "c")
+
+    assert registry.get(tmp_path / "a") is first
+    assert registry.get(tmp_path / "b") is not None
+    assert len(registry._indexes) == 2
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["*.txt", "a?", "a[]]b", "a[!b]*", "[a-c]*", "*[^]*", "[[]x]", "a[b", "*.*"],
+)
+def test_glob_matches_fnmatch(pattern):
+    names = ["a.txt", "b.txt", "ab", "a]b", "a^b", "[x]", "level.dat", "noext"]
+    blob = "".join(f"{name}\n" for name in names)
+
+    matched = [m.group(0) for m in _glob_to_regex(pattern).finditer(blob)]
+
+    assert matched == [n for n in names if fnmatch.fnmatchcase(n, pattern)]
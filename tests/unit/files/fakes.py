@@ -1,7 +1,7 @@
 """In-memory fakes for the files domain Ports.
 
-`FakeFileHistoryRepository`, `FakeFilesUnitOfWork`, and
-`FakeServerReadPort` structurally implement the Protocols in
+`FakeFileHistoryRepository`, `FakeHistoryBlobRepository`,
+`FakeFilesUnitOfWork`, and `FakeServerReadPort` structurally implement the Protocols in
 `app.files.domain.ports` and `app.servers.domain.ports`. They let unit
 tests exercise the file-history application service without a database.
 """
@@ -9,13 +9,14 @@ tests exercise the file-history application service without a database.
 from dataclasses import replace
 from datetime import datetime
 from types import TracebackType
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from app.core.datetime_utils import utcnow
 from app.files.domain.entities import (
     CreateHistoryCommand,
     FileHistoryEntity,
     FileHistoryStatsEntity,
+    HistoryBlobEntity,
 )
 
 
@@ -166,6 +167,46 @@ class FakeFileHistoryRepository:
         return updated
 
 
+class FakeHistoryBlobRepository:
+    """Dict-backed `HistoryBlobRepository` for unit tests.
+
+    Counts references against the `FakeFileHistoryRepository` it is
+    given, like the SQL adapter counts `file_edit_history` rows.
+    """
+
+    def __init__(self, files_history: FakeFileHistoryRepository) -> None:
+        self._files_history = files_history
+        self._blobs: Dict[str, HistoryBlobEntity] = {}
+
+    async def get(self, content_hash: str) -> Optional[HistoryBlobEntity]:
+        return self._blobs.get(content_hash)
+
+    async def get_existing_hashes(self, content_hashes: List[str]) -> Set[str]:
+        return {h for h in content_hashes if h in self._blobs}
+
+    async def get_unreferenced(self) -> List[HistoryBlobEntity]:
+        return [b for b in self._blobs.values() if self._references(b) == 0]
+
+    async def count_references(self, blob: HistoryBlobEntity) -> int:
+        return self._references(blob)
+
+    async def add(self, blob: HistoryBlobEntity) -> HistoryBlobEntity:
+        self._blobs[blob.content_hash] = blob
+        return blob
+
+    async def delete(self, content_hash: str) -> bool:
+        return self._blobs.pop(content_hash, None) is not None
+
+    def _references(self, blob: HistoryBlobEntity) -> int:
+        versions = sum(
+            1
+            for e in self._files_history._records.values()
+            if e.backup_file_path == blob.storage_path
+        )
+        deltas = sum(1 for b in self._blobs.values() if b.base_hash == blob.content_hash)
+        return versions + deltas
+
+
 class FakeFilesUnitOfWork:
     """In-memory `FilesUnitOfWork` for unit tests.
 
@@ -182,6 +223,7 @@ class FakeFilesUnitOfWork:
         self.files_history: FakeFileHistoryRepository = (
             files_history or FakeFileHistoryRepository()
         )
+        self.history_blobs = FakeHistoryBlobRepository(self.files_history)
         self.committed = 0
         self.rolled_back = 0
 
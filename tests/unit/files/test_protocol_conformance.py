@@ -13,14 +13,22 @@ from unittest.mock import MagicMock
 import pytest
 from sqlalchemy.orm import Session
 
-from app.files.adapters.repository import SqlAlchemyFileHistoryRepository
+from app.files.adapters.repository import (
+    SqlAlchemyFileHistoryRepository,
+    SqlAlchemyHistoryBlobRepository,
+)
 from app.files.adapters.uow import SqlAlchemyFilesUnitOfWork
-from app.files.domain.ports import FileHistoryRepository, FilesUnitOfWork
+from app.files.domain.ports import (
+    FileHistoryRepository,
+    FilesUnitOfWork,
+    HistoryBlobRepository,
+)
 from app.servers.adapters.read_port import SqlAlchemyServerReadPort
 from app.servers.domain.ports import ServerReadPort
 from tests.unit.files.fakes import (
     FakeFileHistoryRepository,
     FakeFilesUnitOfWork,
+    FakeHistoryBlobRepository,
     FakeServerReadPort,
 )
 
@@ -29,6 +37,12 @@ if TYPE_CHECKING:
         db=MagicMock(spec=Session)
     )
     _fake_repo: FileHistoryRepository = FakeFileHistoryRepository()
+    _real_blobs: HistoryBlobRepository = SqlAlchemyHistoryBlobRepository(
+        db=MagicMock(spec=Session)
+    )
+    _fake_blobs: HistoryBlobRepository = FakeHistoryBlobRepository(
+        FakeFileHistoryRepository()
+    )
     _real_uow: FilesUnitOfWork = SqlAlchemyFilesUnitOfWork(db=MagicMock(spec=Session))
     _fake_uow: FilesUnitOfWork = FakeFilesUnitOfWork()
     _real_read: ServerReadPort = SqlAlchemyServerReadPort(db=MagicMock(spec=Session))
@@ -101,6 +115,28 @@ def test_async_methods_match_protocol(
     )
 
 
+@pytest.mark.parametrize(
+    "implementation",
+    [
+        pytest.param(
+            FakeHistoryBlobRepository(FakeFileHistoryRepository()), id="fake"
+        ),
+        pytest.param(
+            SqlAlchemyHistoryBlobRepository(db=MagicMock(spec=Session)),
+            id="sqlalchemy",
+        ),
+    ],
+)
+def test_history_blob_repository_implementations(
+    implementation: HistoryBlobRepository,
+) -> None:
+    expected = _public_methods(HistoryBlobRepository)
+    missing = expected - _public_methods(implementation)
+    assert missing == set()
+    drifted = _async_methods(HistoryBlobRepository) - _async_methods(implementation)
+    assert drifted == set()
+
+
 @pytest.mark.parametrize(
     "implementation",
     [
@@ -130,6 +166,7 @@ def test_server_read_port_implementations(
 def test_protocol_imports_succeed() -> None:
     assert FileHistoryRepository is not None
     assert FilesUnitOfWork is not None
+    assert HistoryBlobRepository is not None
     assert ServerReadPort is not None
     assert SqlAlchemyFileHistoryRepository is not None
     assert FakeFileHistoryRepository is not None
@@ -74,8 +74,10 @@ async def test_create_version_backup_creates_first_version(
     assert entity.version_number == 1
     assert entity.editor_user_id == 42
     assert entity.description == "first"
-    # backup file written to disk
-    assert Path(entity.backup_file_path).read_text() == "line=1\n"
+    # backup blob written to disk and read back transparently
+    assert Path(entity.backup_file_path).exists()
+    content, _ = await service.get_version_content(1, "server.properties", 1)
+    assert content == "line=1\n"
     assert uow.committed >= 1
 
 
@@ -304,3 +306,112 @@ async def test_cleanup_old_versions_keeps_recent(
     result = await service.cleanup_old_versions(days=30, server_id=1)
     assert result.deleted_versions == 0
     assert result.freed_storage == 0
+
+
+# ----- blob storage -----
+
+
+@pytest.mark.asyncio
+async def test_identical_content_shares_one_blob(
+    service: FileHistoryService, uow: FakeFilesUnitOfWork
+):
+    first = await service.create_version_backup(
+        server_id=1, file_path="a/ops.json", content="[]\n"
+    )
+    second = await service.create_version_backup(
+        server_id=2, file_path="b/ops.json", content="[]\n"
+    )
+    assert first is not None and second is not None
+    assert first.backup_file_path == second.backup_file_path
+    blob_path = Path(first.backup_file_path)
+
+    await service.delete_version(1, "a/ops.json", 1)
+    assert blob_path.exists()
+    content, _ = await service.get_version_content(2, "b/ops.json", 1)
+    assert content == "[]\n"
+
+    await service.delete_version(2, "b/ops.json", 1)
+    assert not blob_path.exists()
+    assert await uow.history_blobs.get(first.content_hash) is None
+
+
+@pytest.mark.asyncio
+async def test_edits_are_delta_encoded_and_keep_their_base(
+    service: FileHistoryService, uow: FakeFilesUnitOfWork
+):
+    original = "".join(f"key-{i}=value-{i}\n" for i in range(300))
+    edited = original.replace("key-150=value-150", "key-150=edited")
+    first = await service.create_version_backup(
+        server_id=1, file_path="config.yml", content=original
+    )
+    second = await service.create_version_backup(
+        server_id=1, file_path="config.yml", content=edited
+    )
+    assert first is not None and second is not None
+
+    delta = await uow.history_blobs.get(second.content_hash)
+    assert delta is not None
+    assert delta.base_hash == first.content_hash
+    assert delta.chain_depth == 1
+    assert delta.stored_size < len(edited) // 10
+
+    # The base outlives its own version while the delta needs it.
+    await service.delete_version(1, "config.yml", 1)
+    assert Path(first.backup_file_path).exists()
+    content, _ = await service.get_version_content(1, "config.yml", 2)
+    assert content == edited
+
+    await service.delete_version(1, "config.yml", 2)
+    assert not Path(first.backup_file_path).exists()
+    assert not Path(second.backup_file_path).exists()
+
+
+@pytest.mark.asyncio
+async def test_legacy_full_copy_backups_still_read_and_delete(
+    service: FileHistoryService, repo: FakeFileHistoryRepository, tmp_path: Path
+):
+    legacy = tmp_path / "file_history" / "1" / "eula.txt" / "v001_20240101_000000.txt"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_text("eula=false\n")
+    repo.seed(
+        FileHistoryEntity(
+            id=1,
+            server_id=1,
+            file_path="eula.txt",
+            version_number=1,
+            backup_file_path=str(legacy),
+            file_size=11,
+            content_hash="legacy",
+            editor_user_id=None,
+            editor_username=None,
+            created_at=utcnow(),
+            description=None,
+        )
+    )
+
+    content, _ = await service.get_version_content(1, "eula.txt", 1)
+    assert content == "eula=false\n"
+
+    await service.delete_version(1, "eula.txt", 1)
+    assert not legacy.exists()
+
+
+@pytest.mark.asyncio
+async def test_cleanup_releases_blobs_of_rows_deleted_elsewhere(
+    service: FileHistoryService,
+    repo: FakeFileHistoryRepository,
+    uow: FakeFilesUnitOfWork,
+):
+    entity = await service.create_version_backup(
+        server_id=1, file_path="whitelist.json", content="[]\n"
+    )
+    assert entity is not None and entity.id is not None
+    # e.g. ON DELETE CASCADE from a deleted server
+    await repo.delete_by_id(entity.id)
+
+    result = await service.cleanup_old_versions(days=30)
+
+    assert result.deleted_versions == 0
+    assert result.freed_storage > 0
+    assert not Path(entity.backup_file_path).exists()
+    assert await uow.history_blobs.get(entity.content_hash) is None
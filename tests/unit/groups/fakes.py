@@ -416,3 +416,21 @@ class RecordingRealTimeCommands:
         if self.handle_group_should_raise:
             raise self.handle_group_should_raise
         return True
+
+    async def handle_group_change_commands_for_servers(
+        self,
+        servers: Any,
+        group_type: Any,
+        change_type: str = "update",
+        removed_players: Any = None,
+    ) -> Dict[int, bool]:
+        results = {}
+        for server_id, server_path in servers:
+            results[server_id] = await self.handle_group_change_commands(
+                server_id,
+                server_path,
+                group_type,
+                change_type,
+                removed_players=removed_players,
+            )
+        return results
@@ -10,17 +10,26 @@ from __future__ import annotations
 
 from datetime import timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from app.auth.models import AccountLockout
+from app.backups.application.file_service import ArchiveStats
+from app.backups.application.scrubber import ScrubStats
 from app.backups.models import Backup
 from app.core.datetime_utils import utcnow
 from app.health.application.metrics_collector import (
     BusinessMetricsCollector,
     account_lockouts_active,
+    backup_archive_bytes_per_second,
+    backup_archive_files_per_second,
+    backup_scrub_backups,
+    backup_scrub_bytes_read,
     backups_pending_total,
     servers_total,
+    websocket_dropped_messages_total,
+    websocket_outbound_queue_depth,
 )
 from app.servers.domain.value_objects import BackupStatus, ServerStatus
 from app.servers.models import Server
@@ -157,3 +166,48 @@ def test_collect_active_lockouts(
     collector.collect()
 
     assert _gauge_sample(account_lockouts_active) == 2
+
+
+def test_collect_websocket_queue_stats(collector: BusinessMetricsCollector) -> None:
+    from app.websockets.application.service import websocket_service
+
+    stats = {
+        "connections": 2,
+        "queued_messages": 7,
+        "max_queue_depth": 5,
+        "dropped_messages": 11,
+    }
+    with patch.object(
+        websocket_service.connection_manager, "queue_stats", return_value=stats
+    ):
+        collector.collect()
+
+    assert _gauge_sample(websocket_outbound_queue_depth, stat="total") == 7
+    assert _gauge_sample(websocket_outbound_queue_depth, stat="max") == 5
+    assert _gauge_sample(websocket_dropped_messages_total) == 11
+
+
+def test_collect_backup_throughput(collector: BusinessMetricsCollector) -> None:
+    stats = ArchiveStats(files=400, bytes=8 * 1024 * 1024, seconds=2.0)
+    with patch(
+        "app.health.application.metrics_collector.last_archive_stats",
+        return_value=stats,
+    ):
+        collector.collect()
+
+    assert _gauge_sample(backup_archive_files_per_second) == 200
+    assert _gauge_sample(backup_archive_bytes_per_second) == 4 * 1024 * 1024
+
+
+def test_collect_backup_scrub(collector: BusinessMetricsCollector) -> None:
+    stats = ScrubStats(verified=5, mismatched=1, missing=2, bytes_read=1024)
+    with patch(
+        "app.health.application.metrics_collector.last_scrub_stats",
+        return_value=stats,
+    ):
+        collector.collect()
+
+    assert _gauge_sample(backup_scrub_backups, result="verified") == 5
+    assert _gauge_sample(backup_scrub_backups, result="mismatched") == 1
+    assert _gauge_sample(backup_scrub_backups, result="missing") == 2
+    assert _gauge_sample(backup_scrub_bytes_read) == 1024
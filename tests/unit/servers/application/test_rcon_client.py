@@ -0,0 +1,408 @@
+"""Unit tests for the asyncio RCON client and per-server connection pool."""
+
+import asyncio
+import struct
+from datetime import datetime
+
+import pytest
+
+from app.servers.application.minecraft.rcon_client import (
+    MinecraftRCONClient,
+    RCONConnectionPool,
+)
+from app.servers.application.minecraft_server import MinecraftServerManager, ServerProcess
+from app.servers.models import ServerStatus
+
+PASSWORD = "secret"
+
+
+class FakeRCONServer:
+    """Minimal RCON server speaking the Minecraft wire format."""
+
+    def __init__(
+        self,
+        *,
+        reverse_batches: bool = False,
+        responses: dict[str, str] | None = None,
+        trickle: bool = False,
+        strict: bool = False,
+    ):
+        self.reverse_batches = reverse_batches
+        self.responses = responses or {}
+        self.trickle = trickle
+        self.strict = strict
+        self.rejected_reads = 0
+        self.logins = 0
+        self.commands: list[str] = []
+        self.writers: list[asyncio.StreamWriter] = []
+        self.server = None
+        self.port = None
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc):
+        self.drop_connections()
+        self.server.close()
+        await self.server.wait_closed()
+
+    def drop_connections(self):
+        for writer in self.writers:
+            writer.close()
+        self.writers.clear()
+
+    @staticmethod
+    def packet(request_id: int, packet_type: int, payload) -> bytes:
+        if isinstance(payload, str):
+            payload = payload.encode()
+        body = struct.pack("<ii", request_id, packet_type) + payload + b"\0\0"
+        return struct.pack("<i", len(body)) + body
+
+    def response_packets(self, request_id: int, command: str) -> bytes:
+        # Like Minecraft: output is split into 4096-byte packets sharing the
+        # request id (the split may land inside a multi-byte character).
+        payload = self.responses.get(command, f"ran {command}").encode()
+        chunks = [payload[i : i + 4096] for i in range(0, len(payload), 4096)]
+        return b"".join(self.packet(request_id, 0, c) for c in chunks or [b""])
+
+    @property
+    def real_commands(self) -> list[str]:
+        """Commands received, minus the client's empty sentinels/keepalives."""
+        return [c for c in self.commands if c]
+
+    async def _read(self, reader):
+        if self.strict:
+            # Like vanilla's RconClient: one read of up to 1460 bytes, and the
+            # connection is dropped unless it holds exactly one packet.
+            data = await reader.read(1460)
+            if not data:
+                raise ConnectionError("client disconnected")
+            if len(data) < 14 or struct.unpack_from("<i", data)[0] != len(data) - 4:
+                self.rejected_reads += 1
+                raise ConnectionError("read did not hold exactly one packet")
+            data = data[4:]
+        else:
+            (size,) = struct.unpack("<i", await reader.readexactly(4))
+            data = await reader.readexactly(size)
+        request_id, packet_type = struct.unpack_from("<ii", data)
+        return request_id, packet_type, data[8:-2].decode()
+
+    async def _handle(self, reader, writer):
+        self.writers.append(writer)
+        try:
+            request_id, _type, password = await self._read(reader)
+            self.logins += 1
+            ok = password == PASSWORD
+            writer.write(self.packet(request_id if ok else -1, 2, ""))
+            await writer.drain()
+            if not ok:
+                return
+            while True:
+                request_id, _type, command = await self._read(reader)
+                self.commands.append(command)
+                batch = [(request_id, command)]
+                if self.reverse_batches:
+                    # Gather whatever else is already buffered and answer the
+                    # requests in reverse order to prove responses are matched
+                    # by id. Each command's trailing sentinel stays behind it.
+                    while len(reader._buffer) >= 4:
+                        rid, _t, cmd = await self._read(reader)
+                        self.commands.append(cmd)
+                        batch.append((rid, cmd))
+                    pairs = [batch[i : i + 2] for i in range(0, len(batch), 2)]
+                    batch = [item for pair in reversed(pairs) for item in pair]
+                data = b"".join(self.response_packets(rid, cmd) for rid, cmd in batch)
+                if self.trickle:
+                    for i in range(0, len(data), 7):
+                        writer.write(data[i : i + 7])
+                        await writer.drain()
+                        await asyncio.sleep(0)
+                else:
+                    writer.write(data)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_is_reused_across_commands():
+    async with FakeRCONServer() as server:
+        client = MinecraftRCONClient("127.0.0.1", server.port, PASSWORD)
+        try:
+            for i in range(20):
+                assert await client.send_command(f"op player{i}") == f"ran op player{i}"
+        finally:
+            await client.disconnect()
+
+    assert server.logins == 1
+    assert len(server.real_commands) == 20
+
+
+@pytest.mark.asyncio
+async def test_pipelined_requests_matched_by_request_id():
+    async with FakeRCONServer(reverse_batches=True) as server:
+        client = MinecraftRCONClient("127.0.0.1", server.port, PASSWORD)
+        try:
+            commands = [f"whitelist add p{i}" for i in range(30)]
+            results = await asyncio.gather(*(client.send_command(c) for c in commands))
+        finally:
+            await client.disconnect()
+
+    assert results == [f"ran {c}" for c in commands]
+    assert server.logins == 1
+
+
+@pytest.mark.asyncio
+async def test_packets_are_never_coalesced_for_one_packet_per_read_servers():
+    async with FakeRCONServer(strict=True) as server:
+        client = MinecraftRCONClient("127.0.0.1", server.port, PASSWORD)
+        try:
+            assert await client.send_command("say hi") == "ran say hi"
+            commands = [f"op p{i}" for i in range(20)]
+            assert await client.send_commands(commands) == [f"ran {c}" for c in commands]
+            results = await asyncio.gather(*(client.send_command(c) for c in commands))
+            assert results == [f"ran {c}" for c in commands]
+        finally:
+            await client.disconnect()
+
+    assert server.rejected_reads == 0
+    assert server.logins == 1
+    assert server.real_commands == ["say hi", *commands, *commands]
+
+
+@pytest.mark.asyncio
+async def test_wrong_password_fails_to_connect():
+    async with FakeRCONServer() as server:
+        client = MinecraftRCONClient("127.0.0.1", server.port, "wrong")
+        assert await client.connect() is False
+        assert await client.send_command("list") is None
+        assert not client.connected
+
+
+@pytest.mark.asyncio
+async def test_reconnects_after_connection_drop():
+    async with FakeRCONServer() as server:
+        client = MinecraftRCONClient("127.0.0.1", server.port, PASSWORD)
+        try:
+            assert await client.send_command("say one") == "ran say one"
+            server.drop_connections()
+            for _ in range(50):
+                if not client.connected:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert await client.send_command("say two") == "ran say two"
+        finally:
+            await client.disconnect()
+
+    assert server.logins == 2
+
+
+@pytest.mark.asyncio
+async def test_keepalive_probes_idle_connection():
+    async with FakeRCONServer() as server:
+        client = MinecraftRCONClient(
+            "127.0.0.1", server.port, PASSWORD, keepalive_interval=0.05
+        )
+        try:
+            assert await client.connect()
+            await asyncio.sleep(0.3)
+            assert client.connected
+        finally:
+            await client.disconnect()
+
+    assert "" in server.commands
+
+
+@pytest.mark.asyncio
+async def test_connect_failure_returns_none():
+    client = MinecraftRCONClient("127.0.0.1", 1, PASSWORD, timeout=1.0)
+    assert await client.send_command("list") is None
+
+
+@pytest.mark.asyncio
+async def test_pool_keeps_one_client_per_server_and_replaces_on_new_credentials():
+    pool = RCONConnectionPool(keepalive_interval=None)
+    async with FakeRCONServer() as server:
+        try:
+            first = pool.get(1, server.port, PASSWORD)
+            assert pool.get(1, server.port, PASSWORD) is first
+            assert pool.get(2, server.port, PASSWORD) is not first
+
+            assert pool.get(1, server.port, "rotated") is not first
+        finally:
+            await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_manager_reuses_pooled_connection():
+    manager = MinecraftServerManager(log_queue_size=100)
+    async with FakeRCONServer() as server:
+        manager.processes[1] = ServerProcess(
+            server_id=1,
+            process=None,
+            status=ServerStatus.running,
+            started_at=datetime.now(),
+            pid=12345,
+            rcon_port=server.port,
+            rcon_password=PASSWORD,
+        )
+        try:
+            for name in ("alice", "bob", "carol"):
+                assert await manager.send_command(1, f"op {name}") is True
+        finally:
+            await manager.rcon_pool.close_all()
+
+    assert server.logins == 1
+    assert server.real_commands == ["op alice", "op bob", "op carol"]
+
+
+@pytest.mark.asyncio
+async def test_multi_packet_response_is_reassembled():
+    output = "".join(f"player{i}: 123e4567-e89b-12d3-a456-{i:012d}, " for i in range(600))
+    assert len(output) > 4 * 4096
+    async with FakeRCONServer(responses={"list uuids": output}) as server:
+        client = MinecraftRCONClient("127.0.0.1", server.port, PASSWORD)
+        try:
+            assert await client.send_command("list uuids") == output
+            # The connection stays usable for the next command.
+            assert await client.send_command("list") == "ran list"
+        finally:
+            await client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_sentinel_ends_the_response_and_its_reply_is_dropped():
+    # The sentinel goes out after the first fragment, while the server is
+    # still trickling out the rest; every fragment must still be included.
+    output = "".join(f"entry{i:05d};" for i in range(1000))
+    responses = {"data get storage": output, "": "Unknown or incomplete command"}
+    async with FakeRCONServer(responses=responses, strict=True, trickle=True) as server:
+        client = MinecraftRCONClient("127.0.0.1", server.port, PASSWORD)
+        try:
+            fragments = [f async for f in client.stream_command("data get storage")]
+            assert await client.send_command("list") == "ran list"
+        finally:
+            await client.disconnect()
+
+    assert [len(f) for f in fragments] == [4096, 4096, 2808]
+    assert "".join(fragments) == output
+    assert server.commands == ["data get storage", "", "list", ""]
+    assert server.rejected_reads == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_command_yields_fragments_as_they_arrive():
+    output = "x" * 10000
+    async with FakeRCONServer(responses={"data get storage": output}) as server:
+        client = MinecraftRCONClient("127.0.0.1", server.port, PASSWORD)
+        try:
+            fragments = [f async for f in client.stream_command("data get storage")]
+        finally:
+            await client.disconnect()
+
+    assert [len(f) for f in fragments] == [4096, 4096, 1808]
+    assert "".join(fragments) == output
+
+
+@pytest.mark.asyncio
+async def test_multibyte_characters_split_across_packets_survive():
+    # 4095 ASCII bytes push the 3-byte "あ" across the first packet boundary.
+    output = "a" * 4095 + "あいう" * 50
+    async with FakeRCONServer(responses={"say": output}) as server:
+        client = MinecraftRCONClient("127.0.0.1", server.port, PASSWORD)
+        try:
+            assert await client.send_command("say") == output
+        finally:
+            await client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_packets_fragmented_on_the_wire_are_read_fully():
+    output = "y" * 6000
+    async with FakeRCONServer(responses={"dump": output}, trickle=True) as server:
+        client = MinecraftRCONClient("127.0.0.1", server.port, PASSWORD)
+        try:
+            assert await client.send_command("dump") == output
+        finally:
+            await client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_manager_streams_command_output():
+    manager = MinecraftServerManager(log_queue_size=100)
+    output = "z" * 9000
+    async with FakeRCONServer(responses={"plugins": output}) as server:
+        manager.processes[1] = ServerProcess(
+            server_id=1,
+            process=None,
+            status=ServerStatus.running,
+            started_at=datetime.now(),
+            pid=12345,
+            rcon_port=server.port,
+            rcon_password=PASSWORD,
+        )
+        try:
+            fragments = [f async for f in manager.stream_command_output(1, "plugins")]
+        finally:
+            await manager.rcon_pool.close_all()
+
+    assert "".join(fragments) == output
+    assert len(fragments) == 3
+
+    with pytest.raises(ConnectionError):
+        async for _ in manager.stream_command_output(2, "plugins"):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_manager_batch_runs_commands_over_one_session():
+    manager = MinecraftServerManager(log_queue_size=100)
+    commands = [f"op player{i}" for i in range(200)]
+    async with FakeRCONServer(reverse_batches=True) as server:
+        manager.processes[1] = ServerProcess(
+            server_id=1,
+            process=None,
+            status=ServerStatus.running,
+            started_at=datetime.now(),
+            pid=12345,
+            rcon_port=server.port,
+            rcon_password=PASSWORD,
+        )
+        try:
+            results = await manager.send_commands_batch(1, commands)
+        finally:
+            await manager.rcon_pool.close_all()
+
+    assert server.logins == 1
+    assert server.real_commands == commands
+    assert [r.command for r in results] == commands
+    assert all(r.success for r in results)
+    assert results[7].response == "ran op player7"
+
+
+@pytest.mark.asyncio
+async def test_manager_batch_reports_failure_per_command():
+    manager = MinecraftServerManager(log_queue_size=100)
+    results = await manager.send_commands_batch(99, ["op a", "op b"])
+    assert [(r.command, r.success) for r in results] == [("op a", False), ("op b", False)]
+
+    manager.processes[2] = ServerProcess(
+        server_id=2,
+        process=None,
+        status=ServerStatus.running,
+        started_at=datetime.now(),
+        pid=12345,
+        rcon_port=1,
+        rcon_password=PASSWORD,
+    )
+    manager.rcon_pool.timeout = 1.0
+    try:
+        results = await manager.send_commands_batch(2, ["op a", "op b"])
+    finally:
+        await manager.rcon_pool.close_all()
+    assert [r.success for r in results] == [False, False]
@@ -6,6 +6,7 @@ import pytest
 
 from app.core.security import SecurityError
 from app.groups.models import GroupType
+from app.servers.application.minecraft_server import CommandResult
 from app.servers.application.real_time_server_commands import (
     RealTimeServerCommandService,
     real_time_server_commands,
@@ -13,6 +14,15 @@ from app.servers.application.real_time_server_commands import (
 from app.servers.models import ServerStatus
 
 
+def _batch(*flags):
+    """AsyncMock for send_commands_batch reporting the given per-command flags."""
+
+    async def send_commands_batch(server_id, commands):
+        return [CommandResult(c, ok) for c, ok in zip(commands, flags)]
+
+    return AsyncMock(side_effect=send_commands_batch)
+
+
 class TestRealTimeServerCommandService:
     """Test class for RealTimeServerCommandService"""
 
@@ -130,7 +140,7 @@ class TestRealTimeServerCommandService:
     ):
         """Test successful OP sync for running server"""
         mock_manager.get_server_status.return_value = ServerStatus.running
-        mock_manager.send_command = AsyncMock(return_value=True)
+        mock_manager.send_commands_batch = _batch(True, True)
 
         # Mock file operations
         with patch("builtins.open", mock_open(read_data=json.dumps(mock_ops_data))):
@@ -142,8 +152,11 @@ class TestRealTimeServerCommandService:
 
         assert result is True
         mock_manager.get_server_status.assert_called_once_with(1)
-        # Should send OP commands for both players
-        assert mock_manager.send_command.call_count == 2
+        # Should send OP commands for both players in a single batch
+        mock_manager.send_commands_batch.assert_awaited_once_with(
+            1, ["op player1", "op player2"]
+        )
+        mock_manager.send_command.assert_not_called()
 
     @pytest.mark.asyncio
     @patch("app.servers.application.real_time_server_commands.minecraft_server_manager")
@@ -161,7 +174,7 @@ class TestRealTimeServerCommandService:
         result = await service.sync_op_changes_if_running(1, mock_server_path)
 
         assert result is False
-        mock_manager.send_command.assert_not_called()
+        mock_manager.send_commands_batch.assert_not_called()
 
     @pytest.mark.asyncio
     @patch("app.servers.application.real_time_server_commands.minecraft_server_manager")
@@ -178,7 +191,7 @@ class TestRealTimeServerCommandService:
                 result = await service.sync_op_changes_if_running(1, mock_server_path)
 
         assert result is True  # Should succeed with empty ops list
-        mock_manager.send_command.assert_not_called()
+        mock_manager.send_commands_batch.assert_not_called()
 
     @pytest.mark.asyncio
     @patch("app.servers.application.real_time_server_commands.minecraft_server_manager")
@@ -222,7 +235,7 @@ class TestRealTimeServerCommandService:
         """Test OP sync with partial command success"""
         mock_manager.get_server_status.return_value = ServerStatus.running
         # First command succeeds, second fails
-        mock_manager.send_command.side_effect = [True, False]
+        mock_manager.send_commands_batch = _batch(True, False)
 
         with patch("builtins.open", mock_open(read_data=json.dumps(mock_ops_data))):
             with patch.object(Path, "exists", return_value=True):
@@ -239,7 +252,7 @@ class TestRealTimeServerCommandService:
     async def test_apply_op_diff_if_running_success(self, mock_manager, service):
         """Test successful OP diff application"""
         mock_manager.get_server_status.return_value = ServerStatus.running
-        mock_manager.send_command = AsyncMock(return_value=True)
+        mock_manager.send_commands_batch = _batch(True, True, True)
 
         added_players = {"player1", "player2"}
         removed_players = {"player3"}
@@ -247,7 +260,10 @@ class TestRealTimeServerCommandService:
         result = await service.apply_op_diff_if_running(1, added_players, removed_players)
 
         assert result is True
-        assert mock_manager.send_command.call_count == 3  # 2 op + 1 deop commands
+        # 2 op + 1 deop commands, sent as one batch
+        mock_manager.send_commands_batch.assert_awaited_once_with(
+            1, ["op player1", "op player2", "deop player3"]
+        )
 
     @pytest.mark.asyncio
     @patch("app.servers.application.real_time_server_commands.minecraft_server_manager")
@@ -265,7 +281,7 @@ class TestRealTimeServerCommandService:
         result = await service.apply_op_diff_if_running(1, {"player1"}, {"player2"})
 
         assert result is False
-        mock_manager.send_command.assert_not_called()
+        mock_manager.send_commands_batch.assert_not_called()
 
     @pytest.mark.asyncio
     @patch("app.servers.application.real_time_server_commands.minecraft_server_manager")
@@ -276,7 +292,7 @@ class TestRealTimeServerCommandService:
         result = await service.apply_op_diff_if_running(1, set(), set())
 
         assert result is True  # Should succeed with no operations
-        mock_manager.send_command.assert_not_called()
+        mock_manager.send_commands_batch.assert_not_called()
 
     @pytest.mark.asyncio
     @patch("app.servers.application.real_time_server_commands.minecraft_server_manager")
@@ -285,7 +301,9 @@ class TestRealTimeServerCommandService:
     ):
         """Test OP diff with command exception"""
         mock_manager.get_server_status.return_value = ServerStatus.running
-        mock_manager.send_command.side_effect = Exception("Command failed")
+        mock_manager.send_commands_batch = AsyncMock(
+            side_effect=Exception("Command failed")
+        )
 
         result = await service.apply_op_diff_if_running(1, {"player1"}, set())
 
@@ -484,7 +502,7 @@ class TestRealTimeServerCommandService:
                     result = await service.sync_op_changes_if_running(1, mock_server_path)
 
         assert result is True  # Should succeed with no valid names to process
-        mock_manager.send_command.assert_not_called()
+        mock_manager.send_commands_batch.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_various_server_statuses_handling(self, service):
@@ -516,3 +534,63 @@ class TestRealTimeServerCommandService:
         custom_service.base_directory = Path("/custom/servers")
 
         assert custom_service.base_directory == Path("/custom/servers")
+
+    # Test handle_group_change_commands_for_servers
+    @pytest.mark.asyncio
+    @patch("app.servers.application.real_time_server_commands.minecraft_server_manager")
+    async def test_fan_out_runs_servers_concurrently_with_bound(
+        self, mock_manager, service, mock_server_path
+    ):
+        """Group changes fan out concurrently, capped at max_concurrent_servers"""
+        import asyncio
+
+        mock_manager.get_server_status.return_value = ServerStatus.running
+        service.max_concurrent_servers = 3
+        active = 0
+        peak = 0
+
+        async def handle(server_id, server_path, group_type, change_type, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return server_id != 4
+
+        servers = [(i, mock_server_path / str(i)) for i in range(1, 11)]
+        with patch.object(service, "handle_group_change_commands", side_effect=handle):
+            results = await service.handle_group_change_commands_for_servers(
+                servers, GroupType.op, "attach"
+            )
+
+        assert peak == 3
+        assert results == {i: i != 4 for i in range(1, 11)}
+        mock_manager.discover_and_restore_processes.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("app.servers.application.real_time_server_commands.minecraft_server_manager")
+    async def test_fan_out_restores_daemons_once_and_skips_stopped(
+        self, mock_manager, service, mock_server_path
+    ):
+        """Stopped servers trigger a single restoration and are then skipped"""
+        statuses = {
+            1: ServerStatus.running,
+            2: ServerStatus.stopped,
+            3: ServerStatus.stopped,
+        }
+        mock_manager.get_server_status.side_effect = statuses.get
+        mock_manager.discover_and_restore_processes = AsyncMock(return_value={})
+
+        with patch.object(
+            service, "handle_group_change_commands", AsyncMock(return_value=True)
+        ) as mock_handle:
+            results = await service.handle_group_change_commands_for_servers(
+                [(1, mock_server_path), (2, mock_server_path), (3, mock_server_path)],
+                GroupType.whitelist,
+            )
+
+        assert results == {1: True, 2: True, 3: True}
+        mock_manager.discover_and_restore_processes.assert_awaited_once()
+        mock_handle.assert_awaited_once_with(
+            1, mock_server_path, GroupType.whitelist, "update", removed_players=None
+        )
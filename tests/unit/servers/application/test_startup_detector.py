@@ -0,0 +1,159 @@
+"""Unit tests for incremental startup detection in ``_monitor_daemon_process``."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.servers.application.minecraft import monitoring
+from app.servers.application.minecraft.monitoring import (
+    _match_startup_line,
+    _StartupLogDetector,
+)
+from app.servers.application.minecraft_server import MinecraftServerManager, ServerProcess
+from app.servers.models import ServerStatus
+
+DONE_LINE = b'[14:22:54] [Server thread/INFO]: Done (6.633s)! For help, type "help"\n'
+
+
+def _recorded_worldgen_log(total_bytes: int) -> bytes:
+    """Build a large modded-server style log that ends just before ``Done``."""
+    lines = []
+    size = 0
+    i = 0
+    while size < total_bytes:
+        line = (
+            f"[14:22:{i % 60:02d}] [Worker-Main-{i % 8}/INFO]: "
+            f"Preparing spawn area: {i % 100}% (modpack chunk {i})\n"
+        ).encode()
+        lines.append(line)
+        size += len(line)
+        i += 1
+    return b"".join(lines)
+
+
+def _append(path, data: bytes) -> None:
+    with open(path, "ab") as f:
+        f.write(data)
+
+
+def test_match_startup_line_requires_both_parts_on_one_line():
+    assert _match_startup_line(b"Done loading mods\nType For help\n") is None
+    assert _match_startup_line(DONE_LINE) == "Done+For help"
+    assert (
+        _match_startup_line(b"[main/INFO]: Ready to accept connections\n")
+        == "Ready to accept+connections"
+    )
+    assert _match_startup_line(b"Server started\n") == "Server started"
+
+
+def test_detector_reads_each_byte_once_across_large_replay(tmp_path):
+    log_file = tmp_path / "server.log"
+    log_file.write_bytes(b"")
+    recording = _recorded_worldgen_log(12 * 1024 * 1024) + DONE_LINE
+
+    detector = _StartupLogDetector(log_file)
+    # Replay the recording in 90 ticks, mirroring the 0.5s/45s startup loop.
+    tick = len(recording) // 90 + 1
+    detected = None
+    polls = 0
+    for start in range(0, len(recording), tick):
+        _append(log_file, recording[start : start + tick])
+        polls += 1
+        detected = detector.poll()
+        if detected is not None:
+            break
+
+    assert detected == "Done+For help"
+    assert polls == 90
+    # Bytes read for the whole start equal the log size -- nothing re-read.
+    assert detector.bytes_read == len(recording)
+    assert detector.offset == log_file.stat().st_size
+
+
+def test_detector_matches_line_split_across_polls(tmp_path):
+    log_file = tmp_path / "server.log"
+    log_file.write_bytes(b"[14:22:47] [Server thread/INFO]: Loading properties\n")
+    detector = _StartupLogDetector(log_file)
+    assert detector.poll() is None
+
+    _append(log_file, DONE_LINE[:30])
+    assert detector.poll() is None
+    _append(log_file, DONE_LINE[30:])
+
+    assert detector.poll() == "Done+For help"
+    assert detector.bytes_read == log_file.stat().st_size
+
+
+def test_detector_idle_poll_reads_nothing(tmp_path):
+    log_file = tmp_path / "server.log"
+    log_file.write_bytes(b"starting\n")
+    detector = _StartupLogDetector(log_file)
+    detector.poll()
+    read_before = detector.bytes_read
+
+    for _ in range(5):
+        assert detector.poll() is None
+
+    assert detector.bytes_read == read_before
+
+
+def test_detector_rescans_truncated_file(tmp_path):
+    log_file = tmp_path / "server.log"
+    log_file.write_bytes(_recorded_worldgen_log(4096))
+    detector = _StartupLogDetector(log_file)
+    assert detector.poll() is None
+
+    log_file.write_bytes(DONE_LINE)
+
+    assert detector.poll() == "Done+For help"
+    assert detector.offset == len(DONE_LINE)
+
+
+@pytest.mark.asyncio
+async def test_monitor_daemon_process_reads_log_once_per_start(tmp_path):
+    manager = MinecraftServerManager(log_queue_size=20)
+    log_file = tmp_path / "server.log"
+    log_file.write_bytes(b"")
+    recording = _recorded_worldgen_log(2 * 1024 * 1024) + DONE_LINE
+    chunks = [recording[i : i + 65536] for i in range(0, len(recording), 65536)]
+
+    server_process = ServerProcess(
+        server_id=1,
+        process=None,
+        status=ServerStatus.starting,
+        started_at=datetime.now(),
+        pid=12345,
+        server_directory=tmp_path,
+    )
+    manager.processes[1] = server_process
+    status_changes = []
+    manager.set_status_update_callback(lambda sid, st: status_changes.append(st))
+
+    async def fake_sleep(_delay):
+        # Each startup tick the "server" writes the next slice of its log;
+        # once the recording is exhausted, stop the post-startup loop.
+        if chunks:
+            _append(log_file, chunks.pop(0))
+        else:
+            manager.processes.pop(1, None)
+
+    detectors = []
+
+    class RecordingDetector(_StartupLogDetector):
+        def __init__(self, path):
+            super().__init__(path)
+            detectors.append(self)
+
+    _append(log_file, chunks.pop(0))
+    with (
+        patch.object(manager, "_is_process_running", AsyncMock(return_value=True)),
+        patch.object(monitoring, "_StartupLogDetector", RecordingDetector),
+        patch.object(monitoring.asyncio, "sleep", fake_sleep),
+    ):
+        await asyncio.wait_for(manager._monitor_daemon_process(server_process), 10)
+
+    assert status_changes == [ServerStatus.running]
+    assert len(detectors) == 1
+    assert detectors[0].bytes_read == len(recording)
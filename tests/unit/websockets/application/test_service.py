@@ -2,13 +2,19 @@
 
 import asyncio
 import json
+from datetime import datetime
 from pathlib import Path
-from unittest.mock import AsyncMock, Mock, mock_open, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from fastapi import WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
 
+from app.servers.application.minecraft_server import (
+    MinecraftServerManager,
+    ServerProcess,
+)
+from app.servers.models import ServerStatus
 from app.users.domain.value_objects import Role
 from app.users.models import User
 from app.websockets.application.service import (
@@ -179,6 +185,7 @@ class TestConnectionManagerFixed:
         connection_manager.active_connections[server_id] = {ws1, ws2}
 
         await connection_manager.send_to_server_connections(server_id, message)
+        await connection_manager.flush()
 
         # Verify message sent to both connections
         expected_json = json.dumps(message)
@@ -201,6 +208,7 @@ class TestConnectionManagerFixed:
         connection_manager.user_connections[ws2] = Mock(username="user2")
 
         await connection_manager.send_to_server_connections(server_id, message)
+        await connection_manager.flush()
 
         # Verify successful connection still got message
         ws1.send_text.assert_called_once()
@@ -209,6 +217,106 @@ class TestConnectionManagerFixed:
         assert ws2 not in connection_manager.active_connections[server_id]
         assert ws2 not in connection_manager.user_connections
 
+    @pytest.mark.asyncio
+    async def test_slow_connection_does_not_delay_others(self, connection_manager):
+        """A stalled client only backs up its own queue"""
+        server_id = 1
+        release = asyncio.Event()
+
+        async def stalled_send(_payload):
+            await release.wait()
+
+        slow = Mock(spec=WebSocket)
+        slow.send_text = AsyncMock(side_effect=stalled_send)
+        fast = Mock(spec=WebSocket)
+        fast.send_text = AsyncMock()
+        connection_manager.active_connections[server_id] = {slow, fast}
+
+        for i in range(5):
+            await connection_manager.send_to_server_connections(server_id, {"n": i})
+        await connection_manager.outbound_queues[fast].join()
+
+        assert [c.args[0] for c in fast.send_text.call_args_list] == [
+            json.dumps({"n": i}) for i in range(5)
+        ]
+        assert slow.send_text.call_count == 1
+        assert len(connection_manager.outbound_queues[slow]) == 4
+
+        release.set()
+        await connection_manager.flush()
+        assert slow.send_text.call_count == 5
+        # Serialized once and shared by every subscriber.
+        assert (
+            slow.send_text.call_args_list[-1].args[0]
+            is (fast.send_text.call_args_list[-1].args[0])
+        )
+        for ws in (slow, fast):
+            await connection_manager.disconnect(ws, server_id)
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest_messages(self):
+        """drop_oldest keeps the newest messages and counts the drops"""
+        manager = ConnectionManager(send_queue_size=3, slow_consumer_policy="drop_oldest")
+        release = asyncio.Event()
+
+        async def stalled_send(_payload):
+            await release.wait()
+
+        ws = Mock(spec=WebSocket)
+        ws.send_text = AsyncMock(side_effect=stalled_send)
+        manager.active_connections[1] = {ws}
+
+        await manager.send_to_server_connections(1, {"n": 0})
+        await asyncio.sleep(0)  # writer picks up n=0 and blocks
+        for i in range(1, 8):
+            await manager.send_to_server_connections(1, {"n": i})
+
+        stats = manager.queue_stats()
+        assert stats["queued_messages"] == 3
+        assert stats["max_queue_depth"] == 3
+        assert stats["dropped_messages"] == 4
+
+        release.set()
+        await manager.flush()
+        assert [json.loads(c.args[0])["n"] for c in ws.send_text.call_args_list] == [
+            0,
+            5,
+            6,
+            7,
+        ]
+
+        await manager.disconnect(ws, 1)
+        assert manager.queue_stats() == {
+            "connections": 0,
+            "queued_messages": 0,
+            "max_queue_depth": 0,
+            "dropped_messages": 4,
+        }
+
+    @pytest.mark.asyncio
+    async def test_full_queue_disconnects_slow_client(self):
+        """The disconnect policy drops the client instead of messages"""
+        manager = ConnectionManager(send_queue_size=2, slow_consumer_policy="disconnect")
+
+        async def stalled_send(_payload):
+            await asyncio.Event().wait()
+
+        ws = Mock(spec=WebSocket)
+        ws.send_text = AsyncMock(side_effect=stalled_send)
+        ws.close = AsyncMock()
+        manager.active_connections[1] = {ws}
+        manager.user_connections[ws] = Mock(username="slow")
+
+        await manager.send_to_server_connections(1, {"n": 0})
+        await asyncio.sleep(0)
+        for i in range(1, 4):
+            await manager.send_to_server_connections(1, {"n": i})
+
+        assert 1 not in manager.active_connections
+        assert ws not in manager.user_connections
+        assert ws not in manager.outbound_queues
+        ws.close.assert_awaited_once_with(code=1008, reason="Client too slow")
+
     @pytest.mark.asyncio
     async def test_send_personal_message_success(
         self, connection_manager, mock_websocket
@@ -313,37 +421,121 @@ class TestConnectionManagerFixed:
         assert connection_manager._determine_log_type("Random server message") == "other"
 
     @pytest.mark.asyncio
-    async def test_stream_server_logs_success(self, connection_manager):
-        """Test streaming server logs"""
+    async def test_stream_server_logs_success(self, connection_manager, tmp_path):
+        """Lines appended after subscription are pushed to connected clients"""
         server_id = 1
-        log_content = "Test log line\nAnother log line\n"
+        log_file = tmp_path / "logs" / "latest.log"
+        log_file.parent.mkdir()
+        log_file.write_text("Old line before connect\n")
 
         # Mock server manager
         mock_server_manager = Mock()
-        mock_server_manager.server_dir = Path("/servers/test")
+        mock_server_manager.server_dir = tmp_path
 
-        # Setup active connections + log task entry (loop termination
-        # condition reads from server_log_tasks).
         connection_manager.active_connections[server_id] = {Mock()}
-        connection_manager.server_log_tasks[server_id] = Mock()
+        sent = asyncio.Queue()
+
+        async def record(sid, message):
+            await sent.put((sid, message))
 
         with (
             patch(
                 "app.websockets.application.service.minecraft_server_manager"
             ) as mock_mgr,
-            patch("builtins.open", mock_open(read_data=log_content)) as mock_file,
-            patch.object(connection_manager, "send_to_server_connections") as mock_send,
-            patch("pathlib.Path.exists", return_value=True),
-            patch("pathlib.Path.is_file", return_value=True),
-            patch("asyncio.sleep", side_effect=asyncio.CancelledError()),
+            patch.object(
+                connection_manager, "send_to_server_connections", side_effect=record
+            ),
         ):
             mock_mgr.get_server.return_value = mock_server_manager
 
-            # Should be cancelled by sleep
-            await connection_manager._stream_server_logs(server_id)
+            task = asyncio.create_task(connection_manager._stream_server_logs(server_id))
+            connection_manager.server_log_tasks[server_id] = task
+            await asyncio.sleep(0.1)
+            with log_file.open("a") as f:
+                f.write("[12:00:00] [Server thread/ERROR]: Test log line\n")
+
+            sid, message = await asyncio.wait_for(sent.get(), timeout=5)
+            task.cancel()
+            await task
 
             # Verify server manager was retrieved
             mock_mgr.get_server.assert_called_once_with(str(server_id))
+            assert sid == server_id
+            assert message["type"] == "server_log"
+            assert (
+                message["data"]["log_line"]
+                == "[12:00:00] [Server thread/ERROR]: Test log line"
+            )
+            assert message["data"]["log_type"] == "error"
+            # Only lines written after the stream started are sent.
+            assert sent.empty()
+
+    def test_determine_log_type_prefers_highest_priority_keyword(
+        self, connection_manager
+    ):
+        """Classification matches the old if/elif chain regardless of order"""
+        line = "[Server thread/INFO]: Steve joined the game; NullPointerException"
+        assert connection_manager._determine_log_type(line) == "error"
+        assert connection_manager._determine_log_type("DEBUG then WARN") == "warning"
+        assert connection_manager._determine_log_type("ERROR: disk full") == "error"
+
+    @pytest.mark.asyncio
+    async def test_stream_server_logs_batches_for_batch_clients(self, tmp_path):
+        """Batch clients get server_log_batch frames; others keep per-line frames"""
+        # Room for the whole burst in the per-line client's queue.
+        connection_manager = ConnectionManager(send_queue_size=1000)
+        server_id = 1
+        log_file = tmp_path / "logs" / "latest.log"
+        log_file.parent.mkdir()
+        log_file.write_text("")
+        mock_server_manager = Mock()
+        mock_server_manager.server_dir = tmp_path
+
+        batch_ws = Mock(spec=WebSocket)
+        batch_ws.send_text = AsyncMock()
+        line_ws = Mock(spec=WebSocket)
+        line_ws.send_text = AsyncMock()
+        connection_manager.active_connections[server_id] = {batch_ws, line_ws}
+        assert connection_manager.set_log_mode(batch_ws, "batch")
+        assert not connection_manager.set_log_mode(line_ws, "bogus")
+
+        with patch(
+            "app.websockets.application.service.minecraft_server_manager"
+        ) as mock_mgr:
+            mock_mgr.get_server.return_value = mock_server_manager
+            task = asyncio.create_task(connection_manager._stream_server_logs(server_id))
+            await asyncio.sleep(0.1)
+            with log_file.open("a") as f:
+                f.writelines(f"[Server thread/INFO]: line {i}\n" for i in range(300))
+
+            for _ in range(100):
+                await asyncio.sleep(0.05)
+                await connection_manager.flush()
+                if line_ws.send_text.call_count >= 300:
+                    frames = [
+                        json.loads(c.args[0]) for c in batch_ws.send_text.call_args_list
+                    ]
+                    if sum(len(f["data"]["lines"]) for f in frames) >= 300:
+                        break
+            task.cancel()
+            await task
+
+        frames = [json.loads(c.args[0]) for c in batch_ws.send_text.call_args_list]
+        assert {f["type"] for f in frames} == {"server_log_batch"}
+        assert all(len(f["data"]["lines"]) <= 256 for f in frames)
+        lines = [entry for f in frames for entry in f["data"]["lines"]]
+        assert [entry["log_line"] for entry in lines] == [
+            f"[Server thread/INFO]: line {i}" for i in range(300)
+        ]
+        assert {entry["log_type"] for entry in lines} == {"info"}
+        assert len(frames) < 10
+
+        per_line = [json.loads(c.args[0]) for c in line_ws.send_text.call_args_list]
+        assert len(per_line) == 300
+        assert {m["type"] for m in per_line} == {"server_log"}
+
+        for ws in (batch_ws, line_ws):
+            await connection_manager.disconnect(ws, server_id)
 
 
 class TestWebSocketServiceFixed:
@@ -487,35 +679,143 @@ class TestWebSocketServiceFixed:
 
     @pytest.mark.asyncio
     async def test_send_initial_status_success(self, ws_service, mock_websocket):
-        """Test sending initial status to client"""
-        server_id = 1
-        mock_status = {"running": True, "players": 2}
-
-        # Mock server manager
-        mock_server_manager = Mock()
-        mock_server_manager.get_status = AsyncMock(return_value=mock_status)
+        """Initial status carries the same data as pushed status frames"""
+        manager = MinecraftServerManager(log_queue_size=10)
+        await manager._notify_status_change(1, ServerStatus.starting)
+        await manager._notify_status_change(1, ServerStatus.running)
 
         with (
-            patch(
-                "app.websockets.application.service.minecraft_server_manager"
-            ) as mock_mgr,
+            patch("app.websockets.application.service.minecraft_server_manager", manager),
             patch.object(
                 ws_service.connection_manager, "send_personal_message"
             ) as mock_send,
         ):
-            mock_mgr.get_server.return_value = mock_server_manager
+            await ws_service._send_initial_status(mock_websocket, 1)
+            await ws_service._send_initial_status(mock_websocket, 2)
+
+        assert [c.args[0] for c in mock_send.call_args_list] == [mock_websocket] * 2
+        running, stopped = [c.args[1] for c in mock_send.call_args_list]
+        assert running["type"] == "initial_status"
+        assert running["server_id"] == 1
+        assert running["data"] == {
+            "status": "running",
+            "previous_status": "starting",
+            "changed_at": manager.get_status_event(1).timestamp.isoformat(),
+        }
+        assert stopped["data"] == {
+            "status": "stopped",
+            "previous_status": None,
+            "changed_at": None,
+        }
 
-            await ws_service._send_initial_status(mock_websocket, server_id)
+    @pytest.mark.asyncio
+    async def test_set_log_mode_message_is_acknowledged(self, ws_service, mock_websocket):
+        """Clients negotiate batched log frames in-band"""
+        manager = ws_service.connection_manager
+        with patch.object(manager, "send_personal_message") as mock_send:
+            await ws_service._handle_message(
+                mock_websocket,
+                1,
+                {"type": "set_log_mode", "mode": "batch"},
+                Mock(),
+                Mock(),
+            )
+            await ws_service._handle_message(
+                mock_websocket, 1, {"type": "set_log_mode", "mode": "zip"}, Mock(), Mock()
+            )
 
-            # Verify status was sent
-            mock_send.assert_called_once()
-            args = mock_send.call_args[0]
-            assert args[0] == mock_websocket
+        assert mock_websocket in manager.log_batch_connections
+        mock_send.assert_called_once()
+        ack = mock_send.call_args[0][1]
+        assert ack["type"] == "log_mode"
+        assert ack["mode"] == "batch"
+        assert ack["batch_max_lines"] == manager.log_batch_max_lines
 
-            message = args[1]
-            assert message["type"] == "initial_status"
-            assert message["server_id"] == server_id
-            assert message["data"] == mock_status
+    @pytest.mark.asyncio
+    async def test_monitor_pushes_only_actual_status_changes(self, ws_service):
+        """Status frames follow manager transitions instead of a poll timer"""
+        manager = MinecraftServerManager(log_queue_size=10)
+        ws = Mock(spec=WebSocket)
+        ws.send_text = AsyncMock()
+        ws_service.connection_manager.active_connections[1] = {ws}
+
+        await ws_service.start_monitoring()
+        await asyncio.sleep(0)
+        try:
+            await manager._notify_status_change(1, ServerStatus.starting)
+            await manager._notify_status_change(1, ServerStatus.running)
+            # Unchanged status and servers without clients produce nothing.
+            await manager._notify_status_change(1, ServerStatus.running)
+            await manager._notify_status_change(2, ServerStatus.running)
+            for _ in range(10):
+                await asyncio.sleep(0)
+            await ws_service.connection_manager.flush()
+        finally:
+            await ws_service.stop_monitoring()
+            await ws_service.connection_manager.disconnect(ws, 1)
+
+        frames = [json.loads(c.args[0]) for c in ws.send_text.call_args_list]
+        assert [f["type"] for f in frames] == ["server_status", "server_status"]
+        assert [f["data"]["status"] for f in frames] == ["starting", "running"]
+        assert frames[1]["data"]["previous_status"] == "starting"
+        assert {f["server_id"] for f in frames} == {1}
+
+    @pytest.mark.asyncio
+    async def test_published_statuses_are_dropped_once_untracked(self):
+        """The manager only remembers statuses of servers it still tracks"""
+        manager = MinecraftServerManager(log_queue_size=10)
+        for status in (ServerStatus.starting, ServerStatus.stopping):
+            await manager._notify_status_change(1, status)
+        await manager._notify_status_change(1, ServerStatus.stopped)
+        assert manager.get_status_event(1) is None
+
+        manager.processes[2] = ServerProcess(
+            server_id=2,
+            process=None,
+            status=ServerStatus.error,
+            started_at=datetime.now(),
+            pid=None,
+            server_directory=Path("/nonexistent/2"),
+        )
+        await manager._notify_status_change(2, ServerStatus.error)
+        assert manager.get_status_event(2).status == ServerStatus.error
+        await manager._cleanup_server_process(2)
+        assert manager.get_status_event(2) is None
+        assert manager._published_statuses == {}
+
+    @pytest.mark.asyncio
+    async def test_monitor_forwards_restore_progress(self, ws_service):
+        """Restore progress events become backup_restore frames"""
+        from app.backups.application.restore import (
+            RESTORE_PROGRESS_TOPIC,
+            RestoreProgressEvent,
+        )
+        from app.core.event_bus import get_event_bus
+
+        ws = Mock(spec=WebSocket)
+        ws.send_text = AsyncMock()
+        ws_service.connection_manager.active_connections[1] = {ws}
+
+        await ws_service.start_monitoring()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        try:
+            bus = get_event_bus()
+            bus.publish(
+                RESTORE_PROGRESS_TOPIC, RestoreProgressEvent(1, 7, "extracting", 10, 2048)
+            )
+            bus.publish(RESTORE_PROGRESS_TOPIC, RestoreProgressEvent(2, 7, "completed"))
+            for _ in range(10):
+                await asyncio.sleep(0)
+            await ws_service.connection_manager.flush()
+        finally:
+            await ws_service.stop_monitoring()
+            await ws_service.connection_manager.disconnect(ws, 1)
+
+        frames = [json.loads(c.args[0]) for c in ws.send_text.call_args_list]
+        assert [f["type"] for f in frames] == ["backup_restore"]
+        assert frames[0]["data"]["phase"] == "extracting"
+        assert frames[0]["data"]["bytes"] == 2048
 
     def test_global_service_instance(self):
         """Test the global service instance exists and is configured"""